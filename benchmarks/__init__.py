@@ -0,0 +1,4 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""Benchmarks package initialization."""
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Set Source Extraction Benchmark
+
+Extracts the rows of a large "Show All" page and compares the per-field extraction the
+parsers used to perform (a ``html.parser`` BeautifulSoup tree and one ``find_all`` walk per
+field) with the single-pass lxml extractors ``sets_source_parse.extract_set_rows`` and
+``feed_scrape.extract_video_rows``::
+
+    python3 -m benchmarks.set_source_extract --rows 5000
+    python3 -m benchmarks.set_source_extract --sets-page saved_sets_page.html
+
+Pages that are not given are generated with the markup of the photo set and video tables.
+Times include parsing the page source.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import argparse
+import random
+import time
+
+from argparse import ArgumentParser
+from typing import Callable, List, Optional
+
+# Third-party imports
+from bs4 import BeautifulSoup
+
+# Local implementations
+from workflows.tasks.feed_scrape import (
+    extract_date,
+    extract_descriptions,
+    extract_duration,
+    extract_source,
+    extract_thumbnail,
+    extract_title,
+    extract_video_rows,
+)
+from workflows.tasks.sets_source_parse import (
+    extract_set_rows,
+    parse_dates,
+    parse_links,
+    parse_titles,
+)
+
+MONTHS = ("January", "February", "March", "April", "May", "June")
+
+
+def synthetic_sets_page(num_rows: int, seed: int = 42) -> str:
+    """
+    :param num_rows: ``int`` -> Photo set rows.
+    :param seed: ``int`` -> Random seed.
+    :return: ``str`` -> Page source.
+    """
+    rng = random.Random(seed)
+    page = ["<html><head><title>Show All</title></head><body><table>"]
+    for row in range(num_rows):
+        page.append(
+            f'<tr><td class="tab-column left-align col_0">Photo set {row} '
+            f"{'lorem ' * rng.randint(1, 6)}</td>"
+            f'<td class="tab-column col_1 center-align">{rng.choice(MONTHS)} '
+            f"{rng.randint(10, 28)}, 2024</td>"
+            f'<td class="tab-column col_2"><a href="zip_tool?set={row}&amp;u=7">Zip</a>'
+            f'<a href="preview?set={row}">Preview</a></td></tr>'
+        )
+    page.append("</table></body></html>")
+    return "".join(page)
+
+
+def synthetic_videos_page(num_rows: int, seed: int = 42) -> str:
+    """
+    :param num_rows: ``int`` -> Video rows.
+    :param seed: ``int`` -> Random seed.
+    :return: ``str`` -> Page source.
+    """
+    rng = random.Random(seed)
+    page = ["<html><head><title>Show All</title></head><body><table>"]
+    for row in range(num_rows):
+        page.append(
+            f'<tr><td class="tab-column col_0 center-align">Video {row}</td>'
+            f'<td><textarea class="display-link-text" rows="2">&lt;a href="/v/{row}"&gt;</textarea>'
+            f"<script>var v{row} = {row};</script>"
+            f'<textarea class="display-link-text" rows="2">Description {row} '
+            f"{'ipsum ' * rng.randint(5, 20)}</textarea></td>"
+            f'<td class="tab-column col_1 center-align">Sep {rng.randint(1, 28)}, 2024</td>'
+            f'<td class="tab-column col_2 center-align">{rng.randint(1, 40)} Min</td>'
+            f'<td><video class="video_holder_{row} table-video-small" controls="" poster="\n\t'
+            f'https://cdn.example.com/thumbs/{row}.jpg">'
+            f'<source src="https://cdn.example.com/videos/{row}.mp4" type="video/"/>'
+            f"</video></td></tr>"
+        )
+    page.append("</table></body></html>")
+    return "".join(page)
+
+
+def legacy_sets(source_html: str) -> List[tuple]:
+    soup_html = BeautifulSoup(source_html, "html.parser")
+    return list(
+        zip(parse_titles(soup_html), parse_dates(soup_html), parse_links(soup_html))
+    )
+
+
+def legacy_videos(source_html: str) -> List[tuple]:
+    bs4_obj = BeautifulSoup(source_html, "html.parser")
+    return list(
+        zip(
+            extract_title(bs4_obj),
+            extract_descriptions(bs4_obj),
+            extract_date(bs4_obj),
+            extract_duration(bs4_obj),
+            extract_source(bs4_obj),
+            extract_thumbnail(bs4_obj),
+        )
+    )
+
+
+def best_time(
+    extractor: Callable[[str], List[tuple]], source_html: str, repeat: int
+) -> tuple[float, int]:
+    """
+    :param extractor: ``Callable[[str], list]`` -> Extraction function.
+    :param source_html: ``str`` -> Page source.
+    :param repeat: ``int`` -> Runs, the best is reported.
+    :return: ``tuple[float, int]`` -> Best seconds and number of rows extracted.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = extractor(source_html)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(rows)
+
+
+def read_page(path: Optional[str], generate: Callable[[], str]) -> str:
+    """
+    :param path: ``str | None`` -> Saved page.
+    :param generate: ``Callable[[], str]`` -> Synthetic page factory, used without ``path``.
+    :return: ``str`` -> Page source.
+    """
+    if path is None:
+        return generate()
+    with open(path, "r", encoding="utf-8") as page_file:
+        return page_file.read()
+
+
+def run(
+    num_rows: int,
+    repeat: int = 3,
+    seed: int = 42,
+    sets_page: Optional[str] = None,
+    videos_page: Optional[str] = None,
+) -> None:
+    """
+    Prints the best time of each extractor and checks that both produce the same rows.
+
+    :param num_rows: ``int`` -> Rows of the synthetic pages.
+    :param repeat: ``int`` -> Runs per extractor.
+    :param seed: ``int`` -> Random seed.
+    :param sets_page: ``str | None`` -> Saved photo set page to use instead of a synthetic one.
+    :param videos_page: ``str | None`` -> Saved video page to use instead of a synthetic one.
+    :return: ``None``
+    """
+    print(
+        f"{'page':<8} {'MiB':>6} {'rows':>8} {'legacy s':>9} {'single s':>9} {'speedup':>8}"
+    )
+    for table, source_html, legacy, single_pass in (
+        (
+            "sets",
+            read_page(sets_page, lambda: synthetic_sets_page(num_rows, seed)),
+            legacy_sets,
+            extract_set_rows,
+        ),
+        (
+            "videos",
+            read_page(videos_page, lambda: synthetic_videos_page(num_rows, seed)),
+            legacy_videos,
+            extract_video_rows,
+        ),
+    ):
+        if legacy(source_html) != single_pass(source_html):
+            raise AssertionError(f"The {table} extractors returned different rows")
+        legacy_s, rows = best_time(legacy, source_html, repeat)
+        single_s, _ = best_time(single_pass, source_html, repeat)
+        print(
+            f"{table:<8} {len(source_html) / 2**20:>6.1f} {rows:>8}"
+            f" {legacy_s:>9.3f} {single_s:>9.3f}"
+            f" {legacy_s / single_s:>7.1f}x"
+        )
+
+
+def parse_args() -> ArgumentParser:
+    args_parser = argparse.ArgumentParser(
+        description="Compare per-field and single-pass extraction of set source pages"
+    )
+    args_parser.add_argument(
+        "--rows", type=int, default=5000, help="Rows of the synthetic pages."
+    )
+    args_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per extractor, the best is reported.",
+    )
+    args_parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    args_parser.add_argument(
+        "--sets-page", type=str, default=None, help="Saved photo set page."
+    )
+    args_parser.add_argument(
+        "--videos-page", type=str, default=None, help="Saved video page."
+    )
+    return args_parser
+
+
+def main():
+    args = parse_args().parse_args()
+    run(
+        args.rows,
+        repeat=args.repeat,
+        seed=args.seed,
+        sets_page=args.sets_page,
+        videos_page=args.videos_page,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress HTTP Session Benchmark
+
+Replays the requests of a publishing session against a local stand-in for the WordPress
+REST API and compares standalone ``requests`` calls, which open a new connection every time,
+with the connection-pooled ``WPHTTPSession`` used by the ``WordPress`` class.
+
+Each post of the session uploads a thumbnail, attaches its metadata, creates the post
+and publishes it::
+
+    python3 -m benchmarks.wp_http_session --posts 50
+
+The stand-in server speaks plain HTTP on the loopback interface with an artificial
+``--latency`` per request, so the measured savings only account for the TCP handshake,
+remote sites also save the TLS handshake on every reused connection.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import argparse
+import itertools
+import json
+import statistics
+import threading
+import time
+
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Set, Tuple
+
+# Third-party imports
+import requests
+from requests.auth import HTTPBasicAuth
+
+# Local implementations
+from wordpress.client import WPHTTPSession
+
+
+class StandInWordPress:
+    """
+    Minimal threaded HTTP/1.1 server answering the publishing endpoints of the REST API.
+
+    Attributes:
+        base_url (str): REST API base URL of the server.
+        connections (set[tuple[str, int]]): Client addresses of the accepted connections.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Starts the server on a free loopback port.
+
+        :param latency: ``float`` -> Seconds added to every response.
+        """
+        self.connections: Set[Tuple[str, int]] = set()
+        ids = itertools.count(1)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, Nagle's algorithm would
+            # delay the body of every response on a kept-alive connection.
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                server.connections.add(self.client_address)
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                time.sleep(latency)
+                post_id = next(ids)
+                body = json.dumps(
+                    {
+                        "id": post_id,
+                        "slug": f"post-{post_id}",
+                        "status": "publish",
+                        "source_url": f"https://example.com/{post_id}.jpg",
+                    }
+                ).encode()
+                self.send_response(201)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = (
+            f"http://127.0.0.1:{self._server.server_address[1]}/wp-json/wp/v2"
+        )
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def publishing_session(
+    post: Callable[..., requests.Response], base_url: str, num_posts: int
+) -> List[float]:
+    """
+    Sends the requests of a publishing session.
+
+    :param post: ``Callable`` -> Function sending a ``POST`` request to a URL.
+    :param base_url: ``str`` -> REST API base URL.
+    :param num_posts: ``int`` -> Number of posts in the session.
+    :return: ``list[float]`` -> Latency in seconds of every request.
+    """
+    thumbnail = b"\xff\xd8" + bytes(48 * 1024)
+    latencies: List[float] = []
+    for num in range(num_posts):
+        calls = (
+            (f"{base_url}/media", {"files": {"file": ("thumb.jpg", thumbnail)}}),
+            (f"{base_url}/media/{num}", {"json": {"alt_text": f"Thumbnail {num}"}}),
+            (
+                f"{base_url}/posts",
+                {"json": {"title": f"Post {num}", "status": "draft"}},
+            ),
+            (f"{base_url}/posts/{num}", {"json": {"status": "publish"}}),
+        )
+        for url, kwargs in calls:
+            start = time.perf_counter()
+            post(url, **kwargs).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run(num_posts: int, latency: float = 0.0) -> None:
+    """
+    Prints the per-call latency of both clients.
+
+    :param num_posts: ``int`` -> Number of posts in the session.
+    :param latency: ``float`` -> Seconds added by the server to every response.
+    :return: ``None``
+    """
+    auth = HTTPBasicAuth("benchmark", "app password")
+    print(
+        f"{'client':<12} {'calls':>6} {'mean ms':>8} {'p95 ms':>8} {'total s':>8} {'conns':>6}"
+    )
+    for client in ("standalone", "session"):
+        server = StandInWordPress(latency=latency)
+        if client == "standalone":
+            latencies = publishing_session(
+                lambda url, **kw: requests.post(url, auth=auth, timeout=60, **kw),
+                server.base_url,
+                num_posts,
+            )
+        else:
+            with WPHTTPSession(server.base_url, "benchmark", "app password") as http:
+                latencies = publishing_session(http.post, server.base_url, num_posts)
+        server.close()
+        print(
+            f"{client:<12} {len(latencies):>6} {statistics.mean(latencies) * 1000:>8.2f}"
+            f" {statistics.quantiles(latencies, n=20)[-1] * 1000:>8.2f}"
+            f" {sum(latencies):>8.2f} {len(server.connections):>6}"
+        )
+
+
+def parse_args() -> ArgumentParser:
+    args_parser = argparse.ArgumentParser(
+        description="Compare standalone requests with the pooled WordPress HTTP session"
+    )
+    args_parser.add_argument(
+        "--posts", type=int, default=50, help="Posts in the publishing session."
+    )
+    args_parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds added by the stand-in server to every response.",
+    )
+    return args_parser
+
+
+def main():
+    args = parse_args().parse_args()
+    run(args.posts, latency=args.latency)
+
+
+if __name__ == "__main__":
+    main()
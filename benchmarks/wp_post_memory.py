@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Post Memory Benchmark
+
+Measures the memory held by the WordPress post store with synthetic posts shaped like the
+REST API output, comparing plain post dictionaries with ``WPostRecord`` objects.
+Both the full post and the ``_fields`` projection used for cache builds are measured::
+
+    python3 -m benchmarks.wp_post_memory --posts 20000
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List
+
+# Local implementations
+from wordpress.cache import WPostRecord
+
+
+def synthetic_post(post_id: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Builds a post dictionary with the keys and value sizes of a typical REST API post.
+
+    :param post_id: ``int`` -> Post ID.
+    :param rng: ``random.Random`` -> Seeded random generator.
+    :return: ``dict`` -> Post dictionary.
+    """
+    tags = rng.sample(range(1, 400), rng.randint(3, 12))
+    categories = rng.sample(range(1, 30), rng.randint(1, 3))
+    title = f"Synthetic post number {post_id} about topic {rng.randint(1, 500)}"
+    slug = title.lower().replace(" ", "-")
+    keywords = [f"keyword {tag}" for tag in tags]
+    return {
+        "id": post_id,
+        "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00",
+        "modified": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00",
+        "slug": slug,
+        "status": "publish",
+        "link": f"https://example.com/{slug}/",
+        "title": {"rendered": title},
+        "excerpt": {"rendered": f"<p>{title} excerpt. {'Lorem ipsum ' * 8}</p>\n"},
+        "tags": tags,
+        "categories": categories,
+        "class_list": [
+            f"post-{post_id}",
+            "post",
+            "type-post",
+            "status-publish",
+            "format-standard",
+            "hentry",
+            *(f"category-category-{cat}" for cat in categories),
+            *(f"tag-tag-{tag}" for tag in tags),
+        ],
+        "yoast_head_json": {
+            "title": f"{title} - Example",
+            "description": f"{title}. {'Dolor sit amet ' * 6}",
+            "schema": {"@graph": [{"@type": "Article", "keywords": keywords}]},
+        },
+    }
+
+
+def projected_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    :param post: ``dict`` -> Full post dictionary.
+    :return: ``dict`` -> Post restricted to the keys requested with ``_fields`` for the cache.
+    """
+    projected = {
+        key: post[key]
+        for key in (
+            "id",
+            "date",
+            "modified",
+            "slug",
+            "link",
+            "title",
+            "excerpt",
+            "class_list",
+            "tags",
+            "categories",
+        )
+    }
+    yoast = post["yoast_head_json"]
+    projected["yoast_head_json"] = {
+        key: yoast[key] for key in ("title", "description", "schema")
+    }
+    return projected
+
+
+def measure(build: Callable[[], List[Any]]) -> int:
+    """
+    :param build: ``Callable[[], list]`` -> Builds the objects to be measured.
+    :return: ``int`` -> Bytes still allocated by the built objects.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def run(num_posts: int, seed: int = 42) -> None:
+    """
+    Prints the memory used per post by both representations.
+
+    :param num_posts: ``int`` -> Number of synthetic posts.
+    :param seed: ``int`` -> Random seed.
+    :return: ``None``
+    """
+    rng = random.Random(seed)
+    # Posts are serialized first, so that the JSON parser produces the same
+    # fresh objects it would produce when loading a cache file.
+    payloads = {
+        "full": json.dumps([synthetic_post(idd, rng) for idd in range(num_posts)]),
+    }
+    payloads["projected"] = json.dumps(
+        [projected_post(post) for post in json.loads(payloads["full"])]
+    )
+
+    print(f"{'shape':<10} {'dict B/post':>12} {'record B/post':>14} {'ratio':>7}")
+    for shape, payload in payloads.items():
+        dict_size = measure(lambda: json.loads(payload))
+        record_size = measure(
+            lambda: [WPostRecord(post) for post in json.loads(payload)]
+        )
+        print(
+            f"{shape:<10} {dict_size // num_posts:>12} {record_size // num_posts:>14}"
+            f" {dict_size / record_size:>6.1f}x"
+        )
+
+
+def parse_args() -> ArgumentParser:
+    args_parser = argparse.ArgumentParser(
+        description="Compare the memory footprint of cached WordPress posts"
+    )
+    args_parser.add_argument(
+        "--posts", type=int, default=20000, help="Number of synthetic posts."
+    )
+    args_parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    return args_parser
+
+
+def main():
+    args = parse_args().parse_args()
+    run(args.posts, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Bulk Ingest Utilities
+
+This module contains the streaming ingest layer shared by the feed dump parsers.
+Dump files are read lazily, one line at a time, split with a splitter built once per dump,
+and the parsed rows are written to SQLite with ``executemany`` in fixed-size chunks inside
+a single explicit transaction. While a load runs, the database uses the ``WAL`` journal with
+``synchronous=NORMAL``; indexes are created once the rows are in place, and the default
+journal is restored afterwards so that the resulting ``.db`` artifact is a single file.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import itertools
+import logging
+import operator
+import sqlite3
+import urllib.parse
+
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, Tuple
+
+# Rows written per ``executemany`` call.
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def iter_dump_lines(
+    path: str | Path, skip_header: bool = False, encoding: str = "utf-8"
+) -> Iterator[str]:
+    """Yields the lines of a dump file one at a time, without line terminators.
+    Blank lines are skipped.
+
+    :param path: ``str | Path`` path to the dump file.
+    :param skip_header: ``bool`` skip the first line of the file. Default ``False``
+    :param encoding: ``str`` file encoding. Default ``"utf-8"``
+    :return: ``Iterator[str]``
+    """
+    with open(path, "r", encoding=encoding) as dump_file:
+        if skip_header:
+            next(dump_file, None)
+        for line in dump_file:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+
+def make_splitter(sep: str) -> Callable[[str], List[str]]:
+    """Builds the field splitter of a dump once, instead of decoding the separator for every line.
+
+    :param sep: ``str`` field separator, URL-encoded separators (e.g. ``%7C``) are decoded.
+    :return: ``Callable[[str], list[str]]`` function that splits a line into fields.
+    """
+    return operator.methodcaller("split", urllib.parse.unquote(sep))
+
+
+def bulk_insert(
+    db_conn: sqlite3.Connection,
+    insert_sql: str,
+    rows: Iterable[Sequence[Any]],
+    indexes: Iterable[Tuple[str, str, Sequence[str]]] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Writes rows with ``executemany`` in chunks of ``chunk_size`` inside a single transaction.
+    The ``rows`` iterable is consumed lazily, so only one chunk is held in memory at a time.
+
+    If the load fails, the transaction is rolled back and the exception is raised again.
+
+    :param db_conn: ``sqlite3.Connection`` target database, its tables must already exist.
+    :param insert_sql: ``str`` parameterized ``INSERT`` statement, e.g. ``"INSERT INTO sets VALUES(?, ?, ?)"``
+    :param rows: ``Iterable[Sequence]`` rows to insert.
+    :param indexes: ``Iterable[tuple[str, str, Sequence[str]]]`` ``(index, table, columns)`` created after the load.
+    :param chunk_size: ``int`` rows per ``executemany`` call. Default ``DEFAULT_CHUNK_SIZE``
+    :return: ``int`` number of rows inserted.
+    """
+    # Journal settings cannot change inside a transaction, e.g. after a ``CREATE TABLE``.
+    if db_conn.in_transaction:
+        db_conn.commit()
+    journal_mode = db_conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = db_conn.execute("PRAGMA synchronous").fetchone()[0]
+    db_conn.execute("PRAGMA journal_mode=WAL")
+    db_conn.execute("PRAGMA synchronous=NORMAL")
+
+    total_rows = 0
+    rows = iter(rows)
+    try:
+        db_conn.execute("BEGIN")
+        while chunk := list(itertools.islice(rows, chunk_size)):
+            db_conn.executemany(insert_sql, chunk)
+            total_rows += len(chunk)
+        for index_name, table, columns in indexes:
+            db_conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({', '.join(columns)})"
+            )
+        db_conn.commit()
+    except BaseException:
+        db_conn.rollback()
+        raise
+    finally:
+        db_conn.execute(f"PRAGMA synchronous={synchronous}")
+        db_conn.execute(f"PRAGMA journal_mode={journal_mode}")
+
+    logging.info(f"Bulk insert of {total_rows} rows: {insert_sql.split('(')[0]}")
+    return total_rows
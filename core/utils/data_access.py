@@ -12,18 +12,34 @@ Email: yohamg@programmer.net
 __author__ = "Yoham Gabriel Urbine@GitHub"
 __author_email__ = "yohamg@programmer.net"
 
+import http.client
+import logging
 import os
+import queue
 import sqlite3
+import threading
 import urllib
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
 from sqlite3 import Connection, Cursor
-from typing import Any, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict, Tuple
 
 from bs4 import BeautifulSoup
 from requests_oauthlib import OAuth2Session
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
 
 # Local imports
 from core.utils.file_system import is_parent_dir_required, filename_select
+from core.utils.strings import clean_filename
+
+# Bytes read from the socket per iteration in ``download_to_file``.
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Leases served by a pooled webdriver session before it is replaced.
+WEBDRIVER_MAX_USES = 20
 
 
 def access_url_bs4(url_to_bs4: str) -> BeautifulSoup:
@@ -56,6 +72,79 @@ def access_url(url_raw: str) -> Any:
     return page
 
 
+def download_to_file(
+    url_raw: str,
+    filename: str,
+    folder: str,
+    extension: str,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    retries: int = 3,
+    timeout: float = 60,
+) -> Path:
+    """Downloads a URL straight to disk in chunks, without loading the response into memory.
+
+    The first request accepts ``gzip`` transfer encoding and the body is decompressed on the fly.
+    Data is written to a ``.part`` file that is renamed once the download is complete;
+    if the connection drops, the download resumes from the bytes already written with a
+    ``Range`` request, or starts over if the server does not support ranges.
+
+    :param url_raw: ``str`` URL
+    :param filename: ``str`` name of the file, with or without extension.
+    :param folder: ``str`` destination folder for the file.
+    :param extension: ``str`` file extension that will be enforced for the file.
+    :param chunk_size: ``int`` bytes read per iteration. Default ``DOWNLOAD_CHUNK_SIZE``
+    :param retries: ``int`` attempts to resume after a network error. Default ``3``
+    :param timeout: ``float`` socket timeout in seconds. Default ``60``
+    :return: ``Path`` of the downloaded file.
+    """
+    file_path = Path(folder).absolute() / clean_filename(filename, extension)
+    part_path = file_path.with_name(f"{file_path.name}.part")
+    user_agent = "Mozilla/5.0 (Windows; U; Windows NT 5.1; en-US; rv:1.9.0.7) Gecko/2009021910 Firefox/3.0.7"
+    attempt = 0
+    while True:
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"User-Agent": user_agent}
+        if offset:
+            # Ranges refer to the encoded body, so resumed requests ask for the identity encoding.
+            headers.update({"Range": f"bytes={offset}-", "Accept-Encoding": "identity"})
+        else:
+            headers["Accept-Encoding"] = "gzip"
+        request = urllib.request.Request(url_raw, None, headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                if offset and response.status != 206:
+                    offset = 0
+                decoder = (
+                    zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    if response.headers.get("Content-Encoding", "").lower() == "gzip"
+                    else None
+                )
+                with open(part_path, "ab" if offset else "wb") as part_file:
+                    while chunk := response.read(chunk_size):
+                        part_file.write(decoder.decompress(chunk) if decoder else chunk)
+                    if decoder:
+                        part_file.write(decoder.flush())
+                # ``read(amt)`` returns an empty chunk instead of raising when the connection drops.
+                if response.length or (decoder and not decoder.eof):
+                    raise http.client.IncompleteRead(b"")
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                # The partial file already holds the whole body.
+                break
+            if e.code < 500 or attempt >= retries:
+                raise
+        except (http.client.HTTPException, OSError):
+            if attempt >= retries:
+                raise
+        attempt += 1
+        logging.warning(f"Download of {url_raw} interrupted, retry {attempt}/{retries}")
+
+    os.replace(part_path, file_path)
+    logging.info(f"Downloaded {file_path.stat().st_size} bytes to {file_path}")
+    return file_path
+
+
 def fetch_data_sql(
     sql_query: str, db_cursor: sqlite3.Cursor
 ) -> Optional[list[tuple[str | int, ...]]]:
@@ -205,3 +294,157 @@ class WebDriverFactory:
         if self._gecko:
             return self._get_gecko_webdriver()
         return self._get_chrome_webdriver()
+
+
+class WebDriverPool:
+    """
+    Keeps up to ``size`` webdriver sessions warm and leases them one at a time, so that
+    flows that need a browser do not pay for its startup on every call.
+
+    Sessions are started on demand (or ahead of time with ``warm()``). Between leases,
+    extra windows are closed and the cookies and storage of the session are cleared.
+    A session is replaced after ``max_uses`` leases, or as soon as it cannot be reset,
+    e.g. because the browser crashed.
+
+    :param factory: ``WebDriverFactory`` that starts the sessions.
+    :param size: ``int`` maximum number of sessions. Default ``1``.
+    :param max_uses: ``int`` leases served by a session before it is replaced. Default ``WEBDRIVER_MAX_USES``.
+    """
+
+    def __init__(
+        self,
+        factory: WebDriverFactory,
+        size: int = 1,
+        max_uses: int = WEBDRIVER_MAX_USES,
+    ):
+        self._factory = factory
+        self._size = max(size, 1)
+        self._max_uses = max(max_uses, 1)
+        # Idle sessions and the number of leases each one has served.
+        self._idle: queue.LifoQueue[Tuple[WebDriver, int]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self._size)
+
+    def warm(self) -> None:
+        """Starts the sessions that are missing to have ``size`` idle sessions.
+        Call it before leasing, it waits for every session to be idle.
+        """
+        leased: List[Tuple[WebDriver, int]] = []
+        try:
+            for _ in range(self._size):
+                self._slots.acquire()
+                try:
+                    leased.append(self._idle.get_nowait())
+                except queue.Empty:
+                    try:
+                        leased.append((self._factory.get_instance(), 0))
+                    except BaseException:
+                        self._slots.release()
+                        raise
+        finally:
+            for driver, uses in leased:
+                self._idle.put((driver, uses))
+                self._slots.release()
+
+    @contextmanager
+    def lease(self) -> Iterator[WebDriver]:
+        """Leases a session, waiting for one to be returned if all of them are in use.
+        The session goes back to the pool when the block exits, even if it raised.
+
+        :return: ``Iterator[WebDriver]`` -> Selenium ``webdriver`` instance.
+        """
+        self._slots.acquire()
+        try:
+            try:
+                driver, uses = self._idle.get_nowait()
+            except queue.Empty:
+                driver, uses = self._factory.get_instance(), 0
+            try:
+                yield driver
+            finally:
+                self._release(driver, uses + 1)
+        finally:
+            self._slots.release()
+
+    def _release(self, driver: WebDriver, uses: int) -> None:
+        if uses >= self._max_uses:
+            logging.info(f"Recycling webdriver session after {uses} leases")
+            self._quit(driver)
+            return None
+        try:
+            self._reset(driver)
+        except Exception as e:
+            # A dead browser may also fail in the HTTP client, e.g. with urllib3's ``MaxRetryError``.
+            logging.warning(f"Recycling webdriver session that failed to reset: {e!r}")
+            self._quit(driver)
+            return None
+        self._idle.put((driver, uses))
+        return None
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> None:
+        """Clears the state a lease leaves behind. Storage is cleared for the origin
+        of the current page, the last site the flow visited.
+
+        :param driver: ``WebDriver`` session to reset.
+        :return: ``None``
+        """
+        # Raises if the browser is gone, which marks the session as crashed.
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except WebDriverException:
+            # Pages like ``about:blank`` do not have storage.
+            pass
+        driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium can also clear the cookies of the sites that are not open.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.implicitly_wait(0)
+        driver.get("about:blank")
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Failed to quit webdriver session: {e!r}")
+
+    def close(self) -> None:
+        """Quits the idle sessions."""
+        while True:
+            try:
+                driver, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            self._quit(driver)
+
+    def __enter__(self) -> "WebDriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+@contextmanager
+def webdriver_lease(
+    pool: Optional[WebDriverPool], factory: WebDriverFactory
+) -> Iterator[WebDriver]:
+    """Leases a session from ``pool`` or, without a pool, starts a single-use session
+    with ``factory`` that is quit when the block exits.
+
+    :param pool: ``WebDriverPool`` or ``None``.
+    :param factory: ``WebDriverFactory`` for the single-use session.
+    :return: ``Iterator[WebDriver]`` -> Selenium ``webdriver`` instance.
+    """
+    if pool is not None:
+        with pool.lease() as driver:
+            yield driver
+    else:
+        with factory.get_instance() as driver:
+            yield driver
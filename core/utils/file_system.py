@@ -25,8 +25,9 @@ import sqlite3
 import stat
 import subprocess
 from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Any, List, Dict, Deque, Union
+from typing import Optional, Any, List, Dict, Deque, Iterator, Union
 
 
 # Local imports
@@ -276,6 +277,40 @@ def remove_if_exists(fname: str | Path) -> bool:
     return False
 
 
+@contextmanager
+def staged_file(file_path: str | Path) -> Iterator[Path]:
+    """Yields a temporary path next to ``file_path`` and atomically moves it into place
+    once the block completes. If the block raises, the temporary file is removed and
+    the existing ``file_path``, if any, is left untouched.
+
+    :param file_path: ``str`` | ``Path`` -> Final file path.
+    :return: ``Iterator[Path]`` -> Temporary path to write to.
+    """
+    file_path = Path(file_path)
+    staging_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    remove_if_exists(staging_path)
+    try:
+        yield staging_path
+    except BaseException:
+        remove_if_exists(staging_path)
+        raise
+    os.replace(staging_path, file_path)
+
+
+def remove_staged_files(dirname: str | Path, pid: int) -> List[str]:
+    """Removes the temporary files that ``staged_file`` left in ``dirname`` for a process
+    that was terminated before it could clean up, including SQLite journals.
+
+    :param dirname: ``str`` | ``Path`` -> Directory of the final files.
+    :param pid: ``int`` -> PID of the terminated process.
+    :return: ``list[str]`` -> Paths of the removed files.
+    """
+    removed = glob.glob(os.path.join(glob.escape(str(dirname)), f"*.{pid}.tmp*"))
+    for staging_path in removed:
+        remove_if_exists(staging_path)
+    return removed
+
+
 def search_files_by_ext(
     extension: str,
     folder: str | Path,
@@ -20,6 +20,10 @@ from calendar import month_abbr, month_name
 from configparser import ConfigParser
 from datetime import date
 
+# Third-party imports
+import lxml.html
+from bs4 import BeautifulSoup
+
 from core.utils.strings import clean_filename
 from core.utils.interfaces import WordFilter
 from core.exceptions.config_exceptions import ConfigFileNotFound, SectionsNotFoundError
@@ -91,6 +95,25 @@ def parse_date_to_iso(
     return date.fromisoformat(year + month_num + day)
 
 
+def html_document(source_html: str | bytes | BeautifulSoup) -> lxml.html.HtmlElement:
+    """Parses an HTML page with ``lxml``, which is several times faster than the pure Python
+    ``html.parser`` backend of BeautifulSoup on large pages.
+
+    :param source_html: ``str`` | ``bytes`` page source, or a ``BeautifulSoup`` object that is serialized first.
+    :return: ``lxml.html.HtmlElement`` root of the document.
+    """
+    if isinstance(source_html, BeautifulSoup):
+        source_html = str(source_html)
+    if isinstance(source_html, str):
+        # lxml refuses unicode strings that declare their own encoding.
+        source_html = source_html.encode("utf-8")
+    if not source_html.strip():
+        source_html = b"<html></html>"
+    return lxml.html.document_fromstring(
+        source_html, parser=lxml.html.HTMLParser(encoding="utf-8")
+    )
+
+
 def config_section_parser(config_filename: str, target_hint: str):
     """Parse a configuration file that contains a specific string in one of its sections and retrieve options
     under that section.
@@ -18,12 +18,13 @@ __author_email__ = "yohamg@programmer.net"
 
 import base64
 import hashlib
+import html
 import random
 import re
 import string
 from datetime import date
 from re import Pattern
-from typing import Optional
+from typing import Container, Iterable, List, Optional
 
 
 def clean_filename(filename: str, extension: str = "") -> str:
@@ -228,3 +229,35 @@ def generate_random_str(k: int) -> str:
     letters = string.ascii_letters
     random_string = "".join(random.choices(letters, k=k))
     return random_string
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a post title so that it can be compared with titles from other sources.
+    HTML entities are unescaped, whitespace is collapsed and the result is case-folded.
+
+    :param title: ``str`` title as rendered by WordPress or stored in a partner database.
+    :return: ``str`` normalized title
+    """
+    return " ".join(html.unescape(title).split()).casefold()
+
+
+def match_titles(
+    titles: Iterable[Optional[str]], normalized_titles: Container[str]
+) -> List[bool]:
+    """Looks up many titles in a set of normalized titles in a single pass.
+    Titles that appear more than once are only normalized once.
+
+    :param titles: ``Iterable[str | None]`` titles to look up, ``None`` never matches.
+    :param normalized_titles: ``Container[str]`` normalized titles, e.g. a ``set``.
+    :return: ``List[bool]`` True for every title found in ``normalized_titles``
+    """
+    found = {}
+    mask = []
+    for title in titles:
+        if title is None:
+            mask.append(False)
+            continue
+        if (match := found.get(title)) is None:
+            match = found[title] = normalize_title(title) in normalized_titles
+        mask.append(match)
+    return mask
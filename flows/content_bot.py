@@ -79,6 +79,7 @@ class MediaSourceContentBot(ContentBotFlow):
             self._select_guardian()
             self._run_query()
             self._filter_published()
+            self._filter_near_duplicates()
             self._thumbnails_dir_setup()
             if self._load_assets:
                 self._parse_assets()
@@ -13,16 +13,20 @@ Key Features:
 - Video metadata extraction and processing
 - Thumbnail generation and optimization
 - Support for selective updates using partner hints
+- Parallel partner refresh in worker processes with a per-partner timeout
+- Dump retrieval over plain HTTP, with the browser flows as a fallback
 - Headless browser operation support
 
 Main Functionality:
 - Scrapes and parses video content from MediaSource
-- Updates local SQLite databases with new content
+- Updates local SQLite databases with new content, each database replaces the previous
+  one atomically once it has been written, so a failed partner keeps its last artifacts
 - Handles media downloads and storage
 - Provides progress tracking and logging
 
 Dependencies:
-- Selenium: For web scraping and content extraction
+- Requests and lxml: For dump retrieval over HTTP
+- Selenium: For web scraping and content extraction (fallback)
 - SQLite: For local content storage
 - Rich: For enhanced console output
 
@@ -39,46 +43,116 @@ __author__ = "Yoham Gabriel Urbine@GitHub"
 __author_email__ = "yohamg@programmer.net"
 
 import logging
+import multiprocessing
+import queue
+import re
+import shutil
 import sqlite3
 import time
 import os
 import warnings
 
-from argparse import ArgumentParser
-from tempfile import TemporaryDirectory
-from typing import Tuple
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from tempfile import TemporaryDirectory, mkdtemp
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 
 from core.models.file_system import ApplicationPath
-from core.utils.data_access import WebDriverFactory
+from core.utils.data_access import WebDriverFactory, WebDriverPool
 from core.utils.file_system import (
     exists_ok,
     logging_setup,
     load_from_file,
-    remove_if_exists,
+    remove_staged_files,
+    staged_file,
 )
 from core.utils.helpers import get_duration
 from core.utils.strings import clean_filename
 from workflows.tasks import (
     get_vid_dump_flow,
     get_set_source_flow,
+    MediaSourceClient,
     parse_txt_dump_chain,
+    refresh_txt_dump_db,
     db_generate,
 )
 from workflows.utils.logging import ConsoleStyle
-from workflows.exceptions import DataSourceUpdateError
+from workflows.exceptions import DataSourceUpdateError, MediaSourceClientError
+
+
+# Seconds a partner refresh may take before its worker process is terminated.
+DEFAULT_PARTNER_TIMEOUT = 1800
+
+# Session cookies of the HTTP client, kept in the temporary directory between runs.
+# Every partner has its own session, so that parallel workers do not share the partner
+# selection that the server stores in the session.
+MEDIA_SOURCE_COOKIES = "media-source-cookies-{hint}.json"
+
+
+@dataclass(frozen=True)
+class PartnerRefresh:
+    """
+    Outcome of the refresh of a single partner offer.
+
+    :param hint: ``str`` partner hint
+    :param success: ``bool`` ``True`` if the video and photo set databases were updated.
+    :param duration: ``float`` seconds taken by the refresh.
+    :param error: ``str`` reason of the failure, if any.
+    """
+
+    hint: str
+    success: bool
+    duration: float
+    error: Optional[str] = None
+
+
+def refresh_partner(
+    hint: str,
+    cli_args: Namespace,
+    img_optimize: bool,
+    temp_root: str,
+    results: multiprocessing.Queue,
+) -> None:
+    """Worker process entry point: refreshes the databases of a single partner offer
+    and puts a ``PartnerRefresh`` in the ``results`` queue. Exceptions are reported
+    as a failed refresh, so that they do not affect other partners.
+
+    :param hint: ``str`` partner hint
+    :param cli_args: ``Namespace`` command line arguments of the parent process.
+    :param img_optimize: ``bool`` disable image loading in the webdriver.
+    :param temp_root: ``str`` temporary directory of this partner, removed by the parent process.
+    :param results: ``multiprocessing.Queue`` queue shared with the parent process.
+    :return: ``None``
+    """
+    start = time.time()
+    error = None
+    try:
+        updater = MediaSourceUpdater(img_optimize=img_optimize, cli_args=cli_args)
+        temp_dir = TemporaryDirectory(dir=temp_root)
+        try:
+            success = updater._process_hint(temp_dir, hint)
+        finally:
+            temp_dir.cleanup()
+    except Exception as e:
+        logging.error(f"Refresh of partner {hint} failed: {e!r}")
+        success, error = False, repr(e)
+    if not success and error is None:
+        error = "No entries were stored"
+    results.put(PartnerRefresh(hint, success, time.time() - start, error))
 
 
 class MediaSourceUpdater:
-    def __init__(self, img_optimize: bool = True):
+    def __init__(self, img_optimize: bool = True, cli_args: Optional[Namespace] = None):
         self._start_time = time.time()
         self._console = Console()
-        self._cli_args = None
+        self._cli_args = cli_args
         self._img_optimize = img_optimize
-        self._temp_dir = TemporaryDirectory(dir=exists_ok(ApplicationPath.TEMPORARY))
         # --- Deferred assignment ---
         self._hints = None
+        self._client: Optional[MediaSourceClient] = None
+        self._webdrivers: Optional[WebDriverPool] = None
 
     def cli_arg_updater(self) -> None:
         """
@@ -116,6 +190,32 @@ class MediaSourceUpdater:
             "--silent", action="store_true", help="Ignore user warnings"
         )
 
+        arg_parser.add_argument(
+            "--webdriver",
+            action="store_true",
+            help="Retrieve the dumps with the browser instead of the HTTP client.",
+        )
+
+        arg_parser.add_argument(
+            "--persistent",
+            action="store_true",
+            help="Refresh one durable database per partner instead of creating dated databases.",
+        )
+
+        arg_parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of partners refreshed in parallel worker processes.",
+        )
+
+        arg_parser.add_argument(
+            "--timeout",
+            type=int,
+            default=DEFAULT_PARTNER_TIMEOUT,
+            help="Seconds a partner refresh may take before it is terminated.",
+        )
+
         self._cli_args = arg_parser.parse_args()
 
     def _logging_setup(self):
@@ -141,18 +241,56 @@ class MediaSourceUpdater:
             justify="center",
         )
 
+    def _http_client(self, hint: str) -> MediaSourceClient:
+        if self._client is None:
+            self._client = MediaSourceClient.from_config(
+                cookie_path=os.path.join(
+                    exists_ok(ApplicationPath.TEMPORARY),
+                    MEDIA_SOURCE_COOKIES.format(hint=re.sub(r"\W+", "-", hint)),
+                )
+            )
+        return self._client
+
+    def _webdriver_pool(self, temp_dir) -> WebDriverPool:
+        # Browsers are only started if the HTTP client falls back to the webdriver flows,
+        # and the session is reused by the retries and the photo set flow.
+        if self._webdrivers is None:
+            self._webdrivers = WebDriverPool(
+                WebDriverFactory(
+                    temp_dir.name,
+                    headless=self._cli_args.headless,
+                    gecko=self._cli_args.gecko,
+                    no_imgs=self._img_optimize,
+                )
+            )
+        return self._webdrivers
+
+    def _get_vid_dump(self, temp_dir, hint) -> str:
+        if not self._cli_args.webdriver:
+            try:
+                return self._http_client(hint).get_vid_dump(hint, temp_dir.name)
+            except MediaSourceClientError as e:
+                logging.warning(f"HTTP dump retrieval failed, using the webdriver: {e}")
+        with self._webdriver_pool(temp_dir).lease() as driver:
+            return get_vid_dump_flow(
+                driver,
+                partner_hint=hint,
+                temp_dir_p=temp_dir.name,
+            )
+
+    def _get_set_source(self, temp_dir, hint):
+        if not self._cli_args.webdriver:
+            try:
+                return self._http_client(hint).get_set_source(hint)
+            except MediaSourceClientError as e:
+                logging.warning(
+                    f"HTTP photo set retrieval failed, using the webdriver: {e}"
+                )
+        with self._webdriver_pool(temp_dir).lease() as driver:
+            return get_set_source_flow(driver, partner_hint=hint)
+
     def _fetch_dump_txt(self, temp_dir, hint) -> Tuple[str, int]:
-        webdriver = WebDriverFactory(
-            temp_dir.name,
-            headless=self._cli_args.headless,
-            gecko=self._cli_args.gecko,
-            no_imgs=self._img_optimize,
-        )
-        fetched_filename = get_vid_dump_flow(
-            webdriver.get_instance(),
-            partner_hint=hint,
-            temp_dir_p=temp_dir.name,
-        )
+        fetched_filename = self._get_vid_dump(temp_dir, hint)
         dump_txt_filename = load_from_file(
             fetched_filename, "txt", dirname=temp_dir.name, parent=self._cli_args.parent
         )
@@ -171,11 +309,7 @@ class MediaSourceUpdater:
             retry_offset += 2
             retries += 1
 
-            fetched_filename = get_vid_dump_flow(
-                webdriver.get_instance(),
-                partner_hint=hint,
-                temp_dir_p=temp_dir.name,
-            )
+            fetched_filename = self._get_vid_dump(temp_dir, hint)
             dump_txt_filename = load_from_file(
                 fetched_filename,
                 "txt",
@@ -190,15 +324,7 @@ class MediaSourceUpdater:
             raise DataSourceUpdateError("Failed to fetch dump file")
 
     def _fetch_set_source_f(self, temp_dir, hint):
-        webdriver = WebDriverFactory(
-            temp_dir.name,
-            headless=self._cli_args.headless,
-            gecko=self._cli_args.gecko,
-            no_imgs=self._img_optimize,
-        )
-        photoset_source = get_set_source_flow(
-            webdriver.get_instance(), partner_hint=hint
-        )
+        photoset_source = self._get_set_source(temp_dir, hint)
         retry_offset = 3
         retries = 0
         while len(photoset_source[0]) == 0:
@@ -212,9 +338,7 @@ class MediaSourceUpdater:
             )
             retries += 1
 
-            photoset_source = get_set_source_flow(
-                webdriver.get_instance(), partner_hint=hint
-            )
+            photoset_source = self._get_set_source(temp_dir, hint)
 
         if len(photoset_source[0]) > 0:
             return self._parse_store_set_dump(photoset_source)
@@ -222,39 +346,44 @@ class MediaSourceUpdater:
             raise DataSourceUpdateError("Failed to fetch photo set source file")
 
     def _parse_store_vid_dump(self, temp_dir_name: str, filename: str):
+        if self._cli_args.persistent:
+            return self._refresh_vid_dump(temp_dir_name, filename)
         db_name = clean_filename(filename, "db")
         db_path = os.path.join(exists_ok(ApplicationPath.ARTIFACTS), db_name)
-        remove_if_exists(db_path)
-        db_conn = sqlite3.connect(db_path)
-        cursor = db_conn.cursor()
-        logging.info(f"Created database {db_name} at {db_path}")
-        cursor.execute("BEGIN TRANSACTION")
-        cursor.execute(
+        # The previous database is only replaced after a successful load.
+        with staged_file(db_path) as staging_path:
+            db_conn = sqlite3.connect(staging_path)
+            cursor = db_conn.cursor()
+            logging.info(f"Created database {db_name} at {staging_path}")
+            cursor.execute("BEGIN TRANSACTION")
+            cursor.execute(
+                """
+            CREATE TABLE
+                videos(
+                title,
+                description,
+                model,
+                tags,
+                date,
+                duration,
+                source_url,
+                thumbnail_url,
+                tracking_url,
+                wp_slug
+                )
             """
-        CREATE TABLE
-            videos(
-            title,
-            description,
-            model,
-            tags,
-            date,
-            duration,
-            source_url,
-            thumbnail_url,
-            tracking_url,
-            wp_slug
             )
-        """
-        )
 
-        parsing_result = parse_txt_dump_chain(
-            filename,
-            db_name,
-            db_conn,
-            cursor,
-            dirname=temp_dir_name,
-            parent=self._cli_args.parent,
-        )
+            parsing_result = parse_txt_dump_chain(
+                filename,
+                db_name,
+                db_conn,
+                cursor,
+                dirname=temp_dir_name,
+                parent=self._cli_args.parent,
+            )
+            if parsing_result[1] == 0:
+                raise DataSourceUpdateError(f"No video entries found in {filename}")
 
         logging.info(
             vid_result
@@ -265,9 +394,29 @@ class MediaSourceUpdater:
         )
         return parsing_result
 
+    def _refresh_vid_dump(self, temp_dir_name: str, filename: str):
+        db_path, stats = refresh_txt_dump_db(
+            filename, dirname=temp_dir_name, parent=self._cli_args.parent
+        )
+        if stats.skipped:
+            vid_result = f"{filename} is unchanged, skipped the refresh of\n{db_path}\n"
+        else:
+            vid_result = (
+                f"{stats.added} new, {stats.updated} updated, {stats.revived} restored and "
+                f"{stats.removed} removed video entries from {filename} in\n{db_path}\n"
+            )
+        logging.info(vid_result)
+        self._console.print(
+            vid_result, style=ConsoleStyle.TEXT_STYLE_ATTENTION.value, justify="left"
+        )
+        return db_path, stats.active
+
     def _parse_store_set_dump(self, parsing_result):
         parsing_photos = db_generate(
-            parsing_result[0], parsing_result[1], parent=self._cli_args.parent
+            parsing_result[0],
+            parsing_result[1],
+            parent=self._cli_args.parent,
+            persistent=self._cli_args.persistent,
         )
 
         logging.info(
@@ -307,22 +456,100 @@ class MediaSourceUpdater:
         return self._fetch_set_source_f(temp_dir, hint)
 
     def _process_hint(self, temp_dir, hint):
-        if self._vid_dump_flow(temp_dir, hint):
-            if self._photoset_dump_flow(temp_dir, hint):
-                return True
-        return False
+        try:
+            if self._vid_dump_flow(temp_dir, hint):
+                if self._photoset_dump_flow(temp_dir, hint):
+                    return True
+            return False
+        finally:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            if self._webdrivers is not None:
+                self._webdrivers.close()
+                self._webdrivers = None
 
     def _flow_start(self):
-        success = True
-        for hint in self._hints:
-            temp = TemporaryDirectory(dir=exists_ok(ApplicationPath.TEMPORARY))
-            success &= self._process_hint(temp, hint)
-            temp.cleanup()
-
-            if not success:
-                raise DataSourceUpdateError(
-                    "One or more tasks failed during the update process"
+        """
+        Refreshes the partners in up to ``--workers`` parallel worker processes.
+        Each refresh runs in its own process and temporary directory, so a failure or
+        a refresh that exceeds ``--timeout`` does not stop the other partners.
+        Terminated workers cannot close their browser, which is left to the webdriver service,
+        and the staged databases they leave in the artifacts directory are removed.
+        """
+        results = multiprocessing.Queue()
+        pending = list(dict.fromkeys(self._hints))
+        running: Dict[str, Tuple[multiprocessing.Process, float, str]] = {}
+        refreshed: Dict[str, PartnerRefresh] = {}
+
+        def drain_results(timeout: float) -> None:
+            try:
+                while True:
+                    result = results.get(timeout=timeout)
+                    refreshed[result.hint] = result
+                    timeout = 0
+            except queue.Empty:
+                pass
+
+        while pending or running:
+            while pending and len(running) < max(self._cli_args.workers, 1):
+                hint = pending.pop(0)
+                temp_root = mkdtemp(dir=exists_ok(ApplicationPath.TEMPORARY))
+                worker = multiprocessing.Process(
+                    target=refresh_partner,
+                    args=(hint, self._cli_args, self._img_optimize, temp_root, results),
+                    name=f"refresh-{hint}",
                 )
+                worker.start()
+                running[hint] = (worker, time.time(), temp_root)
+
+            drain_results(timeout=0.5)
+            for hint, (worker, started, temp_root) in list(running.items()):
+                elapsed = time.time() - started
+                if worker.is_alive() and hint not in refreshed:
+                    if elapsed < self._cli_args.timeout:
+                        continue
+                    worker.terminate()
+                    worker.join()
+                    for staging_path in remove_staged_files(
+                        exists_ok(ApplicationPath.ARTIFACTS), worker.pid
+                    ):
+                        logging.info(f"Removed {staging_path} of partner {hint}")
+                    refreshed[hint] = PartnerRefresh(
+                        hint, False, elapsed, f"Timed out after {elapsed:.0f}s"
+                    )
+                elif hint not in refreshed:
+                    # The result may still be in transit after the worker exits.
+                    drain_results(timeout=1)
+                    refreshed.setdefault(
+                        hint,
+                        PartnerRefresh(
+                            hint, False, elapsed, f"Exit code {worker.exitcode}"
+                        ),
+                    )
+                worker.join()
+                shutil.rmtree(temp_root, ignore_errors=True)
+                del running[hint]
+
+        self._print_summary([refreshed[hint] for hint in dict.fromkeys(self._hints)])
+        if not all(result.success for result in refreshed.values()):
+            raise DataSourceUpdateError(
+                "One or more tasks failed during the update process"
+            )
+
+    def _print_summary(self, results: List[PartnerRefresh]) -> None:
+        for result in results:
+            status = "updated" if result.success else f"failed: {result.error}"
+            logging.info(
+                summary_line := f"{result.hint:<20} {result.duration:>8.1f}s  {status}"
+            )
+            self._console.print(
+                summary_line,
+                style=ConsoleStyle.TEXT_STYLE_ATTENTION.value
+                if result.success
+                else ConsoleStyle.TEXT_STYLE_WARN.value,
+                justify="left",
+            )
 
     def run(self):
         self._setup_instance()
@@ -50,6 +50,7 @@ from core.config.config_factories import (
     image_config_factory,
 )
 from core.models.file_system import ApplicationPath
+from core.utils.data_access import WebDriverFactory, WebDriverPool
 from core.utils.file_system import exists_ok
 from core.utils.interfaces import WordFilter
 
@@ -67,6 +68,20 @@ class MediaSourceGalleryBot(MediaSourceContentBot):
         self._temp_download_dir = TemporaryDirectory(
             prefix="download", dir=exists_ok(ApplicationPath.TEMPORARY)
         )
+        # One browser session serves the downloads of every photo set in this run.
+        self._webdrivers = WebDriverPool(
+            WebDriverFactory(
+                self._temp_download_dir.name,
+                headless=headless_browser,
+                gecko=gecko_enabled,
+            )
+        )
+
+    @property
+    def _content_schema(self):
+        from workflows.tasks.partner_content_db import PHOTO_SET_SCHEMA
+
+        return PHOTO_SET_SCHEMA
 
     def _build_payload(self) -> Dict[str, str | int]:
         from workflows.builders import PhotoPostPayloadBuilder
@@ -96,6 +111,7 @@ class MediaSourceGalleryBot(MediaSourceContentBot):
             parent=self._parent,
             gecko=self._gecko_enabled,
             headless=self._headless_browser,
+            webdrivers=self._webdrivers,
         )
         extract_zip(self._temp_download_dir.name, self._thumbnails_dir.name)
 
@@ -119,6 +135,12 @@ class MediaSourceGalleryBot(MediaSourceContentBot):
         self._wp_post_create()
         return self._add_post_prompt(next_post=True)
 
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            self._webdrivers.close()
+
     def _main_loop(self) -> None:
         for num, photo in enumerate(self._ready_posts):
             (title, *fields) = photo
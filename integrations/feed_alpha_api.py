@@ -14,21 +14,25 @@ __author_email__ = "yohamg@programmer.net"
 
 import argparse
 import datetime
+import logging
 import os.path
 import sqlite3
 import tempfile
-import urllib.parse
 
 from dataclasses import dataclass
 
 # Local implementations
 from core.config.config_factories import feed_alpha_conf_factory
 from core.models.file_system import ApplicationPath
-from core.utils.data_access import access_url_bs4
+from core.utils.bulk_ingest import bulk_insert, iter_dump_lines, make_splitter
+from core.utils.data_access import download_to_file
 from core.utils.strings import clean_filename
-from core.utils.file_system import remove_if_exists, write_to_file, exists_ok
+from core.utils.file_system import remove_if_exists, exists_ok
 from .url_builder import CSVColumns, URLEncode
 
+# Columns of the embed dump: id, title, duration, date, categories, rating, thumbnail, embed and link.
+DUMP_FIELDS = 9
+
 
 @dataclass(frozen=True)
 class FeedAlphaUrl:
@@ -164,50 +168,59 @@ def feed_alpha_dump_parse(filename: str, dirname: str, partner: str, sep: str) -
     """
     db_cur.execute(db_create_table)
 
-    total_entries = 0
-    with open(path, "r", encoding="utf-8") as dump_file:
-        for line in dump_file.readlines():
-            # I don't want to process or count the header of the csv file.
-            if total_entries == 0:
-                total_entries += 1
-            else:
-                line_split = line.split(urllib.parse.unquote(sep))
-                id_ = line_split[0]
-                title = line_split[1]
-                duration = line_split[2]
-                publish_date = line_split[3].split(" ")[0]
-                categories = line_split[4]
-                rating = line_split[5]
-                main_thumbnail = line_split[6]
-                embed_code = line_split[7]
-                website_link = line_split[8]
-
-                # As mentioned in other modules, slugs have to contain the
-                # content type
-                wp_slug = f"{website_link.split('/')[-2:][0]}-{partner}-video"
-
-                all_values = (
-                    id_,
-                    title,
-                    duration,
-                    publish_date,
-                    categories,
-                    rating,
-                    main_thumbnail,
-                    embed_code,
-                    website_link,
-                    wp_slug,
-                )
-
-                db_cur.execute(
-                    "INSERT INTO embeds values(?,?,?,?,?,?,?,?,?,?)",
-                    all_values,
-                )
-                total_entries += 1
-
-    db_conn.commit()
-    db_cur.close()
-    db_conn.close()
+    split_line = make_splitter(sep)
+
+    def iter_rows():
+        malformed = 0
+        # I don't want to process or count the header of the csv file.
+        for line in iter_dump_lines(path, skip_header=True):
+            line_split = split_line(line)
+            # Lines with missing fields (e.g. a truncated last line) are skipped.
+            if len(line_split) < DUMP_FIELDS:
+                malformed += 1
+                continue
+            id_ = line_split[0]
+            title = line_split[1]
+            duration = line_split[2]
+            publish_date = line_split[3].split(" ")[0]
+            categories = line_split[4]
+            rating = line_split[5]
+            main_thumbnail = line_split[6]
+            embed_code = line_split[7]
+            website_link = line_split[8]
+
+            # As mentioned in other modules, slugs have to contain the
+            # content type
+            wp_slug = f"{website_link.split('/')[-2:][0]}-{partner}-video"
+
+            yield (
+                id_,
+                title,
+                duration,
+                publish_date,
+                categories,
+                rating,
+                main_thumbnail,
+                embed_code,
+                website_link,
+                wp_slug,
+            )
+        if malformed:
+            logging.warning(f"Skipped {malformed} malformed lines in {path}")
+
+    try:
+        total_entries = bulk_insert(
+            db_conn,
+            "INSERT INTO embeds values(?,?,?,?,?,?,?,?,?,?)",
+            iter_rows(),
+            indexes=(
+                ("idx_embeds_title", "embeds", ("title",)),
+                ("idx_embeds_wp_slug", "embeds", ("wp_slug",)),
+            ),
+        )
+    finally:
+        db_cur.close()
+        db_conn.close()
     return f"Inserted a total of {total_entries} video entries into {db_name}"
 
 
@@ -221,12 +234,7 @@ def main(*args, **kwargs):
     )
     temp_dir = tempfile.TemporaryDirectory(dir=exists_ok(ApplicationPath.TEMPORARY))
 
-    write_to_file(
-        "feed_alpha-dump",
-        temp_dir.name,
-        "csv",
-        str(access_url_bs4(main_url)),
-    )
+    download_to_file(main_url, "feed_alpha-dump", temp_dir.name, "csv")
 
     result = feed_alpha_dump_parse("feed_alpha-dump", temp_dir.name, "partner_test", URLEncode.PIPE)
 
@@ -14,19 +14,20 @@ __author_email__ = "yohamg@programmer.net"
 
 import argparse
 import datetime
+import logging
 import os
 import re
 import sqlite3
 import tempfile
-import urllib.parse
 from dataclasses import dataclass
 
 # Local implementations
 from core.config.config_factories import feed_delta_conf_factory
 from core.models.file_system import ApplicationPath
+from core.utils.bulk_ingest import bulk_insert, iter_dump_lines, make_splitter
 from core.utils.strings import clean_filename
-from core.utils.data_access import access_url_bs4
-from core.utils.file_system import remove_if_exists, write_to_file, exists_ok
+from core.utils.data_access import download_to_file
+from core.utils.file_system import remove_if_exists, exists_ok
 from integrations.exceptions.integration_exceptions import NoFieldsException
 from integrations.url_builder import (
     URLEncode,
@@ -240,6 +241,20 @@ class FeedDeltaFieldStr:
         return self.provided
 
 
+# Columns stored as integers in the FeedDelta dump databases.
+INTEGER_COLUMN_PATTERN = re.compile(r"ids?|likes?|duration", flags=re.IGNORECASE)
+
+
+def integer_type_match(column: str) -> str:
+    """Builds the column definition of a FeedDelta dump header field.
+
+    :param column: ``str`` header field, e.g. ``"#id"``
+    :return: ``str`` column definition, e.g. ``"id INTEGER"``
+    """
+    column = column.strip("#")
+    return f"{column} INTEGER" if INTEGER_COLUMN_PATTERN.match(column) else column
+
+
 def feed_delta_parse(
     filename: str, extension: str, dirname: str, sep: str, log_res: bool = False
 ) -> None:
@@ -265,46 +280,39 @@ def feed_delta_parse(
     db_conn = sqlite3.connect(db_name)
     db_cur = db_conn.cursor()
 
+    split_line = make_splitter(sep)
+    dump_lines = iter_dump_lines(path)
     total_entries = 0
-    with open(path, "r", encoding="utf-8") as dump_file:
-        try:
-            for line in dump_file.readlines():
-                line_spl = lambda ln: ln.split(urllib.parse.unquote(sep))  # noqa: E731
-                integer_type_match = (  # noqa: E731
-                    lambda column: f"{column.strip('#')} INTEGER"
-                    if (
-                        re.match("ids?", column.strip("#"), flags=re.IGNORECASE)
-                        or re.match("likes?", column.strip("#"), flags=re.IGNORECASE)
-                        or re.match("duration", column.strip("#"), flags=re.IGNORECASE)
-                    )
-                    else column.strip("#")
-                )
-                if total_entries == 0:
-                    pre_schema = ",".join(
-                        map(
-                            integer_type_match,
-                            line_spl(line),
-                        )
-                    )
-                    db_create_table = "CREATE TABLE embeds({})".format(pre_schema)
-                    db_cur.execute(db_create_table)
-                    total_entries += 1
-                else:
-                    line_split = tuple([elem.strip("\n") for elem in line_spl(line)])
-                    value_calc = f"{'?,' * len(line_split)}".strip(",")
-                    try:
-                        db_cur.execute(
-                            f"INSERT INTO embeds values({value_calc})",
-                            line_split,
-                        )
-                        total_entries += 1
-                    except sqlite3.OperationalError:
-                        # Invalid entries are ignored.
-                        continue
-            db_conn.commit()
-        finally:
-            db_cur.close()
-            db_conn.close()
+    try:
+        if (header := next(dump_lines, None)) is not None:
+            columns = [integer_type_match(column) for column in split_line(header)]
+            db_cur.execute("CREATE TABLE embeds({})".format(",".join(columns)))
+
+            def iter_rows():
+                malformed = 0
+                for line in dump_lines:
+                    line_split = tuple(split_line(line))
+                    # Invalid entries are ignored.
+                    if len(line_split) == len(columns):
+                        yield line_split
+                    else:
+                        malformed += 1
+                if malformed:
+                    logging.warning(f"Skipped {malformed} malformed lines in {path}")
+
+            total_entries = bulk_insert(
+                db_conn,
+                f"INSERT INTO embeds values({','.join('?' * len(columns))})",
+                iter_rows(),
+                indexes=[
+                    (f"idx_embeds_{column}", "embeds", (column,))
+                    for column in map(lambda col: col.split(" ")[0], columns)
+                    if column.lower() in ("id", "title")
+                ],
+            )
+    finally:
+        db_cur.close()
+        db_conn.close()
 
     if log_res:
         print(f"Inserted a total of {total_entries} video entries into {db_name}")
@@ -318,11 +326,8 @@ def main(*args, **kwargs):
     f_house_full_addr = str(f_house_url) + str(f_house_fields)
     temp_store = tempfile.TemporaryDirectory(prefix="dump", dir=".")
     file_extension = f_house_url.get_dump_format()
-    write_to_file(
-        (fname := "partner-ten-dump"),
-        temp_store.name,
-        file_extension,
-        str(access_url_bs4(f_house_full_addr)),
+    download_to_file(
+        f_house_full_addr, (fname := "partner-ten-dump"), temp_store.name, file_extension
     )
     feed_delta_parse(
         fname, file_extension, temp_store.name, f_house_url.get_delim(), log_res=True
@@ -30,12 +30,13 @@ from typing import Optional
 import pyclip
 import requests
 from requests import Response
+from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException
 
 # Local implementations
-from core.utils.data_access import WebDriverFactory
+from core.utils.data_access import WebDriverFactory, WebDriverPool, webdriver_lease
 from core.utils.file_system import search_files_by_ext, load_json_ctx
 from core.utils.strings import match_list_single, generate_random_str
 
@@ -219,7 +220,11 @@ def refresh_token_x(
 
 
 def authorise_app_x(
-    xauth: XAuth, x_endpoints: XEndpoints, headless=True, gecko=False
+    xauth: XAuth,
+    x_endpoints: XEndpoints,
+    headless=True,
+    gecko=False,
+    webdrivers: Optional[WebDriverPool] = None,
 ) -> str:
     """Attempt to emulate user interaction by using webdriver flows with Selenium.
     This authentication flow includes optional clauses that deal with suspicious activity within X
@@ -233,15 +238,16 @@ def authorise_app_x(
     :param x_endpoints: ``XEndpoints`` dataclass containing the endpoints used in this application.
     :param headless: ``bool`` CLI parameter for headless webdriver behaviour.
     :param gecko: ``bool`` CLI parameter for switching the webdriver and use Firefox Gecko instead of Chrome.
+    :param webdrivers: ``WebDriverPool`` to lease the browser from. Without a pool, a browser is started for this flow.
     :return: ``str`` Authorization code in case the flow is successful either via flows or error handling.
     """
-    webdriver = WebDriverFactory(".", headless=headless, gecko=gecko)
-    webdrv = webdriver.get_instance()
-    with webdrv as driver:
+    with webdriver_lease(
+        webdrivers, WebDriverFactory(".", headless=headless, gecko=gecko)
+    ) as driver:
         url = x_oauth_pkce(xauth, x_endpoints)
         driver.get(url)
         time.sleep(4)
-        webdriver.ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+        ActionChains(driver).send_keys(Keys.ESCAPE).perform()
 
         username = driver.find_element(
             By.XPATH,
@@ -53,6 +53,7 @@ from core.controllers.secrets_controller import SecretHandler
 from core.utils.helpers import get_duration
 from core.utils.file_system import load_file_path
 from wordpress.wordpress_api import WordPress
+from wordpress.cache import resolve_cache_path
 from wordpress.models.taxonomies import WPTaxonomyMarker
 
 
@@ -61,7 +62,7 @@ WP_SITE_INSTANCE = WordPress(
     general_config_factory().fq_domain_name,
     WP_AUTH.user,
     WP_AUTH.app_password,
-    ApplicationPath.WP_POSTS_CACHE.value,
+    resolve_cache_path(ApplicationPath.WP_POSTS_CACHE),
     unique_logging_session=False,
 )
 
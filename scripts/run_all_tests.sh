@@ -22,4 +22,81 @@ echo "--> Testing function clean_partner_tag from the workflows package:"
 python3 -m unittest ./tests/test_clean_partner_tag.py
 
 echo "--> Testing function make_slug from the workflows package:"
-python3 -m unittest ./tests/test_make_slug.py
\ No newline at end of file
+python3 -m unittest ./tests/test_make_slug.py
+echo "--> Testing function normalize_title from the core package:"
+python3 -m unittest ./tests/test_normalize_title.py
+
+echo "--> Testing class WPPostStore from the wordpress package:"
+python3 -m unittest ./tests/test_wp_post_store.py
+
+echo "--> Testing class WPSQLiteCache from the wordpress package:"
+python3 -m unittest ./tests/test_wp_sqlite_cache.py
+
+echo "--> Testing class WPTaxonomyIndex from the wordpress package:"
+python3 -m unittest ./tests/test_wp_taxonomy_index.py
+
+echo "--> Testing class WPPageFetcher from the wordpress package:"
+python3 -m unittest ./tests/test_wp_page_fetcher.py
+
+echo "--> Testing class WPostRecord from the wordpress package:"
+python3 -m unittest ./tests/test_wp_post_record.py
+
+echo "--> Testing class WPHTTPSession from the wordpress package:"
+python3 -m unittest ./tests/test_wp_http_session.py
+
+echo "--> Testing class WPPublishedDB from the wordpress package:"
+python3 -m unittest ./tests/test_wp_published_db.py
+
+echo "--> Testing class WPCacheHashes from the wordpress package:"
+python3 -m unittest ./tests/test_wp_cache_hashes.py
+
+echo "--> Testing module bulk_ingest from the core.utils package:"
+python3 -m unittest ./tests/test_bulk_ingest.py
+
+echo "--> Testing function download_to_file from the core.utils package:"
+python3 -m unittest ./tests/test_download_to_file.py
+
+echo "--> Testing class PartnerContentDB from the workflows.tasks package:"
+python3 -m unittest ./tests/test_partner_content_db.py
+
+echo "--> Testing class MediaSourceClient from the workflows.tasks package:"
+python3 -m unittest ./tests/test_media_source_client.py
+
+echo "--> Testing class WebDriverPool from the core.utils package:"
+python3 -m unittest ./tests/test_webdriver_pool.py
+
+echo "--> Testing the single-pass set source extractors from the workflows.tasks package:"
+python3 -m unittest ./tests/test_set_source_extract.py
+
+echo "--> Testing the persisted title index from the wordpress.cache package:"
+python3 -m unittest ./tests/test_wp_title_index.py
+
+echo "--> Testing the near-duplicate detector from the workflows.tasks package:"
+python3 -m unittest ./tests/test_near_duplicates.py
+
+echo "--> Testing function staged_file from the core.utils package:"
+python3 -m unittest ./tests/test_staged_file.py
+
+echo "--> Testing the parallel partner refresh from the flows package:"
+python3 -m unittest ./tests/test_feed_updater.py
+
+echo "--> Testing the batch methods of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_batch.py
+
+echo "--> Testing the cache sync of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_cache_sync.py
+
+echo "--> Testing the local changes of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_local_changes.py
+
+echo "--> Testing the post polling of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_post_polling.py
+
+echo "--> Testing the media uploads of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_upload_images.py
+
+echo "--> Testing the tag report from the wordpress.utils package:"
+python3 -m unittest ./tests/test_tag_report.py
+
+echo "--> Testing the tag mappings of class WordPress from the wordpress package:"
+python3 -m unittest ./tests/test_wp_tag_mappings.py
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for core.utils.bulk_ingest
+
+This module verifies that dump files are streamed without line terminators or blank lines,
+that rows are written in chunks and indexed, and that a failed load leaves no rows behind.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from core.utils.bulk_ingest import bulk_insert, iter_dump_lines, make_splitter
+
+
+class TestBulkIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_conn = sqlite3.connect(os.path.join(self.tmp_dir.name, "dump.db"))
+        self.db_conn.execute("CREATE TABLE embeds(id INTEGER, title)")
+
+    def tearDown(self):
+        self.db_conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_iter_dump_lines(self):
+        dump_path = os.path.join(self.tmp_dir.name, "dump.txt")
+        with open(dump_path, "w", encoding="utf-8") as dump_file:
+            dump_file.write("id|title\r\n1|First\n\n2|Second")
+        split_line = make_splitter("%7C")
+        self.assertEqual(
+            [split_line(line) for line in iter_dump_lines(dump_path, skip_header=True)],
+            [["1", "First"], ["2", "Second"]],
+        )
+
+    def test_bulk_insert(self):
+        rows = ((idx, f"Title {idx}") for idx in range(25))
+        total = bulk_insert(
+            self.db_conn,
+            "INSERT INTO embeds VALUES(?, ?)",
+            rows,
+            indexes=(("idx_embeds_title", "embeds", ("title",)),),
+            chunk_size=10,
+        )
+        self.assertEqual(total, 25)
+        self.assertEqual(
+            self.db_conn.execute("SELECT COUNT(*) FROM embeds").fetchone()[0], 25
+        )
+        self.assertIsNotNone(
+            self.db_conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'idx_embeds_title'"
+            ).fetchone()
+        )
+        self.assertEqual(
+            self.db_conn.execute("PRAGMA journal_mode").fetchone()[0], "delete"
+        )
+
+    def test_rollback(self):
+        with self.assertRaises(sqlite3.ProgrammingError):
+            bulk_insert(
+                self.db_conn,
+                "INSERT INTO embeds VALUES(?, ?)",
+                [(1, "Title"), (2,)],
+            )
+        self.assertEqual(
+            self.db_conn.execute("SELECT COUNT(*) FROM embeds").fetchone()[0], 0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for core.utils.data_access.download_to_file
+
+This module downloads a feed dump from a local stand-in server to verify that gzip bodies are
+decompressed on the fly and that interrupted downloads resume with a ``Range`` request.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import gzip
+import tempfile
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local implementation to be tested
+from core.utils.data_access import download_to_file
+
+DUMP = "".join(f"{idx}|Title {idx} & more\n" for idx in range(5000)).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ranges: list = []
+    drops: int = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.ranges.append(self.headers.get("Range"))
+        if byte_range := self.headers.get("Range"):
+            data = DUMP[int(byte_range.split("=")[1].rstrip("-")) :]
+            self.send_response(206)
+        else:
+            data = DUMP
+            self.send_response(200)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                data = gzip.compress(DUMP)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if StandInHandler.drops > 0:
+            StandInHandler.drops -= 1
+            data = data[: len(data) // 3]
+            self.close_connection = True
+        self.wfile.write(data)
+
+
+class TestDownloadToFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/dump"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        StandInHandler.ranges.clear()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_gzip(self):
+        file_path = download_to_file(self.url, "dump", self.tmp_dir.name, "csv")
+        self.assertEqual(file_path.name, "dump.csv")
+        self.assertEqual(file_path.read_bytes(), DUMP)
+
+    def test_resume(self):
+        StandInHandler.drops = 1
+        file_path = download_to_file(self.url, "dump", self.tmp_dir.name, "csv")
+        self.assertEqual(file_path.read_bytes(), DUMP)
+        self.assertIsNone(StandInHandler.ranges[0])
+        self.assertRegex(StandInHandler.ranges[1], r"^bytes=\d+-$")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for flows.feed_updater.MediaSourceUpdater
+
+This module refreshes stand-in partners in worker processes to verify that a refresh that
+exceeds the timeout is terminated and its staged files are removed, that a crashing worker
+does not affect the others, and that the summary reports every partner once, in order.
+Each partner also gets its own HTTP session.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+
+from argparse import Namespace
+from unittest import mock
+
+# Local implementation to be tested
+from core.models.file_system import ApplicationPath
+from core.utils.file_system import exists_ok, staged_file
+from flows.feed_updater import MediaSourceUpdater
+from workflows.exceptions import DataSourceUpdateError
+
+
+def stand_in_process_hint(self, temp_dir, hint):
+    if hint == "slow":
+        db_path = os.path.join(exists_ok(ApplicationPath.ARTIFACTS), "slowvids.db")
+        with staged_file(db_path) as staging_path:
+            open(staging_path, "w").close()
+            time.sleep(60)
+    elif hint == "crash":
+        raise RuntimeError("parser crashed")
+    elif hint == "exit":
+        os._exit(3)
+    return hint != "empty"
+
+
+@unittest.skipUnless(
+    multiprocessing.get_start_method() == "fork",
+    "the stand-in refresh is patched in the parent process",
+)
+class TestFeedUpdater(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.patches = [
+            mock.patch.object(
+                MediaSourceUpdater, "_process_hint", stand_in_process_hint
+            ),
+            mock.patch.object(MediaSourceUpdater, "_print_summary"),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def flow_start(self, hints):
+        updater = MediaSourceUpdater(
+            cli_args=Namespace(workers=3, timeout=2, parent=False)
+        )
+        updater._hints = hints
+        try:
+            updater._flow_start()
+        finally:
+            # Partner temporary directories are removed, whatever the outcome.
+            self.assertEqual(os.listdir(ApplicationPath.TEMPORARY.value), [])
+        return updater._print_summary.call_args.args[0]
+
+    def test_isolated_failures(self):
+        with self.assertRaises(DataSourceUpdateError):
+            self.flow_start(["ok", "crash", "exit", "empty", "slow", "ok"])
+        results = MediaSourceUpdater._print_summary.call_args.args[0]
+
+        self.assertEqual(
+            [(result.hint, result.success) for result in results],
+            [
+                ("ok", True),
+                ("crash", False),
+                ("exit", False),
+                ("empty", False),
+                ("slow", False),
+            ],
+        )
+        errors = {result.hint: result.error for result in results}
+        self.assertIsNone(errors["ok"])
+        self.assertIn("parser crashed", errors["crash"])
+        self.assertEqual(errors["exit"], "Exit code 3")
+        self.assertEqual(errors["empty"], "No entries were stored")
+        self.assertTrue(errors["slow"].startswith("Timed out"))
+        self.assertLess(results[4].duration, 10)
+        # The staged database of the terminated worker is removed.
+        self.assertEqual(os.listdir(ApplicationPath.ARTIFACTS.value), [])
+
+    def test_success(self):
+        results = self.flow_start(["alpha", "beta"])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual([result.hint for result in results], ["alpha", "beta"])
+
+
+class TestHttpClient(unittest.TestCase):
+    @mock.patch("flows.feed_updater.MediaSourceClient")
+    def test_session_per_partner(self, client_class):
+        cookie_paths = []
+        for hint in ("alpha", "beta one"):
+            updater = MediaSourceUpdater(cli_args=Namespace(webdriver=False))
+            updater._http_client(hint)
+            cookie_paths.append(
+                os.path.basename(
+                    client_class.from_config.call_args.kwargs["cookie_path"]
+                )
+            )
+        self.assertEqual(
+            cookie_paths,
+            ["media-source-cookies-alpha.json", "media-source-cookies-beta-one.json"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
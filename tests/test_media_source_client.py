@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for workflows.tasks.MediaSourceClient
+
+This module retrieves a video dump and a photo set page from a local stand-in server that serves
+recorded MediaSource pages, to verify that the client logs in once with a persistent cookie
+session and submits the same options as the webdriver flows.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Local implementation to be tested
+from workflows.exceptions import MediaSourceClientError
+from workflows.tasks.media_source_client import DUMP_FIELD_OPTIONS, MediaSourceClient
+from workflows.tasks.sets_source_parse import extract_set_rows
+
+LOGIN_PAGE = """<html><body><form method="post" action="/login">
+<input id="user" name="user"><input id="password" name="password" type="password">
+<button id="head-login" name="login" value="1">Log in</button>
+</form></body></html>"""
+
+PARTNER_FORM = """<form method="post" action="/partner">
+<select id="link_site" name="link_site">
+<option value="11">Alpha Partner - 1</option><option value="22">Beta Tease - 2</option>
+</select><input type="submit" value="Apply Changes"></form>"""
+
+FIELD_OPTIONS = "".join(
+    f'<option value="f{idx}">Field {idx}</option>' for idx in range(19)
+)
+
+DUMP_PAGE = f"""<html><body>{PARTNER_FORM}
+<form method="post" action="/dump/result"><input type="hidden" name="token" value="t0k">
+<select id="dump_format" name="dump_format">
+<option value="csv">CSV</option><option value="xml">XML</option><option value="pipe">Dump with |</option>
+</select>
+{"".join(f'<select id="dp_field_{num}" name="dp_field[{num}]">{FIELD_OPTIONS}</select>' for num in range(8))}
+<input id="dumpUpdate" type="submit" name="update" value="Update"></form></body></html>"""
+
+SETS_PAGE = f"""<html><body>{PARTNER_FORM}
+<form method="get" action="/sets/list"><select id="page-count-val" name="count">
+{"".join(f'<option value="{count}">{count}</option>' for count in (10, 20, 50, 100, 200, "all"))}
+</select><input id="pageination-submit" type="submit"></form></body></html>"""
+
+SETS_RESULT = """<html><body><table><tr>
+<td class="tab-column left-align col_0">Set {partner}</td>
+<td class="tab-column col_1 center-align">January 31, 2025</td>
+<td><a href="zip_tool?id={count}">Download</a></td>
+</tr></table></body></html>"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    logins: int = 0
+    partner: str = ""
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body: str, cookie: str = "") -> None:
+        data = body.encode()
+        self.send_response(200)
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _form(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return parse_qs(self.rfile.read(length).decode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if "session=ok" not in self.headers.get("Cookie", ""):
+            return self._reply(LOGIN_PAGE)
+        if url.path == "/dump":
+            return self._reply(DUMP_PAGE)
+        if url.path == "/sets":
+            return self._reply(SETS_PAGE)
+        count = parse_qs(url.query)["count"][0]
+        return self._reply(SETS_RESULT.format(partner=self.partner, count=count))
+
+    def do_POST(self):
+        form = self._form()
+        if self.path == "/login":
+            if form == {"user": ["user"], "password": ["secret"], "login": ["1"]}:
+                StandInHandler.logins += 1
+                return self._reply("", cookie="session=ok; Path=/")
+            return self._reply(LOGIN_PAGE)
+        if self.path == "/partner":
+            StandInHandler.partner = form["link_site"][0]
+            return self._reply("")
+        fields = ",".join(form[f"dp_field[{num}]"][0] for num in range(9))
+        dump = f"{self.partner}|{form['dump_format'][0]}|{form['token'][0]}|{fields}"
+        return self._reply(f"<html><body><textarea>{dump}</textarea></body></html>")
+
+
+class TestMediaSourceClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cookie_path = os.path.join(self.tmp_dir.name, "cookies.json")
+        StandInHandler.logins = 0
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_client(self, password: str = "secret") -> MediaSourceClient:
+        return MediaSourceClient(
+            f"{self.base_url}/dump",
+            f"{self.base_url}/sets",
+            "user",
+            password,
+            cookie_path=self.cookie_path,
+        )
+
+    def test_vid_dump(self):
+        with self.make_client() as client:
+            dump_name = client.get_vid_dump("beta", self.tmp_dir.name)
+        self.assertEqual(dump_name, f"beta-tease-vids-{datetime.date.today()}")
+        with open(os.path.join(self.tmp_dir.name, f"{dump_name}.txt")) as dump_file:
+            fields = ",".join(f"f{option}" for option in DUMP_FIELD_OPTIONS)
+            self.assertEqual(dump_file.read(), f"22|pipe|t0k|{fields}")
+        self.assertEqual(StandInHandler.logins, 1)
+        self.assertEqual(os.stat(self.cookie_path).st_mode & 0o777, 0o600)
+
+    def test_set_source(self):
+        with self.make_client() as client:
+            client.get_vid_dump("alpha", self.tmp_dir.name)
+        # The saved session is reused without logging in again.
+        with self.make_client(password="wrong") as client:
+            source_html, set_name = client.get_set_source("alpha")
+        self.assertEqual(StandInHandler.logins, 1)
+        self.assertEqual(set_name, f"alpha-partner-photos-{datetime.date.today()}")
+        self.assertEqual(
+            extract_set_rows(source_html),
+            [
+                (
+                    "Set 11",
+                    datetime.date(2025, 1, 31),
+                    "https://media_source.com/zip_tool?id=all",
+                )
+            ],
+        )
+
+    def test_login_failed(self):
+        with self.make_client(password="wrong") as client:
+            with self.assertRaises(MediaSourceClientError):
+                client.get_vid_dump("alpha", self.tmp_dir.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for workflows.tasks.NearDuplicateDetector
+
+This module indexes two partner databases that offer the same scene under slightly different
+titles, to verify that the near-duplicate is found across partners, that indexes are synced
+incrementally and that only near-duplicates of published content are filtered out, for videos
+and photo sets.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPPublishedDB
+from workflows.tasks.near_duplicates import (
+    MinHasher,
+    NearDuplicateDetector,
+    NearDuplicateIndex,
+    similarity,
+)
+from workflows.tasks.partner_content_db import (
+    PHOTO_SET_SCHEMA,
+    VIDEO_SCHEMA,
+    PartnerContentDB,
+)
+from workflows.utils.filtering import filter_near_duplicates
+
+
+def make_row(title: str, description: str, key: str) -> tuple:
+    return (title, description, "Jane", "pool", "2025-01-01", "8 Min", key, "", "", "")
+
+
+ALPHA_ROWS = [
+    make_row(
+        "Jane and Ann share a sunny afternoon by the pool",
+        "A lazy summer day",
+        "https://alpha/1",
+    ),
+    make_row("Late night in the city", "Neon lights", "https://alpha/2"),
+]
+
+BETA_ROWS = [
+    make_row(
+        "Jane &amp; Ann Share a Sunny Afternoon at the Pool!",
+        "A lazy summer day",
+        "https://beta/7",
+    ),
+    make_row("Breakfast on the terrace", "Fresh croissants", "https://beta/8"),
+]
+
+
+class TestNearDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        for name, rows in (("alphavids.db", ALPHA_ROWS), ("betavids.db", BETA_ROWS)):
+            with PartnerContentDB(
+                os.path.join(self.tmp_dir.name, name), VIDEO_SCHEMA
+            ) as content_db:
+                content_db.refresh(rows)
+        self.detector = NearDuplicateDetector.from_feed_dir(
+            self.tmp_dir.name, "vids", VIDEO_SCHEMA
+        )
+
+    def tearDown(self):
+        self.detector.close()
+        self.tmp_dir.cleanup()
+
+    def test_signatures(self):
+        hasher = MinHasher()
+        signature = hasher.signature(ALPHA_ROWS[0][0])
+        self.assertGreater(
+            similarity(signature, hasher.signature(BETA_ROWS[0][0])), 0.5
+        )
+        self.assertLess(similarity(signature, hasher.signature(ALPHA_ROWS[1][0])), 0.2)
+        self.assertIsNone(hasher.signature("   "))
+
+    def test_find(self):
+        text = "Jane and Ann share a sunny afternoon by the pool A lazy summer day"
+        matches = self.detector.find(text, source="alphavids.db", key="https://alpha/1")
+        self.assertEqual(
+            [(match.source, match.key) for match in matches],
+            [("betavids.db", "https://beta/7")],
+        )
+        self.assertGreaterEqual(matches[0].similarity, 0.7)
+        # Without a source, the row itself is found too.
+        self.assertEqual(len(self.detector.find(text)), 2)
+        self.assertEqual(self.detector.find("Breakfast in the kitchen"), [])
+
+    def test_incremental_sync(self):
+        db_path = os.path.join(self.tmp_dir.name, "betavids.db")
+        with NearDuplicateIndex(db_path, VIDEO_SCHEMA) as index:
+            self.assertEqual(index.sync(), (0, 0))
+            with PartnerContentDB(db_path, VIDEO_SCHEMA) as content_db:
+                content_db.refresh(
+                    [
+                        BETA_ROWS[0],
+                        make_row("Lunch on the terrace", "Salad", "https://beta/9"),
+                    ]
+                )
+            self.assertEqual(index.sync(), (1, 1))
+            self.assertEqual(len(index), 2)
+
+    def test_filter_near_duplicates(self):
+        with WPPublishedDB(os.path.join(self.tmp_dir.name, "wp-posts.db")) as site:
+            site.update(
+                [
+                    {
+                        "id": 1,
+                        "slug": "jane-ann-pool",
+                        "title": {"rendered": BETA_ROWS[0][0]},
+                        "modified": "2025-01-02T00:00:00",
+                    }
+                ],
+                {1},
+            )
+            kept, skipped = filter_near_duplicates(
+                ALPHA_ROWS,
+                VIDEO_SCHEMA.columns,
+                self.detector,
+                site,
+                source="alphavids.db",
+            )
+        self.assertEqual(kept, [ALPHA_ROWS[1]])
+        self.assertEqual(skipped[0][0], ALPHA_ROWS[0])
+        self.assertEqual(skipped[0][1].key, "https://beta/7")
+
+    def test_filter_photo_sets(self):
+        alpha_sets = [
+            (
+                "Jane and Ann share a sunny afternoon by the pool",
+                "2025-01-01",
+                "https://alpha/sets/1",
+            ),
+            ("Late night in the city", "2025-01-01", "https://alpha/sets/2"),
+        ]
+        beta_sets = [
+            (
+                "Jane &amp; Ann Share a Sunny Afternoon at the Pool!",
+                "2025-01-01",
+                "https://beta/sets/7",
+            ),
+        ]
+        for name, rows in (
+            ("alphaphotos.db", alpha_sets),
+            ("betaphotos.db", beta_sets),
+        ):
+            with PartnerContentDB(
+                os.path.join(self.tmp_dir.name, name), PHOTO_SET_SCHEMA
+            ) as content_db:
+                content_db.refresh(rows)
+        with (
+            NearDuplicateDetector.from_feed_dir(
+                self.tmp_dir.name, "photos", PHOTO_SET_SCHEMA
+            ) as detector,
+            WPPublishedDB(os.path.join(self.tmp_dir.name, "wp-posts.db")) as site,
+        ):
+            site.update(
+                [
+                    {
+                        "id": post_id,
+                        "slug": f"post-{post_id}",
+                        "title": {"rendered": title},
+                        "modified": "2025-01-02T00:00:00",
+                    }
+                    for post_id, title in ((1, beta_sets[0][0]), (2, alpha_sets[1][0]))
+                ],
+                {1, 2},
+            )
+            kept, skipped = filter_near_duplicates(
+                alpha_sets,
+                PHOTO_SET_SCHEMA.columns,
+                detector,
+                site,
+                source="alphaphotos.db",
+                key_column=PHOTO_SET_SCHEMA.key,
+            )
+        # The second set is live too, but a row is never a near-duplicate of itself.
+        self.assertEqual(kept, [alpha_sets[1]])
+        self.assertEqual(skipped[0][0], alpha_sets[0])
+        self.assertEqual(skipped[0][1].key, "https://beta/sets/7")
+
+
+if __name__ == "__main__":
+    unittest.main()
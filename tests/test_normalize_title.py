@@ -0,0 +1,30 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for core.normalize_title Function
+
+This module contains test cases for the normalize_title function, which makes titles
+rendered by WordPress comparable with titles stored in partner databases.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+# Local implementation to be tested
+from core.utils.strings import normalize_title
+
+
+class TestNormalizeTitle(unittest.TestCase):
+    def test_normalize_title(self):
+        self.assertEqual(normalize_title("Sample Title"), "sample title")
+        self.assertEqual(normalize_title("  Sample   Title \n"), "sample title")
+        self.assertEqual(normalize_title("Jane &amp; Ann"), "jane & ann")
+        self.assertEqual(normalize_title("Jane&#8217;s Day"), "jane’s day")
+        self.assertEqual(normalize_title(""), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
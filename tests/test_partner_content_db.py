@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for workflows.tasks.PartnerContentDB
+
+This module verifies that persistent partner databases UPSERT rows by their natural key,
+tombstone and restore rows that drop out of the dump, skip unchanged dumps and reject empty
+dumps, and that unchanged rows are not rewritten to record when they were last seen.
+Rows carry ``datetime.date`` values, as produced by ``db_generate``.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+# Local implementation to be tested
+from workflows.exceptions import DataSourceUpdateError
+from workflows.tasks.partner_content_db import (
+    PHOTO_SET_SCHEMA,
+    PartnerContentDB,
+    RefreshStats,
+    persistent_db_name,
+)
+
+
+DAY_1 = datetime.date(2025, 1, 1)
+DAY_2 = datetime.date(2025, 1, 2)
+
+
+class TestPartnerContentDB(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = PartnerContentDB(
+            os.path.join(self.tmp_dir.name, "partnerphotos.db"), PHOTO_SET_SCHEMA
+        )
+        self.db.refresh(
+            [
+                ("Set 1", DAY_1, "https://a/1"),
+                ("Set 2", DAY_1, "https://a/2"),
+            ],
+            dump_hash="first",
+        )
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp_dir.cleanup()
+
+    def test_refresh(self):
+        stats = self.db.refresh(
+            [
+                ("Set 1 renamed", DAY_1, "https://a/1"),
+                ("Set 3", DAY_2, "https://a/3"),
+            ],
+            dump_hash="second",
+        )
+        self.assertEqual(stats, RefreshStats(added=1, updated=1, removed=1, active=2))
+        self.assertEqual(
+            self.db._conn.execute("SELECT * FROM sets ORDER BY link").fetchall(),
+            [
+                ("Set 1 renamed", "2025-01-01", "https://a/1"),
+                ("Set 3", "2025-01-02", "https://a/3"),
+            ],
+        )
+
+        stats = self.db.refresh([("Set 2", DAY_1, "https://a/2")])
+        self.assertEqual((stats.revived, stats.removed, stats.active), (1, 2, 1))
+
+    def test_unchanged_rows(self):
+        # Dates are hashed in ISO format, so identical rows are not rewritten.
+        stats = self.db.refresh(
+            [
+                ("Set 1", DAY_1, "https://a/1"),
+                ("Set 2", DAY_1, "https://a/2"),
+            ]
+        )
+        self.assertEqual(stats, RefreshStats(active=2))
+
+    def test_last_seen(self):
+        clock = mock.patch(
+            "workflows.tasks.partner_content_db.datetime.datetime",
+            wraps=datetime.datetime,
+        )
+        refreshes = ["2025-01-02T00:00:00", "2025-01-03T00:00:00"]
+        first_refresh = self.db.read_metadata()["last_refresh"]
+        with clock as stand_in:
+            stand_in.now.return_value = datetime.datetime.fromisoformat(refreshes[0])
+            self.db.refresh([("Set 1", DAY_1, "https://a/1")])
+            stand_in.now.return_value = datetime.datetime.fromisoformat(refreshes[1])
+            self.db.refresh(
+                [("Set 1", DAY_1, "https://a/1"), ("Set 3", DAY_2, "https://a/3")]
+            )
+
+        self.assertEqual(
+            self.db._conn.execute(
+                "SELECT link, first_seen, last_seen, removed_at FROM sets_rows "
+                "ORDER BY link"
+            ).fetchall(),
+            [
+                # The unchanged row keeps the timestamps of its first write.
+                ("https://a/1", first_refresh, first_refresh, None),
+                ("https://a/2", first_refresh, first_refresh, refreshes[0]),
+                ("https://a/3", refreshes[1], refreshes[1], None),
+            ],
+        )
+        self.assertEqual(self.db.last_seen("https://a/1"), refreshes[1])
+        self.assertEqual(self.db.last_seen("https://a/2"), first_refresh)
+        self.assertEqual(self.db.last_seen("https://a/3"), refreshes[1])
+        self.assertIsNone(self.db.last_seen("https://a/4"))
+
+    def test_empty_dump(self):
+        before = self.db.read_metadata()
+        with self.assertRaises(DataSourceUpdateError):
+            self.db.refresh([], dump_hash="empty")
+        self.assertEqual(self.db.read_metadata(), before)
+        self.assertEqual(len(self.db), 2)
+
+    def test_unchanged_dump(self):
+        stats = self.db.refresh([], dump_hash="first")
+        self.assertEqual(stats, RefreshStats(active=2, skipped=True))
+
+    def test_persistent_db_name(self):
+        self.assertEqual(persistent_db_name("partnervids-2025-01-31"), "partnervids.db")
+        self.assertEqual(persistent_db_name("partnervids.db"), "partnervids.db")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the single-pass extractors of workflows.tasks
+
+This module verifies that ``extract_set_rows`` and ``extract_video_rows`` return the same rows
+as the per-field BeautifulSoup functions they replace.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import datetime
+import unittest
+
+from bs4 import BeautifulSoup
+
+# Local implementation to be tested
+from workflows.tasks.feed_scrape import combine_vid_elems, extract_video_rows
+from workflows.tasks.sets_source_parse import (
+    extract_set_rows,
+    parse_dates,
+    parse_links,
+    parse_titles,
+)
+
+SETS_PAGE = """<html><body><table>
+<tr><td class="tab-column left-align col_0">Set <b>One</b></td>
+<td class="tab-column col_1  center-align"> March 05, 2025 </td>
+<td><a href="zip_tool?id=1">Zip</a><a href="preview?id=1">Preview</a></td></tr>
+<tr><td class="tab-column left-align col_0">Set Two</td>
+<td class="tab-column col_1 center-align">April 12, 2025</td>
+<td><a href="zip_tool?id=2">Zip</a></td></tr>
+</table></body></html>"""
+
+VIDEOS_PAGE = """<html><body><table><tr>
+<td class="tab-column col_0 center-align">Video One</td>
+<td><textarea class="display-link-text" rows="2">&lt;a href="/v/1"&gt;</textarea>
+<script>var v = 1;</script>
+<textarea class="display-link-text" rows="2">First description</textarea></td>
+<td class="tab-column col_1 center-align">Sep  4, 2024</td>
+<td class="tab-column col_2 center-align">4 Min</td>
+<td><video class="video_holder_1 table-video-small" controls="" poster="
+\thttps://xyz.com/thumb.jpg"><source src="https://xyz.com/video.mp4" type="video/"/></video></td>
+</tr></table></body></html>"""
+
+
+class TestSetSourceExtract(unittest.TestCase):
+    def test_set_rows(self):
+        soup_html = BeautifulSoup(SETS_PAGE, "html.parser")
+        rows = extract_set_rows(SETS_PAGE)
+        self.assertEqual(
+            rows,
+            list(
+                zip(
+                    parse_titles(soup_html),
+                    parse_dates(soup_html),
+                    parse_links(soup_html),
+                )
+            ),
+        )
+        self.assertEqual(
+            rows[0],
+            (
+                "Set One",
+                datetime.date(2025, 3, 5),
+                "https://media_source.com/zip_tool?id=1",
+            ),
+        )
+        self.assertEqual(extract_set_rows(soup_html), rows)
+
+    def test_video_rows(self):
+        self.assertEqual(
+            extract_video_rows(VIDEOS_PAGE),
+            [
+                (
+                    "Video One",
+                    "First description",
+                    "Sep  4, 2024",
+                    "4 Min",
+                    "https://xyz.com/video.mp4",
+                    "https://xyz.com/thumb.jpg",
+                )
+            ],
+        )
+        self.assertEqual(
+            combine_vid_elems(BeautifulSoup(VIDEOS_PAGE, "html.parser"))[0][:3],
+            ("Video One", "First description", "Sep  4, 2024"),
+        )
+
+    def test_empty_page(self):
+        self.assertEqual(extract_set_rows(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for core.utils.file_system.staged_file
+
+This module verifies that a staged file only replaces the existing file once its block
+completes, and that the staged files of a terminated process can be removed.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from core.utils.file_system import remove_staged_files, staged_file
+
+
+class TestStagedFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, "partnervids.db")
+        with open(self.file_path, "w") as old_file:
+            old_file.write("old")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read(self) -> str:
+        with open(self.file_path) as db_file:
+            return db_file.read()
+
+    def test_replace(self):
+        with staged_file(self.file_path) as staging_path:
+            with open(staging_path, "w") as new_file:
+                new_file.write("new")
+            self.assertEqual(self.read(), "old")
+        self.assertEqual(self.read(), "new")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["partnervids.db"])
+
+    def test_keep_old_file_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with staged_file(self.file_path) as staging_path:
+                with open(staging_path, "w") as new_file:
+                    new_file.write("partial")
+                raise RuntimeError("load failed")
+        self.assertEqual(self.read(), "old")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["partnervids.db"])
+
+    def test_remove_staged_files(self):
+        for name in ("a.db.1234.tmp", "a.db.1234.tmp-journal", "b.db.5678.tmp"):
+            open(os.path.join(self.tmp_dir.name, name), "w").close()
+        removed = remove_staged_files(self.tmp_dir.name, 1234)
+        self.assertEqual(
+            sorted(os.path.basename(path) for path in removed),
+            ["a.db.1234.tmp", "a.db.1234.tmp-journal"],
+        )
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)), ["b.db.5678.tmp", "partnervids.db"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
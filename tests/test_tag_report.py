@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the tag report of wordpress.utils.reporting
+
+This module builds the tag report of a fixture cache to verify that the rows collected in a single
+pass match the mappings of the ``WordPress`` class the report was previously built from, and that
+the rows are written to ``.xlsx``, ``CSV`` and ``JSONL`` files, as selected by ``--report-format``.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import zipfile
+
+from unittest import mock
+
+# Local implementation to be tested
+from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
+from wordpress.utils import reporting
+from wordpress.utils.reporting import (
+    DEFAULT_PARTNER,
+    TAG_REPORT_SECTIONS,
+    TagReportCollector,
+    create_tag_report,
+)
+
+# Test fixtures
+from tests.wp_fixtures import StandInCollection, make_site, make_tagged_posts
+
+HINTS = ["Partnerone", "Partnertwo"]
+TAG_ROWS = [
+    ("Blue Sky", 11, 2, "1, 3"),
+    ("Partnerone", 13, 1, "1"),
+    ("Red", 12, 3, "1, 2, 3"),
+    ("Dawn", 16, 1, ""),
+    ("Green", 14, 1, "2"),
+    ("Partnertwo", 15, 1, "3"),
+]
+POST_ROWS = [
+    (1, "example.com/post-1", "Videos"),
+    (2, "example.com/post-2", "Videos, Clips"),
+    (3, "example.com/post-3", ""),
+    (4, "example.com/post-4", "Clips"),
+]
+MODEL_ROWS = [
+    ("Jane Doe", 2, "Partnerone", "1, 2"),
+    ("John Roe", 2, DEFAULT_PARTNER, "2, 3"),
+    ("Ann Poe", 1, "Partnertwo", "3"),
+]
+SHEET_NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def read_sheet(workbook: zipfile.ZipFile, number: int) -> list:
+    """Reads the rows of a worksheet, numbers are read as ``int``."""
+    sheet = ET.fromstring(workbook.read(f"xl/worksheets/sheet{number}.xml"))
+    rows = []
+    for row in sheet.iterfind(".//x:row", SHEET_NS):
+        values = []
+        for cell in row.iterfind("x:c", SHEET_NS):
+            if cell.get("t") == "inlineStr":
+                values.append(cell.findtext("x:is/x:t", "", SHEET_NS))
+            else:
+                values.append(int(float(cell.findtext("x:v", "", SHEET_NS))))
+        rows.append(tuple(values))
+    return rows
+
+
+class TestTagReport(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.site = make_site(
+            os.path.join(self.tmp_dir.name, "posts.json"),
+            StandInCollection(make_tagged_posts()),
+        )
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def collect(self) -> TagReportCollector:
+        collector = TagReportCollector(self.site.fq_domain_name, HINTS)
+        self.post_rows = []
+        collector.collect(self.site.iter_posts(), self.post_rows.append)
+        return collector
+
+    def test_rows(self):
+        collector = self.collect()
+        self.assertEqual(list(collector.tag_rows()), TAG_ROWS)
+        self.assertEqual(self.post_rows, POST_ROWS)
+        self.assertEqual(list(collector.model_rows()), MODEL_ROWS)
+
+    def test_rows_match_wordpress_mappings(self):
+        collector = self.collect()
+
+        tag_ids = self.site.map_wp_class_id(WPTaxonomyMarker.TAG, WPTaxonomyValues.TAGS)
+        tag_counts = self.site.count_wp_class_id(WPTaxonomyMarker.TAG)
+        tagged_ids = self.site.map_tags_posts(WPTaxonomyMarker.TAG, idd=True)
+        self.assertEqual(
+            list(collector.tag_rows()),
+            [
+                (tag, tag_ids.get(tag), count, ", ".join(map(str, tagged_ids[tag])))
+                for tag, count in tag_counts.items()
+            ],
+        )
+
+        post_urls = self.site.map_posts_by_id(include_host_name=True)
+        self.assertEqual([row[:2] for row in self.post_rows], list(post_urls.items()))
+
+        model_counts = self.site.count_map_match_taxonomy(
+            WPTaxonomyMarker.MODELS, WPTaxonomyMarker.TAG, HINTS
+        )
+        self.assertEqual(
+            list(collector.model_rows()),
+            [
+                (model, values[0][0], values[0][1], ", ".join(map(str, values[1:])))
+                for model, values in model_counts.items()
+            ],
+        )
+
+    def test_xlsx(self):
+        paths = create_tag_report(self.site, "report", "xlsx", hints=HINTS)
+
+        self.assertEqual([path.name for path in paths], ["report.xlsx"])
+        with zipfile.ZipFile(paths[0]) as workbook:
+            sheet_names = [
+                sheet.get("name")
+                for sheet in ET.fromstring(workbook.read("xl/workbook.xml")).iterfind(
+                    ".//x:sheet", SHEET_NS
+                )
+            ]
+            sheets = [read_sheet(workbook, number) for number in (1, 2, 3)]
+        self.assertEqual(
+            sheet_names, [name for name, _ in TAG_REPORT_SECTIONS.values()]
+        )
+        for sheet, (_, header), rows in zip(
+            sheets, TAG_REPORT_SECTIONS.values(), (TAG_ROWS, POST_ROWS, MODEL_ROWS)
+        ):
+            # Empty cells are not written.
+            self.assertEqual(
+                sheet,
+                [
+                    header,
+                    *(tuple(value for value in row if value != "") for row in rows),
+                ],
+            )
+
+    def test_csv(self):
+        paths = create_tag_report(self.site, "report", "csv", hints=HINTS)
+
+        self.assertEqual(
+            [path.name for path in paths],
+            ["report-tags.csv", "report-posts.csv", "report-models.csv"],
+        )
+        for path, (_, header), rows in zip(
+            paths, TAG_REPORT_SECTIONS.values(), (TAG_ROWS, POST_ROWS, MODEL_ROWS)
+        ):
+            with open(path, encoding="utf-8", newline="") as csv_file:
+                self.assertEqual(
+                    list(csv.reader(csv_file)),
+                    [list(header), *([str(value) for value in row] for row in rows)],
+                )
+
+    def test_jsonl(self):
+        paths = create_tag_report(self.site, "report", "jsonl", hints=HINTS)
+
+        self.assertEqual([path.name for path in paths], ["report.jsonl"])
+        with open(paths[0], encoding="utf-8") as jsonl_file:
+            records = [json.loads(line) for line in jsonl_file]
+        # Post rows are streamed while the posts are read, tags and models follow.
+        self.assertEqual(
+            records,
+            [
+                {"section": section, **dict(zip(TAG_REPORT_SECTIONS[section][1], row))}
+                for section, rows in (
+                    ("posts", POST_ROWS),
+                    ("tags", TAG_ROWS),
+                    ("models", MODEL_ROWS),
+                )
+                for row in rows
+            ],
+        )
+
+    def test_report_format_option(self):
+        def tag_report(*args, **kwargs):
+            return create_tag_report(*args, hints=HINTS, **kwargs)
+
+        with (
+            mock.patch.object(reporting, "get_site", return_value=self.site),
+            mock.patch.object(reporting, "create_tag_report", side_effect=tag_report),
+            mock.patch("sys.argv", ["reporting", "--excel", "--report-format", "csv"]),
+        ):
+            reporting.main()
+        self.assertEqual(
+            sorted(
+                name.rsplit("-", 1)[1]
+                for name in os.listdir(".")
+                if name.endswith(".csv")
+            ),
+            ["models.csv", "posts.csv", "tags.csv"],
+        )
+
+        with mock.patch("sys.argv", ["reporting", "--excel", "--report-format", "pdf"]):
+            with self.assertRaises(SystemExit):
+                reporting.parse_args().parse_args()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for core.utils.data_access.WebDriverPool
+
+This module leases stand-in webdriver sessions to verify that they are reused and reset
+between leases, and replaced after their maximum number of uses, a crash or a lost connection.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+from selenium.common.exceptions import WebDriverException
+
+# Local implementation to be tested
+from core.utils.data_access import WebDriverPool
+
+
+class StandInSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window = handle
+
+
+class StandInDriver:
+    def __init__(self):
+        self.cookies = {"session": "1"}
+        self.url = "https://example.com"
+        self.handles = ["main"]
+        self.current_window = "main"
+        self.crashed = False
+        self.unreachable = False
+        self.quit_called = False
+        self.switch_to = StandInSwitchTo(self)
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise WebDriverException("invalid session id")
+        if self.unreachable:
+            # The HTTP client of the driver fails before Selenium sees a response.
+            raise ConnectionRefusedError("Connection refused")
+        return list(self.handles)
+
+    def close(self):
+        self.handles.remove(self.current_window)
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+        if self.unreachable:
+            raise ConnectionRefusedError("Connection refused")
+
+
+class StandInFactory:
+    def __init__(self):
+        self.drivers = []
+
+    def get_instance(self):
+        self.drivers.append(StandInDriver())
+        return self.drivers[-1]
+
+
+class TestWebDriverPool(unittest.TestCase):
+    def setUp(self):
+        self.factory = StandInFactory()
+        self.pool = WebDriverPool(self.factory, size=2, max_uses=3)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuse_and_reset(self):
+        with self.pool.lease() as driver:
+            driver.handles.append("popup")
+        with self.pool.lease() as reused:
+            self.assertIs(reused, driver)
+            self.assertEqual(reused.cookies, {})
+            self.assertEqual(reused.handles, ["main"])
+            self.assertEqual(reused.url, "about:blank")
+        self.assertEqual(len(self.factory.drivers), 1)
+
+    def test_recycle(self):
+        for _ in range(3):
+            with self.pool.lease():
+                pass
+        self.assertTrue(self.factory.drivers[0].quit_called)
+
+        with self.assertRaises(ValueError):
+            with self.pool.lease() as driver:
+                driver.crashed = True
+                raise ValueError("flow failed")
+        self.assertTrue(driver.quit_called)
+        with self.pool.lease() as driver:
+            self.assertEqual(len(self.factory.drivers), 3)
+
+    def test_unreachable_driver(self):
+        # The error of the flow is not masked by the failed reset.
+        with self.assertRaises(ValueError):
+            with self.pool.lease() as driver:
+                driver.unreachable = True
+                raise ValueError("flow failed")
+        self.assertTrue(driver.quit_called)
+        with self.pool.lease() as replacement:
+            self.assertIsNot(replacement, driver)
+        self.assertEqual(len(self.factory.drivers), 2)
+
+    def test_warm(self):
+        self.pool.warm()
+        with self.pool.lease(), self.pool.lease():
+            self.assertEqual(len(self.factory.drivers), 2)
+        self.pool.close()
+        self.assertTrue(all(driver.quit_called for driver in self.factory.drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()
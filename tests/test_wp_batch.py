@@ -0,0 +1,226 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the batch methods of wordpress.WordPress
+
+This module sends batch requests through a stand-in HTTP session to verify that requests are
+chunked, that sites without the batch endpoint and failed chunks fall back to single requests,
+that the responses keep the order of the requests and that the created posts and terms
+are applied to the local cache.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.models.batch import WPBatchRequest
+from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
+
+# Test fixtures
+from tests.wp_fixtures import (
+    StandInCollection,
+    StandInHTTP,
+    make_post,
+    make_response,
+    make_site,
+)
+
+BATCH_URL = "https://example.com/wp-json/batch/v1"
+
+
+def created_post(post_id: int, status: str = "publish") -> dict:
+    return {
+        **make_post(post_id),
+        "tags": [],
+        "status": status,
+        "content": {"rendered": f"<p>Post {post_id}</p>"},
+        "type": "post",
+        "author": 1,
+    }
+
+
+class StandInBatchSite:
+    """
+    Answers batch calls with ``batch_status`` and one ``201`` item per request,
+    except for the paths in ``not_allowed``, and single requests with ``single_status``.
+    """
+
+    def __init__(self, batch_status: int = 207, single_status: int = 201):
+        self.batch_status = batch_status
+        self.single_status = single_status
+        self.not_allowed: set = set()
+        self.next_id = 100
+
+    def item_body(self, endpoint: str, body: dict) -> dict:
+        self.next_id += 1
+        if endpoint.endswith("/tags"):
+            return {"id": self.next_id, "slug": body["slug"]}
+        post_id = (
+            int(endpoint.rsplit("/", 1)[1])
+            if body == {"status": "publish"}
+            else self.next_id
+        )
+        return created_post(post_id)
+
+    def __call__(self, method, endpoint, **kwargs):
+        if endpoint != BATCH_URL:
+            return make_response(
+                self.single_status, self.item_body(endpoint, kwargs["json"])
+            )
+        if self.batch_status not in (200, 207):
+            return make_response(self.batch_status, {"code": "rest_no_route"})
+        responses = []
+        for item in kwargs["json"]["requests"]:
+            if item["path"] in self.not_allowed:
+                body = {"code": "rest_batch_not_allowed"}
+                responses.append({"status": 400, "body": body})
+            else:
+                endpoint = item["path"].removeprefix("/wp/v2")
+                body = self.item_body(endpoint, item["body"])
+                responses.append({"status": 201, "body": body})
+        return make_response(self.batch_status, {"responses": responses})
+
+
+class TestWordPressBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.site_handler = StandInBatchSite()
+        self.http = StandInHTTP(self.site_handler)
+        self.site = make_site(
+            os.path.join(self.tmp_dir.name, "posts.json"),
+            StandInCollection(
+                [{**make_post(post_id), "tags": [post_id]} for post_id in (1, 2)]
+            ),
+            self.http,
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def batch_calls(self) -> list:
+        return [call for call in self.http.calls if call[1] == BATCH_URL]
+
+    def single_calls(self) -> list:
+        return [call for call in self.http.calls if call[1] != BATCH_URL]
+
+    def tags(self, count: int) -> list:
+        return [{"name": f"Tag {num}", "slug": f"tag-{num}"} for num in range(count)]
+
+    def test_chunks(self):
+        statuses = self.site.batch_tag_create(self.tags(30))
+
+        self.assertEqual(statuses, [201] * 30)
+        batch_calls = self.batch_calls()
+        self.assertEqual(
+            [len(call[2]["json"]["requests"]) for call in batch_calls], [25, 5]
+        )
+        first_request = batch_calls[0][2]["json"]
+        self.assertEqual(first_request["validation"], "normal")
+        self.assertEqual(
+            first_request["requests"][0],
+            {
+                "method": "POST",
+                "path": "/wp/v2/tags",
+                "body": {"name": "Tag 0", "slug": "tag-0"},
+            },
+        )
+        self.assertEqual(self.single_calls(), [])
+        self.assertTrue(self.site._batch_supported)
+
+    def test_responses_in_request_order(self):
+        responses = self.site.batch(
+            [
+                WPBatchRequest("POST", "/tags", {"name": "A", "slug": f"tag-{num}"})
+                for num in range(30)
+            ]
+        )
+        self.assertEqual(
+            [response.body["slug"] for response in responses],
+            [f"tag-{num}" for num in range(30)],
+        )
+
+    def test_unsupported_endpoint(self):
+        self.site_handler.batch_status = 404
+        self.site_handler.single_status = 200
+
+        self.assertEqual(self.site.batch_publish_posts([1, 2]), [200, 200])
+        self.assertFalse(self.site._batch_supported)
+        self.assertEqual(len(self.batch_calls()), 1)
+        self.assertEqual(
+            [call[:2] for call in self.single_calls()],
+            [("POST", "/posts/1"), ("POST", "/posts/2")],
+        )
+
+        # The fallback is remembered, later calls skip the batch endpoint.
+        self.assertEqual(self.site.batch_publish_posts([1]), [200])
+        self.assertEqual(len(self.batch_calls()), 1)
+        self.assertEqual(len(self.single_calls()), 3)
+
+    def test_failed_chunk(self):
+        self.site_handler.batch_status = 500
+
+        self.assertEqual(self.site.batch_tag_create(self.tags(27)), [201] * 27)
+        self.assertEqual(len(self.batch_calls()), 2)
+        self.assertEqual(len(self.single_calls()), 27)
+        # A failed call does not rule out the batch endpoint.
+        self.assertIsNone(self.site._batch_supported)
+
+    def test_items_not_allowed(self):
+        self.site_handler.not_allowed.add("/wp/v2/tags")
+        responses = self.site.batch(
+            [
+                WPBatchRequest("POST", "/posts", {"title": "First"}),
+                WPBatchRequest("POST", "/tags", {"name": "Tag", "slug": "tag-x"}),
+                WPBatchRequest("POST", "/posts", {"title": "Second"}),
+            ]
+        )
+
+        self.assertEqual([response.status for response in responses], [201] * 3)
+        self.assertEqual(responses[1].body["slug"], "tag-x")
+        self.assertEqual(
+            [call[:2] for call in self.single_calls()], [("POST", "/tags")]
+        )
+        self.assertTrue(self.site._batch_supported)
+
+    def test_created_posts_merged(self):
+        self.site_handler.not_allowed.add("/wp/v2/posts")
+        self.site_handler.single_status = 400
+
+        self.assertEqual(
+            self.site.batch_post_create([{"title": "New"}, {"title": "Rejected"}]),
+            [400, 400],
+        )
+        self.assertEqual(self.site.created_posts, [])
+
+        self.site_handler.not_allowed.clear()
+        self.assertEqual(
+            self.site.batch_post_create([{"title": "New"}, {"title": "Other"}]),
+            [201, 201],
+        )
+        created_ids = [post.post_id for post in self.site.created_posts]
+        self.assertEqual(len(created_ids), 2)
+        for post_id in created_ids:
+            cached = self.site.get_by_id(post_id)
+            self.assertNotIn("status", cached)
+            self.assertTrue(self.site.has_slug(cached["slug"]))
+        self.assertEqual(self.site.local_changes, 2)
+        self.assertTrue(self.site.cache_dirty)
+
+    def test_created_terms_merged(self):
+        self.site.batch_tag_create(
+            [{"name": "Blue Sky", "slug": "blue-sky"}], merge_terms=False
+        )
+        self.site.batch_tag_create([{"name": "Red Sea", "slug": "red-sea"}])
+
+        tag_ids = self.site.map_wp_class_id(WPTaxonomyMarker.TAG, WPTaxonomyValues.TAGS)
+        self.assertNotIn("Blue Sky", tag_ids)
+        self.assertEqual(tag_ids["Red Sea"], self.site_handler.next_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
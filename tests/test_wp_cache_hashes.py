@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPCacheHashes
+
+This module verifies that the cache sync ledger detects changed posts by ``modified_gmt``,
+keeps its rolling digest in step with the recorded hashes and round-trips through the cache metadata.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPCacheHashes, post_content_hash
+
+# Test fixtures
+from tests.wp_fixtures import make_post
+
+
+class TestWPCacheHashes(unittest.TestCase):
+    def setUp(self):
+        self.posts = [make_post(post_id) for post_id in (1, 2, 3)]
+        self.hashes = WPCacheHashes.from_posts(self.posts)
+
+    def test_content_hash(self):
+        post = make_post(1)
+        reordered = dict(reversed(list(post.items())))
+        self.assertEqual(post_content_hash(post), post_content_hash(reordered))
+        self.assertNotEqual(
+            post_content_hash(post),
+            post_content_hash(make_post(2, modified=post["modified"])),
+        )
+
+    def test_changed_ids(self):
+        live = [
+            {
+                "id": 1,
+                "modified": "2024-01-01T00:00:00",
+                "modified_gmt": "2024-01-01T00:00:00",
+            },
+            {
+                "id": 2,
+                "modified": "2024-02-01T00:00:00",
+                "modified_gmt": "2024-02-01T00:00:00",
+            },
+            {
+                "id": 4,
+                "modified": "2024-01-01T00:00:00",
+                "modified_gmt": "2024-01-01T00:00:00",
+            },
+            {
+                "id": 5,
+                "modified": "2024-01-01T00:00:00",
+                "modified_gmt": "2024-01-01T00:00:00",
+            },
+        ]
+        self.hashes.invalidate(self.posts[0])
+        self.assertEqual(
+            self.hashes.changed_ids(live, {4: "2024-01-01T00:00:00"}),
+            ([1, 2, 5], [4]),
+        )
+
+    def test_digest(self):
+        self.assertEqual(self.hashes.digest, WPCacheHashes.digest_of(self.posts))
+        self.hashes.record_post(make_post(4))
+        self.hashes.remove(4)
+        self.assertEqual(self.hashes.digest, WPCacheHashes.digest_of(self.posts))
+
+        restored = WPCacheHashes.from_metadata(self.hashes.to_metadata())
+        self.assertEqual(restored.digest, self.hashes.digest)
+        self.assertEqual(restored.get(1), self.hashes.get(1))
+        tampered = {**self.hashes.to_metadata(), "cache_digest": "0" * 16}
+        self.assertIsNone(WPCacheHashes.from_metadata(tampered))
+
+        self.posts[1]["title"] = {"rendered": "Edited"}
+        self.assertEqual(self.hashes.reconcile(self.posts), 1)
+        self.assertIsNone(self.hashes.get(2)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the cache sync of wordpress.WordPress
+
+This module syncs local caches against a stand-in collection to verify that new and changed
+posts are downloaded by ID in ``include`` chunks, that only posts with a new ``modified_gmt`` or
+content hash are downloaded and written, that deleted and unpublished posts are dropped, that a count
+drift does not rebuild the cache and that a failed sync leaves the ledger of the instance untouched.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+# Local implementation to be tested
+from wordpress.exceptions.internal_exceptions import PageFetchError
+
+# Test fixtures
+from tests.wp_fixtures import StandInCollection, make_post, make_site
+
+LISTING_QUERY = {"_fields": "id,modified,modified_gmt"}
+UPDATED = "2024-02-01T00:00:00"
+
+
+def site_post(post_id: int, **kwargs) -> dict:
+    return make_post(post_id, date=f"2023-01-{post_id:02d}T00:00:00", **kwargs)
+
+
+class TestWordPressCacheSync(unittest.TestCase):
+    cache_name = "posts.json"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, self.cache_name)
+        self.collection = StandInCollection(site_post(post_id) for post_id in (1, 2, 3))
+        self.site = make_site(self.cache_path, self.collection)
+        self.collection.queries.clear()
+
+    def tearDown(self):
+        self.site.close()
+        self.tmp_dir.cleanup()
+
+    def title(self, post_id: int) -> str:
+        return self.site.get_posts_by_id([post_id])[0]["title"]["rendered"]
+
+    def test_added_changed_deleted(self):
+        self.collection.posts[2] = site_post(2, title="Changed", modified=UPDATED)
+        self.collection.posts[4] = site_post(4)
+        del self.collection.posts[3]
+
+        self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queries[0], LISTING_QUERY)
+        self.assertEqual(self.collection.queried_ids(), [[4, 2]])
+        self.assertEqual(self.site.post_ids(), {1, 2, 4})
+        self.assertEqual(self.title(2), "Changed")
+        self.assertEqual(self.site.cache_hashes.get(2)[0], UPDATED)
+        self.assertNotIn(3, self.site.cache_hashes)
+        self.assertEqual(self.site.last_modified, UPDATED)
+        self.assertFalse(self.site.cache_dirty)
+
+        # The cache and its ledger are persisted, so the next instance has nothing to download.
+        if self.cache_name.endswith(".json"):
+            with open(self.cache_path) as cache_file:
+                cached_ids = {post["id"] for post in json.load(cache_file)}
+            self.assertEqual(cached_ids, {1, 2, 4})
+        self.site.close()
+        self.collection.queries.clear()
+        self.site = make_site(self.cache_path, self.collection)
+        self.assertEqual(self.collection.queries, [LISTING_QUERY])
+        self.assertEqual(self.site.post_ids(), {1, 2, 4})
+        self.assertEqual(self.title(2), "Changed")
+
+    def test_include_chunks(self):
+        for post_id in (1, 2, 3):
+            self.collection.posts[post_id] = site_post(post_id, modified=UPDATED)
+        for post_id in (4, 5):
+            self.collection.posts[post_id] = site_post(post_id)
+
+        with mock.patch("wordpress.wordpress_api.WP_MAX_PER_PAGE", 2):
+            self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queried_ids(), [[5, 4], [3, 2], [1]])
+        self.assertEqual(self.site.post_ids(), {1, 2, 3, 4, 5})
+
+    def test_unpublished_dropped(self):
+        self.collection.posts[1]["status"] = "draft"
+        del self.collection.posts[2]
+
+        self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queried_ids(), [])
+        self.assertEqual(self.site.post_ids(), {3})
+        self.assertEqual(len(self.site.cache_hashes), 1)
+        self.assertEqual(self.site.total_posts, 1)
+
+    def test_only_changed_written(self):
+        self.collection.posts[2] = site_post(2, title="Changed", modified=UPDATED)
+        # A merged post is downloaded again, but the version served by the site is already cached.
+        self.site.merge_post(self.site.get_posts_by_id([3])[0].to_dict())
+        store = self.site._post_store or self.site._cache_backend
+
+        with mock.patch.object(store, "upsert", wraps=store.upsert) as upsert:
+            self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queried_ids(), [[3, 2]])
+        self.assertEqual([call.args[0]["id"] for call in upsert.call_args_list], [2])
+        self.assertEqual(self.site.cache_hashes.get(3)[0], "2024-01-01T00:00:00")
+
+    def test_digest_mismatch(self):
+        if self.site._cache_backend is not None:
+            self.skipTest("the SQLite backend writes posts and ledger together")
+        # The cache file was written without its metadata.
+        self.site.post_store.upsert(site_post(1, title="Edited"))
+
+        self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queried_ids(), [[1]])
+        self.assertEqual(self.title(1), "Post 1")
+
+    def test_count_drift(self):
+        self.collection.total = 5
+
+        with (
+            mock.patch.object(self.site, "create_export_local_cache") as rebuild,
+            self.assertLogs(level="WARNING") as logs,
+        ):
+            self.assertTrue(self.site.cache_sync())
+        rebuild.assert_not_called()
+        self.assertIn("count drift: 3 cached vs 5 reported", logs.output[0])
+        self.assertEqual(self.collection.queried_ids(), [])
+        self.assertEqual(self.site.total_posts, 5)
+
+    def test_failed_sync_keeps_ledger(self):
+        for post_id in (2, 3):
+            self.collection.posts[post_id] = site_post(
+                post_id, title="Changed", modified=UPDATED
+            )
+        ledger = self.site.cache_hashes
+        ledger_metadata = ledger.to_metadata()
+        fetch = self.collection.fetch
+
+        def fail_second_chunk(endpoint, query=None, **kwargs):
+            if self.collection.queried_ids():
+                raise PageFetchError(endpoint, 1)
+            return fetch(endpoint, query, **kwargs)
+
+        with (
+            mock.patch("wordpress.wordpress_api.WP_MAX_PER_PAGE", 1),
+            mock.patch.object(self.collection, "fetch", side_effect=fail_second_chunk),
+        ):
+            with self.assertRaises(PageFetchError):
+                self.site.update_json_cache()
+        self.assertIs(self.site.cache_hashes, ledger)
+        self.assertEqual(ledger.to_metadata(), ledger_metadata)
+
+        # Both posts are still outdated in the ledger, so the next sync downloads them again.
+        self.collection.queries.clear()
+        self.assertTrue(self.site.cache_sync())
+        self.assertEqual(self.collection.queried_ids(), [[3, 2]])
+        self.assertEqual([self.title(2), self.title(3)], ["Changed", "Changed"])
+
+
+class TestWordPressCacheSyncSQLite(TestWordPressCacheSync):
+    cache_name = "posts.db"
+
+    def test_database_only(self):
+        self.collection.posts[2] = site_post(2, title="Changed", modified=UPDATED)
+        del self.collection.posts[3]
+
+        self.site.close()
+        self.site = make_site(self.cache_path, self.collection)
+        # The changes went straight to the database, without loading the cached posts.
+        self.assertIsNone(self.site._post_store)
+        self.assertEqual(self.site.post_ids(), {1, 2})
+        self.assertEqual(self.title(2), "Changed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.client.WPHTTPSession
+
+This module runs the pooled HTTP session against a local stand-in for the WordPress REST API
+to verify that credentials are sent, connections are reused and idempotent requests are retried.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import json
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local implementation to be tested
+from wordpress.client import WPHTTPSession
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections: set = set()
+    authorizations: list = []
+    failures: int = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._record()
+        if StandInHandler.failures > 0:
+            StandInHandler.failures -= 1
+            return self._send(503, {"code": "unavailable"})
+        self._send(200, [{"id": 1}])
+
+    def do_POST(self):
+        self._record()
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send(201, {"id": 2})
+
+    def _record(self):
+        self.connections.add(self.client_address)
+        self.authorizations.append(self.headers.get("Authorization"))
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestWPHTTPSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/wp-json/wp/v2"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StandInHandler.connections.clear()
+        StandInHandler.authorizations.clear()
+        StandInHandler.failures = 0
+
+    def test_connection_reuse(self):
+        with WPHTTPSession(self.base_url, "user", "app password") as http:
+            for _ in range(5):
+                self.assertEqual(
+                    http.post("/posts", json={"title": "x"}).status_code, 201
+                )
+            self.assertEqual(http.get("/posts").json(), [{"id": 1}])
+        self.assertEqual(len(StandInHandler.connections), 1)
+        self.assertEqual(len(set(StandInHandler.authorizations)), 1)
+        self.assertTrue(StandInHandler.authorizations[0].startswith("Basic "))
+
+    def test_retry_on_server_error(self):
+        StandInHandler.failures = 2
+        with WPHTTPSession(
+            self.base_url, "user", "app password", backoff_factor=0
+        ) as http:
+            self.assertEqual(http.get("/posts").status_code, 200)
+        self.assertEqual(len(StandInHandler.authorizations), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the local changes of wordpress.WordPress
+
+This module merges posts into local caches built from a stand-in collection to verify that
+only the cached fields are kept, that the post store, the SQLite database and the sync ledger
+are updated together, and that ``sync_local_changes`` and the ``sync_every`` option of the
+content bot flows only sync once enough posts were merged.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+from types import SimpleNamespace
+
+# Local implementation to be tested
+from wordpress.cache import WPSQLiteCache
+from workflows.interfaces import ContentBotFlow
+
+# Test fixtures
+from tests.wp_fixtures import StandInCollection, make_post, make_site
+
+LISTING_QUERY = {"_fields": "id,modified,modified_gmt"}
+
+
+def created_post(post_id: int) -> dict:
+    post = make_post(post_id)
+    post["yoast_head_json"]["og_image"] = [{"url": "https://example.com/a.jpg"}]
+    return {**post, "status": "publish", "content": {"rendered": "<p>Body</p>"}}
+
+
+class TestWordPressLocalChanges(unittest.TestCase):
+    cache_name = "posts.json"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp_dir.name, self.cache_name)
+        self.collection = StandInCollection([make_post(1), make_post(2)])
+        self.site = make_site(self.cache_path, self.collection)
+        self.collection.queries.clear()
+
+    def tearDown(self):
+        self.site.close()
+        self.tmp_dir.cleanup()
+
+    def publish(self, post_id: int) -> None:
+        """Publishes a post on the stand-in site and merges the API response."""
+        post = created_post(post_id)
+        self.collection.posts[post_id] = post
+        self.site.merge_post(post)
+
+    def test_merge_post(self):
+        self.publish(3)
+
+        cached = self.site.get_by_id(3)
+        self.assertNotIn("status", cached)
+        self.assertNotIn("content", cached)
+        self.assertEqual(cached["yoast_head_json"], {"title": "Post 3 - Example"})
+        self.assertTrue(self.site.has_slug("post-3"))
+        # The merged post is downloaded again by the next sync.
+        self.assertIsNone(self.site.cache_hashes.get(3)[0])
+        self.assertTrue(self.site.cache_dirty)
+        self.assertEqual(self.site.local_changes, 1)
+        if self.site._cache_backend is not None:
+            # The merge is committed, so other connections see it.
+            database = WPSQLiteCache(self.cache_path)
+            self.assertEqual(database.load_posts_by_id([3])[3]["slug"], "post-3")
+            database.close()
+
+    def test_sync_local_changes(self):
+        self.assertIsNone(self.site.sync_local_changes())
+
+        self.publish(3)
+        self.publish(4)
+        self.assertIsNone(self.site.sync_local_changes(3))
+        self.assertEqual(self.collection.queries, [])
+
+        self.publish(5)
+        self.assertTrue(self.site.sync_local_changes(3))
+        self.assertEqual(self.collection.queries[0], LISTING_QUERY)
+        self.assertEqual(self.collection.queried_ids(), [[3, 4, 5]])
+        self.assertFalse(self.site.cache_dirty)
+        self.assertEqual(self.site.local_changes, 0)
+        self.assertEqual(self.site.cache_hashes.get(3)[0], "2024-01-01T00:00:00")
+        self.assertIsNone(self.site.sync_local_changes())
+
+    def test_sync_every(self):
+        flow = SimpleNamespace(
+            _interactive=False,
+            _post_add=True,
+            _iter_num=0,
+            _posts_required=10,
+            _auto_cache_sync=True,
+            _sync_every=3,
+            _site=self.site,
+        )
+        syncs = []
+        for post_id in range(3, 10):
+            self.publish(post_id)
+            flow._iter_num += 1
+            self.assertTrue(ContentBotFlow._add_post_prompt(flow))
+            syncs.append(self.collection.queries.count(LISTING_QUERY))
+        self.assertEqual(syncs, [0, 0, 1, 1, 1, 2, 2])
+        self.assertEqual(self.site.local_changes, 1)
+
+
+class TestWordPressLocalChangesSQLite(TestWordPressLocalChanges):
+    cache_name = "posts.db"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPPageFetcher
+
+This module runs the page fetcher against a local stand-in for the WordPress REST API
+to verify page-ordered assembly, retries on server errors and checkpoint resumption.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local implementation to be tested
+from wordpress.cache import WPPageFetcher
+from wordpress.exceptions.internal_exceptions import PageFetchError
+
+TOTAL_POSTS = 95
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures: dict = {}
+    requested_pages: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query["page"][0])
+        per_page = int(query["per_page"][0])
+        self.requested_pages.append(page)
+        if self.failures.get(page, 0) > 0:
+            self.failures[page] -= 1
+            return self._send(503, {"code": "unavailable"})
+        first = (page - 1) * per_page + 1
+        items = [
+            {"id": post_id}
+            for post_id in range(first, min(first + per_page, TOTAL_POSTS + 1))
+        ]
+        total_pages = -(-TOTAL_POSTS // per_page)
+        self._send(
+            200,
+            items,
+            {"X-WP-Total": str(TOTAL_POSTS), "X-WP-TotalPages": str(total_pages)},
+        )
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestWPPageFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/wp-json/wp/v2"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StandInHandler.failures = {}
+        StandInHandler.requested_pages = []
+        self.progress = []
+        self.fetcher = WPPageFetcher(
+            self.base_url,
+            "user",
+            "app password",
+            concurrency=3,
+            max_retries=2,
+            backoff_factor=0.01,
+            progress_callback=lambda done, total: self.progress.append((done, total)),
+        )
+
+    def test_page_order(self):
+        items, total = self.fetcher.fetch("/posts", per_page=10)
+        self.assertEqual(total, TOTAL_POSTS)
+        self.assertEqual([item["id"] for item in items], list(range(1, 96)))
+        self.assertEqual(self.progress[-1], (10, 10))
+
+    def test_retry_server_errors(self):
+        StandInHandler.failures = {4: 2}
+        items, _ = self.fetcher.fetch("/posts", per_page=10)
+        self.assertEqual(len(items), TOTAL_POSTS)
+        self.assertEqual(StandInHandler.requested_pages.count(4), 3)
+
+    def test_retries_exhausted(self):
+        StandInHandler.failures = {2: 3}
+        with self.assertRaises(PageFetchError) as ctx:
+            self.fetcher.fetch("/posts", per_page=10)
+        self.assertEqual(ctx.exception.status, 503)
+
+    def test_checkpoint_resume(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = os.path.join(tmp_dir, "posts_checkpoint.jsonl")
+            StandInHandler.failures = {7: 3}
+            with self.assertRaises(PageFetchError):
+                self.fetcher.fetch("/posts", per_page=10, checkpoint_path=checkpoint)
+            self.assertTrue(os.path.exists(checkpoint))
+
+            StandInHandler.requested_pages = []
+            items, _ = self.fetcher.fetch(
+                "/posts", per_page=10, checkpoint_path=checkpoint
+            )
+            self.assertEqual([item["id"] for item in items], list(range(1, 96)))
+            self.assertNotIn(2, StandInHandler.requested_pages)
+            self.assertFalse(os.path.exists(checkpoint))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.WordPress.post_polling
+
+This module polls a stand-in site with a stand-in clock to verify that the delay between
+requests doubles up to ``max_delay``, that polling stops at the ``deadline`` or when the
+credentials are rejected, that only published posts are merged and that the legacy
+``full_sync`` mode polls by syncing the local cache.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+# Third-party imports
+import requests
+
+# Test fixtures
+from tests.wp_fixtures import (
+    StandInCollection,
+    StandInHTTP,
+    make_post,
+    make_response,
+    make_site,
+)
+
+
+class StandInClock:
+    """Replaces the ``time`` module, ``sleep`` advances the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.on_sleep = None
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep is not None:
+            self.on_sleep(len(self.sleeps))
+
+
+class TestPostPolling(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.responses = []
+        self.http = StandInHTTP(self.respond)
+        self.collection = StandInCollection([make_post(1)])
+        self.site = make_site(
+            os.path.join(self.tmp_dir.name, "posts.json"), self.collection, self.http
+        )
+        self.clock = StandInClock()
+        self.patches = [
+            mock.patch("wordpress.wordpress_api.time", self.clock),
+            mock.patch.dict(os.environ),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.tmp_dir.cleanup()
+
+    def respond(self, method, endpoint, **kwargs):
+        response = (
+            self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        )
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def polled(self, status: str = "publish") -> requests.Response:
+        return make_response(200, [{**make_post(2), "status": status}])
+
+    def test_backoff(self):
+        self.responses = [make_response(200, [])] * 3 + [
+            self.polled("future"),
+            make_response(200, []),
+            self.polled(),
+        ]
+
+        self.assertTrue(self.site.post_polling("post-2", retry_offset=5, max_delay=30))
+        self.assertEqual(self.clock.sleeps, [5, 10, 20, 30, 30])
+        method, endpoint, kwargs = self.http.calls[0]
+        self.assertEqual((method, endpoint), ("GET", "/posts"))
+        self.assertEqual(kwargs["params"]["slug"], "post-2")
+        self.assertTrue(
+            kwargs["params"]["_fields"].startswith("id,link,status,date,modified")
+        )
+        self.assertEqual(os.environ["LATEST_POST"], "https://example.com/post-2/")
+        self.assertNotIn("status", self.site.get_by_slug("post-2"))
+        self.assertEqual(self.site.local_changes, 1)
+
+    def test_deadline(self):
+        self.responses = [make_response(200, [])]
+
+        self.assertIsNone(
+            self.site.post_polling("post-2", retry_offset=5, deadline=60, max_delay=30)
+        )
+        self.assertEqual(self.clock.sleeps, [5, 10, 20, 25])
+        self.assertEqual(len(self.http.calls), 5)
+        self.assertFalse(self.site.has_slug("post-2"))
+
+    def test_errors_retried(self):
+        self.responses = [
+            requests.ConnectionError("reset"),
+            make_response(503, {"code": "unavailable"}),
+            make_response(200),
+            self.polled(),
+        ]
+
+        self.assertTrue(self.site.post_polling("post-2", retry_offset=0))
+        self.assertEqual(self.clock.sleeps, [1, 2, 4])
+
+    def test_rejected(self):
+        self.responses = [make_response(401, {"code": "rest_forbidden"})]
+
+        self.assertIsNone(self.site.post_polling("post-2"))
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertNotIn("LATEST_POST", os.environ)
+
+    def test_full_sync(self):
+        def publish(sleeps: int) -> None:
+            if sleeps == 2:
+                self.collection.posts[2] = make_post(2)
+
+        self.clock.on_sleep = publish
+        self.collection.queries.clear()
+
+        self.assertTrue(self.site.post_polling("post-2", full_sync=True))
+        self.assertEqual(self.clock.sleeps, [5, 4])
+        self.assertEqual(self.http.calls, [])
+        self.assertEqual(len(self.collection.queried_ids()), 1)
+        self.assertEqual(os.environ["LATEST_POST"], "https://example.com/post-2/")
+
+
+if __name__ == "__main__":
+    unittest.main()
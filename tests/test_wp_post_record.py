@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPostRecord
+
+This module verifies that compact post records read like the post dictionaries
+they are built from and that ``to_dict()`` restores the original post.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPostRecord
+
+POST = {
+    "id": 7,
+    "date": "2024-01-01T00:00:00",
+    "modified": "2024-02-01T00:00:00",
+    "slug": "first-post",
+    "link": "https://example.com/first-post/",
+    "title": {"rendered": "First Post"},
+    "excerpt": {"rendered": "<p>Excerpt</p>"},
+    "class_list": ["post-7", "tag-python", "category-news"],
+    "tags": [12, 34],
+    "categories": [5],
+    "yoast_head_json": {"title": "First Post - Example"},
+}
+
+
+class TestWPostRecord(unittest.TestCase):
+    def test_mapping_access(self):
+        record = WPostRecord(POST)
+        self.assertEqual(record["slug"], "first-post")
+        self.assertEqual(record["title"], {"rendered": "First Post"})
+        self.assertEqual(record["class_list"], POST["class_list"])
+        self.assertEqual(record["tags"], [12, 34])
+        self.assertEqual(record["yoast_head_json"]["title"], "First Post - Example")
+        self.assertEqual(list(record), list(POST))
+        self.assertIsNone(record.get("status"))
+        with self.assertRaises(KeyError):
+            record["status"]
+
+    def test_round_trip(self):
+        record = WPostRecord(POST)
+        self.assertEqual(record.to_dict(), POST)
+        self.assertEqual(list(record.to_dict()), list(POST))
+        self.assertEqual(record, POST)
+
+    def test_unexpected_values_round_trip(self):
+        post = {
+            "id": 8,
+            "slug": "odd-post",
+            "title": {"rendered": "Odd", "raw": "Odd"},
+            "class_list": {"0": "post-8"},
+            "tags": [-1, True],
+        }
+        self.assertEqual(WPostRecord(post).to_dict(), post)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPPostStore
+
+This module verifies that the indexes kept by the post store (ID, slug, link and
+normalized title) stay consistent when posts are inserted, replaced and removed.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPPostStore
+
+# Test fixtures
+from tests.wp_fixtures import make_post
+
+
+class TestWPPostStore(unittest.TestCase):
+    def setUp(self):
+        self.store = WPPostStore(
+            [
+                make_post(1, "First Post", slug="first-post"),
+                make_post(
+                    2,
+                    "Second &amp; Post",
+                    "2024-01-02T00:00:00",
+                    slug="second-post",
+                ),
+            ]
+        )
+
+    def test_lookups(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertTrue(self.store.has_slug("first-post"))
+        self.assertFalse(self.store.has_slug("third-post"))
+        self.assertEqual(self.store.get_by_id(2)["slug"], "second-post")
+        self.assertEqual(
+            self.store.get_by_link("https://example.com/first-post/")["id"], 1
+        )
+        self.assertTrue(self.store.has_title("first post"))
+        self.assertTrue(self.store.has_title("Second & Post"))
+        self.assertTrue(self.store.has_title("First Post", yoast_support=True))
+
+    def test_order(self):
+        self.assertEqual([post["id"] for post in self.store.posts()], [2, 1])
+
+    def test_upsert_and_remove(self):
+        version = self.store.version
+        self.store.upsert(make_post(1, "Renamed", slug="renamed"))
+        self.assertGreater(self.store.version, version)
+        self.assertFalse(self.store.has_slug("first-post"))
+        self.assertFalse(self.store.has_title("First Post"))
+        self.assertTrue(self.store.has_slug("renamed"))
+
+        removed = self.store.remove(2)
+        self.assertEqual(removed["id"], 2)
+        self.assertIsNone(self.store.remove(2))
+        self.assertFalse(self.store.has_title("Second & Post"))
+        self.assertEqual([post["id"] for post in self.store], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
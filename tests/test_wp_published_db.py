@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPPublishedDB
+
+This module verifies that the published posts database applies changed posts and removals
+incrementally, adds cached posts missing from the table and answers slug and normalized title
+lookups.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPPublishedDB
+
+# Test fixtures
+from tests.wp_fixtures import make_post
+
+
+class TestWPPublishedDB(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = WPPublishedDB(os.path.join(self.tmp_dir.name, "wp-posts.db"))
+        self.db.update(
+            [
+                make_post(1, "Jane &amp; Ann", "2024-01-01T00:00:00"),
+                make_post(2, "Second Post", "2024-01-02T00:00:00"),
+            ],
+            {1, 2},
+        )
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp_dir.cleanup()
+
+    def test_lookups(self):
+        self.assertTrue(self.db.has_title("  jane & ANN "))
+        self.assertTrue(self.db.has_slug("post-2"))
+        self.assertFalse(self.db.has_slug("post-3"))
+        self.assertEqual(
+            self.db.published_mask(["Jane & Ann", "Third Post", None, "second post"]),
+            [True, False, False, True],
+        )
+        self.assertEqual(self.db.last_modified(), "2024-01-02T00:00:00")
+
+    def test_incremental_update(self):
+        self.assertEqual(
+            self.db.update(
+                [make_post(2, "Renamed Post", "2024-02-01T00:00:00")], {2, 3}
+            ),
+            (1, 1),
+        )
+        self.assertEqual(self.db.ids(), {2})
+        self.assertFalse(self.db.has_title("Second Post"))
+        self.assertTrue(self.db.has_title("Renamed Post"))
+        self.assertEqual(self.db.last_modified(), "2024-02-01T00:00:00")
+
+    def test_missing_cached_posts(self):
+        # A scheduled post that goes live keeps a ``modified`` older than the watermark.
+        scheduled = make_post(3, "Scheduled Post", "2023-12-01T00:00:00")
+        requested = []
+
+        def load_posts(post_ids):
+            requested.extend(post_ids)
+            return [scheduled]
+
+        self.assertEqual(self.db.update([], {1, 2, 3}, load_posts=load_posts), (1, 0))
+        self.assertEqual(requested, [3])
+        self.assertEqual(self.db.ids(), {1, 2, 3})
+        self.assertTrue(self.db.has_slug("post-3"))
+        self.assertTrue(self.db.has_title("scheduled post"))
+        self.assertEqual(self.db.last_modified(), "2024-01-02T00:00:00")
+
+    def test_needs_rebuild(self):
+        self.db.close()
+        self.db = WPPublishedDB(self.db.db_path, yoast_support=True)
+        self.assertTrue(self.db.needs_rebuild())
+        self.db.clear()
+        self.assertEqual(len(self.db), 0)
+        self.assertIsNone(self.db.last_modified())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPSQLiteCache
+
+This module verifies that posts and metadata round-trip through the SQLite cache backend
+and that pending writes can be committed or discarded as a single transaction.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPSQLiteCache
+
+# Test fixtures
+from tests.wp_fixtures import make_post
+
+
+class TestWPSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "wp-posts.db")
+        self.cache = WPSQLiteCache(self.db_path)
+        self.cache.replace_posts(
+            [make_post(1), make_post(2, modified="2024-01-02T00:00:00")]
+        )
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual([post["id"] for post in self.cache.load_posts()], [2, 1])
+        self.assertEqual(
+            self.cache.load_columns("slug", "class_list"),
+            [("post-2", ["tag-2"]), ("post-1", ["tag-1"])],
+        )
+        self.assertTrue(self.cache.has_slug("post-1"))
+        self.assertEqual(self.cache.latest_modified(), "2024-01-02T00:00:00")
+
+    def test_iter_columns(self):
+        rows = self.cache.iter_columns("id", "post")
+        self.assertEqual(next(rows), (2, make_post(2, modified="2024-01-02T00:00:00")))
+        # Other queries can run while the rows are consumed.
+        self.assertTrue(self.cache.has_slug("post-1"))
+        self.assertEqual([row[0] for row in rows], [1])
+
+    def test_upsert_and_delete(self):
+        self.cache.upsert_posts([make_post(2, modified="2024-02-01T00:00:00")])
+        self.cache.delete_posts([1])
+        self.cache.commit()
+        self.assertEqual(self.cache.ids(), {2})
+        self.assertEqual(self.cache.latest_modified(), "2024-02-01T00:00:00")
+
+    def test_rollback(self):
+        self.cache.upsert_posts([make_post(3, modified="2024-03-01T00:00:00")])
+        self.cache.write_metadata({"total_posts": 3})
+        self.cache.rollback()
+        self.assertEqual(self.cache.ids(), {1, 2})
+        self.assertEqual(self.cache.read_metadata(), {})
+
+    def test_metadata(self):
+        self.cache.write_metadata({"total_posts": 2, "last_modified": None})
+        self.cache.commit()
+        self.assertEqual(
+            self.cache.read_metadata(), {"total_posts": 2, "last_modified": None}
+        )
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self.cache.load_columns("id", "author")
+
+
+if __name__ == "__main__":
+    unittest.main()
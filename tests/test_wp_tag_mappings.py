@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for the tag mappings of wordpress.WordPress
+
+This module pins the output of ``get_tag_count``, ``get_tag_id_pairs`` and ``map_tags_posts`` on
+a fixture cache to the output of the implementation that scanned the posts on every call,
+key order included, with and without the Yoast SEO keywords.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.models.taxonomies import WPTaxonomyMarker
+
+# Test fixtures
+from tests.wp_fixtures import StandInCollection, make_site, make_tagged_posts
+
+TAG_POST_IDS = {
+    "Blue Sky": [1, 3],
+    "Partnerone": [1],
+    "Red": [1, 2, 3],
+    "Dawn": [],
+    "Green": [2],
+    "Partnertwo": [3],
+}
+# A post is listed once per occurrence of a Yoast SEO keyword, see post 1.
+KEYWORD_POST_IDS = {"Blue Sky": [1, 3], "Red": [1, 1, 2], "Green": [2], "Clips": [4]}
+
+
+def slugs(post_ids: dict, host_name: str = "") -> list:
+    return [
+        (tag, [f"{host_name}post-{post_id}" for post_id in ids])
+        for tag, ids in post_ids.items()
+    ]
+
+
+class TestWordPressTagMappings(unittest.TestCase):
+    cache_name = "posts.json"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.site = make_site(
+            os.path.join(self.tmp_dir.name, self.cache_name),
+            StandInCollection(make_tagged_posts()),
+        )
+
+    def tearDown(self):
+        self.site.close()
+        self.tmp_dir.cleanup()
+
+    def map_tags_posts(self, **kwargs) -> list:
+        return list(self.site.map_tags_posts(WPTaxonomyMarker.TAG, **kwargs).items())
+
+    def test_get_tag_count(self):
+        self.assertEqual(
+            list(self.site.get_tag_count().items()),
+            [
+                ("Blue Sky", 2),
+                ("Partnerone", 1),
+                ("Red", 3),
+                ("Dawn", 1),
+                ("Green", 1),
+                ("Partnertwo", 1),
+            ],
+        )
+        self.assertEqual(
+            list(self.site.get_tag_count(yoast_support=True).items()),
+            [("Blue Sky", 2), ("Red", 3), ("Green", 1), ("Clips", 1)],
+        )
+
+    def test_get_tag_id_pairs(self):
+        self.assertEqual(
+            list(self.site.get_tag_id_pairs().items()), list(TAG_POST_IDS.items())
+        )
+        self.assertEqual(
+            list(self.site.get_tag_id_pairs(yoast_support=True).items()),
+            [("Blue Sky", [1, 3]), ("Red", [1, 2]), ("Green", [2]), ("Clips", [4])],
+        )
+
+    def test_map_tags_posts(self):
+        self.assertEqual(self.map_tags_posts(idd=True), list(TAG_POST_IDS.items()))
+        self.assertEqual(self.map_tags_posts(idd=False), slugs(TAG_POST_IDS))
+        # Slugs are not prefixed with the host name without Yoast SEO support.
+        self.assertEqual(
+            self.map_tags_posts(idd=False, include_host_name=True), slugs(TAG_POST_IDS)
+        )
+
+    def test_map_tags_posts_yoast(self):
+        self.assertEqual(
+            self.map_tags_posts(idd=True, yoast_support=True),
+            list(KEYWORD_POST_IDS.items()),
+        )
+        self.assertEqual(
+            self.map_tags_posts(idd=False, yoast_support=True),
+            slugs(KEYWORD_POST_IDS),
+        )
+        self.assertEqual(
+            self.map_tags_posts(idd=False, include_host_name=True, yoast_support=True),
+            slugs(KEYWORD_POST_IDS, "example.com/"),
+        )
+
+
+class TestWordPressTagMappingsSQLite(TestWordPressTagMappings):
+    cache_name = "posts.db"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPTaxonomyIndex
+
+This module verifies the keyword extraction, counting and ID pairing performed by the
+taxonomy index over the ``class_list`` of the cached posts.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPTaxonomyIndex
+from wordpress.exceptions.internal_exceptions import YoastSEOUnsupported
+from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
+
+
+class TestWPTaxonomyIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = WPTaxonomyIndex(
+            [
+                {
+                    "id": 2,
+                    "class_list": ["post-2", "tag-python-tips", "photos_tag-sunset"],
+                    "tags": [12],
+                    "yoast_head_json": {
+                        "schema": {"@graph": [{"keywords": ["Python", "Python"]}]}
+                    },
+                },
+                {
+                    "id": 1,
+                    "class_list": ["post-1", "tag-python-tips", "tag-tutorial"],
+                    "tags": [12, 34],
+                    "yoast_head_json": {
+                        "schema": {"@graph": [{"keywords": ["Python", "Tutorial"]}]}
+                    },
+                },
+            ],
+            version=5,
+        )
+
+    def test_found_and_prefixed_terms(self):
+        # "photos_tag-sunset" contains the tag marker but does not start with it.
+        self.assertEqual(
+            self.index.found_terms(WPTaxonomyMarker.TAG)[0],
+            (2, ["Python Tips", "Sunset"]),
+        )
+        self.assertEqual(
+            self.index.prefixed_terms(WPTaxonomyMarker.TAG)[0], (2, ["Python Tips"])
+        )
+
+    def test_term_counts(self):
+        self.assertEqual(
+            self.index.term_counts(WPTaxonomyMarker.TAG),
+            {"Python Tips": 2, "Sunset": 1, "Tutorial": 1},
+        )
+
+    def test_term_ids(self):
+        self.assertEqual(
+            self.index.term_ids(WPTaxonomyMarker.TAG, WPTaxonomyValues.TAGS),
+            {"Python Tips": 12, "Tutorial": 34},
+        )
+        self.assertEqual(self.index.version, 5)
+
+    def test_inverted_indexes(self):
+        self.assertEqual(
+            self.index.term_posts(WPTaxonomyMarker.TAG),
+            {"Python Tips": [2, 1], "Tutorial": [1]},
+        )
+        self.assertEqual(
+            self.index.keyword_posts(), {"Python": [2, 2, 1], "Tutorial": [1]}
+        )
+
+    def test_missing_yoast_keywords(self):
+        index = WPTaxonomyIndex(
+            [
+                {
+                    "id": 1,
+                    "class_list": [],
+                    "yoast_head_json": {"schema": {"@graph": [{"keywords": []}]}},
+                }
+            ]
+        )
+        with self.assertRaises(YoastSEOUnsupported):
+            index.keyword_posts()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.cache.WPTitleIndex
+
+This module verifies that the title index matches titles like the post store does, and that
+a saved index is only reused for the cache digest it was built from.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import unittest
+
+# Local implementation to be tested
+from wordpress.cache import WPPostStore, WPTitleIndex
+
+# Test fixtures
+from tests.wp_fixtures import make_post
+
+
+POSTS = [
+    make_post(1, "First Post", slug="first-post"),
+    make_post(2, "Second &amp; Post", slug="second-post"),
+]
+
+
+class TestWPTitleIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.tmp_dir.name, "posts_title_index.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_published_mask(self):
+        titles = ["first  POST", "Second & Post", "Third Post", None, "first post"]
+        index = WPTitleIndex.from_posts(POSTS, version="abc")
+        self.assertEqual(index.published_mask(titles), [True, True, False, False, True])
+        self.assertEqual(
+            index.published_mask(titles),
+            WPPostStore(POSTS).published_mask(titles),
+        )
+        self.assertTrue(index.has_title("First Post", yoast_support=True))
+        self.assertTrue(index.has_slug("second-post"))
+        self.assertFalse(index.has_slug("third-post"))
+
+    def test_save_and_load(self):
+        WPTitleIndex.from_posts(POSTS, version="abc").save(self.index_path)
+        loaded = WPTitleIndex.load(self.index_path, "abc")
+        self.assertEqual(len(loaded), 2)
+        self.assertTrue(loaded.has_title("second & post"))
+        self.assertIsNone(WPTitleIndex.load(self.index_path, "def"))
+
+        # An index without a version cannot be validated, so it is not saved.
+        os.remove(self.index_path)
+        WPTitleIndex.from_posts(POSTS).save(self.index_path)
+        self.assertFalse(os.path.exists(self.index_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
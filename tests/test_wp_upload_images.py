@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Test Suite for wordpress.WordPress.upload_image and upload_images
+
+This module uploads images to a stand-in site to verify that the file is streamed as the request
+body with its attributes as query parameters, that non-ASCII file names are sent with the RFC 5987
+``filename*`` parameter, that transient errors are retried with backoff and that concurrent
+uploads are bounded by the HTTP pool and reported in input order.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import mock
+from urllib.parse import unquote
+
+# Third-party imports
+import requests
+
+# Test fixtures
+from tests.wp_fixtures import (
+    StandInCollection,
+    StandInHTTP,
+    make_post,
+    make_response,
+    make_site,
+)
+
+
+class StandInMediaSite:
+    """Answers media uploads with the statuses queued for each file name, then ``201``."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.bodies = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, endpoint, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            body = kwargs["data"].read()
+            self.bodies.append(body)
+            file_name = body.decode()
+            # Later files finish first.
+            time.sleep(0.05 if file_name == "a.jpg" else 0.01)
+            queued = self.statuses.get(file_name, [])
+            status = queued.pop(0) if queued else 201
+            if isinstance(status, Exception):
+                raise status
+            if status != 201:
+                return make_response(status, {"code": "unavailable"})
+            return make_response(
+                201,
+                {"id": 7, "source_url": f"https://example.com/uploads/{file_name}"},
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestUploadImages(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.media = StandInMediaSite()
+        self.http = StandInHTTP(self.media)
+        self.site = make_site(
+            os.path.join(self.tmp_dir.name, "posts.json"),
+            StandInCollection([make_post(1)]),
+            self.http,
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def image(self, file_name: str) -> str:
+        """Creates an image file whose content is its own name."""
+        file_path = os.path.join(self.tmp_dir.name, file_name)
+        with open(file_path, "wb") as image_file:
+            image_file.write(file_name.encode())
+        return file_path
+
+    def test_attributes_and_headers(self):
+        payload = {"alt_text": "Alt", "caption": "Caption"}
+
+        self.assertEqual(self.site.upload_image(self.image("a.jpg"), payload), 201)
+        method, endpoint, kwargs = self.http.calls[0]
+        self.assertEqual((method, endpoint), ("POST", "/media"))
+        self.assertEqual(kwargs["params"], payload)
+        self.assertEqual(
+            kwargs["headers"],
+            {
+                "Content-Type": "image/jpeg",
+                "Content-Disposition": 'attachment; filename="a.jpg"',
+            },
+        )
+        self.assertEqual(self.media.bodies, [b"a.jpg"])
+
+    def test_non_ascii_name(self):
+        file_name = 'Café "ñ" 写真.webp'
+        self.site.upload_image(self.image(file_name), {})
+
+        disposition = self.http.calls[0][2]["headers"]["Content-Disposition"]
+        # The header can be sent as Latin-1 and the server recovers the original name.
+        disposition.encode("latin-1")
+        fallback, extended = disposition.split("; filename*=UTF-8''")
+        self.assertEqual(fallback, 'attachment; filename="Caf_ ___ __.webp"')
+        self.assertEqual(unquote(extended), file_name)
+
+    @mock.patch("wordpress.wordpress_api.time")
+    def test_retry(self, clock):
+        self.media.statuses["a.jpg"] = [503, 429]
+
+        self.assertEqual(
+            self.site.upload_image(
+                self.image("a.jpg"), {}, return_source_url=True, max_retries=2
+            ),
+            "https://example.com/uploads/a.jpg",
+        )
+        self.assertEqual([call.args[0] for call in clock.sleep.call_args_list], [1, 2])
+        # The file is streamed again on every attempt.
+        self.assertEqual(self.media.bodies, [b"a.jpg"] * 3)
+
+    @mock.patch("wordpress.wordpress_api.time")
+    def test_retries_exhausted(self, clock):
+        self.media.statuses["a.jpg"] = [503, 503, 503]
+
+        self.assertEqual(
+            self.site.upload_image(self.image("a.jpg"), {}, max_retries=1), 503
+        )
+        self.assertEqual(len(self.http.calls), 2)
+
+        self.media.statuses["a.jpg"] = [400]
+        self.assertEqual(
+            self.site.upload_image(self.image("a.jpg"), {}, max_retries=1), 400
+        )
+        self.assertEqual(len(self.http.calls), 3)
+
+        self.media.statuses["a.jpg"] = [requests.ConnectionError("reset")] * 2
+        with self.assertRaises(requests.ConnectionError):
+            self.site.upload_image(self.image("a.jpg"), {}, max_retries=1)
+
+    @mock.patch("wordpress.wordpress_api.time")
+    def test_upload_images(self, clock):
+        file_names = ["a.jpg", "b.jpg", "c.png", "d.jpg"]
+        self.media.statuses["c.png"] = [requests.ConnectionError("reset")] * 3
+        self.http.pool_size = 2
+
+        results = self.site.upload_images(
+            [self.image(file_name) for file_name in file_names],
+            [{"alt_text": file_name} for file_name in file_names],
+            max_workers=8,
+            return_source_url=True,
+        )
+        self.assertEqual(
+            results,
+            [
+                "https://example.com/uploads/a.jpg",
+                "https://example.com/uploads/b.jpg",
+                0,
+                "https://example.com/uploads/d.jpg",
+            ],
+        )
+        self.assertEqual(self.media.max_in_flight, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress test fixtures
+
+Shared factory of cached post dictionaries for the ``wordpress`` test suites, with the
+fields the cache, its indexes and the published posts database read, and stand-ins for the
+page fetcher and the HTTP session of ``WordPress``, so that sites can be tested offline.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+import copy
+import json
+
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from unittest import mock
+
+# Third-party imports
+import requests
+
+# Local implementations
+from wordpress import WordPress
+from wordpress.client import WPHTTPSession
+
+SITE_DOMAIN = "example.com"
+SITE_API_URL = f"https://{SITE_DOMAIN}/wp-json/wp/v2"
+DEFAULT_MODIFIED = "2024-01-01T00:00:00"
+
+
+def make_post(
+    post_id: int,
+    title: Optional[str] = None,
+    modified: str = DEFAULT_MODIFIED,
+    slug: Optional[str] = None,
+    date: Optional[str] = None,
+    class_list: Optional[List[str]] = None,
+) -> dict:
+    """
+    :param post_id: ``int`` -> Post ID.
+    :param title: ``str | None`` -> Rendered title. Default ``Post <id>``.
+    :param modified: ``str`` -> ``modified`` and ``modified_gmt`` timestamps.
+    :param slug: ``str | None`` -> Post slug. Default ``post-<id>``.
+    :param date: ``str | None`` -> Publication date. Default ``modified``.
+    :param class_list: ``list[str] | None`` -> Post classes. Default ``tag-<id>``.
+    :return: ``dict`` -> Post as returned by the WordPress REST API.
+    """
+    title = f"Post {post_id}" if title is None else title
+    slug = f"post-{post_id}" if slug is None else slug
+    return {
+        "id": post_id,
+        "slug": slug,
+        "link": f"https://example.com/{slug}/",
+        "date": date or modified,
+        "modified": modified,
+        "modified_gmt": modified,
+        "title": {"rendered": title},
+        "yoast_head_json": {"title": f"{title} - Example"},
+        "class_list": [f"tag-{post_id}"] if class_list is None else class_list,
+    }
+
+
+def make_tagged_posts() -> List[dict]:
+    """
+    Four posts, newest first, with tags, models (``authors-*`` classes), categories and Yoast SEO
+    keywords. Edge cases: a class with the tag marker that does not start with it (``photos_tag-dawn``),
+    a repeated Yoast SEO keyword, a list ``articleSection``, a post without ``articleSection``
+    and a post without tags.
+
+    :return: ``list[dict]`` -> Posts as returned by the WordPress REST API.
+    """
+    tagged = [
+        (
+            ["category-videos", "tag-blue-sky", "tag-partnerone", "tag-red"],
+            ["authors-jane-doe"],
+            [11, 13, 12],
+            {"articleSection": "Videos", "keywords": ["Blue Sky", "Red", "Red"]},
+        ),
+        (
+            ["category-videos", "tag-red", "photos_tag-dawn", "tag-green"],
+            ["authors-jane-doe", "authors-john-roe"],
+            [12, 16, 14],
+            {"articleSection": ["Videos", "Clips"], "keywords": ["Red", "Green"]},
+        ),
+        (
+            ["tag-blue-sky", "tag-red", "tag-partnertwo"],
+            ["authors-john-roe", "authors-ann-poe"],
+            [11, 12, 15],
+            {"keywords": ["Blue Sky"]},
+        ),
+        (
+            ["category-clips"],
+            [],
+            [],
+            {"articleSection": "Clips", "keywords": ["Clips"]},
+        ),
+    ]
+    posts = []
+    for post_id, (classes, models, tag_ids, graph) in enumerate(tagged, start=1):
+        post = make_post(
+            post_id,
+            date=f"2024-0{5 - post_id}-01T00:00:00",
+            class_list=[f"post-{post_id}", "status-publish", *classes, *models],
+        )
+        post["tags"] = tag_ids
+        post["yoast_head_json"]["schema"] = {"@graph": [graph]}
+        posts.append(post)
+    return posts
+
+
+def make_response(
+    status: int, body: Any = None, headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """
+    :param status: ``int`` -> HTTP status code.
+    :param body: ``Any`` -> JSON body, ``None`` sends an empty body.
+    :param headers: ``dict[str, str] | None`` -> Response headers.
+    :return: ``requests.Response`` -> Response as returned by the HTTP session.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.encoding = "utf-8"
+    response._content = b"" if body is None else json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def project(post: dict, fields: Iterable[str]) -> dict:
+    """
+    :param post: ``dict`` -> Post dictionary.
+    :param fields: ``Iterable[str]`` -> ``_fields`` values, nested fields use the dot notation.
+    :return: ``dict`` -> Post restricted to the fields, as served by the REST API.
+    """
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        key, _, nested = field.partition(".")
+        if key not in post:
+            continue
+        if not nested:
+            projected[key] = post[key]
+        elif isinstance(post[key], dict) and nested in post[key]:
+            projected.setdefault(key, {})[nested] = post[key][nested]
+    return projected
+
+
+class StandInCollection:
+    """
+    Stand-in for ``WPPageFetcher`` that serves the published posts of a collection, newest first,
+    honouring the ``include`` and ``_fields`` parameters of the REST API.
+
+    Attributes:
+        posts (dict[int, dict]): Posts on the site by ID.
+        queries (list[dict]): Every query received, in order.
+        total (int | None): ``X-WP-Total`` reported for listings, ``None`` reports the real count.
+        failures (dict[str, Exception]): Errors raised for queries with the given parameter.
+    """
+
+    def __init__(self, posts: Iterable[dict] = ()):
+        self.posts: Dict[int, dict] = {post["id"]: post for post in posts}
+        self.queries: List[dict] = []
+        self.total: Optional[int] = None
+        self.failures: Dict[str, Exception] = {}
+
+    def fetch(
+        self,
+        endpoint: str,
+        query: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+        checkpoint_path: Optional[str | Path] = None,
+    ) -> Tuple[List[dict], int]:
+        query = dict(query or {})
+        self.queries.append(query)
+        for key, error in self.failures.items():
+            if key in query:
+                raise error
+        posts = sorted(
+            (
+                post
+                for post in self.posts.values()
+                if post.get("status", "publish") == "publish"
+            ),
+            key=lambda post: post["date"],
+            reverse=True,
+        )
+        if "include" in query:
+            include = {int(post_id) for post_id in str(query["include"]).split(",")}
+            posts = [post for post in posts if post["id"] in include]
+        if "_fields" in query:
+            posts = [project(post, query["_fields"].split(",")) for post in posts]
+        total = len(posts)
+        if self.total is not None and "include" not in query:
+            total = self.total
+        return copy.deepcopy(posts), total
+
+    def queried_ids(self) -> List[List[int]]:
+        """
+        :return: ``list[list[int]]`` -> IDs of every ``include`` query, in order.
+        """
+        return [
+            [int(post_id) for post_id in query["include"].split(",")]
+            for query in self.queries
+            if "include" in query
+        ]
+
+
+class StandInHTTP(WPHTTPSession):
+    """
+    ``WPHTTPSession`` that answers every request with ``handler`` instead of the network.
+
+    Attributes:
+        handler (Callable): Receives ``(method, endpoint, **kwargs)`` and returns a ``requests.Response``.
+        calls (list[tuple[str, str, dict]]): Method, endpoint and keyword arguments of every request.
+    """
+
+    def __init__(self, handler: Optional[Callable[..., requests.Response]] = None):
+        super().__init__(SITE_API_URL, "user", "app-password")
+        self.handler = handler or self.unexpected
+        self.calls: List[Tuple[str, str, dict]] = []
+
+    @staticmethod
+    def unexpected(method: str, endpoint: str, **kwargs) -> requests.Response:
+        raise AssertionError(f"Unexpected request: {method} {endpoint}")
+
+    def request(
+        self, method: str, endpoint: str, timeout: Optional[Any] = None, **kwargs
+    ) -> requests.Response:
+        self.calls.append((method, endpoint, kwargs))
+        return self.handler(method, endpoint, **kwargs)
+
+
+def make_site(
+    cache_path: str | Path,
+    collection: StandInCollection,
+    http: Optional[StandInHTTP] = None,
+    **kwargs,
+) -> WordPress:
+    """
+    Creates a ``WordPress`` instance that fetches its cache from ``collection``
+    and sends every other request through ``http``.
+
+    :param cache_path: ``str | Path`` -> Path to the local cache file.
+    :param collection: ``StandInCollection`` -> Posts on the site.
+    :param http: ``StandInHTTP | None`` -> HTTP session, by default every request fails the test.
+    :param kwargs: Keyword arguments accepted by ``WordPress``.
+    :return: ``WordPress`` -> Site instance with its local cache built or synced.
+    """
+    with (
+        mock.patch("wordpress.wordpress_api.WPPageFetcher", return_value=collection),
+        mock.patch(
+            "wordpress.wordpress_api.WPHTTPSession", return_value=http or StandInHTTP()
+        ),
+    ):
+        return WordPress(
+            SITE_DOMAIN,
+            "user",
+            "app-password",
+            cache_path,
+            unique_logging_session=False,
+            **kwargs,
+        )
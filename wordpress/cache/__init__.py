@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+from wordpress.cache.content_hashes import WPCacheHashes, post_content_hash
+from wordpress.cache.page_fetcher import WPPageFetcher
+from wordpress.cache.post_record import WPostRecord, WPTermVocabulary
+from wordpress.cache.post_store import WPPostStore
+from wordpress.cache.published_db import WPPublishedDB
+from wordpress.cache.sqlite_cache import (
+    WPSQLiteCache,
+    migrate_json_cache,
+    resolve_cache_path,
+    sqlite_cache_path,
+)
+from wordpress.cache.taxonomy_index import WPTaxonomyIndex
+from wordpress.cache.title_index import WPTitleIndex
+
+__all__ = [
+    "WPCacheHashes",
+    "WPPageFetcher",
+    "WPPostStore",
+    "WPPublishedDB",
+    "WPSQLiteCache",
+    "WPTaxonomyIndex",
+    "WPTermVocabulary",
+    "WPTitleIndex",
+    "WPostRecord",
+    "migrate_json_cache",
+    "post_content_hash",
+    "resolve_cache_path",
+    "sqlite_cache_path",
+]
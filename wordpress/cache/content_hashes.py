@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Cache Content Hashes
+
+This module defines the WPCacheHashes class, the per-post change ledger used by the cache sync.
+Every cached post is recorded with the ``modified_gmt`` timestamp served by the site and a
+content hash of the cached post, and the whole cache is summarized by a rolling digest
+(the XOR of the post hashes), which is updated in constant time as posts change.
+
+The ledger is stored in the cache metadata, so a sync only has to compare an
+``id,modified,modified_gmt`` listing of the site against it to know exactly which posts to
+download, and can skip writing posts whose content did not change.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import hashlib
+import json
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Post hashes are 64-bit BLAKE2b digests written as hex strings.
+HASH_SIZE = 8
+
+
+def post_content_hash(post: Mapping[str, Any]) -> str:
+    """
+    Hashes the canonical JSON form of a post, so that equal posts have equal hashes
+    regardless of the key order of the REST API response.
+
+    :param post: ``Mapping`` -> Post dictionary or ``WPostRecord``.
+    :return: ``str`` -> Hex digest.
+    """
+    if hasattr(post, "to_dict"):
+        post = post.to_dict()
+    canonical = json.dumps(
+        post, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=HASH_SIZE).hexdigest()
+
+
+class WPCacheHashes:
+    """
+    Ledger of ``(modified_gmt, content hash)`` pairs by post ID with a rolling cache digest.
+
+    An entry without a ``modified_gmt`` marks a post that must be downloaded again on the next
+    sync, e.g. one merged from an API response instead of the collection served by the site.
+
+    Attributes:
+        digest (str): Rolling digest of the recorded content hashes.
+    """
+
+    def __init__(self, entries: Optional[Dict[int, Tuple[Optional[str], str]]] = None):
+        """
+        :param entries: ``dict[int, tuple[str | None, str]]`` -> ``(modified_gmt, hash)`` by post ID.
+        """
+        self._entries: Dict[int, Tuple[Optional[str], str]] = {}
+        self._digest = 0
+        for post_id, (modified_gmt, content_hash) in (entries or {}).items():
+            self.record(post_id, modified_gmt, content_hash)
+
+    @classmethod
+    def from_posts(cls, posts: Iterable[Mapping[str, Any]]) -> "WPCacheHashes":
+        """
+        :param posts: ``Iterable[Mapping]`` -> Posts as served by the site.
+        :return: ``WPCacheHashes`` -> Ledger with an entry per post.
+        """
+        hashes = cls()
+        for post in posts:
+            hashes.record_post(post)
+        return hashes
+
+    @classmethod
+    def from_metadata(cls, metadata: Mapping[str, Any]) -> Optional["WPCacheHashes"]:
+        """
+        :param metadata: ``Mapping`` -> Cache metadata fields.
+        :return: ``WPCacheHashes | None`` -> Stored ledger, ``None`` if it is missing or
+                 does not match the stored digest.
+        """
+        if "post_hashes" not in metadata:
+            return None
+        hashes = cls(
+            {
+                int(post_id): (modified_gmt, content_hash)
+                for post_id, (modified_gmt, content_hash) in metadata[
+                    "post_hashes"
+                ].items()
+            }
+        )
+        return hashes if hashes.digest == metadata.get("cache_digest") else None
+
+    def copy(self) -> "WPCacheHashes":
+        return WPCacheHashes(self._entries)
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """
+        :return: ``dict`` -> ``cache_digest`` and ``post_hashes`` metadata fields.
+        """
+        return {
+            "cache_digest": self.digest,
+            "post_hashes": {
+                str(post_id): list(entry) for post_id, entry in self._entries.items()
+            },
+        }
+
+    @property
+    def digest(self) -> str:
+        return f"{self._digest:0{HASH_SIZE * 2}x}"
+
+    @staticmethod
+    def digest_of(posts: Iterable[Mapping[str, Any]]) -> str:
+        """
+        :param posts: ``Iterable[Mapping]`` -> Cached posts.
+        :return: ``str`` -> Rolling digest of the posts, comparable with ``digest``.
+        """
+        digest = 0
+        for post in posts:
+            digest ^= int(post_content_hash(post), 16)
+        return f"{digest:0{HASH_SIZE * 2}x}"
+
+    def reconcile(self, posts: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Aligns the ledger with the cached posts after a digest mismatch: entries whose hash
+        differs from the cached post are invalidated, and entries of posts that are not cached are removed.
+
+        :param posts: ``Iterable[Mapping]`` -> Cached posts.
+        :return: ``int`` -> Number of invalidated and removed entries.
+        """
+        mismatches = 0
+        cached_ids = set()
+        for post in posts:
+            cached_ids.add(post["id"])
+            entry = self._entries.get(post["id"])
+            if entry is not None and entry[1] != (
+                content_hash := post_content_hash(post)
+            ):
+                self.record(post["id"], None, content_hash)
+                mismatches += 1
+        for post_id in set(self._entries) - cached_ids:
+            self.remove(post_id)
+            mismatches += 1
+        return mismatches
+
+    def record(
+        self, post_id: int, modified_gmt: Optional[str], content_hash: str
+    ) -> None:
+        """
+        :param post_id: ``int`` -> Post ID.
+        :param modified_gmt: ``str | None`` -> ``modified_gmt`` served by the site, ``None`` to download the post again.
+        :param content_hash: ``str`` -> Content hash of the cached post.
+        :return: ``None``
+        """
+        self.remove(post_id)
+        self._entries[post_id] = (modified_gmt, content_hash)
+        self._digest ^= int(content_hash, 16)
+
+    def record_post(
+        self, post: Mapping[str, Any], modified_gmt: Optional[str] = None
+    ) -> str:
+        """
+        :param post: ``Mapping`` -> Cached post.
+        :param modified_gmt: ``str | None`` -> ``modified_gmt`` served by the site, defaults to the one in the post.
+        :return: ``str`` -> Content hash of the post.
+        """
+        content_hash = post_content_hash(post)
+        self.record(
+            post["id"],
+            modified_gmt if modified_gmt is not None else post.get("modified_gmt"),
+            content_hash,
+        )
+        return content_hash
+
+    def invalidate(self, post: Mapping[str, Any]) -> None:
+        """
+        Records a post that was not served by the collection, so that the next sync downloads it.
+
+        :param post: ``Mapping`` -> Cached post.
+        :return: ``None``
+        """
+        self.record(post["id"], None, post_content_hash(post))
+
+    def remove(self, post_id: int) -> None:
+        if (entry := self._entries.pop(post_id, None)) is not None:
+            self._digest ^= int(entry[1], 16)
+
+    def get(self, post_id: int) -> Optional[Tuple[Optional[str], str]]:
+        """
+        :param post_id: ``int`` -> Post ID.
+        :return: ``tuple[str | None, str] | None`` -> ``(modified_gmt, hash)`` of the post, if recorded.
+        """
+        return self._entries.get(post_id)
+
+    def changed_ids(
+        self,
+        live_items: Iterable[Mapping[str, Any]],
+        cached_modified: Mapping[int, Optional[str]],
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Compares an ``id,modified,modified_gmt`` listing of the site with the ledger.
+
+        Posts without an entry (caches created before the ledger existed) are compared by their
+        local ``modified`` timestamp instead.
+
+        :param live_items: ``Iterable[Mapping]`` -> Listing served by the site.
+        :param cached_modified: ``Mapping[int, str | None]`` -> ``modified`` by ID of the cached posts without an entry.
+        :return: ``tuple[list[int], list[int]]`` -> IDs to download and IDs of unchanged posts without an entry.
+        """
+        changed: List[int] = []
+        unrecorded: List[int] = []
+        for item in live_items:
+            entry = self._entries.get(item["id"])
+            if entry is not None:
+                if entry[0] is None or entry[0] != item.get("modified_gmt"):
+                    changed.append(item["id"])
+            elif item["id"] not in cached_modified or cached_modified[
+                item["id"]
+            ] != item.get("modified"):
+                changed.append(item["id"])
+            else:
+                unrecorded.append(item["id"])
+        return changed, unrecorded
+
+    def __contains__(self, post_id: object) -> bool:
+        return post_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,270 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Page Fetcher
+
+This module defines the WPPageFetcher class, the asynchronous engine used to download
+paginated WordPress REST API collections, both for full cache builds and for syncs.
+
+Pages are requested concurrently over a single keep-alive session, failed requests are retried
+with exponential backoff on server errors and timeouts, and the results are assembled in page order.
+Full downloads can be checkpointed to a JSONL file so that an interrupted build resumes
+from the pages it already has.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import asyncio
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Third-party imports
+import aiohttp
+import urllib3
+
+# Local implementations
+from wordpress.exceptions.internal_exceptions import PageFetchError
+
+# Maximum page size allowed by the WordPress REST API for collections.
+WP_MAX_PER_PAGE = 100
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class WPPageFetcher:
+    """
+    Asynchronous page-fetch engine for WordPress REST API collections.
+
+    Attributes:
+        base_url (str): REST API base URL, e.g. ``https://example.com/wp-json/wp/v2``
+        concurrency (int): Maximum number of pages requested at the same time.
+        max_retries (int): Retries per page on server errors, rate limiting and timeouts.
+        backoff_factor (float): Base delay in seconds, doubled after every retry.
+        timeout (float): Total timeout in seconds for a single page request.
+        progress_callback (ProgressCallback | None): Called with ``(pages_done, total_pages)``.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        app_password: str,
+        concurrency: int = 5,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30.0,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """
+        Initializes the page fetcher.
+
+        :param base_url: ``str`` -> REST API base URL.
+        :param username: ``str`` -> Username for WordPress API authentication.
+        :param app_password: ``str`` -> Application password for WordPress API authentication.
+        :param concurrency: ``int`` -> Maximum number of concurrent page requests.
+        :param max_retries: ``int`` -> Retries per page before giving up.
+        :param backoff_factor: ``float`` -> Base delay in seconds between retries.
+        :param timeout: ``float`` -> Total timeout in seconds for a single page request.
+        :param progress_callback: ``ProgressCallback | None`` -> Receives ``(pages_done, total_pages)``.
+        """
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.progress_callback = progress_callback
+        self._headers = urllib3.make_headers(
+            accept_encoding=True, basic_auth=f"{username}:{app_password}"
+        )
+
+    def fetch(
+        self,
+        endpoint: str,
+        query: Optional[Dict[str, Any]] = None,
+        per_page: int = WP_MAX_PER_PAGE,
+        checkpoint_path: Optional[str | Path] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Downloads every page of a collection. Blocking wrapper around ``fetch_async``.
+
+        :param endpoint: ``str`` -> Collection endpoint with a leading slash, e.g. ``/posts``
+        :param query: ``dict | None`` -> Query string parameters for the collection.
+        :param per_page: ``int`` -> Page size.
+        :param checkpoint_path: ``str | Path | None`` -> JSONL file used to resume an interrupted download.
+        :return: ``tuple[list[dict], int]`` -> Items in page order and the ``X-WP-Total`` value.
+        :raises PageFetchError: If a page cannot be downloaded.
+        """
+        return asyncio.run(
+            self.fetch_async(
+                endpoint, query, per_page=per_page, checkpoint_path=checkpoint_path
+            )
+        )
+
+    async def fetch_async(
+        self,
+        endpoint: str,
+        query: Optional[Dict[str, Any]] = None,
+        per_page: int = WP_MAX_PER_PAGE,
+        checkpoint_path: Optional[str | Path] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Downloads every page of a collection.
+
+        The first page is always requested to read the ``X-WP-Total`` and ``X-WP-TotalPages``
+        headers. If a checkpoint for the same query and total exists, its pages are reused,
+        and the checkpoint file is removed once the download completes.
+
+        :param endpoint: ``str`` -> Collection endpoint with a leading slash, e.g. ``/posts``
+        :param query: ``dict | None`` -> Query string parameters for the collection.
+        :param per_page: ``int`` -> Page size.
+        :param checkpoint_path: ``str | Path | None`` -> JSONL file used to resume an interrupted download.
+        :return: ``tuple[list[dict], int]`` -> Items in page order and the ``X-WP-Total`` value.
+        :raises PageFetchError: If a page cannot be downloaded.
+        """
+        query = {**(query or {}), "per_page": per_page}
+        url = f"{self.base_url}{endpoint}"
+        async with aiohttp.ClientSession(
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+        ) as session:
+            first_page, totals = await self._get_page(session, url, query, 1)
+            if totals is None:
+                raise PageFetchError(url, 1)
+            total, total_pages = totals
+
+            signature = json.dumps(
+                {"url": url, "query": query, "total": total}, sort_keys=True
+            )
+            pages = self._load_checkpoint(checkpoint_path, signature)
+            resumed = bool(pages)
+            pages[1] = first_page
+            if checkpoint_path is not None and not resumed:
+                with open(checkpoint_path, "w", encoding="utf-8") as checkpoint:
+                    checkpoint.write(signature + "\n")
+            self._report(len(pages), total_pages)
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def fetch_page(page_num: int) -> None:
+                async with semaphore:
+                    items, _ = await self._get_page(session, url, query, page_num)
+                pages[page_num] = items
+                if checkpoint_path is not None:
+                    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+                        checkpoint.write(
+                            json.dumps({"page": page_num, "items": items}) + "\n"
+                        )
+                self._report(len(pages), total_pages)
+
+            await asyncio.gather(
+                *(
+                    fetch_page(page_num)
+                    for page_num in range(2, total_pages + 1)
+                    if page_num not in pages
+                )
+            )
+
+        items = [item for page_num in sorted(pages) for item in pages[page_num]]
+        if resumed:
+            # Pages downloaded in a previous run may overlap if the collection shifted.
+            items = list({item["id"]: item for item in items}.values())
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return items, total
+
+    async def _get_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        query: Dict[str, Any],
+        page_num: int,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, int]]]:
+        """
+        Requests a single page, retrying with exponential backoff on server errors and timeouts.
+
+        :param session: ``aiohttp.ClientSession`` -> Shared keep-alive session.
+        :param url: ``str`` -> Collection URL.
+        :param query: ``dict`` -> Query string parameters.
+        :param page_num: ``int`` -> Page number.
+        :return: ``tuple[list[dict], tuple[int, int] | None]`` -> Items and ``(total, total_pages)`` if reported.
+        :raises PageFetchError: If the request is rejected or retries are exhausted.
+        """
+        params = {key: str(value) for key, value in query.items()}
+        params["page"] = str(page_num)
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        totals = None
+                        if "x-wp-total" in response.headers:
+                            totals = (
+                                int(response.headers["x-wp-total"]),
+                                int(response.headers.get("x-wp-totalpages", 1)),
+                            )
+                        return await response.json(content_type=None), totals
+                    if (
+                        response.status not in self.RETRY_STATUSES
+                        or attempt == self.max_retries
+                    ):
+                        raise PageFetchError(url, page_num, response.status)
+                    logging.warning(
+                        f"Page {page_num} of {url} returned {response.status}, retrying..."
+                    )
+            except (
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                asyncio.TimeoutError,
+            ) as err:
+                if attempt == self.max_retries:
+                    raise PageFetchError(url, page_num) from err
+                logging.warning(
+                    f"Page {page_num} of {url} failed: {err!r}, retrying..."
+                )
+            await asyncio.sleep(self.backoff_factor * 2**attempt)
+        raise PageFetchError(url, page_num)
+
+    @staticmethod
+    def _load_checkpoint(
+        checkpoint_path: Optional[str | Path], signature: str
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Loads the pages stored in a checkpoint, if it belongs to the same download.
+
+        :param checkpoint_path: ``str | Path | None`` -> JSONL checkpoint file.
+        :param signature: ``str`` -> Header line identifying the download.
+        :return: ``dict[int, list[dict]]`` -> Items by page number.
+        """
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        if checkpoint_path is None or not os.path.exists(checkpoint_path):
+            return pages
+        with open(checkpoint_path, "r", encoding="utf-8") as checkpoint:
+            if checkpoint.readline().rstrip("\n") != signature:
+                logging.info(f"Discarding stale checkpoint {checkpoint_path}")
+                return pages
+            for line in checkpoint:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line may be truncated if the process was interrupted.
+                    break
+                pages[entry["page"]] = entry["items"]
+        logging.info(f"Resuming from {len(pages)} pages in {checkpoint_path}")
+        return pages
+
+    def _report(self, pages_done: int, total_pages: int) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(pages_done, total_pages)
+        else:
+            logging.debug(f"Fetched {pages_done}/{total_pages} pages")
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Post Record
+
+This module defines the WPostRecord class, the compact in-memory representation of a cached
+WordPress post, and WPTermVocabulary, the table of interned ``class_list`` strings shared by
+all records.
+
+Records keep the fields that the cache indexes read all the time (ID, dates, slug, link and
+rendered title) in slots, the ``class_list`` and taxonomy ID lists as integer arrays, and
+the rest of the REST API post (Yoast SEO data, excerpt, etc.) as a compressed JSON blob
+that is only decoded when one of those keys is read.
+Records behave as read-only mappings, so ``post["slug"]`` keeps working for every consumer
+of the cache, and ``to_dict()`` materializes the original post dictionary.
+
+The existing ``wordpress.models.wpost.WPost`` dataclass remains the model for the posts
+created by a running instance.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import json
+import sys
+import zlib
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Local implementations
+from wordpress.models.taxonomies import WPTaxonomyValues
+
+# Fields kept as plain attributes.
+SCALAR_FIELDS = ("id", "date", "modified", "slug", "link")
+# Fields kept as unsigned integer arrays, e.g. ``"tags": [12, 34]``.
+TAXONOMY_FIELDS = tuple(value.value for value in WPTaxonomyValues)
+# Largest value that fits in an ``array("I")`` item on every platform.
+_MAX_ARRAY_ITEM = 2**32 - 1
+
+
+class WPTermVocabulary:
+    """
+    Table of interned ``class_list`` strings. Records keep the position of their
+    classes in this table instead of one string object per class and post.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._terms: List[str] = []
+
+    def encode(self, terms: Iterable[str]) -> array:
+        """
+        :param terms: ``Iterable[str]`` -> Class strings, e.g. ``["post-1", "tag-python"]``
+        :return: ``array`` -> Positions of the strings in the vocabulary.
+        """
+        encoded = array("I")
+        for term in terms:
+            term_id = self._ids.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                term = sys.intern(term)
+                self._ids[term] = term_id
+                self._terms.append(term)
+            encoded.append(term_id)
+        return encoded
+
+    def decode(self, term_ids: Iterable[int]) -> List[str]:
+        """
+        :param term_ids: ``Iterable[int]`` -> Positions returned by ``encode``.
+        :return: ``list[str]`` -> Class strings.
+        """
+        terms = self._terms
+        return [terms[term_id] for term_id in term_ids]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+# Vocabulary shared by every record in the process.
+VOCABULARY = WPTermVocabulary()
+
+# Most posts share the same key layout, so the key tuples are shared too.
+_KEY_LAYOUTS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _is_id_list(value: Any) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(item, int)
+        and not isinstance(item, bool)
+        and 0 <= item <= _MAX_ARRAY_ITEM
+        for item in value
+    )
+
+
+class WPostRecord(Mapping):
+    """
+    Compact, read-only record for a cached WordPress post.
+
+    Attributes:
+        id (int): Post ID.
+        date (str | None): Publication date.
+        modified (str | None): Last modification date.
+        slug (str | None): Post slug.
+        link (str | None): Post URL.
+        title (str | None): Rendered post title.
+    """
+
+    __slots__ = (
+        "id",
+        "date",
+        "modified",
+        "slug",
+        "link",
+        "title",
+        "_keys",
+        "_class_ids",
+        "_taxonomies",
+        "_extra",
+    )
+
+    def __init__(self, post: Dict[str, Any]):
+        """
+        Builds a record from a post dictionary as returned by the REST API.
+
+        :param post: ``dict`` -> Post dictionary.
+        """
+        keys = tuple(post)
+        self._keys = _KEY_LAYOUTS.setdefault(keys, keys)
+        for field in SCALAR_FIELDS:
+            setattr(self, field, post.get(field))
+        extra: Dict[str, Any] = {}
+
+        title = post.get("title")
+        self.title = None
+        if isinstance(title, dict) and title.keys() == {"rendered"}:
+            self.title = title["rendered"]
+        elif "title" in post:
+            extra["title"] = title
+
+        class_list = post.get("class_list")
+        self._class_ids: Optional[array] = None
+        if isinstance(class_list, list) and all(
+            isinstance(cls, str) for cls in class_list
+        ):
+            self._class_ids = VOCABULARY.encode(class_list)
+        elif "class_list" in post:
+            extra["class_list"] = class_list
+
+        taxonomies = []
+        for field in TAXONOMY_FIELDS:
+            if field not in post:
+                continue
+            if _is_id_list(post[field]):
+                taxonomies.append((sys.intern(field), array("I", post[field])))
+            else:
+                extra[field] = post[field]
+        self._taxonomies: Tuple[Tuple[str, array], ...] = tuple(taxonomies)
+
+        for key, value in post.items():
+            if (
+                key not in SCALAR_FIELDS
+                and key not in TAXONOMY_FIELDS
+                and key not in ("title", "class_list")
+            ):
+                extra[key] = value
+        self._extra: Optional[bytes] = (
+            zlib.compress(
+                json.dumps(extra, ensure_ascii=False, separators=(",", ":")).encode()
+            )
+            if extra
+            else None
+        )
+
+    def _load_extra(self) -> Dict[str, Any]:
+        if self._extra is None:
+            return {}
+        return json.loads(zlib.decompress(self._extra))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in SCALAR_FIELDS:
+            return getattr(self, key)
+        if key == "title" and self.title is not None:
+            return {"rendered": self.title}
+        if key == "class_list" and self._class_ids is not None:
+            return VOCABULARY.decode(self._class_ids)
+        for field, ids in self._taxonomies:
+            if field == key:
+                return ids.tolist()
+        return self._load_extra()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WPostRecord):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in SCALAR_FIELDS:
+            return getattr(self, key) if key in self._keys else default
+        return super().get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Materializes the original post dictionary.
+
+        :return: ``dict`` -> Post dictionary, with the same keys as the one the record was built from.
+        """
+        extra = self._load_extra()
+        return {key: extra[key] if key in extra else self[key] for key in self._keys}
+
+    def __repr__(self) -> str:
+        return f"WPostRecord(id={self.id!r}, slug={self.slug!r})"
@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Post Store
+
+This module defines the WPPostStore class, an in-memory container for the cached
+WordPress posts that keeps hash indexes by post ID, slug, link and normalized title.
+Indexes are updated incrementally whenever a post is inserted, replaced or removed, so that
+lookups performed by the workflows do not need to rescan the whole cache.
+Posts are stored as compact ``WPostRecord`` objects, which are read as post dictionaries.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, KeysView, List, Optional, Set, Tuple
+
+# Local implementations
+from core.utils.strings import match_titles, normalize_title
+from wordpress.cache.post_record import WPostRecord
+
+
+class WPPostStore:
+    """
+    Indexed in-memory store for WordPress posts as returned by the REST API.
+
+    Posts are kept as ``WPostRecord`` objects in a dictionary keyed by post ID. The ordered list exposed by ``posts()``
+    (newest first) is built lazily and reused until the store changes. Inserted and removed
+    post IDs are tracked until ``drain_changes()`` is called, so that persistent backends
+    only need to write what changed.
+
+    Attributes:
+        version (int): Counter incremented on every change, useful to invalidate derived indexes.
+    """
+
+    def __init__(self, posts: Iterable[Dict[str, Any]] = ()):
+        """
+        Initializes the store and builds the indexes in a single pass.
+
+        :param posts: ``Iterable[dict]`` -> Post dictionaries to be indexed.
+        """
+        self.version = 0
+        self._by_id: Dict[int, WPostRecord] = {}
+        self._by_slug: Dict[str, int] = {}
+        self._by_link: Dict[str, int] = {}
+        self._titles: Counter[str] = Counter()
+        self._yoast_titles: Counter[str] = Counter()
+        self._ordered: Optional[List[WPostRecord]] = None
+        self._upserted: Set[int] = set()
+        self._removed: Set[int] = set()
+        for post in posts:
+            self.upsert(post)
+        self.drain_changes()
+
+    @staticmethod
+    def post_title(post: Dict[str, Any], yoast_support: bool = False) -> Optional[str]:
+        """
+        Extracts the title of a post.
+
+        :param post: ``dict`` -> Post dictionary.
+        :param yoast_support: ``bool`` -> Use the Yoast SEO title instead of the rendered title.
+        :return: ``str | None`` -> Post title or ``None`` if the post does not provide it.
+        """
+        if yoast_support:
+            try:
+                return " ".join(
+                    post["yoast_head_json"]["title"].split(" ")[:-2]
+                ).strip()
+            except (KeyError, TypeError):
+                return None
+        return post["title"]["rendered"].strip()
+
+    def _index(self, post: Dict[str, Any]) -> None:
+        self._by_slug[post["slug"]] = post["id"]
+        self._by_link[post["link"]] = post["id"]
+        self._titles[normalize_title(self.post_title(post))] += 1
+        if (yoast_title := self.post_title(post, yoast_support=True)) is not None:
+            self._yoast_titles[normalize_title(yoast_title)] += 1
+
+    def _unindex(self, post: Dict[str, Any]) -> None:
+        if self._by_slug.get(post["slug"]) == post["id"]:
+            del self._by_slug[post["slug"]]
+        if self._by_link.get(post["link"]) == post["id"]:
+            del self._by_link[post["link"]]
+        self._discard_title(self._titles, self.post_title(post))
+        if (yoast_title := self.post_title(post, yoast_support=True)) is not None:
+            self._discard_title(self._yoast_titles, yoast_title)
+
+    @staticmethod
+    def _discard_title(titles: Counter[str], title: str) -> None:
+        key = normalize_title(title)
+        titles[key] -= 1
+        if titles[key] <= 0:
+            del titles[key]
+
+    def upsert(self, post: Dict[str, Any]) -> None:
+        """
+        Inserts a new post or replaces the cached version of an existing one.
+
+        :param post: ``dict | WPostRecord`` -> Post dictionary or record.
+        :return: ``None``
+        """
+        if (previous := self._by_id.get(post["id"])) is not None:
+            self._unindex(previous)
+        # Indexes are computed from the incoming post, which avoids decoding the record.
+        self._index(post)
+        if not isinstance(post, WPostRecord):
+            post = WPostRecord(post)
+        self._by_id[post.id] = post
+        self._upserted.add(post["id"])
+        self._removed.discard(post["id"])
+        self._ordered = None
+        self.version += 1
+
+    def remove(self, post_id: int) -> Optional[WPostRecord]:
+        """
+        Removes a post from the store.
+
+        :param post_id: ``int`` -> ID of the post to be removed.
+        :return: ``WPostRecord | None`` -> The removed post or ``None`` if it was not in the store.
+        """
+        post = self._by_id.pop(post_id, None)
+        if post is not None:
+            self._unindex(post)
+            self._upserted.discard(post_id)
+            self._removed.add(post_id)
+            self._ordered = None
+            self.version += 1
+        return post
+
+    def drain_changes(self) -> Tuple[List[WPostRecord], List[int]]:
+        """
+        Returns the posts inserted or replaced and the IDs removed since the last call.
+
+        :return: ``tuple[list[WPostRecord], list[int]]`` -> Upserted posts and removed post IDs.
+        """
+        upserted = [self._by_id[post_id] for post_id in self._upserted]
+        removed = list(self._removed)
+        self._upserted.clear()
+        self._removed.clear()
+        return upserted, removed
+
+    def posts(self) -> List[WPostRecord]:
+        """
+        Returns every post in the store, newest first.
+
+        :return: ``list[WPostRecord]`` -> Post records.
+        """
+        if self._ordered is None:
+            self._ordered = sorted(
+                self._by_id.values(),
+                key=lambda post: (post.date or "", post.id),
+                reverse=True,
+            )
+        return self._ordered
+
+    def ids(self) -> KeysView[int]:
+        """
+        :return: ``KeysView[int]`` -> IDs of the posts in the store.
+        """
+        return self._by_id.keys()
+
+    def get_by_id(self, post_id: int) -> Optional[WPostRecord]:
+        """
+        :param post_id: ``int`` -> Post ID.
+        :return: ``WPostRecord | None`` -> Post with that ID or ``None``.
+        """
+        return self._by_id.get(post_id)
+
+    def get_by_slug(self, slug: str) -> Optional[WPostRecord]:
+        """
+        :param slug: ``str`` -> Post slug.
+        :return: ``WPostRecord | None`` -> Post with that slug or ``None``.
+        """
+        post_id = self._by_slug.get(slug)
+        return self._by_id[post_id] if post_id is not None else None
+
+    def get_by_link(self, link: str) -> Optional[WPostRecord]:
+        """
+        :param link: ``str`` -> Fully qualified post link.
+        :return: ``WPostRecord | None`` -> Post with that link or ``None``.
+        """
+        post_id = self._by_link.get(link)
+        return self._by_id[post_id] if post_id is not None else None
+
+    def has_slug(self, slug: str) -> bool:
+        """
+        :param slug: ``str`` -> Post slug.
+        :return: ``bool`` -> ``True`` if a post with that slug is in the store.
+        """
+        return slug in self._by_slug
+
+    def has_title(self, title: str, yoast_support: bool = False) -> bool:
+        """
+        Checks whether a post with the same normalized title is in the store.
+
+        :param title: ``str`` -> Title to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``bool`` -> ``True`` if the title is already published.
+        """
+        titles = self._yoast_titles if yoast_support else self._titles
+        return normalize_title(title) in titles
+
+    def published_mask(
+        self, titles: Iterable[Optional[str]], yoast_support: bool = False
+    ) -> List[bool]:
+        """
+        :param titles: ``Iterable[str | None]`` -> Titles to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``list[bool]`` -> ``True`` for every title that is already published.
+        """
+        return match_titles(
+            titles, self._yoast_titles if yoast_support else self._titles
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, post_id: object) -> bool:
+        return post_id in self._by_id
+
+    def __iter__(self) -> Iterator[WPostRecord]:
+        return iter(self.posts())
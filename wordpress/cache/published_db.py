@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Published Posts Database
+
+This module defines the WPPublishedDB class, a persistent SQLite table with the title, slug and
+models of every published post. Other modules query it to find out whether a title or slug has
+already been published without loading the WordPress cache.
+
+Rows are keyed by post ID, with indexes on the slug and on the normalized title
+(``core.utils.strings.normalize_title``). ``update()`` only reads the posts modified since
+the previous run, plus any cached post missing from the table, and applies them with
+``executemany`` UPSERTs in a single transaction, together with the removal of posts that are no longer cached.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import json
+import logging
+import sqlite3
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Local implementations
+from core.utils.strings import match_titles, normalize_title
+from wordpress.cache.post_store import WPPostStore
+from wordpress.models.taxonomies import WPTaxonomyMarker
+
+
+class WPPublishedDB:
+    """
+    Persistent, incrementally maintained table of published posts.
+
+    Attributes:
+        db_path (str | Path): Path to the SQLite database file.
+        photosets (bool): ``True`` for a photoset site, where the model is the first word of the title.
+        yoast_support (bool): Titles are taken from the Yoast SEO data.
+    """
+
+    COLUMNS = ("id", "title", "normalized_title", "models", "slug", "modified")
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        photosets: bool = False,
+        yoast_support: bool = False,
+    ):
+        """
+        Opens (or creates) the database and its schema.
+
+        :param db_path: ``str | Path`` -> Path to the SQLite database file.
+        :param photosets: ``bool`` -> Derive the model from the first word of the title.
+        :param yoast_support: ``bool`` -> Use the Yoast SEO titles.
+        """
+        self.db_path = db_path
+        self.photosets = photosets
+        self.yoast_support = yoast_support
+        self._conn = sqlite3.connect(Path(db_path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS published(
+                id INTEGER PRIMARY KEY,
+                title TEXT,
+                normalized_title TEXT,
+                models TEXT,
+                slug TEXT NOT NULL,
+                modified TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_published_slug ON published(slug);
+            CREATE INDEX IF NOT EXISTS idx_published_title ON published(normalized_title);
+            CREATE TABLE IF NOT EXISTS metadata(key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+
+    def _row(self, post: Mapping[str, Any]) -> Tuple[Any, ...]:
+        title = WPPostStore.post_title(post, yoast_support=self.yoast_support)
+        if self.photosets:
+            models = title.split(" ")[0] if title else None
+            title = title.title() if title else title
+        else:
+            models = (
+                ",".join(
+                    " ".join(cls.split("-")[1:]).title()
+                    for cls in post.get("class_list", [])
+                    if WPTaxonomyMarker.MODELS.pattern.match(cls)
+                )
+                or None
+            )
+        return (
+            post["id"],
+            title,
+            normalize_title(title) if title else None,
+            models,
+            post["slug"],
+            post.get("modified"),
+        )
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """
+        :return: ``dict`` -> Database metadata (``last_modified``, ``yoast_support``, etc.).
+        """
+        return {
+            key: json.loads(value)
+            for key, value in self._conn.execute("SELECT key, value FROM metadata")
+        }
+
+    def needs_rebuild(self) -> bool:
+        """
+        :return: ``bool`` -> ``True`` if the stored rows were built with a different title source.
+        """
+        metadata = self.read_metadata()
+        return bool(metadata) and (
+            metadata.get("yoast_support") != self.yoast_support
+            or metadata.get("photosets") != self.photosets
+        )
+
+    def last_modified(self) -> Optional[str]:
+        """
+        :return: ``str | None`` -> Latest ``modified`` timestamp applied by ``update()``.
+        """
+        return self.read_metadata().get("last_modified")
+
+    def ids(self) -> Set[int]:
+        """
+        :return: ``set[int]`` -> IDs of the stored posts.
+        """
+        return {row[0] for row in self._conn.execute("SELECT id FROM published")}
+
+    def update(
+        self,
+        changed_posts: Iterable[Mapping[str, Any]],
+        cached_ids: Set[int],
+        load_posts: Optional[Callable[[List[int]], Iterable[Mapping[str, Any]]]] = None,
+    ) -> Tuple[int, int]:
+        """
+        Applies the posts modified since the last run, adds the cached posts that are missing
+        from the table and removes the posts that are no longer cached, in a single transaction.
+
+        Cached posts can be missing even if they are older than ``last_modified()``, e.g. a scheduled
+        post that goes live keeps its ``modified`` timestamp, so they are loaded by ID with ``load_posts``.
+
+        :param changed_posts: ``Iterable[Mapping]`` -> Posts modified since ``last_modified()``.
+        :param cached_ids: ``set[int]`` -> IDs of every post in the WordPress cache.
+        :param load_posts: ``Callable[[list[int]], Iterable[Mapping]] | None`` -> Loads cached posts by ID.
+        :return: ``tuple[int, int]`` -> Number of upserted and deleted rows.
+        """
+        rows = [self._row(post) for post in changed_posts]
+        stored_ids = self.ids()
+        missing = cached_ids - stored_ids - {row[0] for row in rows}
+        if missing and load_posts is not None:
+            rows.extend(self._row(post) for post in load_posts(sorted(missing)))
+        elif missing:
+            logging.warning(
+                f"{len(missing)} cached posts are missing from {self.db_path} and no loader was given"
+            )
+        removed = [(post_id,) for post_id in stored_ids - cached_ids]
+        last_modified = max(
+            filter(None, [self.last_modified(), *(row[-1] for row in rows)]),
+            default=None,
+        )
+        with self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT INTO published({", ".join(self.COLUMNS)})
+                VALUES ({", ".join("?" * len(self.COLUMNS))})
+                ON CONFLICT(id) DO UPDATE SET
+                    {", ".join(f"{col}=excluded.{col}" for col in self.COLUMNS[1:])}
+                """,
+                rows,
+            )
+            self._conn.executemany("DELETE FROM published WHERE id = ?", removed)
+            self._conn.executemany(
+                "INSERT INTO metadata(key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                [
+                    (key, json.dumps(value))
+                    for key, value in {
+                        "last_modified": last_modified,
+                        "photosets": self.photosets,
+                        "yoast_support": self.yoast_support,
+                    }.items()
+                ],
+            )
+        return len(rows), len(removed)
+
+    def clear(self) -> None:
+        """Removes every row and the metadata, so that the next ``update()`` reads every post."""
+        with self._conn:
+            self._conn.execute("DELETE FROM published")
+            self._conn.execute("DELETE FROM metadata")
+
+    def has_slug(self, slug: str) -> bool:
+        """
+        :param slug: ``str`` -> Post slug.
+        :return: ``bool`` -> ``True`` if a post with that slug is published.
+        """
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM published WHERE slug = ? LIMIT 1", (slug,)
+            ).fetchone()
+            is not None
+        )
+
+    def has_title(self, title: str) -> bool:
+        """
+        :param title: ``str`` -> Title to look up, normalized before the comparison.
+        :return: ``bool`` -> ``True`` if a post with the same normalized title is published.
+        """
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM published WHERE normalized_title = ? LIMIT 1",
+                (normalize_title(title),),
+            ).fetchone()
+            is not None
+        )
+
+    def published_mask(self, titles: Iterable[Optional[str]]) -> List[bool]:
+        """
+        Looks up many titles at once: the normalized titles are read in a single query
+        instead of one query per title.
+
+        :param titles: ``Iterable[str | None]`` -> Titles to look up.
+        :return: ``list[bool]`` -> ``True`` for every title that is already published.
+        """
+        published = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT normalized_title FROM published WHERE normalized_title IS NOT NULL"
+            )
+        }
+        return match_titles(titles, published)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM published").fetchone()[0]
+
+    def __enter__(self) -> "WPPublishedDB":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,378 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress SQLite Cache
+
+This module provides an optional SQLite storage backend for the WordPress local cache.
+Posts are stored one per row, with indexed ``slug`` and ``modified`` columns and JSON columns
+for the rest of the post, so that readers can load only the columns they need and syncs
+become ``UPSERT`` transactions instead of full file rewrites.
+
+The module can also be run as a script to migrate an existing JSON cache and its
+metadata file into the SQLite format::
+
+    python3 -m wordpress.cache.sqlite_cache --posts
+    python3 -m wordpress.cache.sqlite_cache --photos
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Local implementations
+from core.exceptions.util_exceptions import NoSuitableArgument
+from core.models.file_system import ApplicationPath
+from core.utils.file_system import load_json_ctx
+from wordpress.cache.post_record import WPostRecord
+
+
+class WPSQLiteCache:
+    """
+    SQLite storage backend for the WordPress local cache.
+
+    Writes are accumulated in a single transaction until ``commit()`` is called, so that
+    a failed sync can be discarded with ``rollback()``.
+    """
+
+    COLUMNS = ("id", "slug", "link", "date", "modified", "title", "class_list", "post")
+    JSON_COLUMNS = ("class_list", "post")
+
+    def __init__(self, db_path: str | Path):
+        """
+        Opens (or creates) the cache database and its schema.
+
+        :param db_path: ``str | Path`` -> Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(Path(db_path))
+        self._ids: Optional[Set[int]] = None
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS posts(
+                id INTEGER PRIMARY KEY,
+                slug TEXT NOT NULL,
+                link TEXT,
+                date TEXT,
+                modified TEXT,
+                title TEXT,
+                class_list TEXT,
+                post TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_slug ON posts(slug);
+            CREATE INDEX IF NOT EXISTS idx_posts_modified ON posts(modified);
+            CREATE TABLE IF NOT EXISTS metadata(key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+
+    @staticmethod
+    def _row(post: Dict[str, Any] | WPostRecord) -> Tuple[Any, ...]:
+        if isinstance(post, WPostRecord):
+            post = post.to_dict()
+        return (
+            post["id"],
+            post["slug"],
+            post.get("link"),
+            post.get("date"),
+            post.get("modified"),
+            post.get("title", {}).get("rendered"),
+            json.dumps(post.get("class_list", []), ensure_ascii=False),
+            json.dumps(post, ensure_ascii=False),
+        )
+
+    def upsert_posts(self, posts: Iterable[Dict[str, Any]]) -> None:
+        """
+        Inserts new posts or replaces the stored version of existing ones.
+
+        :param posts: ``Iterable[dict | WPostRecord]`` -> Post dictionaries as returned by the REST API, or records.
+        :return: ``None``
+        """
+        rows = [self._row(post) for post in posts]
+        self._conn.executemany(
+            f"""
+            INSERT INTO posts({", ".join(self.COLUMNS)})
+            VALUES ({", ".join("?" * len(self.COLUMNS))})
+            ON CONFLICT(id) DO UPDATE SET
+                {", ".join(f"{col}=excluded.{col}" for col in self.COLUMNS[1:])}
+            """,
+            rows,
+        )
+        if self._ids is not None:
+            self._ids.update(row[0] for row in rows)
+
+    def delete_posts(self, post_ids: Iterable[int]) -> None:
+        """
+        Removes posts from the cache.
+
+        :param post_ids: ``Iterable[int]`` -> IDs of the posts to be removed.
+        :return: ``None``
+        """
+        post_ids = list(post_ids)
+        self._conn.executemany(
+            "DELETE FROM posts WHERE id = ?", [(post_id,) for post_id in post_ids]
+        )
+        if self._ids is not None:
+            self._ids.difference_update(post_ids)
+
+    def replace_posts(self, posts: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replaces the whole cache with a new list of posts in a single transaction.
+
+        :param posts: ``Iterable[dict]`` -> Post dictionaries as returned by the REST API.
+        :return: ``None``
+        """
+        self._conn.execute("DELETE FROM posts")
+        self._ids = None
+        self.upsert_posts(posts)
+        self.commit()
+
+    def commit(self) -> None:
+        """Commits the pending writes."""
+        self._conn.commit()
+
+    def rollback(self) -> None:
+        """Discards the pending writes."""
+        self._conn.rollback()
+        self._ids = None
+
+    def close(self) -> None:
+        """Commits pending writes and closes the database connection."""
+        self._conn.commit()
+        self._conn.close()
+
+    def load_posts(self) -> List[Dict[str, Any]]:
+        """
+        Loads every post in the cache, newest first.
+
+        :return: ``list[dict]`` -> Post dictionaries.
+        """
+        return [
+            json.loads(row[0])
+            for row in self._conn.execute("SELECT post FROM posts ORDER BY date DESC")
+        ]
+
+    def load_columns(self, *columns: str) -> List[Tuple[Any, ...]]:
+        """
+        Loads only the requested columns for every post, newest first.
+        JSON columns (``class_list`` and ``post``) are decoded.
+
+        :param columns: ``str`` -> Column names, e.g. ``"id", "slug"``.
+        :return: ``list[tuple]`` -> One tuple per post with the requested values.
+        :raises ValueError: If a column is not part of the cache schema.
+        """
+        return list(self.iter_columns(*columns))
+
+    def iter_columns(
+        self, *columns: str, modified_since: Optional[str] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Streams the requested columns for every post, newest first, without
+        loading the whole result set. JSON columns (``class_list`` and ``post``) are decoded.
+
+        :param columns: ``str`` -> Column names, e.g. ``"id", "slug"``.
+        :param modified_since: ``str | None`` -> Only posts modified at or after this timestamp, and posts without one.
+        :return: ``Iterator[tuple]`` -> One tuple per post with the requested values.
+        :raises ValueError: If a column is not part of the cache schema.
+        """
+        if unknown := set(columns) - set(self.COLUMNS):
+            raise ValueError(f"Unknown WordPress cache columns: {unknown}")
+        json_indexes = [
+            indx for indx, col in enumerate(columns) if col in self.JSON_COLUMNS
+        ]
+        # A dedicated cursor, so that other queries can run while the rows are consumed.
+        where, params = "", ()
+        if modified_since is not None:
+            where, params = (
+                "WHERE modified >= ? OR modified IS NULL ",
+                (modified_since,),
+            )
+        rows = self._conn.cursor().execute(
+            f"SELECT {', '.join(columns)} FROM posts {where}ORDER BY date DESC", params
+        )
+        if not json_indexes:
+            yield from rows
+            return
+        for row in rows:
+            yield tuple(
+                json.loads(val) if indx in json_indexes else val
+                for indx, val in enumerate(row)
+            )
+
+    def load_posts_by_id(self, post_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Loads specific posts.
+
+        :param post_ids: ``Iterable[int]`` -> IDs of the posts to load.
+        :return: ``dict[int, dict]`` -> Post dictionaries by ID, missing posts are left out.
+        """
+        post_ids = list(post_ids)
+        posts: Dict[int, Dict[str, Any]] = {}
+        # Stay below the default limit of SQLite host parameters.
+        for start in range(0, len(post_ids), 900):
+            chunk = post_ids[start : start + 900]
+            for post_id, post in self._conn.execute(
+                f"SELECT id, post FROM posts WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                posts[post_id] = json.loads(post)
+        return posts
+
+    def ids(self) -> Set[int]:
+        """
+        :return: ``set[int]`` -> IDs of the cached posts.
+        """
+        if self._ids is None:
+            self._ids = {row[0] for row in self._conn.execute("SELECT id FROM posts")}
+        return self._ids
+
+    def has_slug(self, slug: str) -> bool:
+        """
+        :param slug: ``str`` -> Post slug.
+        :return: ``bool`` -> ``True`` if a post with that slug is cached.
+        """
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM posts WHERE slug = ? LIMIT 1", (slug,)
+            ).fetchone()
+            is not None
+        )
+
+    def latest_modified(self) -> Optional[str]:
+        """
+        :return: ``str | None`` -> Latest ``modified`` timestamp in the cache.
+        """
+        return self._conn.execute("SELECT MAX(modified) FROM posts").fetchone()[0]
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """
+        :return: ``dict`` -> Cache metadata (``cached_pages``, ``total_posts``, etc.).
+        """
+        return {
+            key: json.loads(value)
+            for key, value in self._conn.execute("SELECT key, value FROM metadata")
+        }
+
+    def write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """
+        Writes the cache metadata as part of the pending transaction, so that it is
+        committed together with the posts it describes.
+
+        :param metadata: ``dict`` -> Cache metadata fields.
+        :return: ``None``
+        """
+        self._conn.executemany(
+            "INSERT INTO metadata(key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            [(key, json.dumps(value)) for key, value in metadata.items()],
+        )
+
+    # Methods that allow a sync to be applied directly to the database.
+    def upsert(self, post: Dict[str, Any]) -> None:
+        self.upsert_posts([post])
+
+    def remove(self, post_id: int) -> None:
+        self.delete_posts([post_id])
+
+    def __contains__(self, post_id: object) -> bool:
+        return post_id in self.ids()
+
+    def __len__(self) -> int:
+        return len(self.ids())
+
+
+def sqlite_cache_path(json_cache_path: str | Path) -> str:
+    """
+    Builds the path of the SQLite cache that corresponds to a JSON cache file.
+
+    :param json_cache_path: ``str | Path`` -> Path to the JSON cache, e.g. ``cache/wordpress/wp-posts.json``
+    :return: ``str`` -> Path to the SQLite cache, e.g. ``cache/wordpress/wp-posts.db``
+    """
+    return str(Path(json_cache_path).with_suffix(".db"))
+
+
+def resolve_cache_path(app_path: ApplicationPath) -> str:
+    """
+    Returns the SQLite cache path for a WordPress cache if it has been migrated,
+    otherwise the path of the JSON cache.
+
+    :param app_path: ``ApplicationPath`` -> ``WP_POSTS_CACHE`` or ``WP_PHOTOS_CACHE``
+    :return: ``str`` -> Cache path to be passed to the ``WordPress`` constructor.
+    """
+    db_path = sqlite_cache_path(app_path.value)
+    return db_path if os.path.exists(db_path) else app_path.value
+
+
+def migrate_json_cache(
+    json_cache_path: str | Path, db_path: Optional[str | Path] = None
+) -> str:
+    """
+    Migrates a JSON WordPress cache and its ``_metadata.json`` file to the SQLite format.
+
+    :param json_cache_path: ``str | Path`` -> Path to the JSON cache.
+    :param db_path: ``str | Path | None`` -> Destination database, defaults to the JSON path with a ``.db`` extension.
+    :return: ``str`` -> Path to the SQLite cache.
+    """
+    db_path = db_path or sqlite_cache_path(json_cache_path)
+    cache_dir, cache_name = os.path.split(json_cache_path)
+    posts = load_json_ctx(Path(json_cache_path), log_err=True)
+
+    db_cache = WPSQLiteCache(db_path)
+    db_cache.replace_posts(posts)
+
+    metadata_path = Path(cache_dir, f"{cache_name.split('.')[0]}_metadata.json")
+    metadata: Dict[str, Any] = {}
+    if os.path.exists(metadata_path):
+        metadata = load_json_ctx(metadata_path)[0].get(cache_name, {})
+    metadata["total_posts"] = len(posts)
+    metadata["last_modified"] = db_cache.latest_modified()
+    db_cache.write_metadata(metadata)
+    db_cache.close()
+
+    logging.info(f"Migrated {len(posts)} posts from {json_cache_path} to {db_path}")
+    print(f"Migrated {len(posts)} posts from {json_cache_path} to {db_path}")
+    return str(db_path)
+
+
+def parse_args() -> ArgumentParser:
+    args_parser = argparse.ArgumentParser(
+        description="Migrate the WordPress JSON cache to the SQLite format"
+    )
+    args_parser.add_argument(
+        "--posts",
+        action="store_true",
+        default=False,
+        help="Migrate the wp-posts local cache and its metadata.",
+    )
+    args_parser.add_argument(
+        "--photos",
+        action="store_true",
+        default=False,
+        help="Migrate the wp-photos local cache and its metadata.",
+    )
+    return args_parser
+
+
+def main():
+    args = parse_args().parse_args()
+    if args.posts:
+        migrate_json_cache(ApplicationPath.WP_POSTS_CACHE.value)
+    elif args.photos:
+        migrate_json_cache(ApplicationPath.WP_PHOTOS_CACHE.value)
+    else:
+        raise NoSuitableArgument(__package__, __file__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Taxonomy Index
+
+This module defines the WPTaxonomyIndex class, which parses the ``class_list`` key of every
+cached post once and keeps the keywords found for each ``WPTaxonomyMarker``.
+The taxonomy mapping and counting methods of the ``WordPress`` class read from this index
+instead of running the marker patterns over the whole cache on every call.
+The index also keeps inverted keyword -> post ID lists, for both taxonomy markers and
+Yoast SEO keywords, so that tag reports do not have to rescan the posts for every tag.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Local implementations
+from wordpress.exceptions.internal_exceptions import YoastSEOUnsupported
+from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
+
+
+class WPTaxonomyIndex:
+    """
+    Taxonomy index built in a single pass over the ``class_list`` of the cached posts.
+
+    Keywords are kept per taxonomy marker in two flavours, because the ``WordPress`` methods
+    that rely on this index differ in how they match markers:
+
+        - *found* keywords: the marker appears anywhere in the class (``re.findall`` semantics).
+        - *prefixed* keywords: the class starts with the marker (``re.match`` semantics).
+
+    Keyword names are cleaned as ``"tag-python-tips"`` -> ``"Python Tips"``.
+
+    Attributes:
+        version (int): Version of the post store the index was built from.
+    """
+
+    def __init__(self, posts: Iterable[Dict[str, Any]], version: int = 0):
+        """
+        Builds the index.
+
+        :param posts: ``Iterable[dict]`` -> Post dictionaries, in the order kept by the cache.
+        :param version: ``int`` -> Post store version, used by the caller to invalidate the index.
+        """
+        self.version = version
+        self._posts: List[Dict[str, Any]] = list(posts)
+        self._term_ids: Dict[Tuple[WPTaxonomyMarker, WPTaxonomyValues], Dict] = {}
+        self._keyword_posts: Optional[Dict[str, List[int]]] = None
+
+        # Markers are tracked by position while building, hashing Enum members
+        # for every class of every post is noticeably slower.
+        markers = list(WPTaxonomyMarker)
+        patterns = [(slot, marker.pattern) for slot, marker in enumerate(markers)]
+        found_lists: List[List[Tuple[int, List[str]]]] = [[] for _ in markers]
+        prefixed_lists: List[List[Tuple[int, List[str]]]] = [[] for _ in markers]
+        counts: List[Dict[str, int]] = [{} for _ in markers]
+        term_posts: List[Dict[str, List[int]]] = [{} for _ in markers]
+
+        # Most classes (tags, categories, status, etc.) repeat across posts,
+        # so every distinct class is matched against the markers only once.
+        matches: Dict[str, Tuple[str, List[Tuple[int, bool]]]] = {}
+        for post in self._posts:
+            post_id = post["id"]
+            found: List[List[str]] = [[] for _ in markers]
+            prefixed: List[List[str]] = [[] for _ in markers]
+            for cls in post["class_list"]:
+                if cls not in matches:
+                    matches[cls] = (
+                        " ".join(cls.split("-")[1:]).title(),
+                        [
+                            (slot, pattern.match(cls) is not None)
+                            for slot, pattern in patterns
+                            if pattern.search(cls) is not None
+                        ],
+                    )
+                name, slots = matches[cls]
+                for slot, is_prefix in slots:
+                    found[slot].append(name)
+                    counts[slot][name] = counts[slot].get(name, 0) + 1
+                    if is_prefix:
+                        prefixed[slot].append(name)
+                        term_posts[slot].setdefault(name, []).append(post_id)
+
+            for slot in range(len(markers)):
+                found_lists[slot].append((post_id, found[slot]))
+                prefixed_lists[slot].append((post_id, prefixed[slot]))
+
+        self._found = dict(zip(markers, found_lists))
+        self._prefixed = dict(zip(markers, prefixed_lists))
+        self._counts = dict(zip(markers, counts))
+        self._term_posts = dict(zip(markers, term_posts))
+
+    def found_terms(self, marker: WPTaxonomyMarker) -> List[Tuple[int, List[str]]]:
+        """
+        :param marker: ``WPTaxonomyMarker`` -> Taxonomy marker.
+        :return: ``list[tuple[int, list[str]]]`` -> ``(post_id, keywords)`` for every post, marker found anywhere in the class.
+        """
+        return self._found[marker]
+
+    def prefixed_terms(self, marker: WPTaxonomyMarker) -> List[Tuple[int, List[str]]]:
+        """
+        :param marker: ``WPTaxonomyMarker`` -> Taxonomy marker.
+        :return: ``list[tuple[int, list[str]]]`` -> ``(post_id, keywords)`` for every post, class starting with the marker.
+        """
+        return self._prefixed[marker]
+
+    def term_counts(self, marker: WPTaxonomyMarker) -> Dict[str, int]:
+        """
+        :param marker: ``WPTaxonomyMarker`` -> Taxonomy marker.
+        :return: ``dict[str, int]`` -> Number of occurrences of every keyword found with the marker.
+        """
+        return self._counts[marker]
+
+    def term_posts(self, marker: WPTaxonomyMarker) -> Dict[str, List[int]]:
+        """
+        Inverted index of the keywords of a taxonomy marker (classes prefixed by the marker).
+        A post ID is listed once per occurrence of the keyword in its ``class_list``.
+
+        :param marker: ``WPTaxonomyMarker`` -> Taxonomy marker.
+        :return: ``dict[str, list[int]]`` -> Mapping keyword to post IDs, in cache order.
+        """
+        return self._term_posts[marker]
+
+    def keyword_posts(self) -> Dict[str, List[int]]:
+        """
+        Inverted index of the Yoast SEO keywords (``yoast_head_json`` schema graph).
+        A post ID is listed once per occurrence of the keyword in the post keywords.
+        The index is built on first use.
+
+        :return: ``dict[str, list[int]]`` -> Mapping keyword to post IDs, in cache order.
+        :raises YoastSEOUnsupported: If a post does not provide Yoast SEO keywords.
+        """
+        if self._keyword_posts is None:
+            keyword_posts: Dict[str, List[int]] = {}
+            for post in self._posts:
+                keywords = post["yoast_head_json"]["schema"]["@graph"][0]["keywords"]
+                if not keywords:
+                    raise YoastSEOUnsupported
+                for kw in keywords:
+                    keyword_posts.setdefault(kw, []).append(post["id"])
+            self._keyword_posts = keyword_posts
+        return self._keyword_posts
+
+    def term_ids(
+        self, marker: WPTaxonomyMarker, values: WPTaxonomyValues
+    ) -> Dict[str, int]:
+        """
+        Pairs the keywords of a taxonomy marker with the numeric IDs kept in the
+        taxonomy value key of each post. The first pairing found for a keyword wins.
+        The mapping is computed once per marker and value key.
+
+        :param marker: ``WPTaxonomyMarker`` -> Taxonomy marker, e.g. ``TAG``.
+        :param values: ``WPTaxonomyValues`` -> Key containing the numeric IDs, e.g. ``TAGS``.
+        :return: ``dict[str, int]`` -> Mapping keyword to numeric ID.
+        """
+        if (marker, values) not in self._term_ids:
+            term_ids: Dict[str, int] = {}
+            for post, (_, names) in zip(self._posts, self._found[marker]):
+                for name, wp_id in zip(names, post[values.value]):
+                    term_ids.setdefault(name, wp_id)
+            self._term_ids[(marker, values)] = term_ids
+        return self._term_ids[(marker, values)]
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress Title Index
+
+This module defines the WPTitleIndex class, a set of the normalized titles (rendered and Yoast SEO)
+and slugs of the cached posts. Filters check whole partner databases against it in a single pass
+instead of looking every title up in the cache.
+
+The index is tagged with the cache digest it was built from (``WPCacheHashes.digest``) and saved
+next to the cache, so that it is only rebuilt when the cached posts change.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import json
+import logging
+
+from pathlib import Path
+from typing import Any, Iterable, List, Mapping, Optional
+
+# Local implementations
+from core.utils.file_system import staged_file
+from core.utils.strings import match_titles, normalize_title
+from wordpress.cache.post_store import WPPostStore
+
+TITLE_INDEX_FORMAT = 1
+
+
+class WPTitleIndex:
+    """
+    Immutable hash index of normalized post titles and slugs.
+
+    Attributes:
+        version (str | None): Cache digest the index was built from, ``None`` if it cannot be persisted.
+    """
+
+    def __init__(
+        self,
+        titles: Iterable[str] = (),
+        yoast_titles: Iterable[str] = (),
+        slugs: Iterable[str] = (),
+        version: Optional[str] = None,
+    ):
+        """
+        :param titles: ``Iterable[str]`` -> Normalized rendered titles.
+        :param yoast_titles: ``Iterable[str]`` -> Normalized Yoast SEO titles.
+        :param slugs: ``Iterable[str]`` -> Post slugs.
+        :param version: ``str | None`` -> Cache digest the index was built from.
+        """
+        self.version = version
+        self._titles = frozenset(titles)
+        self._yoast_titles = frozenset(yoast_titles)
+        self._slugs = frozenset(slugs)
+
+    @classmethod
+    def from_posts(
+        cls, posts: Iterable[Mapping[str, Any]], version: Optional[str] = None
+    ) -> "WPTitleIndex":
+        """
+        :param posts: ``Iterable[Mapping]`` -> Cached posts.
+        :param version: ``str | None`` -> Cache digest of the posts.
+        :return: ``WPTitleIndex`` -> Index built in a single pass over the posts.
+        """
+        titles, yoast_titles, slugs = set(), set(), set()
+        for post in posts:
+            slugs.add(post["slug"])
+            titles.add(normalize_title(WPPostStore.post_title(post)))
+            if (
+                yoast_title := WPPostStore.post_title(post, yoast_support=True)
+            ) is not None:
+                yoast_titles.add(normalize_title(yoast_title))
+        return cls(titles, yoast_titles, slugs, version=version)
+
+    @classmethod
+    def load(cls, index_path: str | Path, version: str) -> Optional["WPTitleIndex"]:
+        """
+        :param index_path: ``str | Path`` -> Saved index.
+        :param version: ``str`` -> Current cache digest.
+        :return: ``WPTitleIndex | None`` -> Saved index, or ``None`` if it is missing, unreadable or stale.
+        """
+        try:
+            with open(index_path, "r", encoding="utf-8") as index_file:
+                data = json.load(index_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logging.warning(f"Ignoring unreadable title index {index_path}: {err!r}")
+            return None
+        if data.get("format") != TITLE_INDEX_FORMAT or data.get("version") != version:
+            return None
+        return cls(data["titles"], data["yoast_titles"], data["slugs"], version=version)
+
+    def save(self, index_path: str | Path) -> None:
+        """
+        Writes the index atomically. Indexes without a version are not saved, since
+        they could not be validated when loaded.
+
+        :param index_path: ``str | Path`` -> Destination path.
+        :return: ``None``
+        """
+        if self.version is None:
+            return None
+        with staged_file(index_path) as staging_path:
+            with open(staging_path, "w", encoding="utf-8") as index_file:
+                json.dump(
+                    {
+                        "format": TITLE_INDEX_FORMAT,
+                        "version": self.version,
+                        "titles": sorted(self._titles),
+                        "yoast_titles": sorted(self._yoast_titles),
+                        "slugs": sorted(self._slugs),
+                    },
+                    index_file,
+                    ensure_ascii=False,
+                )
+
+    def has_slug(self, slug: str) -> bool:
+        """
+        :param slug: ``str`` -> Post slug.
+        :return: ``bool`` -> ``True`` if a post with that slug is indexed.
+        """
+        return slug in self._slugs
+
+    def has_title(self, title: str, yoast_support: bool = False) -> bool:
+        """
+        :param title: ``str`` -> Title to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``bool`` -> ``True`` if a post with the same normalized title is indexed.
+        """
+        titles = self._yoast_titles if yoast_support else self._titles
+        return normalize_title(title) in titles
+
+    def published_mask(
+        self, titles: Iterable[Optional[str]], yoast_support: bool = False
+    ) -> List[bool]:
+        """
+        :param titles: ``Iterable[str | None]`` -> Titles to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``list[bool]`` -> ``True`` for every title that is already published.
+        """
+        return match_titles(
+            titles, self._yoast_titles if yoast_support else self._titles
+        )
+
+    def __len__(self) -> int:
+        return len(self._slugs)
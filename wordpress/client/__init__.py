@@ -0,0 +1,6 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+from wordpress.client.http_session import WPHTTPSession
+
+__all__ = ["WPHTTPSession"]
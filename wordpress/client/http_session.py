@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WordPress HTTP Session
+
+This module defines the WPHTTPSession class, the connection-pooled HTTP session shared by
+the ``WordPress`` methods that talk to the REST API one request at a time (post creation,
+publishing, tags and media uploads).
+
+Credentials are bound to the session once, TCP/TLS connections are kept alive and reused
+across calls, every request gets a default timeout and idempotent requests are retried
+with exponential backoff on connection errors and transient server errors.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+from typing import Any, Optional, Tuple
+
+# Third-party imports
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+
+class WPHTTPSession:
+    """
+    Connection-pooled HTTP session for the WordPress REST API.
+
+    Endpoints are joined to ``base_url``, so callers pass paths such as ``/posts`` or ``/media/12``.
+    ``POST`` requests are only retried when the connection could not be established,
+    since the server may have already processed them otherwise.
+
+    Attributes:
+        base_url (str): REST API base URL, e.g. ``https://example.com/wp-json/wp/v2``
+        timeout (tuple[float, float]): Default ``(connect, read)`` timeout in seconds.
+        pool_size (int): Maximum number of connections kept alive per host.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        app_password: str,
+        pool_size: int = 10,
+        timeout: Tuple[float, float] = (5.0, 60.0),
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+    ):
+        """
+        Initializes the session and mounts the pooled adapter.
+
+        :param base_url: ``str`` -> REST API base URL.
+        :param username: ``str`` -> Username for WordPress API authentication.
+        :param app_password: ``str`` -> Application password for WordPress API authentication.
+        :param pool_size: ``int`` -> Maximum number of connections kept alive per host.
+        :param timeout: ``tuple[float, float]`` -> Default ``(connect, read)`` timeout in seconds.
+        :param max_retries: ``int`` -> Retries on connection errors and transient server errors.
+        :param backoff_factor: ``float`` -> Base delay in seconds between retries.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session = requests.Session()
+        self._session.auth = HTTPBasicAuth(username, app_password)
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def url(self, endpoint: str) -> str:
+        """
+        :param endpoint: ``str`` -> Endpoint path with a leading slash, or a fully qualified URL.
+        :return: ``str`` -> Fully qualified URL.
+        """
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url}{endpoint}"
+
+    def request(
+        self, method: str, endpoint: str, timeout: Optional[Any] = None, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request through the pooled session.
+
+        :param method: ``str`` -> HTTP method, e.g. ``"POST"``
+        :param endpoint: ``str`` -> Endpoint path with a leading slash, or a fully qualified URL.
+        :param timeout: ``float | tuple[float, float] | None`` -> Overrides the default timeout.
+        :param kwargs: Keyword arguments accepted by ``requests.Session.request`` (``json``, ``params``, ``files``, etc.)
+        :return: ``requests.Response`` -> Response object.
+        """
+        return self._session.request(
+            method,
+            self.url(endpoint),
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+
+    def get(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("POST", endpoint, **kwargs)
+
+    def delete(self, endpoint: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", endpoint, **kwargs)
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "WPHTTPSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -68,3 +68,22 @@ class CacheCreationAuthError(Exception):
         super().__init__(
             f"{self.message}\n{self.help}\nFind more information here:\n{self.link}"
         )
+
+
+class PageFetchError(Exception):
+    """
+    Alert users when a page of a WordPress REST API collection could not be downloaded,
+    either because the server rejected the request or because retries were exhausted.
+    ``status`` is ``None`` if the server could not be reached at all.
+    """
+
+    def __init__(self, url: str, page: int, status: int | None = None):
+        self.url = url
+        self.page = page
+        self.status = status
+        self.message = (
+            f"Failed to fetch page {page} of {url} (status: {status})"
+            if status is not None
+            else f"Failed to reach {url} while fetching page {page}"
+        )
+        super().__init__(self.message)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
 # Copyright (c) 2025 Yoham Gabriel B.
 
+from wordpress.models.batch import WPBatchRequest, WPBatchResponse
 from wordpress.models.client_schema import PayloadItem, ImagePayloadItem
 
-__all__ = ["PayloadItem", "ImagePayloadItem"]
+__all__ = ["PayloadItem", "ImagePayloadItem", "WPBatchRequest", "WPBatchResponse"]
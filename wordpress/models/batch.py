@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+WPBatchRequest and WPBatchResponse
+This module defines the items sent to and received from the WordPress REST API batch endpoint
+(``/batch/v1``), which processes several write requests in a single HTTP round trip.
+
+Attributes:
+    WPBatchRequest.method (str): HTTP method, ``POST``, ``PUT``, ``PATCH`` or ``DELETE``.
+    WPBatchRequest.endpoint (str): Endpoint relative to the ``wp/v2`` namespace, e.g. ``/posts``.
+    WPBatchRequest.body (dict): JSON body of the request.
+    WPBatchResponse.status (int): HTTP status code of the item.
+    WPBatchResponse.body (dict | list | None): JSON body returned for the item.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+
+@dataclass
+class WPBatchRequest:
+    method: str
+    endpoint: str
+    body: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class WPBatchResponse:
+    status: int
+    body: Optional[Union[Dict[str, Any], List[Any]]] = None
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
@@ -19,7 +19,10 @@ Email: yohamg@programmer.net
 __author__ = "Yoham Gabriel Urbine@GitHub"
 __email__ = "yohamg@programmer.net"
 
+import re
+
 from enum import Enum
+from re import Pattern
 
 
 class WPTaxonomyValues(Enum):
@@ -60,3 +63,15 @@ class WPTaxonomyMarker(Enum):
     STATUS = "status"
     MODELS = "authors"
     PHOTOS = "photos_tag"
+
+    @property
+    def pattern(self) -> Pattern[str]:
+        """
+        Precompiled regular expression for the marker.
+
+        :return: ``Pattern[str]`` -> Compiled marker pattern.
+        """
+        return _MARKER_PATTERNS[self]
+
+
+_MARKER_PATTERNS = {marker: re.compile(marker.value) for marker in WPTaxonomyMarker}
@@ -7,6 +7,10 @@ WordPress Reporting module
 This module provides functions to aggregate and report on WordPress site data,
 including posts, tags, categories, and dedicated taxonomies.
 
+The tag report collects every metric in a single pass over the cached posts and streams
+its rows to an ``.xlsx`` workbook (xlsxwriter ``constant_memory`` mode), ``CSV`` files or a ``JSONL`` file,
+so that report time grows linearly with the cache and memory only grows with the number of distinct tags and models.
+
 Author: Yoham Gabriel Urbine@GitHub
 Email: yohamg@programmer.net
 """
@@ -15,47 +19,300 @@ __author__ = "Yoham Gabriel Urbine@GitHub"
 __author_email__ = "yohamg@programmer.net"
 
 import argparse
-import datetime
+import csv
+import json
+import logging
 import os
-import sqlite3
 
 from argparse import ArgumentParser
-from typing import Generator
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 # Third-party imports
 import xlsxwriter
 
 # Local imports
-from core.utils.file_system import is_parent_dir_required, remove_if_exists
-from core.utils.strings import clean_filename
+from core.utils.file_system import is_parent_dir_required
+from core.utils.strings import clean_filename, match_list_single
 from core.controllers.secrets_controller import SecretHandler
 from core.models.secret_model import SecretType, WPSecrets
 from core.models.file_system import ApplicationPath, ProjectFile
 from core.exceptions.util_exceptions import NoSuitableArgument
 
-from wordpress_api import WordPress
+from wordpress import WordPress
+from wordpress.cache import WPPublishedDB, resolve_cache_path
 from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
 
 from core.config.config_factories import general_config_factory
 
+# Report sections and their column headers, in the order of the workbook sheets.
+TAG_REPORT_SECTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "tags": (
+        "Tag Fields & Videos Tagged",
+        ("Tag", "Tag ID", "Videos Tagged", "Tagged IDs"),
+    ),
+    "posts": ("Post id & Post Slug", ("Post ID", "Post Slug", "Post Category")),
+    "models": (
+        "Video count by Model",
+        ("Model Name", "Video Count", "Partner Name", "Post IDs"),
+    ),
+}
+TAG_REPORT_FORMATS = ("xlsx", "csv", "jsonl")
+# Partner reported for models without a matching partner hint in their first post.
+DEFAULT_PARTNER = "PartnerSeven/FeedBeta"
+
+
+class TagReportCollector:
+    """
+    Collects the tag report metrics in a single pass over the cached posts.
 
-def unpack_tpl_excel(tupled_list: tuple[tuple[str]]) -> Generator[str, None, None]:
-    """This function was created to write the ``Tuple`` (by coercion) contents of
-    another function into an ``.xlsx`` file cell appropriately.
-    It was created to address an unwanted behaviour in this line specifically:
-    ``tuple(map_tags_posts(wp_posts_f, idd='y').values())`` in the ``create_tag_report_excel`` function.
+    Post rows are handed to a callback as soon as each post is read, tag and model rows are
+    aggregated on the way and returned once the pass is complete. Keyword matching follows the
+    taxonomy index of the ``WordPress`` class: every distinct class in the ``class_list`` is
+    matched against the taxonomy markers only once.
+    """
 
-    :param tupled_list: list of tuples
-    :return: ``Generator[str, None, None]`` *Generator with a ``YieldType`` of ``str``*
+    def __init__(self, fq_domain_name: str, hints: List[str]):
+        """
+        :param fq_domain_name: ``str`` -> Domain name used to build the post URLs.
+        :param hints: ``list[str]`` -> Partner hints matched against the tags of the posts of every model.
+        """
+        self.fq_domain_name = fq_domain_name
+        self.hints = hints
+        # tag -> [tag ID, occurrences, tagged post IDs]
+        self._tags: Dict[str, List[Any]] = {}
+        # model -> [occurrences, partner, post IDs]
+        self._models: Dict[str, List[Any]] = {}
+        self._classes: Dict[str, Tuple[str, bool, bool, bool]] = {}
+
+    def _match(self, cls: str) -> Tuple[str, bool, bool, bool]:
+        """
+        :param cls: ``str`` -> Class of the ``class_list``, e.g. ``"tag-python-tips"``
+        :return: ``tuple[str, bool, bool, bool]`` -> Keyword and whether it is a tag (marker found anywhere),
+                    a prefixed tag and a model.
+        """
+        if cls not in self._classes:
+            self._classes[cls] = (
+                " ".join(cls.split("-")[1:]).title(),
+                WPTaxonomyMarker.TAG.pattern.search(cls) is not None,
+                WPTaxonomyMarker.TAG.pattern.match(cls) is not None,
+                WPTaxonomyMarker.MODELS.pattern.search(cls) is not None,
+            )
+        return self._classes[cls]
+
+    def collect(
+        self, posts: Iterable[Mapping[str, Any]], on_post: Callable[[Tuple], None]
+    ) -> None:
+        """
+        Reads every post once.
+
+        :param posts: ``Iterable[Mapping]`` -> Cached posts.
+        :param on_post: ``Callable[[tuple], None]`` -> Receives the ``posts`` section row of every post.
+        :return: ``None``
+        """
+        for post in posts:
+            post_id = post["id"]
+            tags: List[str] = []
+            models: List[str] = []
+            for cls in post["class_list"]:
+                name, is_tag, is_prefixed_tag, is_model = self._match(cls)
+                if is_tag:
+                    tags.append(name)
+                    stats = self._tags.setdefault(name, [None, 0, []])
+                    stats[1] += 1
+                    if is_prefixed_tag:
+                        stats[2].append(post_id)
+                if is_model:
+                    models.append(name)
+
+            # The first tag ID paired with a tag keyword wins.
+            for name, tag_id in zip(tags, post.get(WPTaxonomyValues.TAGS.value, ())):
+                if self._tags[name][0] is None:
+                    self._tags[name][0] = tag_id
+
+            for name in models:
+                if name not in self._models:
+                    match = [
+                        hint for hint in self.hints if match_list_single(hint, tags)
+                    ]
+                    self._models[name] = [0, match[0] if match else DEFAULT_PARTNER, []]
+                self._models[name][0] += 1
+                self._models[name][2].append(post_id)
+
+            on_post(
+                (
+                    post_id,
+                    f"{self.fq_domain_name}/{post['slug']}",
+                    self._post_category(post),
+                )
+            )
+
+    @staticmethod
+    def _post_category(post: Mapping[str, Any]) -> str:
+        try:
+            section = post["yoast_head_json"]["schema"]["@graph"][0]["articleSection"]
+        except (KeyError, IndexError, TypeError):
+            return ""
+        return ", ".join(section) if isinstance(section, list) else str(section)
+
+    def tag_rows(self) -> Generator[Tuple, None, None]:
+        """
+        :return: ``Generator[tuple]`` -> ``tags`` section rows, tags in order of first appearance.
+        """
+        for name, (tag_id, count, post_ids) in self._tags.items():
+            yield name, tag_id, count, ", ".join(map(str, post_ids))
+
+    def model_rows(self) -> Generator[Tuple, None, None]:
+        """
+        :return: ``Generator[tuple]`` -> ``models`` section rows, models in order of first appearance.
+        """
+        for name, (count, partner, post_ids) in self._models.items():
+            yield name, count, partner, ", ".join(map(str, post_ids))
+
+
+class TagReportWriter:
     """
-    for item in tupled_list:
-        yield "".join(str(item)).strip("[']")
+    Streams the rows of the tag report sections to the selected output format.
+
+    - ``xlsx``: one workbook with a sheet per section, written in ``constant_memory`` mode.
+    - ``csv``: one file per section, named ``<report>-<section>.csv``.
+    - ``jsonl``: one file with a JSON object per row and a ``section`` key.
+    """
+
+    COLUMN_WIDTHS = {
+        "tags": {"A:C": 20, "D:E": 90},
+        "posts": {"A:A": 20, "B:B": 80, "C:C": 40},
+        "models": {"A:A": 20, "B:B": 15, "C:C": 25, "D:D": 50},
+    }
+
+    def __init__(self, report_path: str | Path, report_format: str = "xlsx"):
+        """
+        :param report_path: ``str | Path`` -> Output path without the section suffix, extension included.
+        :param report_format: ``str`` -> One of ``TAG_REPORT_FORMATS``.
+        :raises ValueError: If the format is not supported.
+        """
+        if report_format not in TAG_REPORT_FORMATS:
+            raise ValueError(f"Unsupported tag report format: {report_format}")
+        self.report_format = report_format
+        self.report_path = Path(report_path)
+        self.paths: List[Path] = []
+        self._rows: Dict[str, int] = {}
+        self._outputs: Dict[str, Any] = {}
+        if report_format == "xlsx":
+            self._workbook = xlsxwriter.Workbook(
+                self.report_path, {"constant_memory": True}
+            )
+            for section, (sheet_name, header) in TAG_REPORT_SECTIONS.items():
+                sheet = self._workbook.add_worksheet(name=sheet_name)
+                for columns, width in self.COLUMN_WIDTHS[section].items():
+                    sheet.set_column(columns, width)
+                sheet.write_row(0, 0, header)
+                self._outputs[section] = sheet
+                self._rows[section] = 1
+            self.paths.append(self.report_path)
+        elif report_format == "csv":
+            for section, (_, header) in TAG_REPORT_SECTIONS.items():
+                path = self.report_path.with_name(
+                    f"{self.report_path.stem}-{section}.csv"
+                )
+                csv_file = open(path, "w", encoding="utf-8", newline="")
+                writer = csv.writer(csv_file)
+                writer.writerow(header)
+                self._outputs[section] = (csv_file, writer)
+                self.paths.append(path)
+        else:
+            self._jsonl = open(self.report_path, "w", encoding="utf-8")
+            self.paths.append(self.report_path)
+
+    def write_row(self, section: str, row: Tuple) -> None:
+        """
+        :param section: ``str`` -> Key of ``TAG_REPORT_SECTIONS``.
+        :param row: ``tuple`` -> Row values, in the order of the section header.
+        :return: ``None``
+        """
+        if self.report_format == "xlsx":
+            self._outputs[section].write_row(self._rows[section], 0, row)
+            self._rows[section] += 1
+        elif self.report_format == "csv":
+            self._outputs[section][1].writerow(row)
+        else:
+            record = dict(zip(TAG_REPORT_SECTIONS[section][1], row))
+            self._jsonl.write(
+                json.dumps({"section": section, **record}, ensure_ascii=False) + "\n"
+            )
+
+    def write_rows(self, section: str, rows: Iterable[Tuple]) -> None:
+        for row in rows:
+            self.write_row(section, row)
+
+    def close(self) -> None:
+        if self.report_format == "xlsx":
+            self._workbook.close()
+        elif self.report_format == "csv":
+            for csv_file, _ in self._outputs.values():
+                csv_file.close()
+        else:
+            self._jsonl.close()
+
+    def __enter__(self) -> "TagReportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def create_tag_report(
+    wordpress_site: WordPress,
+    report_name: str,
+    report_format: str = "xlsx",
+    parent: bool = False,
+    hints: Optional[List[str]] = None,
+) -> List[Path]:
+    """Write the tagging information of the cached posts into an ``.xlsx`` workbook, ``CSV`` files or a ``JSONL`` file.
+    Metrics are collected in a single pass over the cache, see ``TagReportCollector``.
+
+    :param wordpress_site: ``WordPress`` instance responsible for managing all the
+                             WordPress site data.
+    :param report_name: ``str`` report name with or without extension.
+    :param report_format: ``str`` one of ``TAG_REPORT_FORMATS``, default ``"xlsx"``.
+    :param parent: ``bool`` Place the report in the parent directory if ``True``, default ``False``.
+    :param hints: ``list[str] | None`` partner hints, defaults to the partners of the content bot configuration.
+    :return: ``list[Path]`` paths of the files written.
+    """
+    if hints is None:
+        try:
+            from core.config.config_factories import content_bot_conf_factory
+
+            hints = content_bot_conf_factory().partners.split(",")
+        except ModuleNotFoundError:
+            hints = []
+
+    report_fname = clean_filename(report_name, f".{report_format}")
+    report_path = Path(is_parent_dir_required(parent), report_fname)
+    collector = TagReportCollector(wordpress_site.fq_domain_name, hints)
+    with TagReportWriter(report_path, report_format) as writer:
+        collector.collect(
+            wordpress_site.iter_posts(), lambda row: writer.write_row("posts", row)
+        )
+        writer.write_rows("tags", collector.tag_rows())
+        writer.write_rows("models", collector.model_rows())
+    return writer.paths
 
 
 def create_tag_report_excel(
     wordpress_site: WordPress, workbook_name: str, parent: bool = False
 ) -> None:
-    """Write the tagging information into an Excel ``.xlsx`` file.
+    """Write the tagging information into an Excel ``.xlsx`` file, see ``create_tag_report``.
 
     :param parent: ``bool`` Place the workbook in the parent directory if ``True``, default ``False``.
     :param wordpress_site: ``WordPress`` instance responsible for managing all the
@@ -63,79 +320,8 @@ def create_tag_report_excel(
     :param workbook_name: ``str`` workbook name with or without extension.
     :return: ``None``
     """
-    try:
-        from core.config.config_factories import content_bot_conf_factory
-
-        hints = content_bot_conf_factory().partners.split(",")
-    except ModuleNotFoundError:
-        hints = []
-
     workbook_fname = clean_filename(workbook_name, ".xlsx")
-    dir_prefix = is_parent_dir_required(parent)
-
-    tags_match_key = (WPTaxonomyMarker.TAG, WPTaxonomyValues.TAGS)
-    tags_dict = wordpress_site.map_wp_class_id(tags_match_key[0], tags_match_key[1])
-    tags_count = wordpress_site.count_wp_class_id(tags_match_key[0])
-
-    model_wp_class_count = wordpress_site.count_map_match_taxonomy(
-        WPTaxonomyMarker.MODELS, WPTaxonomyMarker.TAG, hints
-    )
-
-    workbook = xlsxwriter.Workbook(f"{dir_prefix}{workbook_fname}")
-
-    tag_plus_tid = workbook.add_worksheet(name="Tag Fields & Videos Tagged")
-
-    tag_plus_tid.set_column("A:C", 20)
-    tag_plus_tid.set_column("D:E", 90)
-    tag_plus_tid.write_row("A1", ("Tag", "Tag ID", "Videos Tagged", "Tagged IDs"))
-    tag_plus_tid.write_column("A2", tuple(tags_dict.keys()))
-    tag_plus_tid.write_column("B2", tuple(tags_dict.values()))
-    tag_plus_tid.write_column("C2", tuple(tags_count.values()))
-    tag_plus_tid.write_column(
-        "D2",
-        unpack_tpl_excel(
-            wordpress_site.map_tags_posts(WPTaxonomyMarker.TAG, idd=True).values()
-        ),
-    )
-
-    post_id_slug = workbook.add_worksheet(name="Post id & Post Slug")
-    post_id_slug.set_column("A:A", 20)
-    post_id_slug.set_column("B:B", 80)
-    post_id_slug.set_column("C:C", 40)
-    post_id_slug.write_row("A1", ("Post ID", "Post Slug", "Post Category"))
-    post_id_slug.write_column("A2", tuple(wordpress_site.map_posts_by_id().keys()))
-    post_id_slug.write_column(
-        "B2",
-        tuple(wordpress_site.map_posts_by_id(include_host_name=True).values()),
-    )
-    post_id_slug.write_column(
-        "C2",
-        unpack_tpl_excel(wordpress_site.map_postsid_category(host_name=True).values()),
-    )
-
-    model_count = workbook.add_worksheet(name="Video count by Model")
-    model_count.set_column("A:A", 20)
-    model_count.set_column("B:B", 15)
-    model_count.set_column("C:C", 25)
-    model_count.set_column("D:D", 50)
-    model_count.write_row(
-        "A1", ("Model Name", "Video Count", "Partner Name", "Post IDs")
-    )
-    model_count.write_column("A2", tuple(model_wp_class_count.keys()))
-    model_count.write_column(
-        "B2", (count[0][0] for count in model_wp_class_count.values())
-    )
-    model_count.write_column(
-        "C2", (partner[0][1] for partner in model_wp_class_count.values())
-    )
-    par_strip = lambda tp: str(tp).strip(")").strip("(")  # noqa: E731
-    t_comma_out = lambda tp: par_strip(tp) if len(tp) > 1 else par_strip(tp).strip(",")  # noqa: E731
-    model_count.write_column(
-        "D2",
-        tuple(map(t_comma_out, map(lambda tp: tp[1:], model_wp_class_count.values()))),
-    )
-
-    workbook.close()
+    create_tag_report(wordpress_site, workbook_fname, "xlsx", parent=parent)
 
     print(
         f"\nFind the new file {workbook_fname} in \n{is_parent_dir_required(parent=parent)}\n"
@@ -149,11 +335,13 @@ def update_published_titles_db(
     photosets: bool = False,
     yoast: bool = False,
 ) -> None:
-    """Creates a ``SQLite`` db based on the WordPress site cached data that will be used by other modules to
-        compare information in a different format. Sometimes, titles and descriptions can't be matched by
-        the built-in ``re`` module in Python due to character sets or encodings present in different pieces of
-        information extracted from WordPress. This is where, by having a db, we can conduct simple comparison
-        operations without explicit pattern matching with ``re``.
+    """Maintains a persistent ``SQLite`` db with the titles, models and slugs of the published posts that will be
+        used by other modules to compare information in a different format. Sometimes, titles and descriptions
+        can't be matched by the built-in ``re`` module in Python due to character sets or encodings present in
+        different pieces of information extracted from WordPress. This is where, by having a db, we can conduct
+        simple comparison operations without explicit pattern matching with ``re``.
+
+        Only the posts modified since the previous run are written, see ``WPPublishedDB``.
 
     :param wordpress_site: ``WordPress`` object with file configuration information.
     :param parent: ``True`` if you want to place your database in the parent directory. Default ``False``.
@@ -162,35 +350,24 @@ def update_published_titles_db(
                    when fields have unwanted HTML entities. Default ``False``.
     :return: ``None`` (Database file in working or parent directory)
     """
-    db_name = (
-        f"wp-photos-{datetime.date.today()}.db"
-        if photosets
-        else f"wp-posts-{datetime.date.today()}.db"
-    )
+    db_name = "wp-photos-published.db" if photosets else "wp-posts-published.db"
     db_full_name = os.path.join(is_parent_dir_required(parent), db_name)
-    remove_if_exists(db_full_name)
-    db = sqlite3.connect(db_full_name)
-    cur = db.cursor()
-    if photosets:
-        cur.execute("CREATE TABLE sets(title, model, wp_slug)")
-        vid_slugs = wordpress_site.get_slugs()
-        vid_titles = wordpress_site.get_post_titles_local(yoast_support=yoast)
-        for title, slug in zip(vid_titles, vid_slugs):
-            model = title.split(" ")[0]
-            cur.execute(
-                "INSERT INTO sets VALUES (?, ?, ?)", (title.title(), model, slug)
-            )
-        db.commit()
-    else:
-        cur.execute("CREATE TABLE videos(title, models, wp_slug)")
-        vid_slugs = wordpress_site.get_slugs()
-        vid_titles = wordpress_site.get_post_titles_local()
-        vid_models = wordpress_site.get_post_models()
-        for title, models, slug in zip(vid_titles, vid_models, vid_slugs):
-            cur.execute("INSERT INTO videos VALUES (?, ?, ?)", (title, models, slug))
-    db.commit()
-    cur.close()
-    db.close()
+    with WPPublishedDB(
+        db_full_name, photosets=photosets, yoast_support=yoast
+    ) as published_db:
+        if published_db.needs_rebuild():
+            published_db.clear()
+        upserted, deleted = published_db.update(
+            wordpress_site.iter_posts(modified_since=published_db.last_modified()),
+            wordpress_site.post_ids(),
+            load_posts=wordpress_site.get_posts_by_id,
+        )
+        logging.info(
+            f"Published posts db {db_full_name}: {upserted} upserted, {deleted} deleted, {len(published_db)} total"
+        )
+
+    print(f"\nUpdated {db_name} in \n{is_parent_dir_required(parent=parent)}\n")
+    return None
 
 
 def get_site() -> WordPress:
@@ -200,7 +377,7 @@ def get_site() -> WordPress:
         general_config.fq_domain_name,
         wp_auth.user,
         wp_auth.app_password,
-        ApplicationPath.WP_POSTS_CACHE.value,
+        resolve_cache_path(ApplicationPath.WP_POSTS_CACHE),
     )
     return wordpress_site
 
@@ -238,15 +415,29 @@ def parse_args() -> ArgumentParser:
         default=False,
         help="Create an MS Excel report with the tag and slug information of the site.",
     )
+    args_parser.add_argument(
+        "--report-format",
+        choices=TAG_REPORT_FORMATS,
+        default="xlsx",
+        help="Output format of the tag report created with --excel (xlsx, csv or jsonl).",
+    )
     return args_parser
 
 
 def main():
     args = parse_args().parse_args()
-    if args.excel:
+    if args.excel and args.report_format == "xlsx":
         create_tag_report_excel(
             get_site(), ProjectFile.EXCEL_REPORT.value, parent=args.parent
         )
+    elif args.excel:
+        for path in create_tag_report(
+            get_site(),
+            os.path.splitext(ProjectFile.EXCEL_REPORT.value)[0],
+            args.report_format,
+            parent=args.parent,
+        ):
+            print(f"\nFind the new file {path}\n")
     elif args.photos:
         update_published_titles_db(
             get_site(), parent=args.parent, photosets=True, yoast=args.yoast
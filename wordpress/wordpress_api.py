@@ -19,19 +19,31 @@ __email__ = "yohamg@programmer.net"
 import warnings
 from json import JSONDecodeError
 
-import aiohttp
-import asyncio
 import datetime
 import logging
+import math
+import mimetypes
 import os
 import re
 import requests
-import threading
 import time
 
-from collections import namedtuple, deque
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Any, Dict, Deque, Union
+from typing import (
+    Optional,
+    List,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Set,
+    Union,
+)
+from urllib.parse import quote
 
 # Third-party modules
 import urllib3
@@ -42,15 +54,55 @@ from core.utils.file_system import load_json_ctx, export_request_json, logging_s
 from core.models.file_system import ApplicationPath
 from core.utils.strings import clean_filename, match_list_single
 from core.utils.helpers import get_duration
+from wordpress.cache import (
+    WPCacheHashes,
+    WPPageFetcher,
+    WPPostStore,
+    WPSQLiteCache,
+    WPTaxonomyIndex,
+    WPTitleIndex,
+)
+from wordpress.cache.page_fetcher import ProgressCallback, WP_MAX_PER_PAGE
+from wordpress.client import WPHTTPSession
 from wordpress.exceptions.internal_exceptions import (
     MissingCacheError,
-    YoastSEOUnsupported,
     CacheCreationAuthError,
+    CacheSyncIntegrityError,
+    PageFetchError,
 )
+from wordpress.models.batch import WPBatchRequest, WPBatchResponse
 from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
 from wordpress.models.endpoints import WPEndpoints
 from wordpress.models.wpost import WPost
 
+# Default page size used by the WordPress REST API for collections.
+WP_DEFAULT_PER_PAGE = 10
+
+# Maximum number of requests accepted by the REST API batch endpoint in a single call.
+WP_BATCH_MAX_REQUESTS = 25
+
+# Default ``_fields`` projection for cached posts. It covers the keys read by this module,
+# ``ml_engine.model_train`` and ``wordpress.utils.reporting``; ``content.rendered`` and the
+# ``yoast_head`` HTML are never downloaded. Nested Yoast SEO fields use the REST API dot notation.
+WP_CACHE_FIELDS: tuple[str, ...] = (
+    "id",
+    "date",
+    "modified",
+    "modified_gmt",
+    "slug",
+    "link",
+    "title",
+    "excerpt",
+    "class_list",
+    WPTaxonomyValues.TAGS.value,
+    WPTaxonomyValues.CATEGORIES.value,
+    WPTaxonomyValues.MODELS.value,
+    WPTaxonomyValues.PHOTOS.value,
+    "yoast_head_json.title",
+    "yoast_head_json.description",
+    "yoast_head_json.schema",
+)
+
 
 class WordPress:
     """
@@ -61,6 +113,12 @@ class WordPress:
     caching of API data, efficient synchronization, and various utilities for filtering,
     mapping, and reporting on WordPress site content.
 
+    Requests are sent through a connection-pooled session that is closed by ``close()``,
+    instances can also be used as context managers::
+
+        with WordPress(domain, user, app_password, cache_path) as site:
+            site.post_create(payload)
+
     Attributes:
         fq_domain_name (str): Fully qualified domain name of the WordPress site.
         username (str): Username for WordPress API authentication.
@@ -74,6 +132,12 @@ class WordPress:
         cached_pages (int): Number of cached pages.
         total_posts (int): Total number of posts.
         last_updated (str): Date when the cache was last updated.
+        last_modified (str): Latest ``modified`` timestamp of the cached posts.
+        cache_hashes (WPCacheHashes | None): ``modified_gmt`` and content hash of every cached post, used by cache syncs.
+        cache_dirty (bool): ``True`` if responses were applied to the local cache since the last cache sync.
+        local_changes (int): Number of responses applied to the local cache since the last cache sync.
+        cache_fields (tuple[str, ...] | None): ``_fields`` projection requested for cached posts, ``None`` for full posts.
+        http (WPHTTPSession): Connection-pooled session with the credentials of the instance.
     """
 
     def __init__(
@@ -84,6 +148,12 @@ class WordPress:
         cache_path: str | Path,
         use_photo_support: bool = False,
         unique_logging_session: bool = True,
+        fetch_concurrency: int = 5,
+        progress_callback: Optional[ProgressCallback] = None,
+        cache_fields: Optional[Sequence[str]] = WP_CACHE_FIELDS,
+        http_pool_size: int = 10,
+        http_timeout: tuple[float, float] = (5.0, 60.0),
+        http_retries: int = 3,
     ):
         """
         Initializes the WordPress API handler with authentication and cache configuration.
@@ -94,9 +164,15 @@ class WordPress:
         :param fq_domain_name: ``str`` -> Fully qualified domain name of the WordPress site.
         :param username: ``str`` -> Username for WordPress API authentication.
         :param password: ``str`` -> Application password for WordPress API authentication.
-        :param cache_path: ``str | Path`` -> Path to the local cache file, including the filename.
+        :param cache_path: ``str | Path`` -> Path to the local cache file, including the filename. A ``.db`` extension selects the SQLite cache backend.
         :param use_photo_support: ``bool`` -> Flag indicating whether to fetch photo posts. Default is False.
         :param unique_logging_session: ``bool`` -> Flag indicating whether to set up an independent logging session.
+        :param fetch_concurrency: ``int`` -> Maximum number of concurrent page requests when fetching posts.
+        :param progress_callback: ``ProgressCallback | None`` -> Receives ``(pages_done, total_pages)`` while posts are downloaded.
+        :param cache_fields: ``Sequence[str] | None`` -> Post fields to download for the cache, ``None`` downloads full posts. Default ``WP_CACHE_FIELDS``.
+        :param http_pool_size: ``int`` -> Connections kept alive by the HTTP session.
+        :param http_timeout: ``tuple[float, float]`` -> Default ``(connect, read)`` timeout in seconds for HTTP requests.
+        :param http_retries: ``int`` -> Retries on connection errors and transient server errors.
         :return: ``None``
         """
         if unique_logging_session:
@@ -106,6 +182,22 @@ class WordPress:
         self.api_base_url = f"https://{self.fq_domain_name}/wp-json/wp/v2"
         self.username = username
         self.app_password = password
+        self.page_fetcher = WPPageFetcher(
+            self.api_base_url,
+            self.username,
+            self.app_password,
+            concurrency=fetch_concurrency,
+            progress_callback=progress_callback,
+        )
+        self.http = WPHTTPSession(
+            self.api_base_url,
+            self.username,
+            self.app_password,
+            pool_size=http_pool_size,
+            timeout=http_timeout,
+            max_retries=http_retries,
+        )
+        self.cache_fields = tuple(cache_fields) if cache_fields else None
         self.cache_path = cache_path
         self.use_photo_cache = use_photo_support
         self.cache_dir = os.path.split(self.cache_path)[0]
@@ -114,45 +206,212 @@ class WordPress:
             f"{os.path.split(self.cache_path)[1].split('.')[0]}_metadata.json"
         )
         self.cache_metadata_path = self.cache_path if self.cache_path else None
-        self.__cache_metadata: Optional[List[dict]] = (
-            load_json_ctx(
-                Path(self.cache_dir, self.cache_metadata_file), thread_safe=False
-            )
-            if os.path.exists(self.cache_path)
+        self.cache_checkpoint_path = Path(
+            self.cache_dir,
+            f"{os.path.split(self.cache_path)[1].split('.')[0]}_checkpoint.jsonl",
+        )
+        self.title_index_path = Path(
+            self.cache_dir,
+            f"{os.path.split(self.cache_path)[1].split('.')[0]}_title_index.json",
+        )
+        cache_exists = os.path.exists(self.cache_path)
+
+        # Set up cache dir, if it does not exist.
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._cache_backend: Optional[WPSQLiteCache] = (
+            WPSQLiteCache(self.cache_path)
+            if Path(self.cache_path).suffix == ".db"
             else None
         )
+        if self._cache_backend is not None:
+            db_metadata = self._cache_backend.read_metadata()
+            # An empty database is left behind if the first cache build fails.
+            cache_exists = bool(db_metadata)
+            self.__cache_metadata: Optional[List[dict]] = (
+                [{self.cache_name: db_metadata}] if db_metadata else None
+            )
+        else:
+            self.__cache_metadata: Optional[List[dict]] = (
+                load_json_ctx(
+                    Path(self.cache_dir, self.cache_metadata_file), thread_safe=False
+                )
+                if cache_exists
+                else None
+            )
         self.cached_pages: Optional[int] = None
         self.total_posts: Optional[int] = None
         self.last_updated: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.cache_hashes: Optional[WPCacheHashes] = None
         self.created_posts: List[WPost] = []
-        self.cache_page_num = 0
+        self._post_store: Optional[WPPostStore] = (
+            None if self._cache_backend is not None else WPPostStore()
+        )
+        self._taxonomy_index: Optional[WPTaxonomyIndex] = None
+        self._title_index: Optional[WPTitleIndex] = None
+        # Terms created by this instance that are not yet assigned to a cached post.
+        self._created_terms: Dict[WPTaxonomyValues, Dict[str, int]] = {}
+        self.cache_dirty: bool = False
+        self.local_changes: int = 0
+        # Unknown until the first batch call, ``False`` if the site lacks ``/batch/v1``.
+        self._batch_supported: Optional[bool] = None
         logging.info(f"Using {self.api_base_url} as WordPress API base url")
 
-        # Set up cache dir, if it does not exist.
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir, exist_ok=True)
-
         if self.__cache_metadata:
             metadata_fields = self.__cache_metadata[0][self.cache_name]
             self.cached_pages: int = metadata_fields["cached_pages"]
             self.total_posts: int = metadata_fields["total_posts"]
             self.last_updated: str = metadata_fields["last_updated"]
+            self.last_modified = metadata_fields.get("last_modified")
+            self.cache_hashes = WPCacheHashes.from_metadata(metadata_fields)
 
         try:
-            if os.path.exists(self.cache_path):
-                self.cache_data: List[dict] = load_json_ctx(
-                    Path(self.cache_path), thread_safe=False, log_err=True
-                )
+            if cache_exists:
+                if self._cache_backend is None:
+                    self.cache_data = load_json_ctx(
+                        Path(self.cache_path), thread_safe=False, log_err=True
+                    )
                 self.cache_sync()
             else:
                 self.create_export_local_cache()
-        except requests.ConnectionError:
-            if os.path.exists(self.cache_path):
-                self.cache_data: List[dict] = load_json_ctx(
+        except (requests.ConnectionError, PageFetchError):
+            if not cache_exists:
+                raise MissingCacheError(self.cache_path)
+            if self._cache_backend is not None:
+                self._cache_backend.rollback()
+            else:
+                self.cache_data = load_json_ctx(
                     Path(self.cache_path), thread_safe=False
                 )
-            else:
-                raise MissingCacheError(self.cache_path)
+
+    @property
+    def post_store(self) -> WPPostStore:
+        """
+        Indexed in-memory store with the cached posts.
+        With the SQLite backend, posts are loaded from the database on first access.
+
+        :return: ``WPPostStore`` -> Post store instance.
+        """
+        if self._post_store is None:
+            self._post_store = WPPostStore(self._cache_backend.load_posts())
+        return self._post_store
+
+    @property
+    def cache_data(self) -> List[Dict[str, Any]]:
+        """
+        Cached posts, newest first, as kept by the instance post store.
+        Posts are compact ``WPostRecord`` objects, read like post dictionaries.
+
+        :return: ``list[WPostRecord]`` -> List of post records.
+        """
+        return self.post_store.posts()
+
+    @cache_data.setter
+    def cache_data(self, posts: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the cached posts and rebuilds the post store indexes.
+
+        :param posts: ``list[dict]`` -> List of post dictionaries.
+        :return: ``None``
+        """
+        self._post_store = WPPostStore(posts)
+        self._taxonomy_index = None
+
+    def iter_posts(
+        self, modified_since: Optional[str] = None
+    ) -> Iterator[Mapping[str, Any]]:
+        """
+        Iterates over the cached posts, newest first. With the SQLite backend, posts are
+        streamed from the database if the post store has not been loaded, so that single-pass
+        consumers (e.g. reports) do not hold the whole cache in memory.
+
+        :param modified_since: ``str | None`` -> Only posts modified at or after this timestamp, and posts without one.
+        :return: ``Iterator[Mapping[str, Any]]`` -> Post records or dictionaries.
+        """
+        if self._post_store is None:
+            return (
+                row[0]
+                for row in self._cache_backend.iter_columns(
+                    "post", modified_since=modified_since
+                )
+            )
+        if modified_since is None:
+            return iter(self.post_store.posts())
+        return (
+            post
+            for post in self.post_store.posts()
+            if not post.get("modified") or post["modified"] >= modified_since
+        )
+
+    def post_ids(self) -> Set[int]:
+        """
+        :return: ``set[int]`` -> IDs of the cached posts.
+        """
+        if self._post_store is None:
+            return set(self._cache_backend.ids())
+        return set(self.post_store.ids())
+
+    def get_posts_by_id(self, post_ids: Iterable[int]) -> List[Mapping[str, Any]]:
+        """
+        :param post_ids: ``Iterable[int]`` -> IDs of cached posts.
+        :return: ``list[Mapping]`` -> Cached posts, without loading the whole cache if it is not loaded.
+        """
+        return list(self._load_cached_posts(list(post_ids)).values())
+
+    @property
+    def taxonomy_index(self) -> WPTaxonomyIndex:
+        """
+        Taxonomy index over the ``class_list`` of the cached posts.
+        The index is rebuilt only when the post store version changes.
+
+        :return: ``WPTaxonomyIndex`` -> Taxonomy index instance.
+        """
+        store = self.post_store
+        if (
+            self._taxonomy_index is None
+            or self._taxonomy_index.version != store.version
+        ):
+            self._taxonomy_index = WPTaxonomyIndex(store.posts(), version=store.version)
+        return self._taxonomy_index
+
+    @property
+    def title_index(self) -> Optional[WPTitleIndex]:
+        """
+        Normalized title and slug index of the cached posts, saved in ``title_index_path``.
+        The index is versioned with the cache digest: a saved index is reused until the cached
+        posts change, and rebuilt in a single pass over the cache otherwise.
+
+        :return: ``WPTitleIndex | None`` -> Title index, ``None`` if the cache has no content hashes to version it.
+        """
+        if self.cache_hashes is None:
+            return None
+        version = self.cache_hashes.digest
+        if self._title_index is None or self._title_index.version != version:
+            self._title_index = WPTitleIndex.load(self.title_index_path, version)
+        if self._title_index is None:
+            self._title_index = WPTitleIndex.from_posts(
+                self.iter_posts(), version=version
+            )
+            self._title_index.save(self.title_index_path)
+        return self._title_index
+
+    def close(self) -> None:
+        """
+        Closes the HTTP session and, with the SQLite backend, commits and closes the cache database.
+
+        :return: ``None``
+        """
+        self.http.close()
+        if self._cache_backend is not None:
+            self._cache_backend.close()
+
+    def __enter__(self) -> "WordPress":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def curl_wp_self_concat(
         self,
@@ -192,105 +451,35 @@ class WordPress:
     def create_local_cache(self, wp_cache_fname: str) -> list[dict]:
         """
         Fetches all posts from the WordPress site and creates a local cache.
+        Pages are downloaded concurrently by the instance page fetcher and checkpointed,
+        so an interrupted build resumes from the pages that were already downloaded.
 
         :param wp_cache_fname: ``str`` -> Cache filename to use for storing posts.
-        :return: ``list[dict]`` -> List of post dictionaries.
+        :return: ``list[dict]`` -> List of post dictionaries, newest first.
+        :raises CacheCreationAuthError: If the site rejects the credentials.
         """
-        result_lock = threading.Lock()
-        result_deque = deque()
-
-        x_wp_total = 0
-        x_wp_totalpages = 0
-
-        def add_result(elem) -> None:
-            """
-            Appends an element to a shared list while ensuring thread safety using a lock.
-
-            :param elem: ``Any`` -> Element to be appended to the shared list.
-            :return: ``None``
-            """
-            timeout = 30
-            try:
-                if result_lock.acquire(timeout=timeout):
-                    result_deque.append(elem)
-                else:
-                    print(
-                        f"Could not acquire lock in {threading.current_thread()!r} at add_result() within {timeout} seconds."
-                    )
-            finally:
-                result_lock.release()
-
-        end_param_posts = [
-            WPEndpoints.POSTS.value
-            if not self.use_photo_cache
-            else WPEndpoints.PHOTOS.value
-        ]
         wp_cache: str = clean_filename(wp_cache_fname, "json")
-        print(f"\nCreating WordPress {wp_cache} cache file...\n")
-
-        http = urllib3.PoolManager()
-        curl_wp = self.curl_wp_self_concat(http, list(end_param_posts))
-        headers = curl_wp.headers
+        logging.info(f"Creating WordPress {wp_cache} cache file...")
         try:
-            x_wp_total += int(headers["x-wp-total"])
-            x_wp_totalpages += int(headers["x-wp-totalpages"])
-        except KeyError:
-            raise CacheCreationAuthError
-        end_param_posts.append(WPEndpoints.PAGE.value)
-
-        wp_pages = []
-        for page_num in range(1, x_wp_totalpages + 1):
-            wp_self: str = self.api_base_url
-            wp_pages.append(wp_self + "".join(end_param_posts) + str(page_num))
-
-        semaphore = asyncio.Semaphore(value=5)
-
-        async def async_wp_self_concat(
-            session: aiohttp.ClientSession, wp_url: str
-        ) -> None:
-            """
-            Coroutine to fetch a single page of posts from the WordPress API.
-
-            :param session: ``aiohttp.ClientSession`` -> HTTP session for requests.
-            :param wp_url: ``str`` -> URL to fetch.
-            :return: ``None``
-            """
-            username_: str = self.username
-            app_pass_: str = self.app_password
-            auth = aiohttp.BasicAuth(username_, app_pass_)
-            headers_aiohttp = {"keep-alive": "True", "accept-encoding": "True"}
-            async with semaphore:
-                async with session.get(
-                    wp_url, auth=auth, headers=headers_aiohttp
-                ) as response:
-                    if response.status != 400:
-                        print(f"--> Fetching page #{wp_url.split('=')[-1]}")
-
-                        res_json = await response.json()
-                        for item in res_json:
-                            add_result(item)
-
-        async def get_all_posts() -> None:
-            """
-            Fetches all post pages asynchronously and aggregates results.
-
-            :return: ``None``
-            """
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(30),
-                connector=aiohttp.TCPConnector(
-                    ssl_shutdown_timeout=10.0, force_close=True
-                ),
-            ) as session:
-                pages = [async_wp_self_concat(session, wp_page) for wp_page in wp_pages]
-                await asyncio.gather(*pages)
-
-        asyncio.run(get_all_posts())
+            posts, x_wp_total = self.page_fetcher.fetch(
+                self._posts_endpoint(),
+                self._project_fields({}),
+                checkpoint_path=self.cache_checkpoint_path,
+            )
+        except PageFetchError as err:
+            if err.status in (401, 403):
+                raise CacheCreationAuthError
+            raise
 
         # Assumes that no config file exists.
-        self.local_cache_config(x_wp_totalpages, x_wp_total)
-        print(f"\n{'DONE':=^30}\n")
-        return list(result_deque)
+        self.cache_hashes = WPCacheHashes.from_posts(posts)
+        self.local_cache_config(
+            math.ceil(x_wp_total / WP_DEFAULT_PER_PAGE),
+            x_wp_total,
+            last_modified=self._latest_modified(posts),
+        )
+        logging.info(f"Created WordPress {wp_cache} cache with {len(posts)} posts")
+        return posts
 
     def create_export_local_cache(self) -> None:
         """
@@ -299,253 +488,286 @@ class WordPress:
         :return: ``None``
         """
         wp_cache = self.create_local_cache(self.cache_name)
-        export_request_json(self.cache_name, wp_cache, 1, target_dir=self.cache_dir)
+        if self._cache_backend is not None:
+            self._cache_backend.replace_posts(wp_cache)
+        else:
+            export_request_json(self.cache_name, wp_cache, 1, target_dir=self.cache_dir)
         self.cache_data = wp_cache
         return None
 
-    def update_json_cache(self) -> list[dict]:
+    def _posts_endpoint(self) -> str:
         """
-        Updates the local WordPress cache file by fetching new posts.
+        Returns the collection endpoint this instance caches (posts or photos).
 
-        :return: ``list[dict]`` -> Updated list of post dictionaries.
-        :raises core.utils.custom_exceptions.MissingCacheError: If the cache file is missing.
+        :return: ``str`` -> Endpoint path with a leading slash.
         """
-        http = urllib3.PoolManager(
-            num_pools=10,
-            maxsize=10,
-            retries=urllib3.Retry(total=2, backoff_factor=0.5),
+        return (
+            WPEndpoints.POSTS.value
+            if not self.use_photo_cache
+            else WPEndpoints.PHOTOS.value
         )
 
-        params_posts: list[str] = (
-            [WPEndpoints.POSTS.value]
-            if not self.use_photo_cache
-            else [WPEndpoints.PHOTOS.value]
+    def _project_fields(self, query: Dict[str, str | int]) -> Dict[str, str | int]:
+        """
+        Adds the ``_fields`` projection of the instance to a collection query,
+        unless the query already selects its own fields.
+
+        :param query: ``dict[str, str | int]`` -> Query string parameters for the collection.
+        :return: ``dict[str, str | int]`` -> Query with the ``_fields`` parameter.
+        """
+        if self.cache_fields is None or "_fields" in query:
+            return query
+        return {**query, "_fields": ",".join(self.cache_fields)}
+
+    def fetch_collection(self, query: Dict[str, str | int]) -> tuple[list[dict], int]:
+        """
+        Walks every page of a collection query and aggregates the results.
+        Pages are requested with the maximum page size allowed by the REST API.
+
+        :param query: ``dict[str, str | int]`` -> Query string parameters for the collection.
+        :return: ``tuple[list[dict], int]`` -> Items found and the ``X-WP-Total`` value reported by the server.
+        :raises CacheSyncIntegrityError: If the server rejects the query.
+        :raises PageFetchError: If the server cannot be reached.
+        """
+        try:
+            return self.page_fetcher.fetch(
+                self._posts_endpoint(), self._project_fields(query)
+            )
+        except PageFetchError as err:
+            if err.status is None:
+                raise
+            logging.error(f"Collection query {query} failed: {err.message}")
+            raise CacheSyncIntegrityError
+
+    def _latest_modified(self, posts: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Finds the most recent ``modified`` timestamp in a list of posts.
+
+        :param posts: ``list[dict]`` -> Post dictionaries as returned by the REST API.
+        :return: ``str | None`` -> ISO 8601 timestamp or ``None`` if no post has one.
+        """
+        return max(
+            (post["modified"] for post in posts if post.get("modified")),
+            default=None,
         )
-        x_wp_total = 0
-        x_wp_totalpages = 0
-        # The loop will add 1 to page num when the first request is successful.
-        page_num = self.cached_pages - 2
-        result_dict: List[Dict[str, Any]] = self.cache_data
-        total_elems = len(result_dict)
-        recent_posts: list[dict] = []
-        page_num_param: bool = False
-        while True:
-            curl_json = self.curl_wp_self_concat(http, params_posts)
-            if curl_json.status == 400:
-                diff = x_wp_total - total_elems
-                if diff != 0:
-                    add_list = recent_posts[:diff]
-                    add_list.reverse()
-                    for recent in add_list:
-                        result_dict.insert(0, recent)
-                self.local_cache_config(page_num, x_wp_total)
-                return result_dict
-            else:
-                page_num += 1
-                if not page_num_param:
-                    headers = curl_json.headers
-                    x_wp_total += int(headers["x-wp-total"])
-                    x_wp_totalpages = int(headers["x-wp-totalpages"])  # noqa: F841
-                    params_posts.append(WPEndpoints.PAGE.value)
-                    params_posts.append(str(page_num))
-                    page_num_param = True
-                else:
-                    params_posts[-1] = str(page_num)
-                for item in curl_json.json():
-                    if item not in result_dict:
-                        recent_posts.append(item)
-                    else:
-                        continue
 
-    def async_update_json_cache(self) -> List[Dict[str, Any]]:
+    def _load_cached_posts(self, post_ids: List[int]) -> Dict[int, Mapping[str, Any]]:
+        """
+        :param post_ids: ``list[int]`` -> IDs of cached posts.
+        :return: ``dict[int, Mapping]`` -> Cached posts by ID, read from the database if the posts are not loaded.
         """
-        Updates the local WordPress cache file by fetching new posts.
-        Use update_json_cache instead, this one needs more testing.
+        if self._post_store is None:
+            return self._cache_backend.load_posts_by_id(post_ids)
+        return {
+            post_id: post
+            for post_id in post_ids
+            if (post := self._post_store.get_by_id(post_id)) is not None
+        }
 
-        :return: ``list[dict]`` -> Updated list of post dictionaries.
+    def update_json_cache(self) -> Optional[list[dict]]:
         """
-        self.cache_page_num = self.cached_pages - 2
-        x_wp_total = 0
-        x_wp_totalpages = 0
+        Updates the local WordPress cache with the posts that changed on the site.
+
+        A single ``id,modified,modified_gmt`` listing of the collection is compared with the
+        ``modified_gmt`` recorded for every cached post in ``cache_hashes``, and only new and changed
+        posts are downloaded by ID. Downloaded posts whose content hash matches the cached version
+        are not written again, and posts that are no longer listed (deleted, trashed or unpublished)
+        are dropped. Caches without a ledger are compared by their ``modified`` timestamp instead,
+        and the ledger is built on the way.
 
-        http = urllib3.PoolManager(
-            num_pools=10,
-            maxsize=10,
-            retries=urllib3.Retry(total=2, backoff_factor=0.5),
+        If the SQLite backend is in use and the posts have not been loaded into memory, the changes
+        are written straight to the database in a pending transaction, see ``cache_sync``.
+
+        :return: ``list[dict] | None`` -> Updated list of post dictionaries, ``None`` if the changes went to the database only.
+        :raises CacheSyncIntegrityError: If the server rejects the sync queries.
+        """
+        store = (
+            self._post_store if self._post_store is not None else self._cache_backend
         )
-        params_posts: Deque[str] = deque(
-            [WPEndpoints.POSTS.value]
-            if not self.use_photo_cache
-            else [WPEndpoints.PHOTOS.value]
+        # Work on a copy, so that a failed sync leaves the ledger of the instance untouched.
+        hashes = (
+            self.cache_hashes.copy()
+            if self.cache_hashes is not None
+            else WPCacheHashes()
         )
-        # Get headers
-        curl_json = self.curl_wp_self_concat(http, list(params_posts))
-        headers = curl_json.headers
-        x_wp_total += int(headers["x-wp-total"])
-        x_wp_totalpages = int(headers["x-wp-totalpages"])
-        http.clear()
-
-        def generate_params(total_pages):
-            params_list = []
-            while self.cache_page_num <= total_pages:
-                self.cache_page_num += 1
-                params_posts.append(str(self.cache_page_num))
-                params_list.append("".join(params_posts))
-                params_posts.pop()
-                if WPEndpoints.PAGE.value not in params_posts:
-                    params_posts.append(WPEndpoints.PAGE.value)
-            return params_list
-
-        result_dict: List[Dict[str, Any]] = self.cache_data
-        total_elems = len(result_dict)
-        recent_posts: Deque[dict] = Deque()
-
-        recent_posts_lock = threading.Lock()
-        client_semaphore = asyncio.Semaphore(value=5)
-
-        def add_recent_posts(elem):
-            try:
-                if recent_posts_lock.acquire(timeout=5):
-                    recent_posts.append(elem)
-            finally:
-                recent_posts_lock.release()
-
-        async def get_recent_loop(semaphore, client_session, params_req):
-            wp_self: str = self.api_base_url
-            username_: str = self.username
-            app_pass_: str = self.app_password
-            basic_auth = aiohttp.BasicAuth(username_, app_pass_)
-            headers_aiohttp = {"keep_alive": "true", "accept_encoding": "true"}
-            wp_self: str = wp_self + "".join(params_req)
-            async with semaphore:
-                async with client_session.get(
-                    wp_self, auth=basic_auth, headers=headers_aiohttp
-                ) as resp:
-                    resp_status = resp.status
-                    if resp_status != 400:
-                        resp_json = await resp.json()
-                        for item in resp_json:
-                            if item not in result_dict:
-                                add_recent_posts(item)
-
-        async def main():
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(30),
-                connector=aiohttp.TCPConnector(
-                    ssl_shutdown_timeout=10.0, force_close=True
-                ),
-                connector_owner=False,
-            ) as session:
-                tasks = [
-                    get_recent_loop(client_semaphore, session, params)
-                    for params in generate_params(x_wp_totalpages)
-                ]
-                await asyncio.gather(*tasks)
-
-        asyncio.run(main())
-
-        diff = x_wp_total - total_elems
-        if diff != 0:
-            add_list = list(recent_posts)[:diff]
-            add_list.reverse()
-            for recent in add_list:
-                if isinstance(recent, dict):
-                    result_dict.insert(0, recent)
-
-        self.local_cache_config(self.cache_page_num, x_wp_total)
-        return result_dict
+        if (
+            self._cache_backend is None
+            and self.cache_hashes is not None
+            and WPCacheHashes.digest_of(store.posts()) != hashes.digest
+        ):
+            # The JSON cache and its metadata are separate files that may not have been written together.
+            mismatches = hashes.reconcile(store.posts())
+            logging.warning(
+                f"CacheSync digest mismatch in {self.cache_name}: {mismatches} ledger entries reset"
+            )
+
+        live_items, x_wp_total = self.fetch_collection(
+            {"_fields": "id,modified,modified_gmt"}
+        )
+        live = {item["id"]: item for item in live_items}
+
+        unrecorded = self._load_cached_posts(
+            [post_id for post_id in live if post_id not in hashes]
+        )
+        changed_ids, unchanged_ids = hashes.changed_ids(
+            live.values(),
+            {post_id: post.get("modified") for post_id, post in unrecorded.items()},
+        )
+        for post_id in unchanged_ids:
+            hashes.record_post(unrecorded[post_id], live[post_id].get("modified_gmt"))
+
+        written: list[dict] = []
+        new_posts: list[dict] = []
+        for chunk_start in range(0, len(changed_ids), WP_MAX_PER_PAGE):
+            chunk = changed_ids[chunk_start : chunk_start + WP_MAX_PER_PAGE]
+            changed_posts, _ = self.fetch_collection(
+                {"include": ",".join(map(str, chunk))}
+            )
+            for post in changed_posts:
+                previous = hashes.get(post["id"])
+                content_hash = hashes.record_post(
+                    post, live.get(post["id"], {}).get("modified_gmt")
+                )
+                if post["id"] not in store:
+                    new_posts.append(post)
+                elif previous is not None and previous[1] == content_hash:
+                    continue
+                store.upsert(post)
+                written.append(post)
+
+        stale_ids = store.ids() - live.keys()
+        for stale_id in stale_ids:
+            store.remove(stale_id)
+            hashes.remove(stale_id)
+
+        if len(store) != x_wp_total:
+            # The collection changed while it was listed, the next sync picks up the difference.
+            logging.warning(
+                f"CacheSync count drift: {len(store)} cached vs {x_wp_total} reported"
+            )
 
-    def local_cache_config(self, wp_curr_page: int, total_posts: int) -> None:
+        logging.info(
+            f"CacheSync checked {len(live)} posts: {len(changed_ids)} changed, "
+            f"{len(written) - len(new_posts)} rewritten, {len(new_posts)} new, {len(stale_ids)} removed"
+        )
+        self.cache_hashes = hashes
+        self.local_cache_config(
+            math.ceil(x_wp_total / WP_DEFAULT_PER_PAGE),
+            x_wp_total,
+            last_modified=max(
+                filter(None, (self.last_modified, self._latest_modified(written))),
+                default=None,
+            ),
+        )
+        return store.posts() if store is self._post_store else None
+
+    def local_cache_config(
+        self, wp_curr_page: int, total_posts: int, last_modified: Optional[str] = None
+    ) -> None:
         """
         Creates or updates the local cache configuration file with metadata.
 
         :param wp_curr_page: ``int`` -> Last cached page number.
         :param total_posts: ``int`` -> Total number of posts.
+        :param last_modified: ``str | None`` -> Latest ``modified`` timestamp present in the cache.
         :return: ``None``
         """
+        # The ``cache_digest`` and ``post_hashes`` fields come from ``cache_hashes``.
         wp_cache_metadata_file = self.cache_metadata_file
         path_exists = os.path.exists(
             os.path.join(self.cache_dir, wp_cache_metadata_file)
         )
-        create_new = [
-            {
-                self.cache_name: {
-                    "cached_pages": wp_curr_page,
-                    "total_posts": total_posts,
-                    "last_updated": str(datetime.date.today()),
-                }
-            }
-        ]
-        if path_exists:
+        metadata_fields = {
+            "cached_pages": wp_curr_page,
+            "total_posts": total_posts,
+            "last_updated": str(datetime.date.today()),
+            "last_modified": last_modified,
+        }
+        if self.cache_hashes is not None:
+            metadata_fields.update(self.cache_hashes.to_metadata())
+        create_new = [{self.cache_name: metadata_fields}]
+        if path_exists and self.__cache_metadata:
             existing_file = self.__cache_metadata
             for item in existing_file:
-                item.update(
-                    {
-                        self.cache_name: {
-                            "cached_pages": wp_curr_page,
-                            "total_posts": total_posts,
-                            "last_updated": str(datetime.date.today()),
-                        }
-                    }
-                )
+                item.update({self.cache_name: metadata_fields})
             create_new = existing_file
 
         self.__cache_metadata = create_new
-        metadata_fields = self.__cache_metadata[0][self.cache_name]
         self.cached_pages: int = metadata_fields["cached_pages"]
         self.total_posts: int = metadata_fields["total_posts"]
         self.last_updated: str = metadata_fields["last_updated"]
+        self.last_modified: Optional[str] = metadata_fields["last_modified"]
 
-        export_request_json(
-            wp_cache_metadata_file, create_new, target_dir=self.cache_dir
-        )
+        if self._cache_backend is not None:
+            self._cache_backend.write_metadata(metadata_fields)
+        else:
+            export_request_json(
+                wp_cache_metadata_file, create_new, target_dir=self.cache_dir
+            )
         return None
 
     def cache_sync(self) -> Optional[bool]:
         """
         Synchronizes the local cache with the WordPress site.
+        Only the posts that changed since the last sync are downloaded, see ``update_json_cache``.
+        The local cache is rebuilt from scratch only if the site rejects the sync queries.
+
+        With the SQLite backend, only the inserted, replaced and removed posts are written
+        in a single transaction, which is discarded if the sync fails.
 
-        :raises HotFileSyncIntegrityError: If validation fails.
         :return: ``Optional[bool]`` -> True if sync is successful, otherwise None.
         """
-        sync_changes: List[Dict[str, Any]] = self.update_json_cache()
-        # Reload config
-        if len(sync_changes) == self.total_posts:
+        try:
+            sync_changes: Optional[List[Dict[str, Any]]] = self.update_json_cache()
+        except CacheSyncIntegrityError:
+            logging.critical("CacheSync failed - Rebuilding local cache...")
+            if self._cache_backend is not None:
+                self._cache_backend.rollback()
+            self.create_export_local_cache()
+            return None
+
+        if self._cache_backend is None:
             export_request_json(
-                self.cache_name, sync_changes, 1, target_dir=self.cache_dir
+                self.cache_name,
+                [post.to_dict() for post in sync_changes],
+                1,
+                target_dir=self.cache_dir,
             )
-            self.__cache_metadata = load_json_ctx(
-                Path(self.cache_dir, self.cache_metadata_file)
-            )
-            self.cache_data = load_json_ctx(Path(self.cache_path))
-
-            metadata_fields = self.__cache_metadata[0][self.cache_name]
-            self.cached_pages: int = metadata_fields["cached_pages"]
-            self.total_posts: int = metadata_fields["total_posts"]
-            self.last_updated: str = metadata_fields["last_updated"]
-
-            logging.info(f"Exporting new WordPress cache config: {self.cache_name}")
-            logging.info("CacheSync Successful")
-            return True
         else:
-            logging.critical("CacheSync failed - Rebuilding local cache...")
-            self.create_export_local_cache()
-        return None
+            if self._post_store is not None:
+                upserted, removed = self._post_store.drain_changes()
+                self._cache_backend.upsert_posts(upserted)
+                self._cache_backend.delete_posts(removed)
+            self._cache_backend.commit()
+        self.cache_dirty = False
+        self.local_changes = 0
+        logging.info(f"Exporting new WordPress cache config: {self.cache_name}")
+        logging.info("CacheSync Successful")
+        return True
+
+    def sync_local_changes(self, min_changes: int = 1) -> Optional[bool]:
+        """
+        Runs a cache sync only if enough responses were applied to the local cache since
+        the last one, so that workflows can sync periodically or at the end of a session
+        instead of after every post.
+
+        :param min_changes: ``int`` -> Local changes required to trigger the sync. Default 1
+        :return: ``Optional[bool]`` -> Result of ``cache_sync`` or ``None`` if no sync was needed.
+        """
+        if not self.cache_dirty or self.local_changes < min_changes:
+            return None
+        logging.info(f"Syncing {self.local_changes} local changes in {self.cache_name}")
+        return self.cache_sync()
 
     def post_create(self, payload) -> int:
         """
         Creates a new post on the WordPress site via a POST request.
+        The created post is applied to the local cache right away, see ``merge_post``.
 
         :param payload: ``dict`` -> Dictionary containing post information.
         :return: ``int`` -> HTTP status code of the request.
         """
-        wp_self, auth_wp = self.setup_basic_auth()
-        wp_self: str = (
-            wp_self + WPEndpoints.POSTS.value
-            if not self.use_photo_cache
-            else wp_self + WPEndpoints.PHOTOS.value
-        )
-        request_info = requests.post(wp_self, json=payload, auth=auth_wp)
+        request_info = self.http.post(self._posts_endpoint(), json=payload)
         request_json = request_info.json()
         logging.info(f"Post upload result: {request_json}")
         if request_info.status_code != 201:
@@ -553,17 +775,27 @@ class WordPress:
                 f"Post upload failed with status code: {request_info.status_code} Reason: {request_info.reason}"
             )
             return request_info.status_code
+        self._apply_created_post(request_json)
+        return request_info.status_code
+
+    def _apply_created_post(self, post: Dict[str, Any]) -> None:
+        """
+        Records a created post in ``created_posts`` and applies it to the local cache.
+
+        :param post: ``dict`` -> Post dictionary returned by the REST API.
+        :return: ``None``
+        """
         self.created_posts.append(
             WPost(
-                post_id=request_json["id"],
-                title=request_json["title"]["rendered"],
-                slug=request_json["slug"],
-                content=request_json["content"]["rendered"],
-                ptype=request_json["type"],
-                author=request_json["author"],
+                post_id=post["id"],
+                title=post["title"]["rendered"],
+                slug=post["slug"],
+                content=post["content"]["rendered"],
+                ptype=post["type"],
+                author=post["author"],
             )
         )
-        return request_info.status_code
+        self.merge_post(post)
 
     def post_delete(self, post_id: int) -> int:
         """
@@ -572,22 +804,23 @@ class WordPress:
         :param post_id: ``int`` -> ID of the post to be deleted.
         :return: ``int`` -> HTTP status code of the request.
         """
-        wp_self, auth_wp = self.setup_basic_auth()
-        wp_self: str = wp_self + WPEndpoints.POSTS.value + "/" + str(post_id)
-        request_info = requests.delete(wp_self, auth=auth_wp)
+        request_info = self.http.delete(f"{WPEndpoints.POSTS.value}/{post_id}")
         return request_info.status_code
 
     def publish_post(self, post_id: int) -> int:
         """
         Publishes a post on the WordPress site via a POST request.
+        The updated post is applied to the local cache right away, see ``merge_post``.
 
         :param post_id: ``int`` -> ID of the post to be published.
         :return: ``int`` -> HTTP status code of the request.
         """
-        wp_self, auth_wp = self.setup_basic_auth()
-        wp_self: str = wp_self + WPEndpoints.POSTS.value + "/" + str(post_id)
         payload = {"status": "publish"}
-        request_info = requests.post(wp_self, auth=auth_wp, json=payload)
+        request_info = self.http.post(
+            f"{WPEndpoints.POSTS.value}/{post_id}", json=payload
+        )
+        if request_info.status_code == 200:
+            self.merge_post(request_info.json())
         return request_info.status_code
 
     def get_last_post(self) -> Optional[WPost]:
@@ -615,7 +848,7 @@ class WordPress:
         :param tag_name: ``str`` -> Name of the new tag.
         :param tag_slug: ``str`` -> Slug for the new tag.
         :param description: ``Optional[str]`` -> Optional description for the tag.
-        :param sync_on_add: ``bool`` -> If True, synchronizes the cache after adding.
+        :param sync_on_add: ``bool`` -> If True, the created tag is applied to the local tag mapping right away, see ``merge_term``.
         :return: ``int`` -> HTTP status code of the request.
         """
         payload_schema = {
@@ -624,24 +857,241 @@ class WordPress:
         }
         if description:
             payload_schema["description"] = description
-        wp_self, auth_wp = self.setup_basic_auth()
-        wp_self: str = wp_self + WPEndpoints.TAGS.value
-        status_code = requests.post(
-            wp_self, json=payload_schema, auth=auth_wp
-        ).status_code
-        if status_code == 201 and sync_on_add:
-            self.cache_sync()
-        return status_code
-
-    def post_polling(self, post_slug: str, retry_offset: int = 5) -> Optional[bool]:
-        """Check for the publication a post in real time by using iteration of the Cache Sync
-        algorithm. It will detect that you have effectively hit the publish button, so that functionality
-        that directly depends on the post being online can take it from there.
+        request_info = self.http.post(WPEndpoints.TAGS.value, json=payload_schema)
+        if request_info.status_code == 201 and sync_on_add:
+            self.merge_term(WPTaxonomyValues.TAGS, request_info.json())
+        return request_info.status_code
+
+    def batch(
+        self,
+        batch_requests: Sequence[WPBatchRequest],
+        chunk_size: int = WP_BATCH_MAX_REQUESTS,
+    ) -> List[WPBatchResponse]:
+        """
+        Sends write requests through the REST API batch endpoint (``/batch/v1``),
+        in chunks of up to ``WP_BATCH_MAX_REQUESTS`` requests per HTTP call.
+
+        Requests are validated and processed one by one (``"validation": "normal"``), so a failed
+        item does not prevent the rest of its chunk from being applied. If the site does not provide
+        the batch endpoint, every request is sent on its own instead, and so are the items of
+        endpoints that do not allow batching.
+
+        :param batch_requests: ``Sequence[WPBatchRequest]`` -> Requests to be sent.
+        :param chunk_size: ``int`` -> Requests per batch call, at most ``WP_BATCH_MAX_REQUESTS``.
+        :return: ``list[WPBatchResponse]`` -> One response per request, in the same order.
+        """
+        chunk_size = max(1, min(chunk_size, WP_BATCH_MAX_REQUESTS))
+        root, namespace = self.http.base_url.rsplit("/wp-json", 1)
+        responses: List[WPBatchResponse] = []
+        for start in range(0, len(batch_requests), chunk_size):
+            chunk = batch_requests[start : start + chunk_size]
+            if self._batch_supported is False:
+                responses.extend(self._send_single(item) for item in chunk)
+                continue
+            request_info = self.http.post(
+                f"{root}/wp-json/batch/v1",
+                json={
+                    "validation": "normal",
+                    "requests": [
+                        {
+                            "method": item.method,
+                            "path": f"{namespace}{item.endpoint}",
+                            "body": item.body,
+                        }
+                        for item in chunk
+                    ],
+                },
+            )
+            if request_info.status_code in (404, 405, 501):
+                logging.warning(
+                    f"Batch endpoint unavailable ({request_info.status_code}), sending requests one by one"
+                )
+                self._batch_supported = False
+                responses.extend(self._send_single(item) for item in chunk)
+                continue
+            if request_info.status_code not in (200, 207):
+                logging.error(
+                    f"Batch call failed with status {request_info.status_code}, sending its requests one by one"
+                )
+                responses.extend(self._send_single(item) for item in chunk)
+                continue
+
+            self._batch_supported = True
+            for item, item_response in zip(chunk, request_info.json()["responses"]):
+                body = item_response.get("body")
+                if (
+                    isinstance(body, dict)
+                    and body.get("code") == "rest_batch_not_allowed"
+                ):
+                    responses.append(self._send_single(item))
+                else:
+                    responses.append(WPBatchResponse(item_response["status"], body))
+        return responses
+
+    def _send_single(self, item: WPBatchRequest) -> WPBatchResponse:
+        """
+        Sends a batch request item on its own.
+
+        :param item: ``WPBatchRequest`` -> Request to be sent.
+        :return: ``WPBatchResponse`` -> Status and JSON body of the response.
+        """
+        request_info = self.http.request(item.method, item.endpoint, json=item.body)
+        try:
+            body = request_info.json()
+        except JSONDecodeError:
+            body = None
+        return WPBatchResponse(request_info.status_code, body)
+
+    def batch_post_create(self, payloads: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Creates several posts through the batch endpoint, see ``batch``.
+        Created posts are recorded and applied to the local cache as in ``post_create``.
+
+        :param payloads: ``Sequence[dict]`` -> Post payloads.
+        :return: ``list[int]`` -> HTTP status code of every post, in the order of ``payloads``.
+        """
+        responses = self.batch(
+            [
+                WPBatchRequest("POST", self._posts_endpoint(), payload)
+                for payload in payloads
+            ]
+        )
+        for response in responses:
+            if response.status == 201:
+                self._apply_created_post(response.body)
+            else:
+                logging.critical(
+                    f"Post upload failed with status code: {response.status} Reason: {response.body}"
+                )
+        return [response.status for response in responses]
+
+    def batch_publish_posts(self, post_ids: Sequence[int]) -> List[int]:
+        """
+        Publishes several posts through the batch endpoint, see ``batch``.
+
+        :param post_ids: ``Sequence[int]`` -> IDs of the posts to be published.
+        :return: ``list[int]`` -> HTTP status code of every post, in the order of ``post_ids``.
+        """
+        responses = self.batch(
+            [
+                WPBatchRequest(
+                    "POST", f"{self._posts_endpoint()}/{post_id}", {"status": "publish"}
+                )
+                for post_id in post_ids
+            ]
+        )
+        for response in responses:
+            if response.status == 200:
+                self.merge_post(response.body)
+        return [response.status for response in responses]
+
+    def batch_tag_create(
+        self, tags: Sequence[Dict[str, str]], merge_terms: bool = True
+    ) -> List[int]:
+        """
+        Adds several tags through the batch endpoint, see ``batch``.
+
+        :param tags: ``Sequence[dict[str, str]]`` -> Tag payloads with ``name``, ``slug`` and optionally ``description``.
+        :param merge_terms: ``bool`` -> Apply the created tags to the local tag mapping, see ``merge_term``.
+        :return: ``list[int]`` -> HTTP status code of every tag, in the order of ``tags``.
+        """
+        responses = self.batch(
+            [WPBatchRequest("POST", WPEndpoints.TAGS.value, tag) for tag in tags]
+        )
+        for response in responses:
+            if response.status == 201 and merge_terms:
+                self.merge_term(WPTaxonomyValues.TAGS, response.body)
+        return [response.status for response in responses]
+
+    def post_polling(
+        self,
+        post_slug: str,
+        retry_offset: int = 5,
+        deadline: Optional[float] = 1800.0,
+        max_delay: float = 30.0,
+        full_sync: bool = False,
+    ) -> Optional[bool]:
+        """Check for the publication a post in real time. It will detect that you have effectively
+        hit the publish button, so that functionality that directly depends on the post being online
+        can take it from there.
+
+        The post is looked up directly with ``?slug=<post_slug>``, requesting only its ID, link and status
+        (plus the cached fields, which are returned only once the post is published).
+        The delay between requests starts at ``retry_offset`` seconds and doubles up to ``max_delay``.
+        Once the post is published, it is merged into the local cache on its own, without a cache sync.
+        The legacy behaviour, iterating the Cache Sync algorithm, is available with ``full_sync``.
 
         The function assigns environment variable ``"LATEST_POST"`` since objects
         present in this application do not usually work with fully qualified links because it is
         not necessary. This mechanism has also proven effective for manipulating pieces of information during runtime.
 
+        :param post_slug: ``str`` -> self-explanatory
+        :param retry_offset: ``int`` -> Initial delay in seconds between requests, defaults to 5
+        :param deadline: ``float | None`` -> Seconds to wait for the publication, ``None`` waits indefinitely. Default 1800
+        :param max_delay: ``float`` -> Maximum delay in seconds between requests. Default 30
+        :param full_sync: ``bool`` -> Poll by syncing the whole cache instead. Default False
+        :return: ``None`` | ``True``
+        """
+        if full_sync:
+            return self._post_polling_sync(post_slug, retry_offset=retry_offset)
+
+        query: Dict[str, str] = {"slug": post_slug}
+        if self.cache_fields is not None:
+            poll_fields = dict.fromkeys(("id", "link", "status", *self.cache_fields))
+            query["_fields"] = ",".join(poll_fields)
+
+        retries = 0
+        delay = max(float(retry_offset), 1.0)
+        start_check = time.time()
+        while True:
+            try:
+                response = self.http.get(self._posts_endpoint(), params=query)
+                if response.status_code in (401, 403):
+                    logging.error(
+                        f"Post polling for {post_slug} rejected with status {response.status_code}"
+                    )
+                    return None
+                if response.status_code == 200:
+                    published = [
+                        post
+                        for post in response.json()
+                        if post.get("status", "publish") == "publish"
+                    ]
+                    if published:
+                        post = published[0]
+                        os.environ["LATEST_POST"] = post["link"]
+                        self.merge_post(post)
+                        h, mins, secs = get_duration(time.time() - start_check)
+                        logging.info(
+                            f"wordpress_post_polling took -> hours: {h} mins: {mins} secs: {secs} in {retries} retries"
+                        )
+                        return True
+                else:
+                    logging.warning(
+                        f"Post polling for {post_slug} returned status {response.status_code}"
+                    )
+            except (requests.RequestException, JSONDecodeError) as err:
+                logging.warning(f"Post polling for {post_slug} failed: {err!r}")
+
+            elapsed = time.time() - start_check
+            if deadline is not None and elapsed >= deadline:
+                logging.warning(
+                    f"Post {post_slug} was not published within {deadline} seconds"
+                )
+                return None
+            wait = min(delay, max_delay)
+            if deadline is not None:
+                wait = min(wait, deadline - elapsed)
+            time.sleep(wait)
+            delay *= 2
+            retries += 1
+
+    def _post_polling_sync(
+        self, post_slug: str, retry_offset: int = 5
+    ) -> Optional[bool]:
+        """
+        Polls for the publication of a post by iterating the Cache Sync algorithm.
+
         :param post_slug: ``str`` -> self-explanatory
         :param retry_offset: ``int`` -> self-explanatory, defaults to 5
         :return: ``None`` | ``True``
@@ -650,9 +1100,8 @@ class WordPress:
         start_check = time.time()
         cache_sync = self.cache_sync()
         while cache_sync:
-            slugs = self.get_slugs()
-            if post_slug in slugs:
-                os.environ["LATEST_POST"] = self.get_links()[slugs.index(post_slug)]
+            if self.has_slug(post_slug):
+                os.environ["LATEST_POST"] = self.get_by_slug(post_slug)["link"]
                 end_check = time.time()
                 h, mins, secs = get_duration(end_check - start_check)
                 logging.info(
@@ -682,24 +1131,65 @@ class WordPress:
         file_path: str | Path,
         payload: dict[str, str | int],
         return_source_url: bool = False,
+        max_retries: int = 0,
+        backoff_factor: float = 1.0,
     ) -> Union[int, str]:
         """
         Uploads an image as a WordPress media attachment.
 
+        The file is streamed from disk as the raw request body and the attributes are sent
+        as query parameters of the same request, which the media endpoint applies on creation.
+        Non-ASCII file names are sent in the RFC 5987 ``filename*`` parameter, with an ASCII fallback.
+
         :param file_path: ``str | Path`` -> Path to the image file.
         :param payload: ``dict[str, str | int]`` -> Image attributes (ALT text, description, caption).
         :param return_source_url: ``str`` -> Source URL of the image
+        :param max_retries: ``int`` -> Retries on connection errors and transient server errors. Default 0
+        :param backoff_factor: ``float`` -> Base delay in seconds between retries, doubled after every retry.
         :return: ``int`` -> HTTP status code of the request or ``source_url`` of the attachment file in the server
                     if ``return_source_url`` is set to True.
         """
-        wp_self, auth_wp = self.setup_basic_auth()
-        # headers = {"Content-Disposition": f"attachment; filename={file_path}"}
-        wp_self: str = self.api_base_url + WPEndpoints.MEDIA.value
-        with open(file_path, "rb") as thumb:
-            request = requests.post(wp_self, files={"file": thumb}, auth=auth_wp)
+        file_name = os.path.basename(file_path)
+        ascii_name = re.sub(r'[^\x20-\x7e]|"', "_", file_name)
+        disposition = f'attachment; filename="{ascii_name}"'
+        if ascii_name != file_name:
+            # Header values are sent as Latin-1, so the real name is percent-encoded.
+            disposition += f"; filename*=UTF-8''{quote(file_name, safe='')}"
+        headers = {
+            "Content-Type": mimetypes.guess_type(file_name)[0]
+            or "application/octet-stream",
+            "Content-Disposition": disposition,
+        }
+        for attempt in range(max_retries + 1):
+            try:
+                with open(file_path, "rb") as thumb:
+                    request = self.http.post(
+                        WPEndpoints.MEDIA.value,
+                        data=thumb,
+                        params=payload,
+                        headers=headers,
+                    )
+                if (
+                    request.status_code not in WPHTTPSession.RETRY_STATUSES
+                    or attempt == max_retries
+                ):
+                    break
+                logging.warning(
+                    f"Media upload of {file_name} returned {request.status_code}, retrying..."
+                )
+            except requests.RequestException as err:
+                if attempt == max_retries:
+                    raise
+                logging.warning(
+                    f"Media upload of {file_name} failed: {err!r}, retrying..."
+                )
+            time.sleep(backoff_factor * 2**attempt)
 
         status_code = request.status_code
         logging.info(f"WordPress media upload status -> {status_code}")
+        if status_code not in (requests.codes.ok, 201):
+            logging.error("Failed to upload media %s: %s", file_name, request.text)
+            return status_code
 
         try:
             image_json = request.json()
@@ -707,25 +1197,47 @@ class WordPress:
             logging.exception("Failed to decode WordPress media response")
             return status_code
 
-        media_id = image_json.get("id")
-        if not media_id:
+        if not image_json.get("id"):
             logging.error("WordPress upload response missing 'id': %s", image_json)
             return status_code
+        return image_json["source_url"] if return_source_url else status_code
 
-        upload_request = requests.post(
-            wp_self + "/" + str(image_json["id"]),
-            json=payload,
-            auth=auth_wp,
-        )
-        if upload_request in (requests.codes.ok, 201):
-            return (
-                image_json["source_url"]
-                if return_source_url
-                else upload_request.status_code
-            )
-        else:
-            logging.error("Failed to attach metadata to media: %s", upload_request.text)
-            return upload_request.status_code
+    def upload_images(
+        self,
+        file_paths: Sequence[str | Path],
+        payloads: Sequence[dict[str, str | int]],
+        max_workers: int = 4,
+        max_retries: int = 2,
+        return_source_url: bool = False,
+    ) -> List[Union[int, str]]:
+        """
+        Uploads several images as WordPress media attachments concurrently, see ``upload_image``.
+
+        :param file_paths: ``Sequence[str | Path]`` -> Paths to the image files.
+        :param payloads: ``Sequence[dict[str, str | int]]`` -> Image attributes, one per file.
+        :param max_workers: ``int`` -> Maximum number of uploads in flight. Default 4
+        :param max_retries: ``int`` -> Retries per image on connection errors and transient server errors. Default 2
+        :param return_source_url: ``bool`` -> Return the ``source_url`` of every uploaded image instead of the status code.
+        :return: ``list[int | str]`` -> Results of ``upload_image``, in the order of ``file_paths``. Images that could not
+                    be uploaded after the retries are reported with status code ``0``.
+        """
+
+        def upload(file_path: str | Path, payload: dict[str, str | int]):
+            try:
+                return self.upload_image(
+                    file_path,
+                    payload,
+                    return_source_url=return_source_url,
+                    max_retries=max_retries,
+                )
+            except requests.RequestException:
+                logging.exception(f"Media upload of {file_path} failed")
+                return 0
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, self.http.pool_size))
+        ) as executor:
+            return list(executor.map(upload, file_paths, payloads))
 
     def get_tags_num_count(self) -> dict[int, int]:
         """
@@ -746,17 +1258,139 @@ class WordPress:
     def get_slugs(self) -> list[str]:
         """
         Retrieves all slugs from the cached WordPress posts.
+        Use ``has_slug`` for membership checks instead of scanning this list.
 
         :return: ``list[str]`` -> List of slugs/permalinks.
         """
+        if self._post_store is None:
+            return [row[0] for row in self._cache_backend.load_columns("slug")]
         return [elem["slug"] for elem in self.cache_data]
 
+    def _project_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Applies the ``_fields`` projection of the instance to a post returned by another endpoint,
+        e.g. the ``edit`` context response of a created post.
+
+        :param post: ``dict`` -> Post dictionary.
+        :return: ``dict`` -> Post restricted to the cached fields.
+        """
+        if self.cache_fields is None:
+            return post
+        projected: Dict[str, Any] = {}
+        for field in self.cache_fields:
+            key, _, nested = field.partition(".")
+            if key not in post:
+                continue
+            if not nested:
+                projected[key] = post[key]
+            elif isinstance(post[key], dict) and nested in post[key]:
+                projected.setdefault(key, {})[nested] = post[key][nested]
+        return projected
+
+    def merge_post(self, post: Dict[str, Any]) -> None:
+        """
+        Merges a single post into the local cache and its indexes, without a cache sync.
+        Keys that are not part of the cached fields (e.g. ``status``) are discarded.
+        The change is counted in ``local_changes`` and flags the cache as dirty until the next sync,
+        which replaces the merged post with the version served by the site.
+
+        :param post: ``dict`` -> Post dictionary as returned by the REST API.
+        :return: ``None``
+        """
+        post = self._project_post(post)
+        if self.cache_hashes is not None:
+            self.cache_hashes.invalidate(post)
+        if self._post_store is not None:
+            self._post_store.upsert(post)
+        if self._cache_backend is not None:
+            self._cache_backend.upsert_posts([post])
+            self._cache_backend.commit()
+        self.cache_dirty = True
+        self.local_changes += 1
+        logging.info(f"Merged post {post['id']} into {self.cache_name}")
+
+    def merge_term(
+        self, taxonomy_values: WPTaxonomyValues, term: Dict[str, Any]
+    ) -> None:
+        """
+        Applies a created taxonomy term to the keyword mappings of the instance, so that it can be
+        assigned to new posts before a cached post references it. Terms are not part of the
+        post cache, so a cache sync would not make them available either.
+
+        :param taxonomy_values: ``WPTaxonomyValues`` -> Key containing the numeric IDs of the taxonomy, e.g. ``TAGS``.
+        :param term: ``dict`` -> Term dictionary as returned by the REST API.
+        :return: ``None``
+        """
+        keyword = " ".join(term["slug"].split("-")).title()
+        self._created_terms.setdefault(taxonomy_values, {})[keyword] = term["id"]
+        logging.info(
+            f"Merged term {term['id']} ({keyword}) into {taxonomy_values.value}"
+        )
+
+    def has_slug(self, slug: str) -> bool:
+        """
+        Checks whether a post with the given slug is in the local cache.
+
+        :param slug: ``str`` -> Post slug.
+        :return: ``bool`` -> ``True`` if the slug is cached.
+        """
+        if self._post_store is None:
+            return self._cache_backend.has_slug(slug)
+        return self.post_store.has_slug(slug)
+
+    def has_title(self, title: str, yoast_support: bool = False) -> bool:
+        """
+        Checks whether a post with the same normalized title is in the local cache.
+
+        :param title: ``str`` -> Title to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``bool`` -> ``True`` if the title is cached.
+        """
+        if self._post_store is None and (index := self.title_index) is not None:
+            return index.has_title(title, yoast_support=yoast_support)
+        return self.post_store.has_title(title, yoast_support=yoast_support)
+
+    def published_mask(
+        self, titles: Sequence[Optional[str]], yoast_support: bool = False
+    ) -> List[bool]:
+        """
+        Checks many titles against the local cache in a single pass.
+        With the SQLite backend, the persisted title index is used unless the post store is loaded.
+
+        :param titles: ``Sequence[str | None]`` -> Titles to look up.
+        :param yoast_support: ``bool`` -> Match against the Yoast SEO titles.
+        :return: ``list[bool]`` -> ``True`` for every title that is cached.
+        """
+        if self._post_store is None and (index := self.title_index) is not None:
+            return index.published_mask(titles, yoast_support=yoast_support)
+        return self.post_store.published_mask(titles, yoast_support=yoast_support)
+
+    def get_by_id(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cached post by ID.
+
+        :param post_id: ``int`` -> Post ID.
+        :return: ``dict | None`` -> Post dictionary or ``None`` if it is not cached.
+        """
+        return self.post_store.get_by_id(post_id)
+
+    def get_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a cached post by slug.
+
+        :param slug: ``str`` -> Post slug.
+        :return: ``dict | None`` -> Post dictionary or ``None`` if it is not cached.
+        """
+        return self.post_store.get_by_slug(slug)
+
     def get_links(self) -> list[str]:
         """
         Retrieves all post links from the cached WordPress posts.
 
         :return: ``list[str]`` -> List of post links.
         """
+        if self._post_store is None:
+            return [row[0] for row in self._cache_backend.load_columns("link")]
         return [elem["link"] for elem in self.cache_data]
 
     def map_wp_class_id(
@@ -774,21 +1408,10 @@ class WordPress:
         Output sample:
             ``{"Python": 12, "Tutorial": 34}``
         """
-        result_dict = {}
-        for elem in self.cache_data:
-            kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(taxonomy_marker.value, item)
-            ]
-            model_ids = elem[taxonomy_values.value]
-            for item in zip(kw, model_ids):
-                (name, wp_id) = item
-                if name not in result_dict.keys():
-                    result_dict[name] = wp_id
-                else:
-                    continue
-        return result_dict
+        return {
+            **self._created_terms.get(taxonomy_values, {}),
+            **self.taxonomy_index.term_ids(taxonomy_marker, taxonomy_values),
+        }
 
     def get_from_class_list(
         self, taxonomy_marker: WPTaxonomyMarker, unique_str: bool = False
@@ -807,21 +1430,10 @@ class WordPress:
         :param unique_str: ``bool`` -> Return unique results.
         :return: ``list[str]`` -> Cleaned keywords.
         """
-        double_join = lambda tag: "".join(" ".join(tag).title())  # noqa: E731
-        class_list = [
-            [
-                double_join(cls_lst.split("-")[1:])
-                for cls_lst in elem["class_list"]
-                if re.match(taxonomy_marker.value, cls_lst)
-                if cls_lst is not None
-            ]
-            for elem in self.cache_data
-        ]
-
         taxonomy_lst = [
-            taxonomy if len(item) != 0 else None
-            for item in class_list
-            for taxonomy in item
+            taxonomy
+            for _, terms in self.taxonomy_index.prefixed_terms(taxonomy_marker)
+            for taxonomy in terms
         ]
         return (
             taxonomy_lst
@@ -849,27 +1461,16 @@ class WordPress:
         :param tags_key: ``bool`` -> If True, returns a dictionary with the keyword as key and list of ids as value.
         :return: ``dict[str, list[str | int]] | list[dict[str | int, str]]`` -> Grouping keywords and IDs.
         """
-        double_join = lambda tag: "".join(" ".join(tag).title())  # noqa: E731
         class_list = [
-            {
-                elem["id"]: [
-                    double_join(cls_lst.split("-")[1:])
-                    for cls_lst in elem["class_list"]
-                    if re.match(taxonomy_marker.value, cls_lst)
-                ]
-            }
-            for elem in self.cache_data
+            {post_id: list(terms)}
+            for post_id, terms in self.taxonomy_index.prefixed_terms(taxonomy_marker)
         ]
 
         if tags_key:
-            tags_site = self.get_tag_count().keys()
-            class_list_dict = {kw: [] for kw in tags_site}
-            for post in class_list:
-                for id_, cls_list in post.items():
-                    for cls in cls_list:
-                        if cls in class_list_dict.keys():
-                            class_list_dict[cls].append(id_)
-            class_list = class_list_dict
+            term_posts = self.taxonomy_index.term_posts(taxonomy_marker)
+            return {
+                kw: list(term_posts.get(kw, ())) for kw in self.get_tag_count().keys()
+            }
         return class_list
 
     def tag_id_merger_dict(self) -> dict[str, int]:
@@ -903,17 +1504,11 @@ class WordPress:
         :return: ``dict[str, int]`` -> Mapping tag name to count.
         :raises core.utils.custom_exceptions.YoastSEOUnsupported: If Yoast SEO data is missing.
         """
-        tags_count: dict = {}
         if yoast_support:
-            for dic in self.cache_data:
-                if dic["yoast_head_json"]["schema"]["@graph"][0]["keywords"]:
-                    for kw in dic["yoast_head_json"]["schema"]["@graph"][0]["keywords"]:
-                        if kw in tags_count.keys():
-                            tags_count[kw] = tags_count[kw] + 1
-                        else:
-                            tags_count[kw] = 1
-                else:
-                    raise YoastSEOUnsupported
+            tags_count = {
+                kw: len(post_ids)
+                for kw, post_ids in self.taxonomy_index.keyword_posts().items()
+            }
         else:
             tags_count = self.count_wp_class_id(WPTaxonomyMarker.TAG)
         return tags_count
@@ -954,13 +1549,12 @@ class WordPress:
         :param yoast_support: ``bool`` -> Enable Yoast SEO support for parsing.
         :return: ``dict[str, list[str | int]]`` -> Mapping tag name to list of post IDs.
         """
-        unique_tags = self.get_tag_count(yoast_support=yoast_support).keys()
-        tags_c: dict[str, list[str | int]] = {kw: [] for kw in unique_tags}
         if yoast_support:
-            for dic in self.cache_data:
-                for kw in unique_tags:
-                    if kw in dic["yoast_head_json"]["schema"]["@graph"][0]["keywords"]:
-                        tags_c[kw].append(dic["id"])
+            # A post is listed once per keyword, even if the keyword is repeated.
+            tags_c: dict[str, list[str | int]] = {
+                kw: list(dict.fromkeys(post_ids))
+                for kw, post_ids in self.taxonomy_index.keyword_posts().items()
+            }
         else:
             tags_c = self.get_class_list_id_groups(WPTaxonomyMarker.TAG, tags_key=True)
         return tags_c
@@ -972,15 +1566,10 @@ class WordPress:
         :param yoast_support: ``bool`` -> Enable Yoast SEO support for parsing.
         :return: ``list[str]`` -> List of post titles.
         """
-        all_titles = []
-        for post in self.cache_data:
-            if yoast_support:
-                all_titles.append(
-                    " ".join(post["yoast_head_json"]["title"].split(" ")[:-2]).strip()
-                )
-            else:
-                all_titles.append(post["title"]["rendered"].strip())
-        return all_titles
+        return [
+            WPPostStore.post_title(post, yoast_support=yoast_support)
+            for post in self.cache_data
+        ]
 
     def map_posts_by_id(self, include_host_name: bool = False) -> dict[str, int]:
         """
@@ -989,10 +1578,7 @@ class WordPress:
         :param include_host_name: ``bool`` -> If True, includes the hostname in the URL.
         :return: ``dict[str, str]`` -> Mapping post ID to slug or URL.
         """
-        wp_cache_data = self.cache_data
-        u_pack = zip(
-            [idd["id"] for idd in wp_cache_data], [url["slug"] for url in wp_cache_data]
-        )
+        u_pack = ((post["id"], post["slug"]) for post in self.cache_data)
         if include_host_name:
             return {idd: f"{self.fq_domain_name}/" + url for idd, url in u_pack}
         else:
@@ -1042,30 +1628,26 @@ class WordPress:
         :param yoast_support: ``bool`` -> Enable Yoast SEO support for parsing.
         :return: ``dict[str, list[str]]`` -> Mapping tag name to list of slugs or IDs.
         """
-        mapped_ids: dict = self.map_posts_by_id(include_host_name=include_host_name)
         unique_tags = self.get_tag_count(yoast_support=yoast_support).keys()
         tags_c: dict = {kw: [] for kw in unique_tags}
         if yoast_support:
-            for dic in self.cache_data:
-                for kw in dic["yoast_head_json"]["schema"]["@graph"][0]["keywords"]:
-                    if kw in tags_c.keys():
-                        if idd is True:
-                            tags_c[kw].append(dic["id"])
-                        else:
-                            tags_c[kw].append(mapped_ids[dic["id"]])
+            mapped_ids: dict = self.map_posts_by_id(include_host_name=include_host_name)
+            for kw, post_ids in self.taxonomy_index.keyword_posts().items():
+                tags_c[kw] = (
+                    list(post_ids)
+                    if idd is True
+                    else [mapped_ids[post_id] for post_id in post_ids]
+                )
         else:
             class_list = self.get_class_list_id_groups(taxonomy_marker, tags_key=True)
             for tag, post_ids in class_list.items():
-                for post_id in post_ids:
-                    for post in self.cache_data:
-                        if post["id"] == post_id:
-                            if idd:
-                                append_val = post["id"]
-                            else:
-                                append_val = post["slug"]
-
-                            if tag.title() in tags_c.keys():
-                                tags_c[tag.title()].append(append_val)
+                if (tag := tag.title()) not in tags_c:
+                    continue
+                tags_c[tag].extend(
+                    post_ids
+                    if idd
+                    else [self.get_by_id(post_id)["slug"] for post_id in post_ids]
+                )
         return tags_c
 
     def map_post_id_slug(
@@ -1150,19 +1732,10 @@ class WordPress:
         :return: ``dict[str, set[str]]`` -> Mapping taxonomy to set of matched values.
         """
         result_dict = {}
-        for elem in self.cache_data:
-            kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(match_taxonomy_marker.value, item)
-            ]
-
-            d_kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(compare_taxonomy_marker.value, item)
-            ]
-
+        for (_, kw), (_, d_kw) in zip(
+            self.taxonomy_index.found_terms(match_taxonomy_marker),
+            self.taxonomy_index.found_terms(compare_taxonomy_marker),
+        ):
             for item in d_kw:
                 if item not in result_dict.keys():
                     result_dict[item] = set(kw)
@@ -1181,19 +1754,7 @@ class WordPress:
             Used to match prefixes in the class_list (e.g., "tag", "category").
         :return: ``dict[str, int]`` -> Mapping taxonomy to count.
         """
-        result_dict = {}
-        for elem in self.cache_data:
-            kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(taxonomy_marker.value, item)
-            ]
-            for item in kw:
-                if item not in result_dict.keys():
-                    result_dict[item] = 1
-                else:
-                    result_dict[item] += 1
-        return result_dict
+        return dict(self.taxonomy_index.term_counts(taxonomy_marker))
 
     def count_map_match_taxonomy(
         self,
@@ -1222,20 +1783,10 @@ class WordPress:
         :return: ``dict[str, tuple[int, str]`` {'keyword': (count: int, matching_track_taxonomy: str)}
         """
         result_dict = {}
-        for elem in self.cache_data:
-            kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(match_taxonomy.value, item)
-            ]
-
-            track_kw = [
-                " ".join(item.split("-")[1:]).title()
-                for item in elem["class_list"]
-                if re.findall(track_taxonomy.value, item)
-            ]
-
-            post_id = elem["id"]
+        for (post_id, kw), (_, track_kw) in zip(
+            self.taxonomy_index.found_terms(match_taxonomy),
+            self.taxonomy_index.found_terms(track_taxonomy),
+        ):
             for item in kw:
                 if item not in result_dict.keys():
                     match = [
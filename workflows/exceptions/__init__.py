@@ -5,10 +5,12 @@ from workflows.exceptions.validation import (
     IncompatibleLinkException,
     InvalidPostQuantityException,
     DataSourceUpdateError,
+    MediaSourceClientError,
 )
 
 __all__ = [
     "IncompatibleLinkException",
     "InvalidPostQuantityException",
     "DataSourceUpdateError",
+    "MediaSourceClientError",
 ]
@@ -52,3 +52,10 @@ class DataSourceUpdateError(Exception):
     def __init__(self, message):
         self.message = message
         super().__init__(self.message)
+
+
+class MediaSourceClientError(DataSourceUpdateError):
+    """
+    Exception raised when the HTTP client cannot retrieve a MediaSource page or dump,
+    e.g. because the page layout changed. Callers fall back to the webdriver flows.
+    """
@@ -46,6 +46,7 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
         post_required: int = 0,
         exclude_partner_tag=False,
         parent: bool = False,
+        sync_every: int = 10,
     ):
         super().__init__(workflow_config, interactive=interactive, parent=parent)
 
@@ -54,6 +55,9 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
         self._iter_num = 0
         self._default_re_filter = re_filter
         self._auto_cache_sync = auto_cache_sync
+        # Created posts are applied to the local cache right away,
+        # so a full cache sync is only needed every ``sync_every`` posts.
+        self._sync_every = sync_every
         self._post_add = False
         self._posts_required = 0
         self._exclude_partner_tag = exclude_partner_tag
@@ -116,6 +120,8 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
     def _flow_session_end(self, log_statement: str, exhausted: bool) -> NoReturn:
         logging.info(log_statement)
         self._thumbnails_dir.cleanup()
+        if self._auto_cache_sync:
+            self._site.sync_local_changes()
         self._time_end = time.time()
         h, mins, secs = get_duration(self._time_end - self._time_start)
         try:
@@ -181,7 +187,7 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
                             f"[{self._action_style}] Refreshing WordPress Local Cache... [blink]┌(◎_◎)┘[/blink] [/{self._action_style}]\n",
                             spinner="bouncingBall",
                         ):
-                            self._site.cache_sync()
+                            self._site.sync_local_changes(self._sync_every)
                     return True
                 else:
                     self._flow_session_end(
@@ -214,7 +220,7 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
                 )
             else:
                 if self._auto_cache_sync:
-                    self._site.cache_sync()
+                    self._site.sync_local_changes(self._sync_every)
                 return True
 
     def _loop_state_check(self) -> Optional[bool]:
@@ -434,7 +440,7 @@ class ContentBotFlow(ContentBotRunner, Generic[W_co]):
         push_thumb = self._site.upload_image(
             os.path.join(self._thumbnails_dir.name, self._thumbnail_name), thumb_payload
         )
-        if push_thumb != (200 or 201):
+        if push_thumb not in (200, 201):
             logging.warning(
                 f"Defective thumbnail or service unavailable: {self._thumbnail_name} Status: {push_thumb}"
             )
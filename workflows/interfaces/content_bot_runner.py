@@ -64,6 +64,7 @@ class ContentBotRunner(ABC, Generic[W_co]):
         self._partner_db_name = None
         self._cursor = None
         self._query_result = None
+        self._query_columns = None
         self._ready_posts = None
         self._total_ready = None
         self._thumbnails_dir = None
@@ -99,6 +100,7 @@ class ContentBotRunner(ABC, Generic[W_co]):
 
     def _wp_setup(self):
         from wordpress import WordPress
+        from wordpress.cache import resolve_cache_path
         from core.models.config_model import ContentBotConf, EmbedAssistBotConf
 
         wp_auth: WPSecrets = SecretHandler().get_secret(SecretType.WP_APP_PASSWORD)[0]
@@ -111,7 +113,7 @@ class ContentBotRunner(ABC, Generic[W_co]):
                 self._general_config.fq_domain_name,
                 wp_auth.user,
                 wp_auth.app_password,
-                ApplicationPath.WP_POSTS_CACHE.value,
+                resolve_cache_path(ApplicationPath.WP_POSTS_CACHE),
                 unique_logging_session=False,
             )
         else:
@@ -122,7 +124,7 @@ class ContentBotRunner(ABC, Generic[W_co]):
                 self._general_config.fq_domain_name,
                 wp_auth.user,
                 wp_auth.app_password,
-                ApplicationPath.WP_PHOTOS_CACHE.value,
+                resolve_cache_path(ApplicationPath.WP_PHOTOS_CACHE),
                 use_photo_support=True,
                 unique_logging_session=False,
             )
@@ -191,6 +193,9 @@ class ContentBotRunner(ABC, Generic[W_co]):
             self._query_result: List[Tuple[str, ...]] = fetch_data_sql(
                 self._query, self._cursor
             )
+            self._query_columns: List[str] = [
+                column[0] for column in self._cursor.description
+            ]
             logging.info(
                 f"{len(self._query_result)} elements found in database {self._partner_db_name}"
             )
@@ -230,6 +235,58 @@ class ContentBotRunner(ABC, Generic[W_co]):
             f"{self._total_ready} elements to be published in database {self._partner_db_name}"
         )
 
+    @property
+    def _content_schema(self):
+        """
+        Layout of the partner content databases of the bot, used by the near-duplicate indexes.
+        Bots that work with other content types override it.
+        """
+        from workflows.tasks.partner_content_db import VIDEO_SCHEMA
+
+        return VIDEO_SCHEMA
+
+    def _filter_near_duplicates(self):
+        from workflows.tasks.near_duplicates import NearDuplicateDetector
+        from workflows.utils.filtering import filter_near_duplicates
+
+        schema = self._content_schema
+
+        def filter_duplicates():
+            with NearDuplicateDetector.from_feed_dir(
+                ApplicationPath.ARTIFACTS.value,
+                self._bot_config.content_hint,
+                schema,
+                parent=self._parent,
+            ) as detector:
+                return filter_near_duplicates(
+                    self._ready_posts,
+                    self._query_columns,
+                    detector,
+                    self._site,
+                    source=os.path.basename(self._partner_db_name),
+                    key_column=schema.key,
+                )
+
+        if self._interactive:
+            with self._console.status(
+                f"[{self._action_style}] Checking near-duplicates ... [blink]┌(◎_◎)┘[/blink] [/{self._action_style}]\n",
+                spinner="bouncingBall",
+            ):
+                self._ready_posts, skipped = filter_duplicates()
+        else:
+            self._ready_posts, skipped = filter_duplicates()
+
+        for row, match in skipped:
+            logging.warning(
+                f"Skipped near-duplicate {row[0]!r}: {match.similarity:.0%} similar to "
+                f"published {match.title!r} from {match.source}"
+            )
+        self._total_ready = len(self._ready_posts)
+        logging.info(
+            f"{self._total_ready} elements to be published in database {self._partner_db_name} "
+            f"after skipping {len(skipped)} near-duplicates"
+        )
+
     def _filter_embeds(self):
         from workflows.utils.filtering import filter_published_embeds
 
@@ -15,11 +15,20 @@ __version__ = "1.0.0"
 # ** MediaSource Dump Creation `feed_dump_create.py` **
 from workflows.tasks.feed_dump_create import parse_partner_name, get_vid_dump_flow
 
+# ** MediaSource HTTP client, the webdriver flows above are its fallback
+from workflows.tasks.media_source_client import MediaSourceClient
+
 # ** MediaSource Photo Set Scrape `media_source_scrape.py` **
 from workflows.tasks.feed_scrape import get_set_source_flow
 
 # ** MediaSource TXT dump parser
-from workflows.tasks.parse_txt_dump import parse_txt_dump_chain
+from workflows.tasks.parse_txt_dump import parse_txt_dump_chain, refresh_txt_dump_db
+
+# ** Persistent partner content databases
+from workflows.tasks.partner_content_db import PartnerContentDB, RefreshStats
+
+# ** MinHash/LSH near-duplicate detection across partner content databases
+from workflows.tasks.near_duplicates import NearDuplicateDetector, NearDuplicateIndex
 
 # ** MediaSource HTML photoset dump parser
 from workflows.tasks.sets_source_parse import db_generate
@@ -31,7 +40,13 @@ __all__ = [
     "parse_partner_name",
     "get_vid_dump_flow",
     "get_set_source_flow",
+    "MediaSourceClient",
     "db_generate",
     "parse_txt_dump_chain",
+    "refresh_txt_dump_db",
+    "PartnerContentDB",
+    "RefreshStats",
+    "NearDuplicateDetector",
+    "NearDuplicateIndex",
     "clean_outdated",
 ]
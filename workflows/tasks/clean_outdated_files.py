@@ -32,6 +32,7 @@ import os
 # Local implementations
 from core.utils.strings import match_list_elem_date
 from core.utils.file_system import search_files_by_ext
+from workflows.tasks.partner_content_db import is_persistent_db
 
 
 def clean_outdated(
@@ -53,9 +54,14 @@ def clean_outdated(
     """
     reverse = True if not invert_clean else False
     os.chdir(folder)
-    outdated = match_list_elem_date(
-        hints_, file_lst, ignore_case=True, strict=True, reverse=reverse
-    )
+    outdated = [
+        file
+        for file in match_list_elem_date(
+            hints_, file_lst, ignore_case=True, strict=True, reverse=reverse
+        )
+        # Persistent partner databases carry no date and are never outdated.
+        if not is_persistent_db(file)
+    ]
     for file in outdated:
         file_path = os.path.abspath(file)
 
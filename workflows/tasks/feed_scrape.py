@@ -9,6 +9,7 @@ It contains functions for:
 
 1. Extracting video metadata (titles, descriptions, dates, durations)
 2. Extracting media links (source URLs, thumbnails)
+   ``extract_video_rows`` extracts every field in a single pass over the page parsed with lxml.
 3. Retrieving XML export data
 4. Automating authentication and site navigation
 
@@ -36,6 +37,7 @@ from selenium.webdriver.common.by import By
 from core.models.config_model import WebSourcesConf
 from core.models.secret_model import SecretType, MediaSourceAuth
 from core.config.config_factories import web_sources_conf_factory
+from core.utils.parsers import html_document
 from core.utils.secret_handler import SecretHandler
 from core.utils.strings import match_list_single
 from .feed_dump_create import parse_partner_name
@@ -127,20 +129,54 @@ def extract_thumbnail(bs4_obj: BeautifulSoup) -> list[str]:
     return [thumb.attrs["poster"].strip("\n\t") for thumb in video_thumb]
 
 
+def extract_video_rows(
+    source_html: str | bytes | BeautifulSoup,
+) -> list[tuple[str, str, str, str, str, str]]:
+    """Extract every video field in a single walk over the page, instead of one ``find_all``
+    walk per field like the ``extract_*`` functions above. The rows are the same those
+    functions produce when their lists are zipped together.
+
+    :param source_html: ``str`` | ``bytes`` page source or ``BeautifulSoup`` object.
+    :return: ``list[tuple[str, str, str, str, str, str]]`` `(title, description, date, duration, source, thumbnail)`
+    """
+    columns = {
+        "tab-column col_0 center-align": [],
+        "tab-column col_1 center-align": [],
+        "tab-column col_2 center-align": [],
+    }
+    text_areas, sources, thumbnails = [], [], []
+    for element in html_document(source_html).iter("td", "textarea", "source", "video"):
+        if element.tag == "td":
+            td_class = " ".join(element.get("class", "").split())
+            if td_class in columns:
+                columns[td_class].append(element.text_content())
+        elif element.tag == "textarea":
+            if (
+                "display-link-text" in element.get("class", "").split()
+                and element.get("rows") == "2"
+            ):
+                text_areas.append(element.text_content())
+        elif element.tag == "source":
+            sources.append(element.get("src"))
+        else:
+            thumbnails.append(element.get("poster", "").strip("\n\t"))
+    titles, dates, durations = columns.values()
+    # Descriptions are the text areas in even positions, see ``extract_descriptions``.
+    return list(zip(titles, text_areas[1::2], dates, durations, sources, thumbnails))
+
+
 def combine_vid_elems(bs4_obj: BeautifulSoup) -> list[tuple[str, str, str, str, str]]:
-    """Combine all elements in a common data structure with the values returned by other functions.
+    """Combine all elements in a common data structure, extracted in a single pass by ``extract_video_rows``.
 
-    :param bs4_obj: `BeautifulSoup``
+    :param bs4_obj: ``BeautifulSoup`` or ``str`` page source
     :return: ``list[tuple[str, str, str, str, str]]`` `(title, descriptions, date, source, thumbnail)`
     """
-    page_vids = zip(
-        extract_title(bs4_obj),
-        extract_descriptions(bs4_obj),
-        extract_date(bs4_obj),
-        extract_source(bs4_obj),
-        extract_thumbnail(bs4_obj),
-    )
-    return list(page_vids)
+    return [
+        (title, description, date, source, thumbnail)
+        for title, description, date, _, source, thumbnail in extract_video_rows(
+            bs4_obj
+        )
+    ]
 
 
 def get_xml_link(bs4_obj: BeautifulSoup) -> list[str]:
@@ -173,69 +209,68 @@ def get_set_source_flow(
         SecretType.MEDIA_SOURCE_PASSWORD
     )[0],
     partner_hint: str = None,
-) -> tuple[BeautifulSoup, str]:
+) -> tuple[str, str]:
     """Get the photo set source code for further parsing.
     This source file will be parsed by a specialised parser in this package.
 
-    :param webdrv: ``webdriver`` Chrome/Gecko webdriver instance
+    :param webdrv: ``webdriver`` Chrome/Gecko webdriver instance, e.g. a ``WebDriverPool`` lease. It is not quit here.
     :param web_sources_conf: ``TasksConf`` object with configuration for task modules
     :param media_source_auth: ``MediaSourceAuth`` with credentials to access the partner site.
     :param partner_hint: ``str`` pattern to match the correct partner offer
-    :return: ``tuple[BeautifulSoup, str]`` (source_code, filename)
+    :return: ``tuple[str, str]`` (source_code, filename), see ``sets_source_parse.extract_set_rows``
     """
     source_html = None
-    with webdrv as driver:
-        # Go to URL
-        driver.get(web_sources_conf.feed_set_url)
+    driver = webdrv
+    # Go to URL
+    driver.get(web_sources_conf.feed_set_url)
 
-        driver.implicitly_wait(30)
+    driver.implicitly_wait(30)
 
-        username_box = driver.find_element(By.ID, "user")
-        pass_box = driver.find_element(By.ID, "password")
+    username_box = driver.find_element(By.ID, "user")
+    pass_box = driver.find_element(By.ID, "password")
 
-        username_box.send_keys(media_source_auth.username)
-        pass_box.send_keys(media_source_auth.password)
+    username_box.send_keys(media_source_auth.username)
+    pass_box.send_keys(media_source_auth.password)
 
-        button_login = driver.find_element(By.ID, "head-login")
-        button_login.click()
+    button_login = driver.find_element(By.ID, "head-login")
+    button_login.click()
 
-        website_partner = driver.find_element(By.ID, "link_site")
-        website_partner_select = Select(website_partner)
-        partner_options = website_partner_select.options
+    website_partner = driver.find_element(By.ID, "link_site")
+    website_partner_select = Select(website_partner)
+    partner_options = website_partner_select.options
 
-        if partner_hint:
-            selection = match_list_single(
-                partner_hint, partner_options, ignore_case=True
-            )
-        else:
-            for num, opt in enumerate(partner_options, start=0):
-                print(f"{num}. {opt.text}")
+    if partner_hint:
+        selection = match_list_single(partner_hint, partner_options, ignore_case=True)
+    else:
+        for num, opt in enumerate(partner_options, start=0):
+            print(f"{num}. {opt.text}")
 
-            selection = input("Enter a number and select a partner: ")
+        selection = input("Enter a number and select a partner: ")
 
-        website_partner_select.select_by_index(int(selection))
-        partner_name = parse_partner_name(partner_options, int(selection))
+    website_partner_select.select_by_index(int(selection))
+    partner_name = parse_partner_name(partner_options, int(selection))
 
-        apply_changes_xpath = (
-            "/html/body/div[1]/div[2]/form/div/div[2]/div/div/div[6]/div/div/input"
-        )
-        apply_changes_button = driver.find_element(By.XPATH, apply_changes_xpath)
-        apply_changes_button.click()
+    apply_changes_xpath = (
+        "/html/body/div[1]/div[2]/form/div/div[2]/div/div/div[6]/div/div/input"
+    )
+    apply_changes_button = driver.find_element(By.XPATH, apply_changes_xpath)
+    apply_changes_button.click()
 
-        # Refresh the page to avoid loading status crashes in Chrome
-        driver.refresh()
+    # Refresh the page to avoid loading status crashes in Chrome
+    driver.refresh()
 
-        # Increase videos per page before dumping to XML
-        vids_per_page = driver.find_element(By.ID, "page-count-val")
+    # Increase videos per page before dumping to XML
+    vids_per_page = driver.find_element(By.ID, "page-count-val")
 
-        vid_select = Select(vids_per_page)
+    vid_select = Select(vids_per_page)
 
-        # Selecting `Show All` by default in index 5
-        vid_select.select_by_index(5)
+    # Selecting `Show All` by default in index 5
+    vid_select.select_by_index(5)
 
-        update_submit_button = driver.find_element(By.ID, "pageination-submit")
-        update_submit_button.click()
+    update_submit_button = driver.find_element(By.ID, "pageination-submit")
+    update_submit_button.click()
 
-        source_html = BeautifulSoup(driver.page_source, "html.parser")
+    # Parsed by ``sets_source_parse`` in a single pass, the page is not parsed twice.
+    source_html = driver.page_source
 
     return source_html, f"{partner_name}photos-{datetime.date.today()}"
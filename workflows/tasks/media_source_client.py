@@ -0,0 +1,345 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+MediaSource HTTP Client
+
+This module retrieves MediaSource video dumps and photo set pages over plain HTTP, without
+starting a browser. The MediaSourceClient logs in once with a cookie session (optionally saved
+to disk, so later runs skip the login), and submits the same forms and option indexes that the
+webdriver flows in ``tasks.feed_dump_create`` and ``tasks.feed_scrape`` click through. Pages are
+parsed with ``lxml.html``.
+
+When a page does not have the expected forms, e.g. after a layout change, the client raises
+``MediaSourceClientError`` and callers fall back to the webdriver flows.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import datetime
+import json
+import logging
+import os
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+# Third-party Libraries
+import lxml.html
+import requests
+
+# Local implementations
+from core.utils.file_system import staged_file, write_to_file
+from core.utils.strings import match_list_single
+from workflows.exceptions import MediaSourceClientError
+from workflows.tasks.feed_dump_create import parse_partner_name
+
+# The option indexes below are the ones selected by the webdriver flows.
+# Dump type select `Dump with |`
+DUMP_FORMAT_OPTION = 2
+# name | description | models | tags | site_name | date | source | thumbnail | tracking
+DUMP_FIELD_OPTIONS = (1, 3, 10, 6, 16, 17, 5, 4, 18)
+# Photo sets per page: `Show All`
+PAGE_COUNT_OPTION = 5
+
+PARTNER_SELECT_XPATHS = (
+    "//select[@id='link_site']",
+    "/html/body/div[1]/div[2]/form/div/div[2]/div/div/div[4]/div/select",
+)
+APPLY_CHANGES_XPATH = (
+    "/html/body/div[1]/div[2]/form/div/div[2]/div/div/div[6]/div/div/input"
+)
+DUMP_TEXTAREA_XPATHS = (
+    "/html/body/div[1]/div[2]/div[3]/div[2]/div/div/div/textarea",
+    "//textarea",
+)
+
+
+class MediaSourceClient:
+    """
+    Cookie-session HTTP client for the MediaSource partner pages.
+
+    Attributes:
+        dump_url (str): Video dump page URL.
+        set_url (str): Photo set page URL.
+        cookie_path (Path | None): File where the session cookies are kept between runs.
+    """
+
+    def __init__(
+        self,
+        dump_url: str,
+        set_url: str,
+        username: str,
+        password: str,
+        cookie_path: Optional[str | Path] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        :param dump_url: ``str`` -> Video dump page URL.
+        :param set_url: ``str`` -> Photo set page URL.
+        :param username: ``str`` -> MediaSource username.
+        :param password: ``str`` -> MediaSource password.
+        :param cookie_path: ``str | Path | None`` -> File to keep the session cookies in.
+        :param timeout: ``float`` -> Seconds to wait for each response.
+        """
+        self.dump_url = dump_url
+        self.set_url = set_url
+        self.cookie_path = Path(cookie_path) if cookie_path else None
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = (
+            "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+        )
+        self._load_cookies()
+
+    @classmethod
+    def from_config(
+        cls, cookie_path: Optional[str | Path] = None
+    ) -> "MediaSourceClient":
+        """
+        :param cookie_path: ``str | Path | None`` -> File to keep the session cookies in.
+        :return: ``MediaSourceClient`` with the configured URLs and credentials.
+        """
+        from core.config.config_factories import web_sources_conf_factory
+        from core.models.secret_model import SecretType
+        from core.utils.secret_handler import SecretHandler
+
+        web_sources_conf = web_sources_conf_factory()
+        media_source_auth = SecretHandler().get_secret(
+            SecretType.MEDIA_SOURCE_PASSWORD
+        )[0]
+        return cls(
+            web_sources_conf.feed_dump_url,
+            web_sources_conf.feed_set_url,
+            media_source_auth.username,
+            media_source_auth.password,
+            cookie_path=cookie_path,
+        )
+
+    def _load_cookies(self) -> None:
+        if self.cookie_path and self.cookie_path.exists():
+            with open(self.cookie_path, "r", encoding="utf-8") as cookie_file:
+                self._session.cookies.update(json.load(cookie_file))
+
+    def _save_cookies(self) -> None:
+        if self.cookie_path is None:
+            return None
+        # Session cookies are credentials, the file is only readable by its owner.
+        # The file is replaced atomically, so an interrupted write does not lose the session.
+        with staged_file(self.cookie_path) as staging_path:
+            file_descriptor = os.open(
+                staging_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as cookie_file:
+                json.dump(
+                    requests.utils.dict_from_cookiejar(self._session.cookies),
+                    cookie_file,
+                )
+        return None
+
+    def _request(
+        self, method: str, url: str, payload: Optional[List[Tuple[str, str]]] = None
+    ) -> lxml.html.HtmlElement:
+        try:
+            response = self._session.request(
+                method,
+                url,
+                params=payload if method == "GET" else None,
+                data=payload if method != "GET" else None,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise MediaSourceClientError(f"Request to {url} failed: {e!r}")
+        # Form submissions that only update the session may answer with an empty body.
+        return lxml.html.document_fromstring(
+            response.text.strip() or "<html></html>", base_url=response.url
+        )
+
+    @staticmethod
+    def _find(doc: lxml.html.HtmlElement, *xpaths: str) -> Optional[Any]:
+        for xpath in xpaths:
+            if found := doc.xpath(xpath):
+                return found[0]
+        return None
+
+    def _submit(
+        self,
+        doc: lxml.html.HtmlElement,
+        element: lxml.html.HtmlElement,
+        values: Dict[str, str],
+        submit_xpath: Optional[str] = None,
+    ) -> lxml.html.HtmlElement:
+        """
+        Submits the form that contains ``element``, like a click on its submit button would.
+
+        :param doc: ``HtmlElement`` -> Page with the form.
+        :param element: ``HtmlElement`` -> Any element inside the form.
+        :param values: ``dict[str, str]`` -> Field values that replace the ones in the page.
+        :param submit_xpath: ``str | None`` -> Submit button, sent if it has a name.
+        :return: ``HtmlElement`` -> Response page.
+        """
+        form = next(element.iterancestors("form"), None)
+        if form is None:
+            raise MediaSourceClientError(f"No form found for <{element.tag}>")
+        payload = [
+            (name, value) for name, value in form.form_values() if name not in values
+        ]
+        payload.extend(values.items())
+        if (
+            submit_xpath is not None
+            and (submit := self._find(doc, submit_xpath)) is not None
+            and submit.get("name")
+        ):
+            payload.append((submit.get("name"), submit.get("value", "")))
+        action = urljoin(doc.base_url, form.get("action") or doc.base_url)
+        return self._request(form.get("method", "GET").upper(), action, payload)
+
+    def _fetch(self, url: str) -> lxml.html.HtmlElement:
+        """
+        Opens a page, logging in first if the session is not authenticated.
+
+        :param url: ``str`` -> Page URL.
+        :return: ``HtmlElement`` -> Page.
+        """
+        doc = self._request("GET", url)
+        if (user_box := self._find(doc, "//input[@id='user']")) is None:
+            return doc
+        password_box = self._find(doc, "//input[@id='password']")
+        if password_box is None:
+            raise MediaSourceClientError("Unexpected login form")
+        self._submit(
+            doc,
+            user_box,
+            {
+                user_box.get("name", "user"): self._username,
+                password_box.get("name", "password"): self._password,
+            },
+            submit_xpath="//*[@id='head-login']",
+        )
+        doc = self._request("GET", url)
+        if self._find(doc, "//input[@id='user']") is not None:
+            raise MediaSourceClientError("Login failed")
+        logging.info(f"Logged in to MediaSource as {self._username}")
+        self._save_cookies()
+        return doc
+
+    @staticmethod
+    def _select(select: lxml.html.HtmlElement, index: int) -> Tuple[str, str]:
+        options = select.xpath(".//option")
+        if index >= len(options):
+            raise MediaSourceClientError(
+                f"Option {index} not found in <select id={select.get('id')}>"
+            )
+        option = options[index]
+        return select.get("name"), option.get("value", option.text_content())
+
+    def _select_partner(
+        self, url: str, partner_hint: Optional[str]
+    ) -> Tuple[lxml.html.HtmlElement, str]:
+        """
+        Selects the partner offer and applies the changes.
+
+        :param url: ``str`` -> Page URL.
+        :param partner_hint: ``str | None`` -> Pattern to match the partner, prompts the user if ``None``.
+        :return: ``tuple[HtmlElement, str]`` -> (page for the partner, partner name)
+        """
+        doc = self._fetch(url)
+        partner_select = self._find(doc, *PARTNER_SELECT_XPATHS)
+        if partner_select is None:
+            raise MediaSourceClientError("Partner select not found")
+        partner_options = partner_select.xpath(".//option")
+        if partner_hint:
+            selection = match_list_single(
+                partner_hint,
+                [option.text_content() for option in partner_options],
+                ignore_case=True,
+            )
+            if selection is None:
+                raise MediaSourceClientError(f"No partner matches {partner_hint!r}")
+        else:
+            for num, opt in enumerate(partner_options, start=0):
+                print(f"{num}. {opt.text_content()}")
+
+            selection = input("\nEnter a number and select a partner: ")
+
+        name, value = self._select(partner_select, int(selection))
+        self._submit(doc, partner_select, {name: value}, APPLY_CHANGES_XPATH)
+        # The selection is stored in the session, the page is loaded again like the flows do.
+        return self._request("GET", url), parse_partner_name(
+            partner_options, int(selection)
+        )
+
+    def get_vid_dump(self, partner_hint: Optional[str], temp_dir_p: str) -> str:
+        """
+        Writes the video dump of a partner offer to a ``.txt`` file, like ``get_vid_dump_flow``.
+
+        :param partner_hint: ``str | None`` -> Pattern to match the partner offer.
+        :param temp_dir_p: ``str`` -> Directory for the dump file.
+        :return: ``str`` -> Dump filename.
+        """
+        doc, partner_name = self._select_partner(self.dump_url, partner_hint)
+        dump_format = self._find(doc, "//select[@id='dump_format']")
+        if dump_format is None:
+            raise MediaSourceClientError("Dump format select not found")
+
+        values = dict([self._select(dump_format, DUMP_FORMAT_OPTION)])
+        first_field = self._find(doc, "//select[@id='dp_field_0']")
+        if first_field is None:
+            raise MediaSourceClientError("Dump field selects not found")
+        for num, option in enumerate(DUMP_FIELD_OPTIONS):
+            field = self._find(doc, f"//select[@id='dp_field_{num}']")
+            if field is None:
+                # There are 8 fields, the browser adds the 9th with the options of the first one.
+                name, value = self._select(first_field, option)
+                prefix, _, suffix = name.rpartition("0")
+                values[f"{prefix}{num}{suffix}"] = value
+            else:
+                name, value = self._select(field, option)
+                values[name] = value
+
+        result = self._submit(doc, dump_format, values, "//*[@id='dumpUpdate']")
+        dump_textarea = self._find(result, *DUMP_TEXTAREA_XPATHS)
+        dump_content = dump_textarea.text_content() if dump_textarea is not None else ""
+        if not dump_content.strip():
+            raise MediaSourceClientError(f"Empty dump for partner {partner_name}")
+
+        # Create a name for out dump file.
+        dump_name = f"{partner_name}vids-{datetime.date.today()}"
+        write_to_file(dump_name, temp_dir_p, "txt", dump_content)
+        return dump_name
+
+    def get_set_source(self, partner_hint: Optional[str]) -> Tuple[str, str]:
+        """
+        Gets the photo set page of a partner offer, like ``get_set_source_flow``.
+
+        :param partner_hint: ``str | None`` -> Pattern to match the partner offer.
+        :return: ``tuple[str, str]`` (source_code, filename)
+        """
+        doc, partner_name = self._select_partner(self.set_url, partner_hint)
+        page_count = self._find(doc, "//select[@id='page-count-val']")
+        if page_count is None:
+            raise MediaSourceClientError("Page count select not found")
+        name, value = self._select(page_count, PAGE_COUNT_OPTION)
+        result = self._submit(
+            doc, page_count, {name: value}, "//*[@id='pageination-submit']"
+        )
+        source_html = lxml.html.tostring(result, encoding="unicode")
+        return source_html, f"{partner_name}photos-{datetime.date.today()}"
+
+    def close(self) -> None:
+        """Closes the HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "MediaSourceClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
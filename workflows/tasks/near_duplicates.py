@@ -0,0 +1,479 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Near-Duplicate Content Detection
+
+The same scene is often offered by several partners under slightly different titles,
+so exact title matches miss it. This module finds those near-duplicates with MinHash
+signatures and a banded LSH (locality-sensitive hashing) index.
+
+The title and description of every row are normalized (``core.utils.strings.normalize_title``),
+stripped of punctuation and split into overlapping byte shingles.
+Each row gets a signature with the minimum of ``NUM_PERM`` universal hashes over its
+shingles. Two rows agree on any signature slot with a probability equal to the Jaccard
+similarity of their shingle sets. Signatures are split into ``LSH_BANDS`` bands, and rows that
+share a band bucket become candidates. A candidate lookup therefore costs a fixed number of
+indexed bucket reads regardless of the size of the feed. Candidates are then confirmed with
+the similarity estimated from the full signatures.
+
+``NearDuplicateIndex`` keeps the signatures and buckets of a feed database in tables of the same
+SQLite file, next to the content table described by its ``ContentSchema``. ``sync()`` only hashes
+the rows that were added or changed since the previous sync. ``NearDuplicateDetector`` looks a
+candidate up in the indexes of every feed database.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Third-party imports
+import numpy as np
+
+# Local implementations
+from core.utils.file_system import search_files_by_ext
+from core.utils.strings import match_list_mult, normalize_title
+from workflows.tasks.partner_content_db import ContentSchema, is_persistent_db
+
+# 128 hashes in 32 bands of 4 rows: pairs with a similarity of 0.7 share a bucket with a
+# probability above 0.999, pairs below 0.3 with a probability below 0.23.
+# Titles that differ in a word or two ("by the pool", "at the pool") are above 0.7
+# with 4-byte shingles, titles that only share a phrase stay below.
+NUM_PERM = 128
+LSH_BANDS = 32
+SHINGLE_SIZE = 4
+DEFAULT_THRESHOLD = 0.7
+MINHASH_SEED = 1
+# Odd 64-bit constants of the band bucket hash.
+BUCKET_BASE = np.uint64(0x9E3779B97F4A7C15)
+BUCKET_OFFSET = np.uint64(0xC2B2AE3D27D4EB4F)
+
+# Punctuation is dropped before shingling, e.g. "Ann & Jane!" and "Ann and Jane" differ in words only.
+WORD_REGEX = re.compile(r"\w+")
+
+# Columns joined into the text of a row, when the schema has them.
+TEXT_COLUMNS = ("title", "description")
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+    """
+    Row of a feed database that is similar to a candidate.
+
+    :param source: ``str`` feed database filename.
+    :param key: ``str`` natural key of the row.
+    :param title: ``str`` title of the row.
+    :param similarity: ``float`` estimated Jaccard similarity of the shingles, between 0 and 1.
+    """
+
+    source: str
+    key: str
+    title: str
+    similarity: float
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Overlapping byte shingles of the normalized words of a text. Each shingle is packed into an
+    integer, so that no hashing is needed to compare them. Repeated shingles are kept,
+    they do not change the MinHash signature.
+
+    :param text: ``str`` title and description.
+    :param size: ``int`` bytes per shingle, at most 8.
+    :return: ``np.ndarray`` shingles as ``uint64``, empty if the text is blank.
+    """
+    words = WORD_REGEX.findall(normalize_title(text))
+    data = np.frombuffer(" ".join(words).encode(), dtype=np.uint8)
+    if data.size == 0:
+        return np.empty(0, dtype=np.uint64)
+    if data.size < size:
+        data = np.pad(data, (0, size - data.size))
+    data = data.astype(np.uint64)
+    count = data.size - size + 1
+    values = data[:count].copy()
+    for offset in range(1, size):
+        values |= data[offset : offset + count] << np.uint64(8 * offset)
+    return values
+
+
+class MinHasher:
+    """
+    MinHash signatures with a seeded family of multiply-shift hashes, so that signatures
+    computed in different runs and processes can be compared.
+
+    Attributes:
+        num_perm (int): Hashes per signature.
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = MINHASH_SEED):
+        """
+        :param num_perm: ``int`` -> Hashes per signature.
+        :param seed: ``int`` -> Seed of the hash family.
+        """
+        self.num_perm = num_perm
+        rng = np.random.default_rng(seed)
+        max_int = np.iinfo(np.uint64).max
+        # Multiply-shift hashing needs odd multipliers.
+        self._a = rng.integers(
+            0, max_int, size=(num_perm, 1), dtype=np.uint64, endpoint=True
+        ) | np.uint64(1)
+        self._b = rng.integers(
+            0, max_int, size=(num_perm, 1), dtype=np.uint64, endpoint=True
+        )
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """
+        :param text: ``str`` -> Title and description.
+        :return: ``np.ndarray | None`` -> ``uint32`` signature, ``None`` for a blank text.
+        """
+        values = shingles(text)
+        if values.size == 0:
+            return None
+        # uint64 arithmetic wraps around, the high 32 bits are the hash.
+        hashes = (self._a * values + self._b) >> np.uint64(32)
+        return hashes.min(axis=1).astype(np.uint32)
+
+
+def similarity(signature: np.ndarray, other: np.ndarray) -> float:
+    """
+    :param signature: ``np.ndarray`` -> MinHash signature.
+    :param other: ``np.ndarray`` -> MinHash signature with the same parameters.
+    :return: ``float`` -> Estimated Jaccard similarity.
+    """
+    return float(np.count_nonzero(signature == other)) / signature.size
+
+
+def band_buckets(signature: np.ndarray, bands: int = LSH_BANDS) -> List[int]:
+    """
+    :param signature: ``np.ndarray`` -> MinHash signature.
+    :param bands: ``int`` -> Number of LSH bands, a divisor of the signature size.
+    :return: ``list[int]`` -> Signed 64-bit bucket of each band, distinct across bands.
+    """
+    rows = signature.reshape(bands, -1).astype(np.uint64)
+    # Polynomial hash of the band values, offset by the band number (wraps around in uint64).
+    coefficients = BUCKET_BASE ** np.arange(rows.shape[1], dtype=np.uint64)
+    offsets = np.arange(1, bands + 1, dtype=np.uint64) * BUCKET_OFFSET
+    return (rows @ coefficients + offsets).view(np.int64).tolist()
+
+
+def row_text(row: Sequence[Any], columns: Sequence[str]) -> str:
+    """
+    :param row: ``Sequence`` -> Row values.
+    :param columns: ``Sequence[str]`` -> Column names of the row.
+    :return: ``str`` -> Title and description of the row, as indexed.
+    """
+    return " ".join(
+        str(row[columns.index(column)])
+        for column in TEXT_COLUMNS
+        if column in columns and row[columns.index(column)]
+    )
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash/LSH index of the rows of a feed database, stored in the same file.
+
+    Attributes:
+        db_path (str | Path): Path to the feed database.
+        schema (ContentSchema): Layout of the content table.
+        threshold (float): Minimum estimated similarity of a near-duplicate.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        schema: ContentSchema,
+        threshold: float = DEFAULT_THRESHOLD,
+        hasher: Optional[MinHasher] = None,
+    ):
+        """
+        Opens the feed database and creates the index tables. The index is emptied if it
+        was built with different parameters.
+
+        :param db_path: ``str | Path`` -> Path to the feed database.
+        :param schema: ``ContentSchema`` -> Layout of the content table.
+        :param threshold: ``float`` -> Minimum estimated similarity of a near-duplicate.
+        :param hasher: ``MinHasher | None`` -> Shared signature hasher.
+        """
+        self.db_path = db_path
+        self.schema = schema
+        self.threshold = threshold
+        self._hasher = hasher or MinHasher()
+        self._params = {
+            "num_perm": self._hasher.num_perm,
+            "bands": LSH_BANDS,
+            "shingle_size": SHINGLE_SIZE,
+            "seed": MINHASH_SEED,
+        }
+        self._conn = sqlite3.connect(Path(db_path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS minhash_signatures(
+                key TEXT PRIMARY KEY,
+                title TEXT,
+                text_hash TEXT NOT NULL,
+                signature BLOB
+            );
+            CREATE TABLE IF NOT EXISTS minhash_buckets(
+                bucket INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY(bucket, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS metadata(key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+        if self._read_metadata("minhash_params") != self._params:
+            self.clear()
+
+    def _read_metadata(self, key: str) -> Any:
+        row = self._conn.execute(
+            "SELECT value FROM metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write_metadata(self, values: Mapping[str, Any]) -> None:
+        self._conn.executemany(
+            "INSERT INTO metadata(key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            [(key, json.dumps(value)) for key, value in values.items()],
+        )
+
+    def clear(self) -> None:
+        """Removes every signature, so that the next ``sync()`` hashes every row."""
+        with self._conn:
+            self._conn.execute("DELETE FROM minhash_signatures")
+            self._conn.execute("DELETE FROM minhash_buckets")
+            self._write_metadata(
+                {"minhash_params": self._params, "minhash_refresh": None}
+            )
+
+    def sync(self) -> Tuple[int, int]:
+        """
+        Indexes the rows added or changed since the previous sync and drops the rows that are
+        no longer in the content table. The sync is skipped if the feed was not refreshed since.
+
+        :return: ``tuple[int, int]`` -> Number of indexed and removed rows.
+        """
+        refresh_id = self._read_metadata("refresh_id")
+        if refresh_id is not None and refresh_id == self._read_metadata(
+            "minhash_refresh"
+        ):
+            return 0, 0
+
+        columns = [
+            self.schema.key,
+            *(c for c in TEXT_COLUMNS if c in self.schema.columns),
+        ]
+        stored: Dict[str, Tuple[str, Optional[bytes]]] = {
+            key: (text_hash, signature)
+            for key, text_hash, signature in self._conn.execute(
+                "SELECT key, text_hash, signature FROM minhash_signatures"
+            )
+        }
+        seen = set()
+        # Rows with a repeated key keep the values of the last occurrence.
+        changes: Dict[str, Tuple[Optional[str], str, Optional[np.ndarray]]] = {}
+        for row in self._conn.execute(
+            f"SELECT {', '.join(columns)} FROM {self.schema.table}"
+        ):
+            if (key := row[0]) is None:
+                continue
+            text = row_text(row, columns)
+            text_hash = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+            seen.add(key)
+            if key in stored and stored[key][0] == text_hash:
+                changes.pop(key, None)
+                continue
+            title = row[1] if "title" in columns else None
+            changes[key] = (title, text_hash, self._hasher.signature(text))
+        removed = [(key,) for key in stored.keys() - seen]
+        # The buckets of the previous signatures are recomputed to delete them by primary key.
+        stale_buckets = [
+            (bucket, key)
+            for key in [*changes, *(key for (key,) in removed)]
+            if key in stored and stored[key][1] is not None
+            for bucket in band_buckets(np.frombuffer(stored[key][1], dtype=np.uint32))
+        ]
+        new_buckets = sorted(
+            (bucket, key)
+            for key, (_, _, sig) in changes.items()
+            if sig is not None
+            for bucket in band_buckets(sig)
+        )
+
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM minhash_buckets WHERE bucket = ? AND key = ?",
+                stale_buckets,
+            )
+            self._conn.executemany(
+                "DELETE FROM minhash_signatures WHERE key = ?", removed
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO minhash_signatures(key, title, text_hash, signature) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (key, title, text_hash, None if sig is None else sig.tobytes())
+                    for key, (title, text_hash, sig) in changes.items()
+                ],
+            )
+            # Buckets are inserted in primary key order, which keeps the B-tree inserts sequential.
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO minhash_buckets(bucket, key) VALUES (?, ?)",
+                new_buckets,
+            )
+            self._write_metadata({"minhash_refresh": refresh_id})
+        logging.info(
+            f"Near-duplicate index of {self.db_path}: {len(changes)} rows indexed, {len(removed)} removed"
+        )
+        return len(changes), len(removed)
+
+    def query(
+        self, signature: np.ndarray, exclude_key: Optional[str] = None
+    ) -> List[Tuple[str, str, float]]:
+        """
+        :param signature: ``np.ndarray`` -> MinHash signature of the candidate.
+        :param exclude_key: ``str | None`` -> Key of the candidate itself, if it is in this feed.
+        :return: ``list[tuple[str, str, float]]`` -> ``(key, title, similarity)`` of the
+                 near-duplicates, most similar first.
+        """
+        buckets = band_buckets(signature)
+        matches = []
+        for key, title, stored in self._conn.execute(
+            f"""
+            SELECT key, title, signature FROM minhash_signatures WHERE key IN (
+                SELECT key FROM minhash_buckets
+                WHERE bucket IN ({", ".join("?" * len(buckets))})
+            )
+            """,
+            buckets,
+        ):
+            if key == exclude_key:
+                continue
+            score = similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+            if score >= self.threshold:
+                matches.append((key, title, score))
+        return sorted(matches, key=lambda match: match[2], reverse=True)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[
+            0
+        ]
+
+    def __enter__(self) -> "NearDuplicateIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class NearDuplicateDetector:
+    """
+    Looks candidates up in the near-duplicate indexes of several feed databases.
+    """
+
+    def __init__(
+        self,
+        indexes: Mapping[str, NearDuplicateIndex],
+        hasher: Optional[MinHasher] = None,
+    ):
+        """
+        :param indexes: ``Mapping[str, NearDuplicateIndex]`` -> Synced indexes by feed database filename.
+        :param hasher: ``MinHasher | None`` -> Hasher the indexes were built with.
+        """
+        self._indexes = dict(indexes)
+        self._hasher = hasher or MinHasher()
+
+    @classmethod
+    def from_feed_dir(
+        cls,
+        dirname: str | Path,
+        content_hint: str,
+        schema: ContentSchema,
+        threshold: float = DEFAULT_THRESHOLD,
+        parent: bool = False,
+    ) -> "NearDuplicateDetector":
+        """
+        Opens and syncs the index of every persistent feed database of a content type.
+
+        :param dirname: ``str | Path`` -> Directory with the feed databases.
+        :param content_hint: ``str`` -> Content type in the filenames, typically ``vids`` or ``photos``.
+        :param schema: ``ContentSchema`` -> Layout of the content tables.
+        :param threshold: ``float`` -> Minimum estimated similarity of a near-duplicate.
+        :param parent: ``bool`` -> Look for ``dirname`` in the parent directory.
+        :return: ``NearDuplicateDetector``
+        """
+        hasher = MinHasher()
+        db_paths = [
+            path
+            for path in search_files_by_ext("db", dirname, parent=parent, abspaths=True)
+            if is_persistent_db(path)
+        ]
+        db_names = [os.path.basename(path) for path in db_paths]
+        indexes: Dict[str, NearDuplicateIndex] = {}
+        for indx in match_list_mult(content_hint, db_names):
+            index = NearDuplicateIndex(
+                db_paths[indx], schema, threshold=threshold, hasher=hasher
+            )
+            index.sync()
+            indexes[db_names[indx]] = index
+        return cls(indexes, hasher=hasher)
+
+    def find(
+        self, text: str, source: Optional[str] = None, key: Optional[str] = None
+    ) -> List[NearDuplicate]:
+        """
+        :param text: ``str`` -> Title and description of the candidate.
+        :param source: ``str | None`` -> Feed database filename of the candidate, if indexed.
+        :param key: ``str | None`` -> Natural key of the candidate in ``source``.
+        :return: ``list[NearDuplicate]`` -> Near-duplicates in every feed, most similar first.
+        """
+        signature = self._hasher.signature(text)
+        if signature is None:
+            return []
+        matches = [
+            NearDuplicate(name, match_key, title, score)
+            for name, index in self._indexes.items()
+            for match_key, title, score in index.query(
+                signature, exclude_key=key if name == source else None
+            )
+        ]
+        return sorted(matches, key=lambda match: match.similarity, reverse=True)
+
+    def close(self) -> None:
+        """Closes the indexes."""
+        for index in self._indexes.values():
+            index.close()
+
+    def __enter__(self) -> "NearDuplicateDetector":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def sync_near_duplicate_index(db_path: str | Path, schema: ContentSchema) -> None:
+    """Syncs the near-duplicate index of a feed database after a refresh.
+
+    :param db_path: ``str | Path`` feed database.
+    :param schema: ``ContentSchema`` layout of the content table.
+    :return: ``None``
+    """
+    with NearDuplicateIndex(db_path, schema) as index:
+        index.sync()
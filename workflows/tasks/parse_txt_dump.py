@@ -19,11 +19,11 @@ by other components of the system. This module serves as the foundation for the
 management pipeline used across the project.
 
 The primary function, parse_txt_dump_chain(), handles the complete parsing workflow:
-1. Locating and opening dump file
+1. Locating and streaming the dump file
 2. Processing each line to extract structured metadata
 3. Validating and cleaning the extracted data
 4. Constructing slugs for web publishing
-5. Inserting records into the database
+5. Bulk-inserting records into the database
 
 Author: Yoham Gabriel Urbine@GitHub
 Email: yohamg@programmer.net
@@ -34,13 +34,120 @@ __author_email__ = "yohamg@programmer.net"
 
 import logging
 import os
-import re
 import sqlite3
 
+from typing import Iterator, Optional
+
 # Local implementations
-from core.utils.file_system import is_parent_dir_required
+from core.models.file_system import ApplicationPath
+from core.utils.bulk_ingest import bulk_insert, iter_dump_lines, make_splitter
+from core.utils.file_system import exists_ok, is_parent_dir_required
 from core.utils.parsers import parse_date_to_iso
 from core.utils.strings import clean_filename
+from workflows.tasks.near_duplicates import sync_near_duplicate_index
+from workflows.tasks.partner_content_db import (
+    VIDEO_SCHEMA,
+    PartnerContentDB,
+    RefreshStats,
+    file_hash,
+    persistent_db_name,
+)
+
+
+# Fields of a valid dump line.
+TXT_DUMP_FIELDS = 9
+
+
+def parse_txt_dump_line(dump_line: list[str]) -> Optional[tuple[str | None, ...]]:
+    """Organize the fields of a single dump line into a ``videos`` table row.
+
+    :param dump_line: ``list[str]`` fields of the line, split by ``'|'``
+    :return: ``tuple`` row values or ``None`` if the video has no source URL.
+    """
+    # I am not interested in videos that don't point to a source URL.
+    # In some cases, their tags are moved to the source URL field
+    # and that breaks the slug construction.
+    source_url = dump_line[6]
+    if not source_url.startswith("http"):
+        return None
+
+    title = dump_line[0]
+    description = dump_line[1]
+    model = dump_line[2] or None
+    tags = dump_line[3] or None
+    site_name = dump_line[4]
+    date = str(parse_date_to_iso(dump_line[5], m_abbr=True))
+
+    # The duration comes at the end of source urls.
+    source_name = source_url.split("/")[-1]
+    source_parts = source_name.split("_")
+    if len(source_parts) >= 2:
+        duration = source_parts[-1].split(".")[0]
+    else:
+        duration = None
+    thumbnail_url = dump_line[7]
+    tracking_url = dump_line[8]
+
+    # Pre_slug is taken from the source URL slug without the
+    # duration value.
+    pre_slug = "-".join(source_parts[:-1])
+
+    if pre_slug == "":
+        post_slug = source_name
+        # Sometimes, the last element contains a file extension
+        # and I don't want that in my url slugs.
+        if "." in post_slug:
+            post_slug = source_name.split(".")[0]
+    else:
+        post_slug = pre_slug
+
+    wp_slug = "-".join(site_name.split(" ")).lower() + "-" + post_slug
+
+    return (
+        title,
+        description,
+        model,
+        tags,
+        date,
+        duration,
+        source_url,
+        thumbnail_url,
+        tracking_url,
+        wp_slug,
+    )
+
+
+def iter_txt_dump_rows(path: str) -> Iterator[tuple[str | None, ...]]:
+    """Stream the ``videos`` table rows of a ``.txt`` dump file, line by line.
+    Lines with missing fields (e.g. a truncated last line) are skipped.
+
+    :param path: ``str`` path to the dump file
+    :return: ``Iterator[tuple]`` row values
+    """
+    split_line = make_splitter("|")
+    malformed = 0
+    for line in iter_dump_lines(path):
+        dump_line = split_line(line)
+        if len(dump_line) < TXT_DUMP_FIELDS:
+            malformed += 1
+            continue
+        if (row := parse_txt_dump_line(dump_line)) is not None:
+            yield row
+    if malformed:
+        logging.warning(f"Skipped {malformed} malformed lines in {path}")
+
+
+def txt_dump_path(filename: str, dirname: str = "", parent: bool = False) -> str:
+    """
+    :param filename: ``str`` name of the dump file
+    :param dirname: ``str`` Where to find the `dump` file in your system.
+    :param parent: ``bool`` look for the file in the parent directory
+    :return: ``str`` path to the ``.txt`` dump file
+    """
+    cl_fname = clean_filename(filename, "txt")
+    if dirname:
+        return os.path.join(dirname, cl_fname)
+    return os.path.join(is_parent_dir_required(parent), cl_fname)
 
 
 # Make sure that you get a dump file with all these fields:
@@ -55,6 +162,7 @@ def parse_txt_dump_chain(
     parent: bool = False,
 ) -> tuple[str, int]:
     """Parse the ``.txt`` file provided, organize and insert the values into a ``sqlite3`` database.
+    The file is streamed and the rows are bulk-inserted, see ``core.utils.bulk_ingest``.
 
     :param filename: ``str`` name of the file to be parsed
     :param d_name: ``str`` Desired name for the resulting database
@@ -64,95 +172,41 @@ def parse_txt_dump_chain(
     :param parent: ``bool`` look for the file in the parent directory
     :return: ``tuple[str, int]`` (abs_path_db, total_entries_in_db)
     """
-    cl_fname = clean_filename(filename, "txt")
-    if dirname:
-        path = os.path.join(dirname, cl_fname)
-    else:
-        path = os.path.join(is_parent_dir_required(parent), cl_fname)
-
-    total_entries = 0
-    with open(path, "r", encoding="utf-8") as dump_file:
-        try:
-            for line in dump_file.readlines():
-                dump_line = line.split("|")
-
-                # I am not interested in videos that don't point to a source URL.
-                # In some cases, their tags are moved to the source URL field
-                # and that breaks the slug construction.
-                if dump_line[6] == "" or re.match("http", dump_line[6]) is None:
-                    continue
-
-                title = dump_line[0]
-                description = dump_line[1]
-                model = dump_line[2]
-                if model == "":
-                    model = None
-
-                tags = dump_line[3]
-                if tags == "":
-                    tags = None
-
-                date = str(parse_date_to_iso(dump_line[5], m_abbr=True))
-
-                # The duration comes at the end of source urls.
-                pre_duration = dump_line[6].split("/")[-1:][0].split("_")
-                if len(pre_duration) >= 2:
-                    duration = (
-                        dump_line[6].split("/")[-1:][0].split("_")[-1:][0].split(".")[0]
-                    )
-                else:
-                    duration = None
-                source_url = dump_line[6]
-                thumbnail_url = dump_line[7]
-                tracking_url = dump_line[8].strip("\n")
-                site_name = dump_line[4]
-
-                # Pre_slug is taken from the source URL slug without the
-                # duration value.
-                pre_slug = "-".join(dump_line[6].split("/")[-1:][0].split("_")[:-1])
-
-                if pre_slug == "":
-                    post_slug = dump_line[6].split("/")[-1:][0]
-                    # Sometimes, the last element contains a file extension
-                    # and I don't want that in my url slugs.
-                    if re.findall(r"\.", post_slug):
-                        post_slug = dump_line[6].split("/")[-1:][0].split(".")[0]
-                else:
-                    post_slug = pre_slug
-
-                wp_slug = "-".join(site_name.split(" ")).lower() + "-" + post_slug
-
-                all_values = (
-                    title,
-                    description,
-                    model,
-                    tags,
-                    date,
-                    duration,
-                    source_url,
-                    thumbnail_url,
-                    tracking_url,
-                    wp_slug,
-                )
-
-                d_cur.execute(
-                    "INSERT INTO videos VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    all_values,
-                )
-
-                total_entries += 1
-
-            d_conn.commit()
-
-        except IndexError as ierr:
-            # This seems to be a pattern.
-            # When it reaches the end and there is no more data, Python
-            # throws an IndexError in this function.
-            logging.warning(
-                f"Error or end of transaction stream: {ierr!r} at {__file__}."
-            )
-        finally:
-            d_cur.close()
-            d_conn.close()
-
-        return f"{os.path.abspath(d_name)}", total_entries
+    path = txt_dump_path(filename, dirname=dirname, parent=parent)
+    try:
+        total_entries = bulk_insert(
+            d_conn,
+            "INSERT INTO videos VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            iter_txt_dump_rows(path),
+            indexes=(
+                ("idx_videos_title", "videos", ("title",)),
+                ("idx_videos_wp_slug", "videos", ("wp_slug",)),
+            ),
+        )
+    finally:
+        d_cur.close()
+        d_conn.close()
+
+    return f"{os.path.abspath(d_name)}", total_entries
+
+
+def refresh_txt_dump_db(
+    filename: str, dirname: str = "", parent: bool = False
+) -> tuple[str, RefreshStats]:
+    """Refresh the persistent ``videos`` database of a partner with the ``.txt`` dump provided,
+    instead of creating a new dated database, and its near-duplicate index.
+    See ``workflows.tasks.partner_content_db`` and ``workflows.tasks.near_duplicates``.
+
+    :param filename: ``str`` name of the dump file, e.g. ``partnervids-2025-01-31``
+    :param dirname: ``str`` Where to find the `dump` file in your system.
+    :param parent: ``bool`` look for the file in the parent directory
+    :return: ``tuple[str, RefreshStats]`` (abs_path_db, refresh_stats)
+    """
+    path = txt_dump_path(filename, dirname=dirname, parent=parent)
+    db_path = os.path.join(
+        exists_ok(ApplicationPath.ARTIFACTS), persistent_db_name(filename)
+    )
+    with PartnerContentDB(db_path, VIDEO_SCHEMA) as content_db:
+        stats = content_db.refresh(iter_txt_dump_rows(path), dump_hash=file_hash(path))
+    sync_near_duplicate_index(db_path, VIDEO_SCHEMA)
+    return os.path.abspath(db_path), stats
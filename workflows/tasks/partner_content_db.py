@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (c) 2025 Yoham Gabriel B.
+
+"""
+Persistent Partner Content Databases
+
+This module defines the PartnerContentDB class, a durable SQLite database per partner offer
+that is refreshed in place instead of being rebuilt under a new dated filename every day.
+
+Rows are keyed by a natural key (the source URL of a video or the link of a photo set) and
+stored with a hash of their values, so a refresh only writes the rows that were added, changed
+or came back after dropping out of the dump. Rows that are no longer in the dump are kept as
+tombstones with a ``removed_at`` timestamp, and every row records when it was ``first_seen``.
+Unchanged rows are not touched to record that they were seen again: a live row was last seen
+by the latest refresh, and a tombstone by the refresh before the one that removed it, see
+``PartnerContentDB.last_seen()``. If the hash of the dump matches the one of the previous
+refresh, the refresh is skipped without parsing it.
+
+Consumers keep querying the usual table name (``videos`` or ``sets``): it is a view with
+the original columns that only returns the rows that are still in the dump.
+
+Author: Yoham Gabriel Urbine@GitHub
+Email: yohamg@programmer.net
+"""
+
+__author__ = "Yoham Gabriel Urbine@GitHub"
+__author_email__ = "yohamg@programmer.net"
+
+import datetime
+import hashlib
+import json
+import re
+import sqlite3
+import uuid
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+# Local implementations
+from workflows.exceptions import DataSourceUpdateError
+
+# Dated artifacts follow the ``<partner><content>-<date-in-ISO-format>`` naming convention.
+DATE_SUFFIX_REGEX = re.compile(r"-?\d{2,4}-\d{1,2}-\d{1,2}$")
+
+
+@dataclass(frozen=True)
+class ContentSchema:
+    """
+    Layout of a partner content table.
+
+    :param table: ``str`` name of the view queried by the flows.
+    :param columns: ``tuple[str, ...]`` columns in the order of the dated databases.
+    :param key: ``str`` natural key column.
+    """
+
+    table: str
+    columns: Tuple[str, ...]
+    key: str
+
+
+VIDEO_SCHEMA = ContentSchema(
+    "videos",
+    (
+        "title",
+        "description",
+        "model",
+        "tags",
+        "date",
+        "duration",
+        "source_url",
+        "thumbnail_url",
+        "tracking_url",
+        "wp_slug",
+    ),
+    "source_url",
+)
+
+PHOTO_SET_SCHEMA = ContentSchema("sets", ("title", "date", "link"), "link")
+
+
+@dataclass(frozen=True)
+class RefreshStats:
+    """
+    Outcome of ``PartnerContentDB.refresh()``.
+
+    :param added: ``int`` new rows.
+    :param updated: ``int`` rows whose values changed.
+    :param revived: ``int`` tombstoned rows that are back in the dump.
+    :param removed: ``int`` rows that dropped out of the dump.
+    :param active: ``int`` rows in the dump after the refresh.
+    :param skipped: ``bool`` ``True`` if the dump was unchanged and the refresh was skipped.
+    """
+
+    added: int = 0
+    updated: int = 0
+    revived: int = 0
+    removed: int = 0
+    active: int = 0
+    skipped: bool = False
+
+
+def persistent_db_name(dump_name: str) -> str:
+    """Name of the persistent database of a dated dump, e.g. ``partnervids-2025-01-31``
+    becomes ``partnervids.db``.
+
+    :param dump_name: ``str`` dump filename, with or without extension.
+    :return: ``str`` database filename.
+    """
+    return f"{DATE_SUFFIX_REGEX.sub('', Path(dump_name).stem)}.db"
+
+
+def is_persistent_db(filename: str) -> bool:
+    """
+    :param filename: ``str`` database filename.
+    :return: ``bool`` ``True`` if the filename does not follow the dated naming convention.
+    """
+    return DATE_SUFFIX_REGEX.search(Path(filename).stem) is None
+
+
+def file_hash(path: str | Path) -> str:
+    """
+    :param path: ``str | Path`` dump file.
+    :return: ``str`` BLAKE2b hex digest of the file contents.
+    """
+    with open(path, "rb") as dump_file:
+        return hashlib.file_digest(dump_file, hashlib.blake2b).hexdigest()
+
+
+def row_hash(row: Sequence[Any]) -> str:
+    """
+    :param row: ``Sequence`` row values, dates are hashed in ISO format.
+    :return: ``str`` 64-bit BLAKE2b hex digest of the row values.
+    """
+    return hashlib.blake2b(
+        json.dumps(list(row), ensure_ascii=False, default=str).encode(), digest_size=8
+    ).hexdigest()
+
+
+class PartnerContentDB:
+    """
+    Durable content database of a partner offer, refreshed in place from each new dump.
+
+    Attributes:
+        db_path (str | Path): Path to the SQLite database file.
+        schema (ContentSchema): Layout of the content table.
+    """
+
+    def __init__(self, db_path: str | Path, schema: ContentSchema):
+        """
+        Opens (or creates) the database and its schema.
+
+        :param db_path: ``str | Path`` -> Path to the SQLite database file.
+        :param schema: ``ContentSchema`` -> Layout of the content table.
+        """
+        self.db_path = db_path
+        self.schema = schema
+        self._rows_table = f"{schema.table}_rows"
+        columns = ", ".join(
+            f"{column} TEXT PRIMARY KEY" if column == schema.key else column
+            for column in schema.columns
+        )
+        self._conn = sqlite3.connect(Path(db_path))
+        # The view is created first: schema readers take the first entry of ``sqlite_master``.
+        self._conn.executescript(
+            f"""
+            CREATE VIEW IF NOT EXISTS {schema.table} AS
+                SELECT {", ".join(schema.columns)} FROM {self._rows_table}
+                WHERE removed_at IS NULL;
+            CREATE TABLE IF NOT EXISTS {self._rows_table}(
+                {columns},
+                row_hash TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                removed_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_{self._rows_table}_title
+                ON {self._rows_table}(title);
+            CREATE TABLE IF NOT EXISTS metadata(key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+
+    def read_metadata(self) -> Dict[str, Any]:
+        """
+        :return: ``dict`` -> Database metadata (``dump_hash``, ``last_refresh``, ``refresh_id``).
+        """
+        return {
+            key: json.loads(value)
+            for key, value in self._conn.execute("SELECT key, value FROM metadata")
+        }
+
+    def refresh(
+        self, rows: Iterable[Sequence[Any]], dump_hash: Optional[str] = None
+    ) -> RefreshStats:
+        """
+        Applies a new dump in a single transaction: new, changed and revived rows are UPSERTed
+        by their natural key and rows that are not in the dump are tombstoned.
+        Rows with a repeated key keep the values of the last occurrence.
+        A dump without rows is rejected, since applying it would tombstone every live row.
+
+        :param rows: ``Iterable[Sequence]`` -> Rows of the dump, with the values of ``schema.columns``.
+        :param dump_hash: ``str | None`` -> Hash of the dump file, the refresh is skipped if it
+                          matches the hash of the previous refresh.
+        :return: ``RefreshStats``
+        :raises DataSourceUpdateError: if the dump has no rows. The database is left untouched.
+        """
+        if dump_hash is not None and dump_hash == self.read_metadata().get("dump_hash"):
+            return RefreshStats(active=len(self), skipped=True)
+
+        key_index = self.schema.columns.index(self.schema.key)
+        stored: Dict[str, Tuple[str, bool]] = {
+            key: (stored_hash, removed_at is not None)
+            for key, stored_hash, removed_at in self._conn.execute(
+                f"SELECT {self.schema.key}, row_hash, removed_at FROM {self._rows_table}"
+            )
+        }
+        # Only the keys of the dump and the rows that must be written are kept in memory.
+        seen: Set[str] = set()
+        changes: Dict[str, Tuple[Any, ...]] = {}
+        for row in rows:
+            key, digest = row[key_index], row_hash(row)
+            seen.add(key)
+            if key not in stored or stored[key] != (digest, False):
+                changes[key] = (*row, digest)
+            else:
+                changes.pop(key, None)
+        if not seen:
+            raise DataSourceUpdateError(
+                f"No rows found in the dump, {self.db_path} was not refreshed"
+            )
+
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        # Rows that are removed now were in the dump of the previous refresh.
+        previous_refresh = self.read_metadata().get("last_refresh")
+        added, updated, revived = 0, 0, 0
+        for key in changes:
+            if key not in stored:
+                added += 1
+            elif stored[key][1]:
+                revived += 1
+            else:
+                updated += 1
+        upserts = [(*row, now, now) for row in changes.values()]
+        removed = [
+            (now, previous_refresh, key)
+            for key, (_, is_removed) in stored.items()
+            if not is_removed and key not in seen
+        ]
+
+        columns = (*self.schema.columns, "row_hash")
+        with self._conn:
+            self._conn.executemany(
+                f"""
+                INSERT INTO {self._rows_table}({", ".join(columns)}, first_seen, last_seen)
+                VALUES ({", ".join("?" * (len(columns) + 2))})
+                ON CONFLICT({self.schema.key}) DO UPDATE SET
+                    {", ".join(f"{col}=excluded.{col}" for col in columns)},
+                    last_seen=excluded.last_seen,
+                    removed_at=NULL
+                """,
+                upserts,
+            )
+            self._conn.executemany(
+                f"""
+                UPDATE {self._rows_table}
+                SET removed_at = ?, last_seen = COALESCE(?, last_seen)
+                WHERE {self.schema.key} = ?
+                """,
+                removed,
+            )
+            self._conn.executemany(
+                "INSERT INTO metadata(key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                [
+                    ("dump_hash", json.dumps(dump_hash)),
+                    ("last_refresh", json.dumps(now)),
+                    ("refresh_id", json.dumps(uuid.uuid4().hex)),
+                ],
+            )
+        return RefreshStats(added, updated, revived, len(removed), len(seen))
+
+    def last_seen(self, key: str) -> Optional[str]:
+        """
+        Live rows are only written when they change, so their stored ``last_seen`` is the
+        refresh that last wrote them; they were all in the dump of the latest refresh.
+
+        :param key: ``str`` -> Natural key of the row.
+        :return: ``str | None`` -> ISO timestamp of the last refresh whose dump had the row,
+                 ``None`` if the key is unknown.
+        """
+        row = self._conn.execute(
+            f"""
+            SELECT CASE WHEN removed_at IS NULL
+                THEN COALESCE(
+                    (SELECT json_extract(value, '$') FROM metadata
+                     WHERE key = 'last_refresh'),
+                    last_seen
+                )
+                ELSE last_seen END
+            FROM {self._rows_table} WHERE {self.schema.key} = ?
+            """,
+            (key,),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM {self.schema.table}"
+        ).fetchone()[0]
+
+    def __enter__(self) -> "PartnerContentDB":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
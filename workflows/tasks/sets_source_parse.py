@@ -11,11 +11,12 @@ for photo sets from MediaSource. It offers tools to:
 2. Store extracted metadata in SQLite databases
 3. Handle file path generation and database management
 
-The main workflow involves using BeautifulSoup to extract metadata elements,
-process them into appropriate formats, and store them in a structured database
-for later use in content management workflows.
+The main workflow extracts the metadata of every photo set in a single pass over the
+page parsed with lxml, processes it into appropriate formats, and stores it in a
+structured database for later use in content management workflows.
 
 Key functions:
+- extract_set_rows: Extract the title, date and link of every photo set in one pass
 - parse_titles: Extract photo set titles from HTML
 - parse_dates: Extract and format dates from HTML
 - parse_links: Extract and format download links from HTML
@@ -40,13 +41,24 @@ from bs4 import BeautifulSoup
 
 # Local implementation
 from core.models.file_system import ApplicationPath
+from core.utils.bulk_ingest import bulk_insert
 from core.utils.file_system import (
     filename_creation_helper,
-    remove_if_exists,
+    staged_file,
     exists_ok,
 )
-from core.utils.parsers import parse_date_to_iso
+from core.utils.parsers import html_document, parse_date_to_iso
 from core.utils.strings import clean_filename
+from workflows.tasks.near_duplicates import sync_near_duplicate_index
+from workflows.tasks.partner_content_db import (
+    PHOTO_SET_SCHEMA,
+    PartnerContentDB,
+    persistent_db_name,
+)
+
+SET_BASE_URL = "https://media_source.com/"
+SET_TITLE_CLASS = "tab-column left-align col_0"
+SET_DATE_CLASS = "tab-column col_1 center-align"
 
 
 def parse_titles(soup_html: BeautifulSoup) -> list[str]:
@@ -83,7 +95,7 @@ def parse_links(soup_html: BeautifulSoup) -> list[str]:
     :param soup_html: ``BeautifulSoup`` object
     :return: list[str]
     """
-    base_url = "https://media_source.com/"
+    base_url = SET_BASE_URL
     ziptool_links = soup_html.find_all("a")
 
     def make_link(td):
@@ -95,47 +107,91 @@ def parse_links(soup_html: BeautifulSoup) -> list[str]:
     return list(map(make_link, filter(match_ziptool, ziptool_links)))
 
 
+def extract_set_rows(
+    source_html: str | bytes | BeautifulSoup,
+) -> list[tuple[str, datetime.date, str]]:
+    """Extracts the title, date and download link of every photo set in a single walk
+    over the page, instead of one ``find_all`` walk per field like ``parse_titles``,
+    ``parse_dates`` and ``parse_links``. The rows are the same those functions produce when
+    their lists are zipped together.
+
+    :param source_html: ``str`` | ``bytes`` page source or ``BeautifulSoup`` object.
+    :return: ``list[tuple[str, datetime.date, str]]`` (title, date, link)
+    """
+    titles, dates, links = [], [], []
+    for element in html_document(source_html).iter("td", "a"):
+        if element.tag == "a":
+            href = element.get("href", "")
+            if href.startswith("zip_tool"):
+                links.append(f"{SET_BASE_URL}{href}")
+            continue
+        td_class = " ".join(element.get("class", "").split())
+        if td_class == SET_TITLE_CLASS:
+            titles.append(element.text_content())
+        elif td_class == SET_DATE_CLASS:
+            dates.append(
+                parse_date_to_iso(
+                    element.text_content().strip(), zero_day=True, m_abbr=False
+                )
+            )
+    return list(zip(titles, dates, links))
+
+
 def db_generate(
-    soup_html: BeautifulSoup, db_suggest: list[str] | str, parent: bool = False
+    soup_html: str | BeautifulSoup,
+    db_suggest: list[str] | str,
+    parent: bool = False,
+    persistent: bool = False,
 ) -> tuple[str, int]:
     """As its name describes, it puts all the information that previous
     functions returned into a SQLite db.
 
-    :param soup_html: ``BeautifulSoup`` object
+    :param soup_html: ``str`` page source or ``BeautifulSoup`` object
     :param db_suggest: List with name suggestions for your db files or string.
     :param parent: ``bool`` ``True`` if you want to generate the database in your parent dir. Default ``False``
+    :param persistent: ``bool`` ``True`` to refresh the persistent database of the partner and its
+                       near-duplicate index instead of creating a dated one,
+                       see ``workflows.tasks.partner_content_db``. Default ``False``
     :return: ``tuple[str, int]`` (db_path, total_entries)
     """
-    set_titles = parse_titles(soup_html)
-    set_dates = parse_dates(soup_html)
-    set_links = parse_links(soup_html)
+    set_rows = extract_set_rows(soup_html)
 
     if isinstance(db_suggest, list):
         d_name = filename_creation_helper(db_suggest, extension="db")
     else:
         d_name = clean_filename(db_suggest, "db")
 
+    if persistent:
+        db_path = os.path.join(
+            exists_ok(ApplicationPath.ARTIFACTS), persistent_db_name(d_name)
+        )
+        with PartnerContentDB(db_path, PHOTO_SET_SCHEMA) as content_db:
+            stats = content_db.refresh(set_rows)
+        sync_near_duplicate_index(db_path, PHOTO_SET_SCHEMA)
+        logging.info(f"Refreshed {db_path}: {stats}")
+        return db_path, stats.active
+
     db_path = os.path.join(exists_ok(ApplicationPath.ARTIFACTS), d_name)
-    remove_if_exists(db_path)
-    db_conn = sqlite3.connect(db_path)
-    cursor = db_conn.cursor()
-    cursor.execute("CREATE TABLE sets(title, date, link)")
     # Sum of entered into the db.
     total_photosets = 0
-    all_values = zip(set_titles, set_dates, set_links)
 
     try:
-        for vals in all_values:
-            cursor.execute("INSERT INTO sets VALUES(?, ?, ?)", vals)
-            total_photosets += 1
-
-        db_conn.commit()
+        # The previous database is only replaced after a successful load.
+        with staged_file(db_path) as staging_path:
+            db_conn = sqlite3.connect(staging_path)
+            try:
+                db_conn.execute("CREATE TABLE sets(title, date, link)")
+                total_photosets = bulk_insert(
+                    db_conn,
+                    "INSERT INTO sets VALUES(?, ?, ?)",
+                    set_rows,
+                    indexes=(("idx_sets_title", "sets", ("title",)),),
+                )
+            finally:
+                db_conn.close()
     except Exception as e:
         logging.warning(
             f"Error: {e!r} detected in the database generation process at {__file__}."
         )
-    finally:
-        cursor.close()
-        db_conn.close()
 
     return db_path, total_photosets
@@ -42,6 +42,7 @@ from core.utils.strings import (
     match_list_mult,
     match_list_single,
 )
+from workflows.tasks.partner_content_db import is_persistent_db
 
 
 def search_db_like(
@@ -90,7 +91,8 @@ def content_select_db_match(
     within two separate lists: the available ``.db`` file list and a list of partner offers.
     In order to accomplish this, the modules in the ``tasks`` package apply a consistent naming convention that
     looks like ``partner-name-content-type-date-in-ISO-format``; those filenames are further analysed by an algorithm
-    that matches strings found in a lookup list.
+    that matches strings found in a lookup list. Persistent databases (``partner-name-content-type.db``,
+    see ``workflows.tasks.partner_content_db``) are selected before any dated database of the same partner.
 
     For more information on how this matching works and the algorithm behind it, refer to the documentation for
     ``match_list_mult`` and ``match_list_elem_date`` in the ``core.utils.strings`` module.
@@ -114,8 +116,27 @@ def content_select_db_match(
     console = Console()
 
     available_files: List[str] = search_files_by_ext("db", folder=dir, parent=parent)
-    filtered_files: List[str] = match_list_elem_date(
-        hint_lst,
+
+    # Persistent partner databases take precedence over the dated ones, so only
+    # partners without a persistent database need the date-based selection.
+    persistent_files: List[str] = [
+        available_files[indx]
+        for indx in match_list_mult(content_hint, available_files)
+        if is_persistent_db(available_files[indx])
+    ]
+    filtered_files: List[str] = []
+    dated_hints: List[str] = []
+    for hint in hint_lst:
+        persistent_matches: List[int] = match_list_mult(
+            "-".join(hint.split(" ")), persistent_files, ignore_case=True
+        )
+        if persistent_matches:
+            filtered_files.extend(persistent_files[indx] for indx in persistent_matches)
+        else:
+            dated_hints.append(hint)
+
+    filtered_files += match_list_elem_date(
+        dated_hints,
         available_files,
         join_hints=(True, " ", "-"),
         ignore_case=True,
@@ -19,7 +19,7 @@ import os
 import shutil
 import time
 import zipfile
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 
 # Third-party imports
 import requests
@@ -29,7 +29,11 @@ from selenium.webdriver.remote.webelement import WebElement
 # Local imports
 from core.config.config_factories import image_config_factory
 from core.models.secret_model import MediaSourceAuth, SecretType
-from core.utils.data_access import WebDriverFactory
+from core.utils.data_access import (
+    WebDriverFactory,
+    WebDriverPool,
+    webdriver_lease,
+)
 from core.utils.file_system import search_files_by_ext
 from core.utils.interfaces import WordFilter
 from core.utils.secret_handler import SecretHandler
@@ -100,6 +104,7 @@ def fetch_zip(
     parent: bool = False,
     gecko: bool = False,
     headless: bool = False,
+    webdrivers: Optional[WebDriverPool] = None,
 ) -> None:
     """Fetch a .zip archive from the internet by following set of authentication and retrieval
     steps via automated execution of a browser instance (webdriver).
@@ -122,12 +127,11 @@ def fetch_zip(
     :param parent: ``bool``  ``True`` if your download dir is in a parent directory. Default ``False``
     :param gecko: ``bool`` ``True`` if you want to use Gecko (Firefox) webdriver instead of Chrome. Default ``False``
     :param headless: ``bool`` ``True`` if you want headless execution. Default ``False``.
+    :param webdrivers: ``WebDriverPool`` to lease the browser from, its download folder must be ``dwn_dir``.
+                       Without a pool, a browser is started for this download. Default ``None``
     :param media_source_auth: ``MediaSourceAuth`` object with authentication information to access MediaSource.
     :return: ``None``
     """
-    webdriver = WebDriverFactory(dwn_dir, headless=headless, gecko=gecko)
-    webdrv = webdriver.get_instance()
-
     webdrv_user_sel = "Gecko" if gecko else "Chrome"
     logging.info(
         f"User selected webdriver {webdrv_user_sel} -> Headless? {str(headless)}"
@@ -139,7 +143,9 @@ def fetch_zip(
     )[0]
     username: str = media_source_auth.username
     password: str = media_source_auth.password
-    with webdrv as driver:
+    with webdriver_lease(
+        webdrivers, WebDriverFactory(dwn_dir, headless=headless, gecko=gecko)
+    ) as driver:
         # Go to URL
         print("--> Getting files from MediaSource")
         print("--> Authenticating...")
@@ -158,8 +164,8 @@ def fetch_zip(
         print("--> Downloading...")
 
         if not gecko:
-            # Chrome exits after authenticating and before completing pending downloads.
-            # On the other hand, Gecko does not need additional time.
+            # Chrome exits (or is reset, if pooled) after authenticating and before completing
+            # pending downloads. On the other hand, Gecko does not need additional time.
             time.sleep(15)
 
     time.sleep(5)
@@ -211,13 +217,17 @@ def upload_image_set(
     folder: str,
     title: str,
     wordpress_site: WordPress,
+    max_workers: int = 4,
 ) -> None:
     """Upload a set of images to the WordPress Media endpoint.
+    Images are uploaded concurrently, each one in a single streamed request
+    that also sets its attributes, and reported in the order of the set.
 
     :param ext: ``str`` image file extension to look for.
     :param folder:  ``str`` Your thumbnails folder, just the name is necessary.
     :param title: ``str`` gallery name
     :param wordpress_site: ``WordPress`` instance
+    :param max_workers: ``int`` maximum number of uploads in flight.
     :return: ``None``
     """
     thumbnails: List[str] = search_files_by_ext(ext, folder=folder)
@@ -245,6 +255,8 @@ def upload_image_set(
     # Prepare the image new name so that separators are replaced by hyphens.
     # E.g. this_is_a_cool_pic.jpg => this-is-a-cool-pic.jpg
 
+    img_paths: List[str] = []
+    img_payloads: List[Dict[str, str]] = []
     for number, image in enumerate(thumbnails, start=1):
         img_attrs: Dict[str, str] = WorkflowMediaPayload().gallery_payload_factory(
             title, number
@@ -263,8 +275,15 @@ def upload_image_set(
             ),
         )
 
-        status_code: int = wordpress_site.upload_image(img_new, img_attrs)
+        img_paths.append(img_new)
+        img_payloads.append(img_attrs)
 
+    status_codes: List[int] = wordpress_site.upload_images(
+        img_paths, img_payloads, max_workers=max_workers
+    )
+    for number, (img_new, status_code) in enumerate(
+        zip(img_paths, status_codes), start=1
+    ):
         img_now = os.path.basename(img_new)
         if status_code == 200 or status_code == 201:
             logging.info(f"Removing --> {img_now}")
@@ -17,23 +17,31 @@ __author_email__ = "yohamg@programmer.net"
 import logging
 import re
 
-from typing import List, Tuple, Dict, Union
+from typing import List, Optional, Sequence, Set, Tuple, Dict, Union
 
 # Local imports
 from core.utils.interfaces import WordFilter
 from wordpress import WordPress
+from wordpress.cache import WPPublishedDB
 from wordpress.models.taxonomies import WPTaxonomyMarker, WPTaxonomyValues
 from workflows.interfaces import EmbedsMultiSchema
+from workflows.tasks.near_duplicates import (
+    NearDuplicate,
+    NearDuplicateDetector,
+    row_text,
+)
 
 
 def published_json(
-    title: str, wordpress_site: WordPress, yoast_support: bool = False
+    title: str, wordpress_site: WordPress | WPPublishedDB, yoast_support: bool = False
 ) -> bool:
     """This function leverages the power of a local implementation that specialises
     in getting, manipulating and filtering WordPress API post information in JSON format.
-    After getting the posts from the local cache, the function filters each element using
-    the ``re`` module to find matches to the title passed in as a parameter. After all that work,
-    the function returns a boolean; True if the title was found and that just suggests
+    The lookup is performed against the normalized title index kept by the ``WordPress`` post store,
+    so that it does not have to rebuild the list of titles for every candidate.
+    A ``WPPublishedDB`` can be passed instead to query the published posts database without loading the cache;
+    its title source (Yoast SEO or rendered titles) is fixed when the database is built.
+    The function returns a boolean; True if the title was found and that just suggests
     that such a title is already published, or there is a post with the same title.
 
     Ideally, we can benefit from a different and more accurate filter for this purpose, however,
@@ -42,19 +50,32 @@ def published_json(
 
     :param title: ``str`` lookup term, in this case a ``title``
     :param wordpress_site: ``WordPress`` class instance responsible for managing all the
-                             WordPress site data.
+                             WordPress site data, or a ``WPPublishedDB`` instance.
     :param yoast_support: ``bool`` Enable Yoast SEO support for parsing.
     :return: ``bool`` True if one or more matches is found, False if the result is None.
     """
-    post_titles: List[str] = wordpress_site.get_post_titles_local(
-        yoast_support=yoast_support
-    )
-
-    results: List[str] = [vid_name for vid_name in post_titles if title in post_titles]
-    if len(results) >= 1:
-        return True
-    else:
-        return False
+    if isinstance(wordpress_site, WPPublishedDB):
+        return wordpress_site.has_title(title)
+    return wordpress_site.has_title(title, yoast_support=yoast_support)
+
+
+def published_mask(
+    titles: Sequence[Optional[str]],
+    wordpress_site: WordPress | WPPublishedDB,
+    yoast_support: bool = False,
+) -> List[bool]:
+    """Batch version of ``published_json``: the titles are checked against the normalized title
+    hash index of the site in a single pass, so that filtering a whole partner database
+    does not repeat a cache lookup, or a database query, per candidate.
+
+    :param titles: ``Sequence[str | None]`` lookup terms, ``None`` is never published.
+    :param wordpress_site: ``WordPress`` or ``WPPublishedDB`` instance.
+    :param yoast_support: ``bool`` Enable Yoast SEO support for parsing.
+    :return: ``List[bool]`` True for every title that is already published.
+    """
+    if isinstance(wordpress_site, WPPublishedDB):
+        return wordpress_site.published_mask(titles)
+    return wordpress_site.published_mask(titles, yoast_support=yoast_support)
 
 
 def filter_published(
@@ -76,22 +97,70 @@ def filter_published(
     :param yoast_support: ``bool`` Enable Yoast SEO support for parsing. Default ``False``.
     :return: ``list[tuple]`` with the new filtered values.
     """
-    not_published: List[Tuple[str, ...]] = []
     word_regex = re.compile(r"^(?!https?)\w+\b")
+    candidates: List[Tuple[str, ...]] = []
+    titles: List[str] = []
     for elem in all_videos:
         for item in elem:
-            try:
-                if word_regex.match(item):
-                    if published_json(
-                        item, wordpress_site, yoast_support=yoast_support
-                    ):
-                        break
-                    else:
-                        not_published.append(elem)
-                        break
-            except TypeError:
-                continue
-    return not_published
+            if isinstance(item, str) and word_regex.match(item):
+                candidates.append(elem)
+                titles.append(item)
+                break
+    mask = published_mask(titles, wordpress_site, yoast_support=yoast_support)
+    return [elem for elem, published in zip(candidates, mask) if not published]
+
+
+def filter_near_duplicates(
+    rows: List[Tuple[str, ...]],
+    columns: Sequence[str],
+    detector: NearDuplicateDetector,
+    wordpress_site: WordPress | WPPublishedDB,
+    source: Optional[str] = None,
+    key_column: str = "source_url",
+    yoast_support: bool = False,
+) -> Tuple[List[Tuple[str, ...]], List[Tuple[Tuple[str, ...], NearDuplicate]]]:
+    """Removes the rows that are near-duplicates of content that is already live: the same scene
+    offered by another partner (or again by the same one) under a slightly different title or description.
+    Every row is looked up in the MinHash/LSH indexes of the feed databases, and the titles of the
+    near-duplicates found are checked against the published titles in a single ``published_mask`` pass.
+
+    :param rows: ``list[tuple[str, ...]]`` rows that passed ``filter_published``.
+    :param columns: ``Sequence[str]`` column names of the rows, e.g. from ``cursor.description``.
+    :param detector: ``NearDuplicateDetector`` with the indexes of the feed databases.
+    :param wordpress_site: ``WordPress`` or ``WPPublishedDB`` instance.
+    :param source: ``str | None`` feed database filename of the rows, so that rows do not match themselves.
+    :param key_column: ``str`` natural key column of the feed database. Default ``source_url``
+    :param yoast_support: ``bool`` Enable Yoast SEO support for parsing. Default ``False``.
+    :return: ``tuple[list[tuple], list[tuple[tuple, NearDuplicate]]]`` rows to keep, and the skipped rows
+             with the most similar live near-duplicate.
+    """
+    columns = list(columns)
+    key_indx = columns.index(key_column) if key_column in columns else None
+    matches: List[List[NearDuplicate]] = [
+        detector.find(
+            row_text(row, columns),
+            source=source,
+            key=row[key_indx] if key_indx is not None else None,
+        )
+        for row in rows
+    ]
+    live = iter(
+        published_mask(
+            [match.title for found in matches for match in found],
+            wordpress_site,
+            yoast_support=yoast_support,
+        )
+    )
+    kept: List[Tuple[str, ...]] = []
+    skipped: List[Tuple[Tuple[str, ...], NearDuplicate]] = []
+    for row, found in zip(rows, matches):
+        # Matches are sorted by similarity, so the first live one is the closest.
+        live_matches = [match for match in found if next(live)]
+        if live_matches:
+            skipped.append((row, live_matches[0]))
+        else:
+            kept.append(row)
+    return kept, skipped
 
 
 def select_guard(db_name: str, partner: str) -> None:
@@ -154,19 +223,10 @@ def identify_missing(
     if len(data_lst) == len(data_ids):
         return None
     else:
-        not_found: List[str] = []
-        for item in data_lst:
-            if ignore_case:
-                item: str = item.lower()
-                tags: List[str] = list(map(lambda tag: tag.lower(), wp_data_dic.keys()))
-                if item not in tags:
-                    not_found.append(item)
-            else:
-                try:
-                    wp_data_dic[item]
-                except KeyError:
-                    not_found.append(item)
-        return not_found
+        if ignore_case:
+            tags: Set[str] = {tag.lower() for tag in wp_data_dic.keys()}
+            return [item.lower() for item in data_lst if item.lower() not in tags]
+        return [item for item in data_lst if item not in wp_data_dic]
 
 
 def filter_published_embeds(
@@ -187,17 +247,13 @@ def filter_published_embeds(
     :return: ``list[tuple[str, ...]]`` with the new filtered values.
     """
     db_interface = EmbedsMultiSchema(db_cur)
-    post_titles: List[str] = wordpress_site.get_post_titles_local(yoast_support=True)
 
-    not_published: List[Tuple] = []
+    titles: List[str] = []
     for elem in videos:
         db_interface.load_data_instance(elem)
-        vid_title = db_interface.get_title()
-        if vid_title in post_titles:
-            continue
-        else:
-            not_published.append(elem)
-    return not_published
+        titles.append(db_interface.get_title())
+    mask = published_mask(titles, wordpress_site, yoast_support=True)
+    return [elem for elem, published in zip(videos, mask) if not published]
 
 
 def filter_relevant(
@@ -222,20 +278,8 @@ def filter_relevant(
             WPTaxonomyMarker.MODELS, WPTaxonomyValues.MODELS
         ).keys()
     )
-    not_published_yet = []
-    for elem in all_galleries:
-        (title, *fields) = elem
-        model_in_set = False
-        title_split = title.split(" ")
-        for word in title_split:
-            if word not in models_set:
-                continue
-            else:
-                model_in_set = True
-                break
-
-        if not published_json(title, wordpress_photos_site, False) and model_in_set:
-            not_published_yet.append(elem)
-        else:
-            continue
-    return not_published_yet
+    relevant = [
+        elem for elem in all_galleries if not models_set.isdisjoint(elem[0].split(" "))
+    ]
+    mask = published_mask([elem[0] for elem in relevant], wordpress_photos_site)
+    return [elem for elem, published in zip(relevant, mask) if not published]
@@ -46,6 +46,7 @@ from core.utils.secret_handler import SecretHandler
 from core.utils.system_shell import clean_console
 from integrations import x_api, XEndpoints
 from wordpress import WordPress
+from wordpress.cache import resolve_cache_path
 from workflows.utils.databases import content_select_db_match, query_modifier
 from workflows.utils.filtering import (
     filter_published,
@@ -114,7 +115,7 @@ def pilot_warm_up(
                     general_config.fq_domain_name,
                     wp_auth.user,
                     wp_auth.app_password,
-                    ApplicationPath.WP_POSTS_CACHE.value,
+                    resolve_cache_path(ApplicationPath.WP_POSTS_CACHE),
                     unique_logging_session=False,
                 )
             else:
@@ -125,7 +126,7 @@ def pilot_warm_up(
                     general_config.fq_domain_name,
                     wp_auth.user,
                     wp_auth.app_password,
-                    ApplicationPath.WP_PHOTOS_CACHE.value,
+                    resolve_cache_path(ApplicationPath.WP_PHOTOS_CACHE),
                     use_photo_support=True,
                     unique_logging_session=False,
                 )
@@ -215,7 +216,7 @@ def pilot_warm_up(
                 general_config.fq_domain_name,
                 wp_auth.user,
                 wp_auth.app_password,
-                ApplicationPath.WP_PHOTOS_CACHE.value,
+                resolve_cache_path(ApplicationPath.WP_PHOTOS_CACHE),
                 use_photo_support=True,
                 unique_logging_session=False,
             )